@@ -26,16 +26,30 @@ Kullanım:
 API adresi: http://localhost:5001
 """
 
-from flask import Flask, jsonify, send_file, request, send_from_directory
+from flask import Flask, jsonify, send_file, request, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 import os
-import shutil
-import uuid
+import threading
 from pathlib import Path
-from datetime import datetime
 from snyk_runner import run_and_return, REPORT_DIR
-from metric_runner import run_code_scan_and_save
-from deepsource_runner import run_deepsource_scan_and_save
+from scan_jobs import job_manager, JobQueueFullError, run_scan, run_scans_parallel
+from scan_compare import run_comparison
+from scan_progress import format_sse
+from scan_cache import scan_cache
+from single_flight import scan_flights
+from tool_registry import tool_registry
+from retention import retention_manager
+from project_registry import project_registry
+from results_store import results_store, KIND_SCAN
+from result_io import COMPRESSED_SUFFIX, is_compressed, read_bytes, read_json
+from object_store import object_store, parse_reference
+from upload_store import (
+    upload_store,
+    UploadError,
+    UploadTooLargeError,
+    ARCHIVE_CONTENT_TYPES,
+    UPLOAD_MAX_BYTES
+)
 
 # Web UI dosyalarının bulunduğu klasör
 WEB_UI_DIR = Path(__file__).parent.parent / "src"
@@ -44,20 +58,109 @@ WEB_UI_DIR = Path(__file__).parent.parent / "src"
 app = Flask(__name__, static_folder=str(WEB_UI_DIR), static_url_path='')
 CORS(app)  # CORS desteği ekle (web UI için)
 
-# Mevcut test projeleri listesi
-# Bu projeler test_projects/ klasöründe bulunmalıdır
-AVAILABLE_PROJECTS = [
-    "flask_demo",
-    "vulnerable_sql_injection",
-    "vulnerable_command_injection",
-    "vulnerable_xss",
-    "vulnerable_hardcoded_creds"
-]
+# Yükleme boyut sınırı: multipart başlıkları için 1 MB pay bırakılır, aşan
+# istekler gövde okunmadan 413 ile reddedilir (asıl sınır upload_store'da)
+app.config["MAX_CONTENT_LENGTH"] = UPLOAD_MAX_BYTES + 1024 * 1024
+
+# Taranabilir projeler (test_projects/ altındaki sabit projeler + yüklenenler)
+# project_registry'de tutulur; bkz. project_registry.BUILTIN_PROJECTS
 
 # Yüklenen dosyalar için geçici proje klasörü
 UPLOAD_DIR = "../test_projects/uploaded"
 Path(UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
 
+# Tarama sonuç dosyaları (bkz. result_io.py)
+RESULTS_DIR = Path("../results")
+
+
+# Retention tarafından silinen yüklenmiş projeler dizinden ve sonuç deposundan da çıkarılır
+retention_manager.on_evict(project_registry.remove)
+retention_manager.on_evict(results_store.delete_project)
+
+# İlk istekte arka plan servisleri başlatıldı mı (bkz. start_background_services)
+_background_started = threading.Event()
+
+
+@app.before_request
+def start_background_services():
+    """
+    Arka plan saklama temizleyicisini ilk istekte başlatır
+
+    Uygulama `python app.py` yerine bir WSGI sunucusuyla (gunicorn, waitress)
+    veya reloader'sız çalıştırıldığında da disk kotası uygulanır. Debug
+    reloader'ın izleyici süreci istek almadığı için orada başlatılmaz.
+    """
+    if not _background_started.is_set():
+        retention_manager.start()
+        _background_started.set()
+
+
+def _invalid_project_response(project: str):
+    """Kayıtlı olmayan proje için 400 response"""
+    available_projects = project_registry.names()
+    return jsonify({
+        "success": False,
+        "error": f"Invalid project. Available projects: {available_projects}",
+        "available_projects": available_projects,
+        "project": project
+    }), 400
+
+
+def _wants_async() -> bool:
+    """
+    İsteğin asenkron (job tabanlı) çalıştırılmak istenip istenmediğini döner
+
+    Body'de "async": true veya query'de ?async=1 verilirse tarama kuyruğa
+    eklenir ve endpoint hemen job id döner.
+    """
+    if request.is_json and request.json and request.json.get("async"):
+        return True
+    return request.args.get("async", "").lower() in ("1", "true", "yes")
+
+
+def _wants_cache_bypass() -> bool:
+    """
+    Tarama önbelleğinin atlanıp atlanmayacağını döner
+
+    Body'de "no_cache": true veya query'de ?no_cache=1 verilirse proje
+    değişmemiş olsa bile tarayıcı yeniden çalıştırılır.
+    """
+    if request.is_json and request.json and request.json.get("no_cache"):
+        return True
+    return request.args.get("no_cache", "").lower() in ("1", "true", "yes")
+
+
+def _submit_scan_job(tool: str, project: str, **options):
+    """
+    Taramayı iş kuyruğuna ekler ve 202 response döner
+
+    Args:
+        tool: Tool adı ("snyk_code" veya "deepsource")
+        project: Proje adı
+        **options: Runner'a aktarılacak ek parametreler (örn: use_cache)
+
+    Returns:
+        Flask response (202 Accepted veya kuyruk doluysa 503)
+    """
+    try:
+        job = job_manager.submit(tool, project, **options)
+    except JobQueueFullError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e),
+            "project": project
+        }), 503
+
+    return jsonify({
+        "success": True,
+        "message": "scan queued",
+        "job_id": job.job_id,
+        "status": job.status,
+        "tool": job.tool,
+        "project": project,
+        "status_url": f"/jobs/{job.job_id}"
+    }), 202
+
 @app.route("/scan", methods=["POST"])
 def scan():
     """
@@ -114,16 +217,16 @@ def scan_code():
             project = request.args.get("project", "flask_demo")
         
         # Proje geçerli mi kontrol et
-        if project not in AVAILABLE_PROJECTS:
-            return jsonify({
-                "success": False,
-                "error": f"Invalid project. Available projects: {AVAILABLE_PROJECTS}",
-                "available_projects": AVAILABLE_PROJECTS,
-                "project": project
-            }), 400
+        if not project_registry.contains(project):
+            return _invalid_project_response(project)
+        
+        # Asenkron istek: kuyruğa ekle ve job id dön
+        use_cache = not _wants_cache_bypass()
+        if _wants_async():
+            return _submit_scan_job("snyk_code", project, use_cache=use_cache)
         
-        # Tarama yap
-        result = run_code_scan_and_save(project)
+        # Tarama yap (run_scan, tarama süresince projeyi retention'a karşı korur)
+        result = run_scan("snyk_code", project, use_cache=use_cache)
         
         if not result.get("success", False):
             error_msg = result.get("error", "Scan failed")
@@ -142,7 +245,8 @@ def scan_code():
             "file_path": result["file_path"],
             "advanced_metrics_file_path": result.get("advanced_metrics_file_path"),
             "metrics": result["metric_result"],
-            "advanced_metrics": result.get("advanced_metrics", {})
+            "advanced_metrics": result.get("advanced_metrics", {}),
+            "cache_hit": result.get("cache_hit", False)
         }), 200
         
     except Exception as e:
@@ -162,24 +266,23 @@ def scan_code_all():
     """
     Tüm test projeleri için Snyk Code taraması yapar
     
-    AVAILABLE_PROJECTS listesindeki tüm projeleri sırayla tarar
-    ve her biri için sonuçları döner.
+    Kayıtlı tüm projeleri (project_registry) sınırlı bir thread
+    havuzunda paralel tarar (SCAN_ALL_SNYK_CONCURRENCY) ve her biri için
+    sonuçları proje sırasıyla döner.
     
     Returns:
         JSON response with:
         - message: Başarılı tarama sayısı
         - results: Her proje için tarama sonuçları listesi
     """
-    results = []
-    
-    for project in AVAILABLE_PROJECTS:
-        result = run_code_scan_and_save(project)
-        results.append(result)
+    # Tarama sırasında yeni upload'lar dizini değiştirebilir; names() kopya döner
+    projects = project_registry.names()
+    results = run_scans_parallel("snyk_code", projects, use_cache=not _wants_cache_bypass())
     
     success_count = sum(1 for r in results if r["success"])
     
     return jsonify({
-        "message": f"Scanned {success_count}/{len(AVAILABLE_PROJECTS)} projects",
+        "message": f"Scanned {success_count}/{len(projects)} projects",
         "results": results
     }), 200 if success_count > 0 else 500
 
@@ -189,25 +292,36 @@ def list_projects():
     """
     Mevcut test projelerini listeler
     
+    Yanıt proje dizininden (project_registry) gelir; klasörler her çağrıda
+    taranmaz. ?refresh=1 ile değişen projelerin istatistikleri yenilenir
+    (yalnızca mtime imzası değişen projeler yeniden okunur).
+    
     Returns:
         JSON response with:
         - available_projects: Proje adları listesi
-        - projects: Her proje için detaylı bilgi (name, exists, path)
+        - projects: Her proje için detaylı bilgi (name, exists, path, kind,
+          file_count, loc, size_bytes, languages, tree_hash, last_scans)
     """
-    projects_info = []
+    if request.args.get("refresh", "").lower() in ("1", "true", "yes"):
+        project_registry.refresh_all()
     
-    for project in AVAILABLE_PROJECTS:
-        project_path = Path(f"../test_projects/{project}")
-        exists = project_path.exists()
-        
+    projects_info = []
+    for project in project_registry.list_projects():
         projects_info.append({
-            "name": project,
-            "exists": exists,
-            "path": str(project_path)
+            "name": project["name"],
+            "exists": project["exists_on_disk"],
+            "path": project["path"],
+            "kind": project["kind"],
+            "file_count": project["file_count"],
+            "loc": project["loc"],
+            "size_bytes": project["size_bytes"],
+            "languages": project["languages"],
+            "tree_hash": project["tree_hash"],
+            "last_scans": project["last_scans"]
         })
     
     return jsonify({
-        "available_projects": AVAILABLE_PROJECTS,
+        "available_projects": [project["name"] for project in projects_info],
         "projects": projects_info
     })
 
@@ -215,11 +329,33 @@ def list_projects():
 @app.route("/scan/latest", methods=["GET"])
 def latest():
     """
-    En son container tarama raporunu döner (eski endpoint)
+    En son tarama sonucunu döner
+    
+    Query parametreleri (tool, project veya kind) verilirse sonuç deposunun
+    indeksinden en son kayıt döner; verilmezse eski davranış (en son container
+    tarama raporu) korunur.
+    
+    Query Parameters:
+        tool: Araç adı ("snyk_code", "deepsource")
+        project: Proje adı
+        kind: Kayıt türü (default: "scan"; "advanced_metrics", "benchmark_report", ...)
+        include_payload: "0" ise yalnızca meta veri döner (default: "1")
     
     Returns:
-        En son rapor dosyası
+        JSON: Kayıt meta verisi ve ham içerik, veya en son rapor dosyası
     """
+    if any(key in request.args for key in ("tool", "project", "kind")):
+        record = results_store.latest(
+            request.args.get("kind", KIND_SCAN),
+            tool=request.args.get("tool"),
+            project=request.args.get("project")
+        )
+        if record is None:
+            return jsonify({"error": "no results found"}), 404
+        if request.args.get("include_payload", "1") != "0":
+            record["payload"] = results_store.payload(record["id"])
+        return jsonify(record)
+    
     files = os.listdir(REPORT_DIR)
     if not files:
         return jsonify({"error": "no reports found"}), 404
@@ -228,6 +364,92 @@ def latest():
     return send_file(os.path.join(REPORT_DIR, latest))
 
 
+@app.route("/results/history", methods=["GET"])
+def results_history():
+    """
+    Sonuç deposundaki kayıtları yeniden eskiye listeler (payload hariç)
+    
+    Query Parameters:
+        kind: Kayıt türü (default: "scan")
+        tool: Araç adı (opsiyonel)
+        project: Proje adı (opsiyonel)
+        since: Bu Unix zamanından sonraki kayıtlar (opsiyonel)
+        limit: En fazla kayıt (default: 50, en fazla 1000)
+    
+    Returns:
+        JSON: {"records": [...], "count": int}
+    """
+    try:
+        limit = min(int(request.args.get("limit", 50)), 1000)
+        since = float(request.args["since"]) if "since" in request.args else None
+    except ValueError:
+        return jsonify({"error": "limit and since must be numeric"}), 400
+    
+    records = results_store.history(
+        request.args.get("kind", KIND_SCAN),
+        tool=request.args.get("tool"),
+        project=request.args.get("project"),
+        since=since,
+        limit=limit
+    )
+    return jsonify({"records": records, "count": len(records)})
+
+
+@app.route("/results/<int:record_id>", methods=["GET"])
+def result_payload(record_id):
+    """
+    Sonuç deposundaki bir kaydın ham içeriğini döner
+    
+    Args:
+        record_id: Kayıt id'si (/results/history çıktısındaki "id")
+    """
+    payload = results_store.payload(record_id)
+    if payload is None:
+        return jsonify({"error": f"result {record_id} not found"}), 404
+    return jsonify(payload)
+
+
+@app.route("/results/file/<name>", methods=["GET"])
+def result_file(name):
+    """
+    results/ klasöründeki bir sonuç dosyasını JSON olarak döner
+    
+    Kompakt (gzip) dosyalar, istemci gzip kabul ediyorsa olduğu gibi
+    (Content-Encoding: gzip), etmiyorsa açılarak gönderilir. "x.json" istenip
+    yalnızca "x.json.gz" varsa o dosya kullanılır. İçerik adresli ham çıktıya
+    referans veren tarama kayıtları için ham çıktı gönderilir; kaydın kendisi
+    (meta veri) ?record=1 ile alınır.
+    
+    Args:
+        name: Dosya adı (örn: snyk_code_flask_demo_2026-01-06_21-58-49.json)
+    """
+    if Path(name).name != name:
+        return jsonify({"error": "invalid file name"}), 400
+    
+    file_path = RESULTS_DIR / name
+    if not file_path.exists() and not name.endswith(COMPRESSED_SUFFIX):
+        file_path = RESULTS_DIR / (name + COMPRESSED_SUFFIX)
+    if not file_path.is_file():
+        return jsonify({"error": f"result file '{name}' not found"}), 404
+    
+    # Referans kayıtları küçüktür; büyük dosyalar ham çıktının kendisidir
+    if request.args.get("record") != "1" and file_path.stat().st_size < 64 * 1024:
+        digest = parse_reference(read_json(file_path, resolve=False))
+        if digest:
+            file_path = object_store.path_for(digest)
+            if file_path is None:
+                return jsonify({"error": f"raw output for '{name}' is missing"}), 404
+    
+    if not is_compressed(file_path):
+        return send_file(file_path, mimetype="application/json")
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = send_file(file_path, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+    return Response(read_bytes(file_path), mimetype="application/json")
+
+
 @app.route("/scan/file/<name>", methods=["GET"])
 def file(name):
     """
@@ -283,16 +505,16 @@ def scan_deepsource():
             project = request.args.get("project", "flask_demo")
         
         # Proje geçerli mi kontrol et
-        if project not in AVAILABLE_PROJECTS:
-            return jsonify({
-                "success": False,
-                "error": f"Invalid project. Available projects: {AVAILABLE_PROJECTS}",
-                "available_projects": AVAILABLE_PROJECTS,
-                "project": project
-            }), 400
+        if not project_registry.contains(project):
+            return _invalid_project_response(project)
+        
+        # Asenkron istek: kuyruğa ekle ve job id dön
+        use_cache = not _wants_cache_bypass()
+        if _wants_async():
+            return _submit_scan_job("deepsource", project, use_cache=use_cache)
         
-        # Tarama yap
-        result = run_deepsource_scan_and_save(project)
+        # Tarama yap (run_scan, tarama süresince projeyi retention'a karşı korur)
+        result = run_scan("deepsource", project, use_cache=use_cache)
         
         if not result.get("success", False):
             error_msg = result.get("error", "Scan failed")
@@ -311,7 +533,8 @@ def scan_deepsource():
             "file_path": result["file_path"],
             "advanced_metrics_file_path": result.get("advanced_metrics_file_path"),
             "metrics": result["metric_result"],
-            "advanced_metrics": result.get("advanced_metrics", {})
+            "advanced_metrics": result.get("advanced_metrics", {}),
+            "cache_hit": result.get("cache_hit", False)
         }), 200
         
     except Exception as e:
@@ -326,65 +549,164 @@ def scan_deepsource():
         }), 500
 
 
+@app.route("/scan/compare", methods=["POST"])
+def scan_compare():
+    """
+    Snyk Code ve DeepSource karşılaştırmalı tarama endpoint'i
+    
+    İki aracı aynı proje snapshot'ı üzerinde eşzamanlı çalıştırır ve
+    sonuçları yan yana döner. Toplam süre, iki taramanın toplamı yerine
+    en uzun taramanın süresi kadardır.
+    
+    Request body (JSON):
+    {
+        "project": "flask_demo" (opsiyonel, default: flask_demo)
+    }
+    
+    veya query parameter:
+    ?project=flask_demo
+    
+    Returns:
+        JSON response with:
+        - snyk_code / deepsource: Her araç için metrics ve advanced_metrics
+        - comparison: Severity, accuracy ve efficiency metrikleri yan yana
+        - wall_time: Karşılaştırmanın toplam süresi (saniye)
+    """
+    try:
+        project = None
+        
+        if request.is_json and request.json:
+            project = request.json.get("project")
+        
+        if not project:
+            project = request.args.get("project", "flask_demo")
+        
+        if not project_registry.contains(project):
+            return _invalid_project_response(project)
+        
+        result = run_comparison(project, use_cache=not _wants_cache_bypass())
+        
+        tools = {}
+        for tool in ("snyk_code", "deepsource"):
+            tool_result = result.get(tool, {})
+            if tool_result.get("success", False):
+                tools[tool] = {
+                    "success": True,
+                    "file_path": tool_result["file_path"],
+                    "advanced_metrics_file_path": tool_result.get("advanced_metrics_file_path"),
+                    "metrics": tool_result["metric_result"],
+                    "advanced_metrics": tool_result.get("advanced_metrics", {}),
+                    "cache_hit": tool_result.get("cache_hit", False)
+                }
+            else:
+                tools[tool] = {
+                    "success": False,
+                    "error": tool_result.get("error", "Scan failed")
+                }
+        
+        response = {
+            "success": result["success"],
+            "message": "comparison completed" if result["success"] else "comparison failed",
+            "project": project,
+            **tools,
+            "comparison": result.get("comparison", {}),
+            "wall_time": result.get("wall_time", 0.0)
+        }
+        if not result["success"]:
+            response["error"] = result.get("error", "Scan failed")
+        
+        return jsonify(response), 200 if result["success"] else 500
+        
+    except Exception as e:
+        error_msg = str(e)
+        print(f"EXCEPTION in scan_compare: {error_msg}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            "success": False,
+            "error": f"Unexpected error: {error_msg}",
+            "project": project if 'project' in locals() else "unknown"
+        }), 500
+
+
 @app.route("/upload", methods=["POST"])
 def upload_files():
     """
     Dosya yükleme endpoint'i
     
-    Yüklenen dosyaları geçici bir proje klasörüne kaydeder ve
-    bu klasörü AVAILABLE_PROJECTS listesine ekler.
+    Yüklenen dosyaları ve arşivleri (zip, tar, tar.gz, tgz, tar.bz2, tar.xz)
+    içerik adresli bir proje klasörüne (uploaded_<tree_hash[:12]>) yerleştirir
+    ve bu projeyi proje dizinine (project_registry) ekler. Aynı içerik daha önce
+    yüklendiyse mevcut proje döner; önbellekteki tarama sonuçları yeniden
+    kullanılır.
     
     Request:
-        multipart/form-data ile dosyalar gönderilir
+        multipart/form-data ile dosyalar ("files" alanı) gönderilir
+        veya arşiv doğrudan gövde olarak gönderilir
+        (Content-Type: application/zip, application/gzip, application/x-tar ...;
+        opsiyonel ?filename=proje.tar.gz)
     
     Returns:
         JSON response with:
         - success: bool
-        - project_name: str (oluşturulan proje adı)
-        - files: list (yüklenen dosya adları)
+        - project_name: str (içerik adresli proje adı)
+        - files: list (yüklenen dosyaların göreli yolları)
+        - tree_hash: str
+        - deduplicated: bool (aynı içerik daha önce yüklenmiş mi)
+        Boyut sınırı aşılırsa 413, geçersiz/güvensiz arşivde 400 döner.
     """
     try:
-        if 'files' not in request.files:
-            return jsonify({
-                "success": False,
-                "error": "No files provided"
-            }), 400
-        
-        files = request.files.getlist('files')
-        
-        if not files or files[0].filename == '':
-            return jsonify({
-                "success": False,
-                "error": "No files selected"
-            }), 400
-        
-        # Benzersiz proje adı oluştur
-        project_name = f"uploaded_{uuid.uuid4().hex[:8]}_{int(datetime.now().timestamp())}"
-        project_path = Path(UPLOAD_DIR) / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-        
-        uploaded_file_names = []
+        with upload_store.session() as upload:
+            if request.mimetype in ARCHIVE_CONTENT_TYPES:
+                # Ham gövde: arşiv request.stream'den parça parça okunur
+                filename = request.args.get("filename") or ARCHIVE_CONTENT_TYPES[request.mimetype]
+                upload.add_stream(request.stream, filename)
+            else:
+                if 'files' not in request.files:
+                    return jsonify({
+                        "success": False,
+                        "error": "No files provided"
+                    }), 400
+                
+                files = request.files.getlist('files')
+                
+                if not files or files[0].filename == '':
+                    return jsonify({
+                        "success": False,
+                        "error": "No files selected"
+                    }), 400
+                
+                for file in files:
+                    if file.filename:
+                        upload.add_stream(file.stream, file.filename)
+            
+            record = upload.commit()
+            uploaded_file_names = upload.file_names
         
-        # Dosyaları kaydet
-        for file in files:
-            if file.filename:
-                # Güvenlik: Dosya adını temizle
-                safe_filename = os.path.basename(file.filename)
-                file_path = project_path / safe_filename
-                file.save(str(file_path))
-                uploaded_file_names.append(safe_filename)
+        project_name = record["project_name"]
         
-        # Projeyi geçici olarak AVAILABLE_PROJECTS'e ekle
-        if project_name not in AVAILABLE_PROJECTS:
-            AVAILABLE_PROJECTS.append(project_name)
+        # Projeyi dizine ekle (aynı içerik zaten kayıtlıysa yalnızca değişiklik kontrolü yapılır)
+        project_registry.register(project_name, Path(UPLOAD_DIR) / project_name, kind="uploaded")
         
         return jsonify({
             "success": True,
             "project_name": project_name,
             "files": uploaded_file_names,
+            "tree_hash": record.get("tree_hash"),
+            "deduplicated": record["deduplicated"],
             "message": f"Files uploaded successfully to project: {project_name}"
         }), 200
-        
+    
+    except UploadTooLargeError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 413
+    except UploadError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             "success": False,
@@ -397,28 +719,277 @@ def scan_deepsource_all():
     """
     Tüm test projeleri için DeepSource taraması yapar
     
-    AVAILABLE_PROJECTS listesindeki tüm projeleri sırayla tarar
-    ve her biri için sonuçları döner.
+    Kayıtlı tüm projeleri (project_registry) sınırlı bir thread
+    havuzunda paralel tarar (SCAN_ALL_DEEPSOURCE_CONCURRENCY) ve her biri
+    için sonuçları proje sırasıyla döner.
     
     Returns:
         JSON response with:
         - message: Başarılı tarama sayısı
         - results: Her proje için tarama sonuçları listesi
     """
-    results = []
-    
-    for project in AVAILABLE_PROJECTS:
-        result = run_deepsource_scan_and_save(project)
-        results.append(result)
+    # Tarama sırasında yeni upload'lar dizini değiştirebilir; names() kopya döner
+    projects = project_registry.names()
+    results = run_scans_parallel("deepsource", projects, use_cache=not _wants_cache_bypass())
     
     success_count = sum(1 for r in results if r["success"])
     
     return jsonify({
-        "message": f"DeepSource scanned {success_count}/{len(AVAILABLE_PROJECTS)} projects",
+        "message": f"DeepSource scanned {success_count}/{len(projects)} projects",
         "results": results
     }), 200 if success_count > 0 else 500
 
 
+# ============================================
+# TARAMA İŞ KUYRUĞU ENDPOINT'LERİ
+# ============================================
+
+@app.route("/jobs", methods=["POST"])
+def create_job():
+    """
+    Yeni bir tarama işi oluşturur (asenkron)
+    
+    Request body (JSON):
+    {
+        "tool": "snyk_code" | "deepsource",
+        "project": "flask_demo"
+    }
+    
+    Returns:
+        202 response with job_id ve status_url
+    """
+    data = request.json if request.is_json and request.json else {}
+    tool = data.get("tool") or request.args.get("tool", "snyk_code")
+    project = data.get("project") or request.args.get("project", "flask_demo")
+    
+    if not project_registry.contains(project):
+        return _invalid_project_response(project)
+    
+    try:
+        return _submit_scan_job(tool, project, use_cache=not _wants_cache_bypass())
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e),
+            "project": project
+        }), 400
+
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    """
+    Kayıtlı tarama işlerini listeler
+    
+    Query parameter:
+        ?status=queued|running|completed|failed (opsiyonel)
+    
+    Returns:
+        JSON response with:
+        - jobs: İş listesi (sonuçlar hariç)
+        - stats: Kuyruk doluluk bilgisi
+    """
+    status = request.args.get("status")
+    jobs = []
+    for job in job_manager.list_jobs(status=status):
+        job_dict = job.to_dict()
+        job_dict.pop("result", None)
+        jobs.append(job_dict)
+    
+    return jsonify({
+        "jobs": jobs,
+        "stats": job_manager.stats()
+    })
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """
+    Tarama işinin durumunu ve (bittiyse) sonucunu döner
+    
+    Args:
+        job_id: POST /scan/code, /scan/deepsource veya /jobs'un döndüğü id
+    
+    Returns:
+        JSON response with job status, timing bilgisi ve runner sonucu
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({
+            "success": False,
+            "error": f"Job not found: {job_id}"
+        }), 404
+    
+    return jsonify(job.to_dict())
+
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    """
+    Tarama işinin aşama olaylarını Server-Sent Events olarak yayınlar
+    
+    Her olay "stage" event'i olarak gönderilir ve aşama adı, zaman damgası,
+    bir önceki aşamadan bu yana geçen süre (duration) ve toplam geçen süreyi
+    (elapsed) içerir. Tarama bitince "done" event'i ile iş durumu gönderilir
+    ve bağlantı kapanır. Yeniden bağlanan istemciler Last-Event-ID header'ı
+    ile kaldıkları yerden devam eder.
+    
+    Args:
+        job_id: Tarama işi id'si
+    
+    Returns:
+        text/event-stream response
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({
+            "success": False,
+            "error": f"Job not found: {job_id}"
+        }), 404
+    
+    try:
+        start_index = int(request.headers.get("Last-Event-ID", "-1")) + 1
+    except ValueError:
+        start_index = 0
+    
+    def generate():
+        index = start_index
+        while True:
+            events, finished = job.progress.wait_for_events(index, timeout=15.0)
+            for event in events:
+                yield format_sse(event, event="stage", event_id=index)
+                index += 1
+            if finished and not events:
+                job_dict = job.to_dict()
+                job_dict.pop("result", None)
+                yield format_sse(job_dict, event="done")
+                break
+            if not events:
+                # Proxy'lerin bağlantıyı kapatmaması için keep-alive yorumu
+                yield ": keep-alive\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+# ============================================
+# TARAYICI DURUMU ENDPOINT'İ
+# ============================================
+
+@app.route("/tools", methods=["GET"])
+def tools_status():
+    """
+    Tarayıcı CLI'larının (Snyk, DeepSource) keşif durumunu döner
+    
+    Sonuçlar tool_registry'den okunur; ?refresh=1 ile keşif yeniden yapılır
+    (örn: CLI sonradan kurulduysa).
+    
+    Returns:
+        JSON response with her araç için path, version, available ve
+        DeepSource API istemcisinin devre kesici durumu
+    """
+    # Runner'lar import edildiğinde kendi araçlarını kayda ekler
+    import metric_runner  # noqa: F401
+    import deepsource_runner  # noqa: F401
+    
+    refresh = request.args.get("refresh", "").lower() in ("1", "true", "yes")
+    from deepsource_client import clients_status
+    return jsonify({
+        "success": True,
+        "tools": tool_registry.status(refresh=refresh),
+        # DeepSource API istemcisi ve devre kesici durumu
+        "deepsource_api": clients_status()
+    })
+
+
+# ============================================
+# TARAMA ÖNBELLEĞİ ENDPOINT'LERİ
+# ============================================
+
+@app.route("/cache", methods=["GET"])
+def cache_stats():
+    """
+    Tarama sonuç önbelleğinin doluluk ve isabet istatistiklerini döner
+    
+    Returns:
+        JSON response with entries, total_bytes, hits, misses, sınırlar ve
+        single_flight (devam eden / birleştirilen tarama sayıları)
+    """
+    stats = scan_cache.stats()
+    # Şu an devam eden ve birleştirilen (coalesced) taramalar
+    stats["single_flight"] = scan_flights.stats()
+    return jsonify(stats)
+
+
+@app.route("/cache", methods=["DELETE"])
+def cache_clear():
+    """
+    Tarama sonuç önbelleğini temizler
+    
+    Returns:
+        JSON response with silinen kayıt sayısı
+    """
+    removed = scan_cache.clear()
+    return jsonify({
+        "success": True,
+        "removed_entries": removed
+    })
+
+
+# ============================================
+# HIZ SINIRI ENDPOINT'İ
+# ============================================
+
+@app.route("/rate-limits", methods=["GET"])
+def rate_limits_status():
+    """
+    Harici servisler (DeepSource API, Snyk Code) için hız sınırı durumunu döner
+    
+    Toplu çalıştırmalar (benchmark, kapsamlı test raporu) bu bilgiyle
+    taramaları planlayabilir.
+    
+    Returns:
+        JSON response with servis başına sınırlar ve servis + kimlik bilgisi
+        başına kalan token, bir sonraki token için bekleme süresi ve sıradaki çağrılar
+    """
+    from rate_limiter import rate_limiter
+    return jsonify(rate_limiter.status())
+
+
+# ============================================
+# BAKIM (RETENTION) ENDPOINT'LERİ
+# ============================================
+
+@app.route("/maintenance/gc", methods=["POST"])
+def maintenance_gc():
+    """
+    Yüklenen projeler için saklama temizliğini hemen çalıştırır
+    
+    TTL'i dolan ve disk kotası / proje sayısı sınırını aşan (en uzun süredir
+    kullanılmayan) yüklenmiş projeler ve sonuç dosyaları silinir. Taranmakta
+    olan projeler atlanır. ?dry_run=1 ile yalnızca silinecekler raporlanır.
+    
+    Returns:
+        JSON response with evicted, skipped_in_use, freed_bytes, remaining_*
+    """
+    dry_run = request.args.get("dry_run", "").lower() in ("1", "true", "yes")
+    report = retention_manager.sweep(dry_run=dry_run)
+    return jsonify({"success": True, **report})
+
+
+@app.route("/maintenance/retention", methods=["GET"])
+def maintenance_retention():
+    """
+    Saklama ayarlarını, aktif proje lease'lerini ve son temizlik raporunu döner
+    """
+    return jsonify(retention_manager.status())
+
+
 # Web UI Static File Serving (en sonda olmalı, API route'larından sonra)
 @app.route("/")
 def index():
@@ -471,7 +1042,18 @@ if __name__ == "__main__":
     print(f"  - POST /upload")
     print(f"  - POST /scan/code")
     print(f"  - POST /scan/deepsource")
+    print(f"  - POST /scan/compare")
+    print(f"  - POST /jobs, GET /jobs/<id>, GET /jobs/<id>/events")
+    print(f"  - GET  /cache, DELETE /cache")
+    print(f"  - GET  /tools")
+    print(f"  - GET  /rate-limits")
+    print(f"  - GET  /scan/latest?tool=&project=, GET /results/history, GET /results/<id>")
+    print(f"  - GET  /results/file/<name>")
+    print(f"  - POST /maintenance/gc, GET /maintenance/retention")
     print("=" * 60)
     print()
     
+    # Saklama temizleyicisi ilk istekte başlar (bkz. start_background_services).
+    # Eski results/ geçmişi açılışı geciktirmemek için elle içe aktarılır:
+    # python results_store.py import
     app.run(port=5001, debug=True)
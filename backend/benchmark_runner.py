@@ -3,14 +3,26 @@ Benchmark Runner - Karşılaştırmalı Test Senaryoları Çalıştırıcı
 
 Bu script, tüm test senaryolarını hem Snyk Code hem DeepSource ile tarar,
 ground truth verisi ile karşılaştırır ve detaylı analiz raporu oluşturur.
+
+Kullanım:
+    cd backend
+    python benchmark_runner.py [--matching greedy|optimal]
+
+    --matching optimal: Issue'lar ground truth ile sıradan bağımsız, en fazla
+    eşleşmeyi veren atamayla eşleştirilir (bkz. metrics/issue_matching.py).
+    Varsayılan ISSUE_MATCHING_MODE (greedy).
 """
 
 import json
 import time
-import requests
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
+from result_io import write_json, read_json
+from metrics.issue_model import Issue
+from metrics.issue_extractors import extract_issues
+from metrics.issue_matching import MATCHING_MODES, match_metrics, resolve_matching_mode, BENCHMARK_POLICY
+from results_store import results_store, KIND_BENCHMARK_REPORT
 
 # API base URL
 API_BASE_URL = "http://localhost:5001"
@@ -53,6 +65,9 @@ def run_scan(tool: str, project: str) -> Dict[str, Any]:
     if tool == "snyk":
         endpoint = f"{API_BASE_URL}/scan/code"
     
+    # requests yalnızca tarama isteğinde yüklenir (import süresi, bkz. tests/test_import_time.py)
+    import requests
+    
     try:
         start_time = time.time()
         response = requests.post(
@@ -82,7 +97,7 @@ def run_scan(tool: str, project: str) -> Dict[str, Any]:
         }
 
 
-def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Dict]:
+def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Issue]:
     """
     Raw sonuç dosyasından issue'ları çıkarır
     
@@ -105,58 +120,13 @@ def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Dict]:
         if not file_path.exists():
             return issues
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        raw_data = read_json(file_path)
         
-        # Snyk Code için
+        # DeepSource API'sinde dosya bilgisi yok; ground truth ile eşleşmesi için varsayılan app.py
+        issues = extract_issues(tool, raw_data, default_file="app.py")
         if tool == "snyk":
-            if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
-                results = raw_data["runs"][0].get("results", [])
-                for result in results:
-                    locations = result.get("locations", [])
-                    if locations:
-                        location = locations[0].get("physicalLocation", {})
-                        artifact_location = location.get("artifactLocation", {})
-                        region = location.get("region", {})
-                        
-                        # Dosya adını normalize et
-                        file_uri = artifact_location.get("uri", "")
-                        file_name = file_uri.split("/")[-1] if "/" in file_uri else file_uri
-                        
-                        issues.append({
-                            "file": file_name,
-                            "line": region.get("startLine", -1),
-                            "type": result.get("ruleId", ""),
-                            "severity": result.get("level", "error"),
-                            "description": result.get("message", {}).get("text", "")
-                        })
-        
-        # DeepSource için
-        elif tool == "deepsource":
-            # GraphQL formatı
-            if "data" in raw_data and "repository" in raw_data["data"]:
-                repo_data = raw_data["data"]["repository"]
-                if "issues" in repo_data and "edges" in repo_data["issues"]:
-                    for edge in repo_data["issues"]["edges"]:
-                        if "node" in edge and "issue" in edge["node"]:
-                            issue = edge["node"]["issue"]
-                            issues.append({
-                                "file": "app.py",  # DeepSource API'sinde dosya bilgisi yok, varsayılan
-                                "line": -1,
-                                "type": issue.get("shortcode", ""),
-                                "severity": issue.get("severity", ""),
-                                "description": issue.get("title", "")
-                            })
-            # Mock format
-            elif "issues" in raw_data:
-                for issue in raw_data["issues"]:
-                    issues.append({
-                        "file": issue.get("file", "app.py"),
-                        "line": issue.get("line", -1),
-                        "type": issue.get("issue_code", ""),
-                        "severity": issue.get("severity", "").upper(),
-                        "description": issue.get("message", "")
-                    })
+            # Dosya adını normalize et
+            issues = [issue._replace(file=issue.file_name) for issue in issues]
     
     except Exception as e:
         print(f"  [UYARI] Issue çıkarma hatası: {e}")
@@ -164,7 +134,7 @@ def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Dict]:
     return issues
 
 
-def extract_issues_from_result(result: Dict, tool: str) -> List[Dict]:
+def extract_issues_from_result(result: Dict, tool: str) -> List[Issue]:
     """
     Tarama sonucundan issue'ları çıkarır
     Raw dosyayı okuyarak detaylı issue bilgilerini alır
@@ -182,106 +152,18 @@ def extract_issues_from_result(result: Dict, tool: str) -> List[Dict]:
     return issues
 
 
-def match_issue(detected: Dict, truth: Dict) -> bool:
-    """
-    Bir detected issue ile ground truth issue'yu eşleştirir
-    
-    Eşleştirme kriterleri:
-    1. Dosya adı eşleşmeli
-    2. Satır numarası eşleşmeli (veya ±2 satır tolerans)
-    3. Issue tipi benzer olmalı (opsiyonel)
-    """
-    detected_file = detected.get("file", "").lower()
-    detected_line = detected.get("line", -1)
-    detected_type = detected.get("type", "").upper()
-    
-    truth_file = truth.get("file", "").lower()
-    truth_line = truth.get("line", -1)
-    truth_type = truth.get("type", "").upper()
-    
-    # Dosya adı eşleşmeli
-    if detected_file and truth_file:
-        # Sadece dosya adını karşılaştır (path'ten bağımsız)
-        detected_name = detected_file.split("/")[-1].split("\\")[-1]
-        truth_name = truth_file.split("/")[-1].split("\\")[-1]
-        if detected_name != truth_name:
-            return False
-    
-    # Satır numarası eşleşmeli (±2 satır tolerans)
-    if detected_line > 0 and truth_line > 0:
-        if abs(detected_line - truth_line) <= 2:
-            return True
-    
-    # Eğer satır numarası yoksa, issue tipine bak
-    if detected_line <= 0 or truth_line <= 0:
-        # Issue tipi benzerliği kontrol et
-        if truth_type in detected_type or detected_type in truth_type:
-            return True
-    
-    return False
-
-
-def calculate_metrics(detected_issues: List[Dict], ground_truth: List[Dict]) -> Dict[str, float]:
+def run_benchmark(matching_mode: str = None):
     """
-    Precision, Recall, F1 Score hesaplar
+    Tüm test senaryolarını çalıştırır ve karşılaştırmalı analiz yapar
     
     Args:
-        detected_issues: Bulunan issue'lar
-        ground_truth: Gerçek issue'lar
-    
-    Returns:
-        Metrikler (precision, recall, f1_score, true_positives, false_positives, false_negatives)
+        matching_mode: Issue eşleştirme modu, "greedy" veya "optimal" (None ise ISSUE_MATCHING_MODE)
     """
-    if not ground_truth:
-        # Ground truth yoksa, sadece false positive oranını hesaplayabiliriz
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1_score": 0.0,
-            "true_positives": 0,
-            "false_positives": len(detected_issues),
-            "false_negatives": 0
-        }
-    
-    # Eşleştirme yap
-    matched_truth_indices = set()
-    matched_detected_indices = set()
-    
-    for i, detected in enumerate(detected_issues):
-        for j, truth in enumerate(ground_truth):
-            if j not in matched_truth_indices and match_issue(detected, truth):
-                matched_truth_indices.add(j)
-                matched_detected_indices.add(i)
-                break
-    
-    true_positives = len(matched_truth_indices)
-    false_positives = len(detected_issues) - len(matched_detected_indices)
-    false_negatives = len(ground_truth) - len(matched_truth_indices)
-    
-    # Precision: TP / (TP + FP)
-    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
-    
-    # Recall: TP / (TP + FN)
-    recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0.0
-    
-    # F1 Score
-    f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
-    
-    return {
-        "precision": precision,
-        "recall": recall,
-        "f1_score": f1_score,
-        "true_positives": true_positives,
-        "false_positives": false_positives,
-        "false_negatives": false_negatives
-    }
-
-
-def run_benchmark():
-    """Tüm test senaryolarını çalıştırır ve karşılaştırmalı analiz yapar"""
+    matching_mode = resolve_matching_mode(matching_mode)
     print("=" * 80)
     print("BENCHMARK TEST SUITE - KARŞILAŞTIRMALI ANALİZ")
     print("=" * 80)
+    print(f"Eşleştirme Modu: {matching_mode}")
     print()
     
     # Ground truth yükle
@@ -289,6 +171,7 @@ def run_benchmark():
     
     results = {
         "timestamp": datetime.now().isoformat(),
+        "matching_mode": matching_mode,
         "projects": {}
     }
     
@@ -365,12 +248,12 @@ def run_benchmark():
         
         if project_results["snyk"].get("success"):
             snyk_issues = extract_issues_from_result(snyk_result, "snyk")
-            project_results["snyk"]["detected_issues"] = snyk_issues
+            project_results["snyk"]["detected_issues"] = [issue.to_dict() for issue in snyk_issues]
             project_results["snyk"]["detected_issues_count"] = len(snyk_issues)
         
         if project_results["deepsource"].get("success"):
             deepsource_issues = extract_issues_from_result(deepsource_result, "deepsource")
-            project_results["deepsource"]["detected_issues"] = deepsource_issues
+            project_results["deepsource"]["detected_issues"] = [issue.to_dict() for issue in deepsource_issues]
             project_results["deepsource"]["detected_issues_count"] = len(deepsource_issues)
         
         # Ground truth ile karşılaştırma ve metrik hesaplama
@@ -381,7 +264,7 @@ def run_benchmark():
             
             # Snyk Code metrikleri
             if snyk_issues:
-                snyk_metrics = calculate_metrics(snyk_issues, ground_truth)
+                snyk_metrics = match_metrics(snyk_issues, ground_truth, BENCHMARK_POLICY, matching_mode)
                 project_results["snyk"]["comparison_metrics"] = snyk_metrics
                 print(f"\n  Snyk Code:")
                 print(f"    - Bulunan Issues: {len(snyk_issues)}")
@@ -394,7 +277,7 @@ def run_benchmark():
             
             # DeepSource metrikleri
             if deepsource_issues:
-                deepsource_metrics = calculate_metrics(deepsource_issues, ground_truth)
+                deepsource_metrics = match_metrics(deepsource_issues, ground_truth, BENCHMARK_POLICY, matching_mode)
                 project_results["deepsource"]["comparison_metrics"] = deepsource_metrics
                 print(f"\n  DeepSource:")
                 print(f"    - Bulunan Issues: {len(deepsource_issues)}")
@@ -419,8 +302,9 @@ def run_benchmark():
     timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     report_file = results_dir / f"benchmark_report_{timestamp}.json"
     
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    report_file = write_json(report_file, results)
+    
+    results_store.safe_add(KIND_BENCHMARK_REPORT, results, file_path=str(report_file))
     
     print(f"\n{'='*80}")
     print("BENCHMARK TAMAMLANDI")
@@ -498,5 +382,12 @@ def print_summary(results: Dict):
 
 
 if __name__ == "__main__":
-    run_benchmark()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark test senaryolarını çalıştırır")
+    parser.add_argument(
+        "--matching", choices=MATCHING_MODES, default=None,
+        help="Issue eşleştirme modu (varsayılan: ISSUE_MATCHING_MODE)"
+    )
+    run_benchmark(parser.parse_args().matching)
 
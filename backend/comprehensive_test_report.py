@@ -2,14 +2,26 @@
 Kapsamlı Test Raporu Oluşturucu
 
 Tüm test senaryolarını çalıştırır, sonuçları analiz eder ve detaylı rapor oluşturur.
+
+Kullanım:
+    cd backend
+    python comprehensive_test_report.py [--matching greedy|optimal]
+
+    --matching optimal: Issue'lar ground truth ile sıradan bağımsız, en fazla
+    eşleşmeyi veren atamayla eşleştirilir (bkz. metrics/issue_matching.py).
+    Varsayılan ISSUE_MATCHING_MODE (greedy).
 """
 
 import json
 import time
-import requests
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
+from result_io import write_json, read_json
+from metrics.issue_model import Issue
+from metrics.issue_extractors import extract_issues
+from metrics.issue_matching import MATCHING_MODES, match_metrics, resolve_matching_mode, REPORT_POLICY
+from results_store import results_store, KIND_COMPREHENSIVE_REPORT
 
 API_BASE_URL = "http://localhost:5001"
 TEST_PROJECTS = [
@@ -36,6 +48,9 @@ def run_scan(tool: str, project: str) -> Dict[str, Any]:
     """Belirtilen araç ile proje taraması yapar"""
     endpoint = f"{API_BASE_URL}/scan/code" if tool == "snyk" else f"{API_BASE_URL}/scan/deepsource"
     
+    # requests yalnızca tarama isteğinde yüklenir (import süresi, bkz. tests/test_import_time.py)
+    import requests
+    
     try:
         start_time = time.time()
         response = requests.post(
@@ -65,11 +80,12 @@ def run_scan(tool: str, project: str) -> Dict[str, Any]:
         }
 
 
-def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Dict]:
+def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Issue]:
     """Raw sonuç dosyasından issue'ları çıkarır"""
     issues = []
     
     try:
+        # Dosya yolunu düzelt (relative path)
         if file_path.startswith(".."):
             file_path = Path(file_path).resolve()
         else:
@@ -78,53 +94,13 @@ def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Dict]:
         if not file_path.exists():
             return issues
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        raw_data = read_json(file_path)
         
+        # DeepSource API'sinde dosya bilgisi yok; ground truth ile eşleşmesi için varsayılan app.py
+        issues = extract_issues(tool, raw_data, default_file="app.py")
         if tool == "snyk":
-            if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
-                results = raw_data["runs"][0].get("results", [])
-                for result in results:
-                    locations = result.get("locations", [])
-                    if locations:
-                        location = locations[0].get("physicalLocation", {})
-                        artifact_location = location.get("artifactLocation", {})
-                        region = location.get("region", {})
-                        
-                        file_uri = artifact_location.get("uri", "")
-                        file_name = file_uri.split("/")[-1] if "/" in file_uri else file_uri
-                        
-                        issues.append({
-                            "file": file_name,
-                            "line": region.get("startLine", -1),
-                            "type": result.get("ruleId", ""),
-                            "severity": result.get("level", "error"),
-                            "description": result.get("message", {}).get("text", "")
-                        })
-        
-        elif tool == "deepsource":
-            if "data" in raw_data and "repository" in raw_data["data"]:
-                repo_data = raw_data["data"]["repository"]
-                if "issues" in repo_data and "edges" in repo_data["issues"]:
-                    for edge in repo_data["issues"]["edges"]:
-                        if "node" in edge and "issue" in edge["node"]:
-                            issue = edge["node"]["issue"]
-                            issues.append({
-                                "file": "app.py",
-                                "line": -1,
-                                "type": issue.get("shortcode", ""),
-                                "severity": issue.get("severity", ""),
-                                "description": issue.get("title", "")
-                            })
-            elif "issues" in raw_data:
-                for issue in raw_data["issues"]:
-                    issues.append({
-                        "file": issue.get("file", "app.py"),
-                        "line": issue.get("line", -1),
-                        "type": issue.get("issue_code", ""),
-                        "severity": issue.get("severity", "").upper(),
-                        "description": issue.get("message", "")
-                    })
+            # Dosya adını normalize et
+            issues = [issue._replace(file=issue.file_name) for issue in issues]
     
     except Exception as e:
         print(f"  [UYARI] Issue çıkarma hatası: {e}")
@@ -132,72 +108,18 @@ def extract_issues_from_raw_file(file_path: str, tool: str) -> List[Dict]:
     return issues
 
 
-def match_issue(detected: Dict, truth: Dict) -> bool:
-    """Issue eşleştirme"""
-    detected_file = detected.get("file", "").lower()
-    detected_line = detected.get("line", -1)
-    
-    truth_file = truth.get("file", "").lower()
-    truth_line = truth.get("line", -1)
-    
-    if detected_file and truth_file:
-        detected_name = detected_file.split("/")[-1].split("\\")[-1]
-        truth_name = truth_file.split("/")[-1].split("\\")[-1]
-        if detected_name != truth_name:
-            return False
-    
-    if detected_line > 0 and truth_line > 0:
-        if abs(detected_line - truth_line) <= 2:
-            return True
-    
-    return False
-
-
-def calculate_metrics(detected_issues: List[Dict], ground_truth: List[Dict]) -> Dict[str, float]:
-    """Precision, Recall, F1 Score hesaplar"""
-    if not ground_truth:
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1_score": 0.0,
-            "true_positives": 0,
-            "false_positives": len(detected_issues),
-            "false_negatives": 0
-        }
-    
-    matched_truth_indices = set()
-    matched_detected_indices = set()
-    
-    for i, detected in enumerate(detected_issues):
-        for j, truth in enumerate(ground_truth):
-            if j not in matched_truth_indices and match_issue(detected, truth):
-                matched_truth_indices.add(j)
-                matched_detected_indices.add(i)
-                break
+def run_comprehensive_tests(matching_mode: str = None):
+    """
+    Tüm test senaryolarını çalıştırır ve kapsamlı rapor oluşturur
     
-    true_positives = len(matched_truth_indices)
-    false_positives = len(detected_issues) - len(matched_detected_indices)
-    false_negatives = len(ground_truth) - len(matched_truth_indices)
-    
-    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
-    recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0.0
-    f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
-    
-    return {
-        "precision": precision,
-        "recall": recall,
-        "f1_score": f1_score,
-        "true_positives": true_positives,
-        "false_positives": false_positives,
-        "false_negatives": false_negatives
-    }
-
-
-def run_comprehensive_tests():
-    """Tüm test senaryolarını çalıştırır ve kapsamlı rapor oluşturur"""
+    Args:
+        matching_mode: Issue eşleştirme modu, "greedy" veya "optimal" (None ise ISSUE_MATCHING_MODE)
+    """
+    matching_mode = resolve_matching_mode(matching_mode)
     print("=" * 80)
     print("KAPSAMLI TEST RAPORU - TÜM SENARYOLAR")
     print("=" * 80)
+    print(f"Eşleştirme Modu: {matching_mode}")
     print(f"Başlangıç Zamanı: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
@@ -205,6 +127,7 @@ def run_comprehensive_tests():
     
     results = {
         "timestamp": datetime.now().isoformat(),
+        "matching_mode": matching_mode,
         "test_summary": {
             "total_projects": len(TEST_PROJECTS),
             "tools_tested": ["Snyk Code", "DeepSource"]
@@ -241,7 +164,7 @@ def run_comprehensive_tests():
             detected_issues = extract_issues_from_raw_file(file_path, "snyk") if file_path else []
             
             # Metrikleri hesapla
-            comparison_metrics = calculate_metrics(detected_issues, ground_truth)
+            comparison_metrics = match_metrics(detected_issues, ground_truth, REPORT_POLICY, matching_mode)
             
             project_results["snyk"] = {
                 "success": True,
@@ -278,7 +201,7 @@ def run_comprehensive_tests():
             detected_issues = extract_issues_from_raw_file(file_path, "deepsource") if file_path else []
             
             # Metrikleri hesapla
-            comparison_metrics = calculate_metrics(detected_issues, ground_truth)
+            comparison_metrics = match_metrics(detected_issues, ground_truth, REPORT_POLICY, matching_mode)
             
             project_results["deepsource"] = {
                 "success": True,
@@ -310,8 +233,9 @@ def run_comprehensive_tests():
     timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     report_file = results_dir / f"comprehensive_test_report_{timestamp}.json"
     
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    report_file = write_json(report_file, results)
+    
+    results_store.safe_add(KIND_COMPREHENSIVE_REPORT, results, file_path=str(report_file))
     
     print(f"\n{'='*80}")
     print("TEST RAPORU TAMAMLANDI")
@@ -472,5 +396,12 @@ def generate_summary_report(results: Dict, json_file: Path):
 
 
 if __name__ == "__main__":
-    run_comprehensive_tests()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kapsamlı test raporunu oluşturur")
+    parser.add_argument(
+        "--matching", choices=MATCHING_MODES, default=None,
+        help="Issue eşleştirme modu (varsayılan: ISSUE_MATCHING_MODE)"
+    )
+    run_comprehensive_tests(parser.parse_args().matching)
 
@@ -0,0 +1,381 @@
+"""
+DeepSource GraphQL API İstemcisi
+
+Bu modül, DeepSource GraphQL API çağrıları için paylaşılan bir HTTP istemcisi
+sağlar:
+- Bağlantı havuzu: Tek bir requests.Session ile keep-alive bağlantılar
+  yeniden kullanılır (her çağrıda yeni TCP/TLS el sıkışması yapılmaz)
+- Sınırlı yeniden deneme: Ağ hataları, 429 ve 5xx yanıtlarında en fazla
+  DEEPSOURCE_HTTP_RETRIES kez, jitter'lı üstel bekleme ile tekrar denenir
+  (Retry-After başlığı varsa ona uyulur)
+- Devre kesici (circuit breaker): Arka arkaya DEEPSOURCE_BREAKER_THRESHOLD
+  başarısız çağrıdan sonra API DEEPSOURCE_BREAKER_RESET_SECONDS boyunca hiç
+  çağrılmaz; süre dolunca tek bir deneme çağrısına izin verilir
+- Son başarılı yanıt: Her başarılı yanıt diske kaydedilir; API bozukken
+  runner mock veri yerine bu yanıtı kullanabilir
+- Hız sınırı: Her istek öncesi token başına paylaşılan token-bucket'tan
+  (rate_limiter) token alınır; 429 yanıtında aynı token'ı kullanan tüm
+  çağrılar birlikte bekletilir
+
+Kullanım:
+    from deepsource_client import get_client, DeepSourceAPIError
+    client = get_client(api_url, token)
+    try:
+        data = client.execute(query, variables)
+    except DeepSourceAPIError:
+        data = client.last_good(query, variables)
+
+Environment Variables:
+    DEEPSOURCE_HTTP_CONNECT_TIMEOUT: Bağlantı zaman aşımı, saniye (default: 10)
+    DEEPSOURCE_HTTP_READ_TIMEOUT: Okuma zaman aşımı, saniye (default: 300)
+    DEEPSOURCE_HTTP_RETRIES: En fazla yeniden deneme sayısı (default: 3)
+    DEEPSOURCE_HTTP_BACKOFF_BASE: İlk bekleme üst sınırı, saniye (default: 0.5)
+    DEEPSOURCE_HTTP_BACKOFF_MAX: En uzun bekleme, saniye (default: 8)
+    DEEPSOURCE_HTTP_POOL_SIZE: Havuzdaki en fazla bağlantı sayısı (default: 10)
+    DEEPSOURCE_BREAKER_THRESHOLD: Devreyi açan ardışık hata sayısı (default: 5)
+    DEEPSOURCE_BREAKER_RESET_SECONDS: Devrenin açık kalma süresi (default: 60)
+    DEEPSOURCE_LAST_GOOD_DIR: Son başarılı yanıt klasörü (default: ../results/.cache/deepsource_last_good)
+"""
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from rate_limiter import rate_limiter
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+DEEPSOURCE_HTTP_CONNECT_TIMEOUT = float(os.getenv("DEEPSOURCE_HTTP_CONNECT_TIMEOUT", "10"))
+DEEPSOURCE_HTTP_READ_TIMEOUT = float(os.getenv("DEEPSOURCE_HTTP_READ_TIMEOUT", "300"))
+DEEPSOURCE_HTTP_RETRIES = int(os.getenv("DEEPSOURCE_HTTP_RETRIES", "3"))
+DEEPSOURCE_HTTP_BACKOFF_BASE = float(os.getenv("DEEPSOURCE_HTTP_BACKOFF_BASE", "0.5"))
+DEEPSOURCE_HTTP_BACKOFF_MAX = float(os.getenv("DEEPSOURCE_HTTP_BACKOFF_MAX", "8"))
+DEEPSOURCE_HTTP_POOL_SIZE = int(os.getenv("DEEPSOURCE_HTTP_POOL_SIZE", "10"))
+DEEPSOURCE_BREAKER_THRESHOLD = int(os.getenv("DEEPSOURCE_BREAKER_THRESHOLD", "5"))
+DEEPSOURCE_BREAKER_RESET_SECONDS = float(os.getenv("DEEPSOURCE_BREAKER_RESET_SECONDS", "60"))
+DEEPSOURCE_LAST_GOOD_DIR = os.getenv("DEEPSOURCE_LAST_GOOD_DIR", "../results/.cache/deepsource_last_good")
+
+# Yeniden denenen HTTP durum kodları (geçici hatalar)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class DeepSourceAPIError(RuntimeError):
+    """API çağrısı yeniden denemelere rağmen başarısız olduğunda"""
+
+
+class CircuitOpenError(DeepSourceAPIError):
+    """Devre kesici açıkken API çağrılmadığında"""
+
+
+class CircuitBreaker:
+    """
+    Ardışık hatalarda API çağrılarını geçici olarak durduran devre kesici
+
+    Durumlar:
+    - closed: Çağrılar normal yapılır
+    - open: Çağrı yapılmaz (reset_seconds dolana kadar)
+    - half_open: Tek bir deneme çağrısına izin verilir; başarılıysa closed,
+      başarısızsa tekrar open olur
+    """
+
+    def __init__(self, threshold: int = DEEPSOURCE_BREAKER_THRESHOLD, reset_seconds: float = DEEPSOURCE_BREAKER_RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.time() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def admit(self) -> Optional[str]:
+        """
+        Çağrıya izin verir
+
+        Returns:
+            Optional[str]: "closed" (normal çağrı), "trial" (half_open deneme
+            çağrısı; sonucu record_success/record_failure/release_trial ile
+            kapatılmalı) veya izin yoksa None
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return "closed"
+            if state == "half_open" and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return "trial"
+            return None
+
+    def allow(self) -> bool:
+        """Çağrı yapılıp yapılamayacağını döner"""
+        return self.admit() is not None
+
+    def release_trial(self):
+        """Sonuçlanmadan biten deneme çağrısını bırakır (devre half_open kalır)"""
+        with self._lock:
+            self._trial_in_progress = False
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self._trial_in_progress or self.consecutive_failures >= self.threshold:
+                self.opened_at = time.time()
+            self._trial_in_progress = False
+
+
+class DeepSourceClient:
+    """
+    Bağlantı havuzlu, yeniden denemeli ve devre kesicili GraphQL istemcisi
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        token: str,
+        max_retries: int = DEEPSOURCE_HTTP_RETRIES,
+        backoff_base: float = DEEPSOURCE_HTTP_BACKOFF_BASE,
+        backoff_max: float = DEEPSOURCE_HTTP_BACKOFF_MAX,
+        pool_size: int = DEEPSOURCE_HTTP_POOL_SIZE,
+        breaker: Optional[CircuitBreaker] = None,
+        last_good_dir: str = DEEPSOURCE_LAST_GOOD_DIR
+    ):
+        self.api_url = api_url
+        self.token = token
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_size = pool_size
+        self.breaker = breaker or CircuitBreaker()
+        self.last_good_dir = Path(last_good_dir)
+        self.timeout = (DEEPSOURCE_HTTP_CONNECT_TIMEOUT, DEEPSOURCE_HTTP_READ_TIMEOUT)
+        self._session = None
+        self._session_lock = threading.Lock()
+        self.requests_sent = 0
+        self.retries = 0
+        self.throttled = 0
+
+    @property
+    def session(self):
+        """Paylaşılan requests.Session (ilk kullanımda oluşturulur)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    # Yeniden denemeler bu sınıfta yapılır; adapter tekrar denememeli
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({
+                        "Authorization": f"Bearer {self.token}",
+                        "Content-Type": "application/json"
+                    })
+                    self._session = session
+        return self._session
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Jitter'lı üstel bekleme süresi (full jitter); Retry-After varsa o kullanılır"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def execute(self, query: str, variables: Optional[dict] = None, remember: bool = True) -> dict:
+        """
+        GraphQL sorgusunu çalıştırır
+
+        Args:
+            query: GraphQL sorgu metni
+            variables: Sorgu değişkenleri (opsiyonel)
+            remember: Başarılı yanıt son başarılı yanıt olarak kaydedilsin mi
+                (sayfalı çekimde tek tek sayfalar yerine birleşik sonuç kaydedilir)
+
+        Returns:
+            dict: API'nin JSON yanıtı (GraphQL "errors" alanı içerebilir)
+
+        Raises:
+            CircuitOpenError: Devre açıkken
+            DeepSourceAPIError: Yeniden denemeler tükendiğinde veya kalıcı HTTP hatasında
+        """
+        import requests
+
+        admission = self.breaker.admit()
+        if admission is None:
+            raise CircuitOpenError(
+                f"DeepSource API devre kesici açık ({self.breaker.consecutive_failures} ardışık hata)"
+            )
+
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        settled = False
+        try:
+            last_error = None
+            for attempt in range(self.max_retries + 1):
+                retry_after = None
+                throttled = False
+                # Kota: token yoksa hata yerine sırada beklenir
+                rate_limiter.acquire("deepsource", self.token)
+                try:
+                    self.requests_sent += 1
+                    response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    last_error = f"DeepSource API request failed: {e}"
+                else:
+                    if response.status_code == 200:
+                        try:
+                            data = response.json()
+                        except ValueError as e:
+                            last_error = f"DeepSource API returned invalid JSON: {e}"
+                        else:
+                            self.breaker.record_success()
+                            settled = True
+                            if remember and "errors" not in data:
+                                self.save_last_good(query, variables, data)
+                            return data
+                    elif response.status_code in RETRYABLE_STATUS_CODES:
+                        last_error = f"DeepSource API error: {response.status_code} - {response.text[:500]}"
+                        retry_after = response.headers.get("Retry-After")
+                        throttled = response.status_code == 429
+                    else:
+                        # 4xx (yetki, geçersiz sorgu vb.) kalıcıdır: tekrar denenmez.
+                        # API ayakta olduğu için başarı sayılır (half_open deneme kapanır)
+                        self.breaker.record_success()
+                        settled = True
+                        raise DeepSourceAPIError(
+                            f"DeepSource API error: {response.status_code} - {response.text[:500]}"
+                        )
+
+                if attempt < self.max_retries:
+                    self.retries += 1
+                    delay = self._backoff_delay(attempt, retry_after)
+                    if throttled and rate_limiter.enabled:
+                        # Bekleme bucket üzerinden yapılır: bir sonraki acquire bu süre
+                        # kadar bekler, aynı token'ı kullanan diğer çağrılar da durur
+                        self.throttled += 1
+                        rate_limiter.defer("deepsource", self.token, delay)
+                    else:
+                        time.sleep(delay)
+
+            self.breaker.record_failure()
+            settled = True
+            raise DeepSourceAPIError(last_error or "DeepSource API request failed")
+        finally:
+            # Hız sınırı zaman aşımı vb. ile yarıda kalan deneme çağrısı devreyi
+            # kilitlememeli: bir sonraki çağrı yeniden deneme yapabilir
+            if admission == "trial" and not settled:
+                self.breaker.release_trial()
+
+    # ============================================
+    # SON BAŞARILI YANIT
+    # ============================================
+
+    def _last_good_path(self, query: str, variables: Optional[dict]) -> Path:
+        key_material = json.dumps(
+            {"api_url": self.api_url, "query": query, "variables": variables or {}},
+            sort_keys=True
+        )
+        return self.last_good_dir / f"{hashlib.sha256(key_material.encode('utf-8')).hexdigest()}.json"
+
+    def save_last_good(self, query: str, variables: Optional[dict], data: dict):
+        """
+        Yanıtı, sorgu (ve değişkenler) için son başarılı yanıt olarak kaydeder
+
+        Args:
+            query: Sorgu metni veya birleşik sonuçlar için sabit bir anahtar
+            variables: Sorgu değişkenleri
+            data: Kaydedilecek yanıt
+        """
+        path = self._last_good_path(query, variables)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"saved_at": time.time(), "data": data}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"WARNING: DeepSource son başarılı yanıtı kaydedilemedi: {e}")
+
+    def last_good(self, query: str, variables: Optional[dict] = None) -> Optional[dict]:
+        """
+        Aynı sorgu için en son başarılı yanıtı döner
+
+        Returns:
+            dict: API yanıtı veya kayıt yoksa None
+        """
+        try:
+            with open(self._last_good_path(query, variables), "r", encoding="utf-8") as f:
+                return json.load(f)["data"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, OSError):
+            return None
+
+    def stats(self) -> dict:
+        """İstemci ve devre kesici durumu"""
+        return {
+            "api_url": self.api_url,
+            "breaker_state": self.breaker.state,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "requests_sent": self.requests_sent,
+            "retries": self.retries,
+            "throttled": self.throttled
+        }
+
+
+# ============================================
+# PAYLAŞILAN İSTEMCİLER
+# ============================================
+
+_clients: Dict[tuple, DeepSourceClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_url: str, token: str) -> DeepSourceClient:
+    """
+    API URL'si ve token başına tek bir paylaşılan istemci döner
+
+    Args:
+        api_url: GraphQL endpoint'i
+        token: API token
+
+    Returns:
+        DeepSourceClient
+    """
+    # Token bellekte anahtar olarak tutulmaz, yalnızca özeti kullanılır
+    key = (api_url, hashlib.sha256(token.encode("utf-8")).hexdigest())
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = DeepSourceClient(api_url, token)
+            _clients[key] = client
+        return client
+
+
+def clients_status() -> list:
+    """Oluşturulmuş istemcilerin durumunu döner"""
+    with _clients_lock:
+        return [client.stats() for client in _clients.values()]
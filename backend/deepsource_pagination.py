@@ -0,0 +1,477 @@
+"""
+DeepSource Issue Sayfalama Modülü
+
+Bu modül, DeepSource repository issue'larını ilk 100 ile sınırlı kalmadan,
+sayfa sayfa çeker. Her sayfa geldiği anda normalize edilir:
+- Severity sayaçları DeepSourceMetrics eşlemesiyle güncellenir
+- Issue'lar advanced metrics için Issue kaydı olarak tutulur
+- persist=True ise issue'lar (shortcode, title, severity, category) nesne
+  deposuna akış halinde yazılır
+- Sayfa yanıtının kendisi hemen bırakılır
+
+Böylece bellekte tüm sayfaların ham yanıtları ve birleşik yanıt birikmez;
+bellekte en fazla eşzamanlı çekilen sayfalar ve issue başına küçük bir kayıt tutulur.
+
+Çekim stratejisi:
+1. İlk sayfa cursor ile çekilir; totalCount ve pageInfo öğrenilir
+2. Kalan sayfalar offset ile DEEPSOURCE_PAGE_CONCURRENCY kadar paralel
+   çekilir ve sırayla işlenir
+3. API offset'i kabul etmezse (GraphQL hatası) kalan sayfalar
+   pageInfo.endCursor ile sırayla çekilir
+
+Toplu çekim (fetch_issues_batch): Birden fazla projenin hedef repository'leri
+tek bir alias'lı GraphQL isteğinde (t0: repository(...), t1: ...) sorgulanır
+ve yanıt hedeflere ayrılır; aynı repository'yi hedefleyen projeler tek
+alias'ı paylaşır. Aynı istekte her repository'nin son analizi de
+(analysisRuns(first: 1)) alınır; tarama önbelleği anahtarı için ayrı istek
+gerekmez (accumulator.analysis_state).
+
+Kullanım:
+    from deepsource_pagination import fetch_repository_issues
+    accumulator = fetch_repository_issues(client, "owner", "repo", "GITHUB", persist=True)
+    accumulator.metric_result()   # MetricResult
+    accumulator.issues            # List[Issue]
+    accumulator.digest            # Birleşik yanıtın nesne deposundaki hash'i
+
+Environment Variables:
+    DEEPSOURCE_PAGE_SIZE: Sayfa başına issue sayısı (default: 100)
+    DEEPSOURCE_PAGE_CONCURRENCY: Paralel çekilen en fazla sayfa sayısı (default: 4)
+    DEEPSOURCE_MAX_PAGES: En fazla sayfa sayısı, sonsuz döngüye karşı (default: 1000)
+    DEEPSOURCE_BATCH_SIZE: Toplu sorguda tek istekteki en fazla repository (default: 10)
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from metrics.deepsource_metrics import DeepSourceMetrics
+from metrics.issue_extractors import DEFAULT_FILE
+from metrics.issue_model import Issue
+from object_store import ObjectWriter, object_store
+from result_io import OBJECT_REF_KEY, OBJECT_REF_PREFIX
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+DEEPSOURCE_PAGE_SIZE = int(os.getenv("DEEPSOURCE_PAGE_SIZE", "100"))
+DEEPSOURCE_PAGE_CONCURRENCY = int(os.getenv("DEEPSOURCE_PAGE_CONCURRENCY", "4"))
+DEEPSOURCE_MAX_PAGES = int(os.getenv("DEEPSOURCE_MAX_PAGES", "1000"))
+DEEPSOURCE_BATCH_SIZE = int(os.getenv("DEEPSOURCE_BATCH_SIZE", "10"))
+
+# Saklanan issue alanları (sorguda istenenlerle aynı)
+ISSUE_FIELDS = ("shortcode", "title", "severity", "category")
+
+# Son analizin seçimi (tarama önbelleği anahtarı için)
+ANALYSIS_RUN_SELECTION = """
+            analysisRuns(first: 1) {
+                edges { node { runUid commitOid status } }
+            }"""
+
+
+def _dumps(value) -> str:
+    """object_digest() ile aynı minified biçim"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class PaginationError(RuntimeError):
+    """Sayfa yanıtı beklenen formatta değilse veya GraphQL hatası içeriyorsa"""
+
+    def __init__(self, message: str, response: Optional[dict] = None):
+        super().__init__(message)
+        self.response = response
+
+
+def build_issues_query(
+    owner: str,
+    name: str,
+    vcs_provider: str,
+    first: int,
+    after: Optional[str] = None,
+    offset: Optional[int] = None
+) -> str:
+    """
+    Tek bir issue sayfası için GraphQL sorgusu oluşturur
+
+    Args:
+        owner: Repository sahibi (login)
+        name: Repository adı
+        vcs_provider: GITHUB, GITLAB, BITBUCKET
+        first: Sayfa boyutu
+        after: Önceki sayfanın endCursor değeri (cursor modu)
+        offset: Atlanacak issue sayısı (offset modu)
+
+    Returns:
+        str: GraphQL sorgu metni
+    """
+    return "query {%s}" % _repository_selection(owner, name, vcs_provider, first, after=after, offset=offset)
+
+
+def build_batch_issues_query(targets: List[Tuple[str, str, str]], first: int) -> str:
+    """
+    Birden fazla repository'nin ilk issue sayfası için tek bir alias'lı sorgu oluşturur
+
+    Yanıtta her hedef "t<index>" alias'ı altında, son analiziyle
+    (analysisRuns(first: 1)) birlikte döner.
+
+    Args:
+        targets: (owner, name, vcs_provider) listesi
+        first: Sayfa boyutu
+
+    Returns:
+        str: GraphQL sorgu metni
+    """
+    selections = "".join(
+        _repository_selection(owner, name, vcs_provider, first, alias=f"t{index}", analysis_run=True)
+        for index, (owner, name, vcs_provider) in enumerate(targets)
+    )
+    return "query {%s}" % selections
+
+
+def _repository_selection(
+    owner: str,
+    name: str,
+    vcs_provider: str,
+    first: int,
+    after: Optional[str] = None,
+    offset: Optional[int] = None,
+    alias: Optional[str] = None,
+    analysis_run: bool = False
+) -> str:
+    """Tek bir repository issue sayfasının GraphQL seçimini oluşturur (istenirse son analizle)"""
+    page_args = f"first: {first}"
+    if after is not None:
+        page_args += f", after: {json.dumps(after)}"
+    if offset is not None:
+        page_args += f", offset: {offset}"
+
+    return """
+        %srepository(login: %s, name: %s, vcsProvider: %s) {
+            name%s
+            issues(%s) {
+                totalCount
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                edges {
+                    node {
+                        issue {
+                            shortcode
+                            title
+                            severity
+                            category
+                        }
+                    }
+                }
+            }
+        }
+    """ % (
+        f"{alias}: " if alias else "",
+        json.dumps(owner),
+        json.dumps(name),
+        vcs_provider,
+        ANALYSIS_RUN_SELECTION if analysis_run else "",
+        page_args
+    )
+
+
+def parse_analysis_state(repository: Optional[dict]) -> Optional[str]:
+    """
+    Repository yanıtındaki son analizin kimliğini döner
+
+    Args:
+        repository: analysisRuns(first: 1) içeren repository düğümü
+
+    Returns:
+        str: "<commit oid>:<run uid>:<durum>" veya analiz yoksa None
+    """
+    try:
+        node = repository["analysisRuns"]["edges"][0]["node"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    if not node.get("runUid"):
+        return None
+    return f"{node.get('commitOid')}:{node['runUid']}:{node.get('status')}"
+
+
+def _issues_connection(response: dict) -> dict:
+    """Sayfa yanıtından issues bağlantısını döner, hata varsa PaginationError fırlatır"""
+    if "errors" in response:
+        raise PaginationError(f"DeepSource GraphQL error: {response['errors']}", response)
+    try:
+        return response["data"]["repository"]["issues"]
+    except (KeyError, TypeError):
+        raise PaginationError("DeepSource yanıtında repository.issues bulunamadı", response)
+
+
+class IssuePageAccumulator:
+    """
+    Sayfaları geldikçe sayaçlara ve issue listesine işler
+
+    persist=True ise her sayfanın issue'ları geldiği anda nesne deposuna
+    (GraphQL yanıt formatında, minified) akış halinde yazılır; birleşik
+    yanıt hiçbir zaman bellekte dict olarak oluşturulmaz. Nesne
+    object_digest(<birleşik yanıt>) ile aynı baytlardan oluşur.
+    """
+
+    def __init__(self, persist: bool = False):
+        self.repository_name: Optional[str] = None
+        self.total_count = 0
+        self.counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        self.issues: List[Issue] = []
+        self.pages = 0
+        self.end_cursor: Optional[str] = None
+        self.has_next_page = False
+        self.truncated = False
+        self.digest: Optional[str] = None
+        # Toplu çekimde aynı istekte alınan son analiz kimliği (parse_analysis_state)
+        self.analysis_state: Optional[str] = None
+        self.persist = persist
+        self._writer: Optional[ObjectWriter] = None
+
+    def add_page(self, response: dict):
+        """
+        Bir sayfa yanıtını işler (yanıt daha sonra tutulmaz)
+
+        Args:
+            response: Tek bir sayfanın GraphQL yanıtı
+        """
+        connection = _issues_connection(response)
+        if self.pages == 0:
+            self.repository_name = response["data"]["repository"].get("name")
+            self.total_count = connection.get("totalCount", self.total_count)
+            if self.persist:
+                # Başlık ilk sayfadaki ad ve totalCount ile yazılır
+                self._writer = object_store.writer()
+                self._writer.write(
+                    ('{"data":{"repository":{"name":%s,"issues":{"totalCount":%s,"edges":['
+                     % (_dumps(self.repository_name), _dumps(self.total_count))).encode("utf-8")
+                )
+        page_info = connection.get("pageInfo") or {}
+        self.has_next_page = bool(page_info.get("hasNextPage"))
+        self.end_cursor = page_info.get("endCursor")
+
+        edges = []
+        for edge in connection.get("edges", []):
+            issue = (edge.get("node") or {}).get("issue")
+            if issue is None:
+                continue
+            compact_issue = {field: issue.get(field) for field in ISSUE_FIELDS}
+            self.counts[DeepSourceMetrics.severity_bucket(compact_issue["severity"])] += 1
+            # extract_deepsource_issues ile aynı Issue (API dosya/satır vermez)
+            self.issues.append(Issue(
+                DEFAULT_FILE, -1, compact_issue["shortcode"], compact_issue["severity"], compact_issue["title"]
+            ))
+            if self._writer is not None:
+                edges.append(_dumps({"node": {"issue": compact_issue}}))
+        if edges:
+            prefix = "," if len(self.issues) > len(edges) else ""
+            self._writer.write((prefix + ",".join(edges)).encode("utf-8"))
+        self.pages += 1
+
+    def commit(self) -> Optional[str]:
+        """
+        Nesneyi tamamlar ve içerik hash'ini döner (persist=False ise None)
+        """
+        if self._writer is not None:
+            self._writer.write(b"]}}}}")
+            self.digest = self._writer.commit()
+            self._writer = None
+        return self.digest
+
+    def abort(self):
+        """Yarım kalan nesneyi siler (çekim hatasında)"""
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
+
+    def metric_result(self):
+        """Sayaçlardan MetricResult oluşturur"""
+        return DeepSourceMetrics.result_from_counts(self.counts, len(self.issues))
+
+    def skeleton(self) -> dict:
+        """edges'i boş bırakılmış küçük yanıt (coverage gibi issue dışı alanlar için)"""
+        return {
+            "data": {
+                "repository": {
+                    "name": self.repository_name,
+                    "issues": {"totalCount": self.total_count, "edges": []}
+                }
+            }
+        }
+
+    def reference(self) -> dict:
+        """Önbellek ve son başarılı yanıt kayıtlarında tam çıktının yerine tutulan referans"""
+        return {OBJECT_REF_KEY: OBJECT_REF_PREFIX + self.digest}
+
+
+def fetch_repository_issues(
+    client,
+    owner: str,
+    name: str,
+    vcs_provider: str,
+    page_size: int = DEEPSOURCE_PAGE_SIZE,
+    concurrency: int = DEEPSOURCE_PAGE_CONCURRENCY,
+    max_pages: int = DEEPSOURCE_MAX_PAGES,
+    persist: bool = False
+) -> IssuePageAccumulator:
+    """
+    Repository'nin tüm issue'larını sayfa sayfa çeker
+
+    Args:
+        client: DeepSourceClient
+        owner: Repository sahibi
+        name: Repository adı
+        vcs_provider: GITHUB, GITLAB, BITBUCKET
+        page_size: Sayfa boyutu
+        concurrency: Paralel çekilen en fazla sayfa sayısı (1 ise yalnızca cursor modu)
+        max_pages: En fazla sayfa sayısı
+        persist: Issue'lar geldikçe nesne deposuna yazılsın mı (accumulator.digest)
+
+    Returns:
+        IssuePageAccumulator
+
+    Raises:
+        PaginationError: İlk sayfa GraphQL hatası içeriyorsa (response alanında yanıt bulunur)
+        DeepSourceAPIError: HTTP seviyesinde hata
+    """
+    accumulator = IssuePageAccumulator(persist=persist)
+    try:
+        accumulator.add_page(client.execute(build_issues_query(owner, name, vcs_provider, page_size), remember=False))
+        fetch_remaining_pages(client, accumulator, owner, name, vcs_provider, page_size, concurrency, max_pages)
+        accumulator.commit()
+    except BaseException:
+        accumulator.abort()
+        raise
+    return accumulator
+
+
+def fetch_remaining_pages(
+    client,
+    accumulator: IssuePageAccumulator,
+    owner: str,
+    name: str,
+    vcs_provider: str,
+    page_size: int = DEEPSOURCE_PAGE_SIZE,
+    concurrency: int = DEEPSOURCE_PAGE_CONCURRENCY,
+    max_pages: int = DEEPSOURCE_MAX_PAGES
+):
+    """
+    İlk sayfası işlenmiş bir accumulator için kalan sayfaları çeker
+
+    Args:
+        client: DeepSourceClient
+        accumulator: İlk sayfası eklenmiş IssuePageAccumulator
+        owner, name, vcs_provider: Repository hedefi
+        page_size: Sayfa boyutu (ilk sayfayla aynı olmalı)
+        concurrency: Paralel çekilen en fazla sayfa sayısı
+        max_pages: En fazla sayfa sayısı
+
+    Sayfa sınırına takılınca has_next_page True kalır ve accumulator.truncated
+    işaretlenir.
+    """
+    # Offset modu: kalan sayfalar sınırlı paralellikle çekilir, sırayla işlenir
+    if accumulator.has_next_page and concurrency > 1:
+        needed_pages = -(-accumulator.total_count // page_size)
+        page_count = min(needed_pages, max_pages)
+        offsets = deque(page * page_size for page in range(1, page_count))
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="deepsource-page") as executor:
+            pending = deque()
+            try:
+                while offsets or pending:
+                    # Pencereyi doldur: en fazla concurrency sayfa aynı anda bellekte/uçuşta
+                    while offsets and len(pending) < concurrency:
+                        offset = offsets.popleft()
+                        pending.append(executor.submit(
+                            client.execute,
+                            build_issues_query(owner, name, vcs_provider, page_size, offset=offset),
+                            remember=False
+                        ))
+                    accumulator.add_page(pending.popleft().result())
+            except PaginationError:
+                # Offset desteklenmiyor: kalan istekleri iptal et, cursor moduna geç
+                for future in pending:
+                    future.cancel()
+                accumulator.has_next_page = accumulator.end_cursor is not None and len(accumulator.issues) < accumulator.total_count
+            else:
+                # max_pages sınırına takıldıysa kalan sayfalar var demektir
+                accumulator.has_next_page = page_count < needed_pages
+
+    # Cursor modu: pageInfo.endCursor ile sırayla
+    while accumulator.has_next_page and accumulator.end_cursor and accumulator.pages < max_pages:
+        accumulator.add_page(client.execute(
+            build_issues_query(owner, name, vcs_provider, page_size, after=accumulator.end_cursor),
+            remember=False
+        ))
+
+    if accumulator.has_next_page:
+        # Sonuç eksik: sessizce tamamlanmış gibi raporlanmaz
+        accumulator.truncated = True
+        print(
+            f"WARNING: DeepSource issue'ları DEEPSOURCE_MAX_PAGES={max_pages} sınırında kesildi "
+            f"({len(accumulator.issues)}/{accumulator.total_count} issue çekildi)"
+        )
+
+
+def fetch_issues_batch(
+    client,
+    targets: List[Tuple[str, str, str]],
+    page_size: int = DEEPSOURCE_PAGE_SIZE,
+    batch_size: int = DEEPSOURCE_BATCH_SIZE,
+    concurrency: int = DEEPSOURCE_PAGE_CONCURRENCY,
+    max_pages: int = DEEPSOURCE_MAX_PAGES,
+    persist: bool = False
+) -> Dict[Tuple[str, str, str], IssuePageAccumulator]:
+    """
+    Birden fazla repository'nin issue'larını alias'lı toplu sorgularla çeker
+
+    Aynı hedef birden fazla kez verilirse yalnızca bir kez sorgulanır. İlk
+    sayfalar batch_size'lık gruplar halinde tek istekte alınır; birden fazla
+    sayfası olan hedeflerin kalan sayfaları ayrıca çekilir.
+
+    Args:
+        client: DeepSourceClient
+        targets: (owner, name, vcs_provider) listesi
+        page_size: Sayfa boyutu
+        batch_size: Tek istekteki en fazla alias sayısı
+        concurrency: Hedef başına paralel sayfa sayısı
+        max_pages: Hedef başına en fazla sayfa sayısı
+        persist: Issue'lar geldikçe nesne deposuna yazılsın mı
+
+    Returns:
+        dict: {hedef: IssuePageAccumulator}; son analiz kimliği
+        accumulator.analysis_state'tedir. Yanıtta hata dönen hedefler
+        sonuçta yer almaz (çağıran taraf tekil çekime dönebilir).
+
+    Raises:
+        DeepSourceAPIError: HTTP seviyesinde hata
+    """
+    unique_targets = list(dict.fromkeys(targets))
+    results = {}
+    for batch_start in range(0, len(unique_targets), max(batch_size, 1)):
+        batch = unique_targets[batch_start:batch_start + max(batch_size, 1)]
+        response = client.execute(build_batch_issues_query(batch, page_size), remember=False)
+        data = response.get("data") or {}
+
+        # Yanıtı alias'lara göre hedeflere ayır (demultiplex)
+        for index, target in enumerate(batch):
+            repository = data.get(f"t{index}")
+            if repository is None:
+                continue
+            accumulator = IssuePageAccumulator(persist=persist)
+            accumulator.analysis_state = parse_analysis_state(repository)
+            try:
+                accumulator.add_page({"data": {"repository": repository}})
+                fetch_remaining_pages(client, accumulator, *target, page_size, concurrency, max_pages)
+                accumulator.commit()
+            except PaginationError:
+                accumulator.abort()
+                continue
+            except BaseException:
+                accumulator.abort()
+                raise
+            results[target] = accumulator
+    return results
@@ -30,16 +30,48 @@ Environment Variables:
     DEEPSOURCE_REPO_OWNER: GitHub repository owner (default: zeliha-orhan)
     DEEPSOURCE_REPO_NAME: Repository name (default: SmartTestAI)
     DEEPSOURCE_VCS_PROVIDER: VCS provider (default: GITHUB)
+    DEEPSOURCE_PROJECT_REPOS: Proje başına repository eşlemesi, JSON (opsiyonel)
+        örn: {"flask_demo": "GITHUB/owner/flask-demo", "nodejs-goof": "owner/goof"}
+    DEEPSOURCE_PREFETCH_TTL: Toplu ön-çekim sonuçlarının geçerlilik süresi, saniye (default: 300)
+    DEEPSOURCE_ANALYSIS_STATE_TTL: Tekil sorguyla alınan son analiz kimliğinin tutulma
+        süresi, saniye (default: 30)
 """
 
 import json
 import subprocess
 import os
-import requests
+import shutil
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from metrics.deepsource_metrics import DeepSourceMetrics
 from metrics.advanced_metrics import AdvancedMetricsCalculator
+from scan_cache import scan_cache
+from tool_registry import tool_registry
+from deepsource_pagination import IssuePageAccumulator, parse_analysis_state
+from single_flight import SingleFlight, scan_flights
+from tree_hash import compute_tree_hash
+from result_io import write_json
+from object_store import (
+    ObjectNotFoundError,
+    object_store,
+    parse_reference,
+    resource_delta,
+    resource_snapshot,
+    write_scan_record,
+)
+from results_store import results_store, KIND_SCAN, KIND_ADVANCED_METRICS
+from scan_progress import (
+    emit_stage,
+    STAGE_PROJECT_RESOLVED,
+    STAGE_SCANNER_STARTED,
+    STAGE_COALESCED,
+    STAGE_OUTPUT_RECEIVED,
+    STAGE_PARSED,
+    STAGE_GROUND_TRUTH_MATCHED,
+    STAGE_RESULTS_SAVED,
+)
 
 # Ground truth dosyasının yolu
 GROUND_TRUTH_FILE = "../test_projects/ground_truth.json"
@@ -71,55 +103,16 @@ def load_ground_truth(project_name: str) -> list:
 RESULTS_DIR = "../results"
 
 
-def extract_issues_from_deepsource_result(raw_data: dict) -> list:
-    """
-    DeepSource GraphQL formatından veya mock formatından issue'ları çıkarır
-    
-    Args:
-        raw_data: DeepSource'tan gelen ham JSON çıktısı (GraphQL veya mock format)
-    
-    Returns:
-        list: Issue listesi (dict formatında)
-    """
-    issues = []
-    
-    # GraphQL formatı (gerçek API)
-    if "data" in raw_data and "repository" in raw_data["data"]:
-        repo_data = raw_data["data"]["repository"]
-        if "issues" in repo_data and "edges" in repo_data["issues"]:
-            for edge in repo_data["issues"]["edges"]:
-                if "node" in edge and "issue" in edge["node"]:
-                    issue = edge["node"]["issue"]
-                    issues.append({
-                        "file": "unknown",  # DeepSource API'sinde dosya bilgisi yok
-                        "line": -1,
-                        "type": issue.get("shortcode", ""),
-                        "severity": issue.get("severity", ""),
-                        "description": issue.get("title", "")
-                    })
-    
-    # Mock format (test için)
-    elif "issues" in raw_data:
-        for issue in raw_data["issues"]:
-            issues.append({
-                "file": issue.get("file", "unknown"),
-                "line": issue.get("line", -1),
-                "type": issue.get("issue_code", ""),
-                "severity": issue.get("severity", "").upper(),  # MAJOR, MINOR, etc.
-                "description": issue.get("message", "")
-            })
-    
-    return issues
-
 def save_advanced_metrics_result(
     tool_name: str,
     project_name: str,
     basic_result,
     advanced_result,
-    ground_truth: list = None
+    ground_truth: list = None,
+    tree_hash: str = None
 ) -> str:
     """
-    Gelişmiş metrik sonuçlarını results/ klasörüne kaydeder
+    Gelişmiş metrik sonuçlarını results/ klasörüne ve sonuç deposuna kaydeder
     
     Args:
         tool_name: Araç adı ("deepsource")
@@ -127,6 +120,7 @@ def save_advanced_metrics_result(
         basic_result: Temel metrik sonucu (MetricResult)
         advanced_result: Gelişmiş metrik sonucu (AdvancedMetricResult)
         ground_truth: Ground truth listesi (opsiyonel)
+        tree_hash: Taranan içeriğin tree hash'i (opsiyonel)
     
     Returns:
         str: Kaydedilen dosyanın yolu
@@ -177,9 +171,16 @@ def save_advanced_metrics_result(
         "ground_truth_count": len(ground_truth) if ground_truth else 0
     }
     
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(result_dict, f, indent=2, ensure_ascii=False)
+    file_path = write_json(file_path, result_dict)
     
+    results_store.safe_add(
+        KIND_ADVANCED_METRICS,
+        result_dict,
+        tool=tool_name,
+        project=project_name,
+        tree_hash=tree_hash,
+        file_path=str(file_path)
+    )
     return str(file_path)
 
 def _get_mock_deepsource_output(target_path: str) -> dict:
@@ -237,14 +238,203 @@ DEEPSOURCE_REPO_OWNER = os.getenv("DEEPSOURCE_REPO_OWNER", "zeliha-orhan")
 DEEPSOURCE_REPO_NAME = os.getenv("DEEPSOURCE_REPO_NAME", "SmartTestAI")
 DEEPSOURCE_VCS_PROVIDER = os.getenv("DEEPSOURCE_VCS_PROVIDER", "GITHUB")  # GITHUB, GITLAB, BITBUCKET
 
-# Debug: Environment variable'ları kontrol et
-if not DEEPSOURCE_API_TOKEN:
-    print("WARNING: DEEPSOURCE_API_TOKEN environment variable bulunamadi!")
-else:
-    print(f"INFO: DeepSource API token bulundu (ilk 10 karakter: {DEEPSOURCE_API_TOKEN[:10]}...)")
-print(f"INFO: Repository: {DEEPSOURCE_REPO_OWNER}/{DEEPSOURCE_REPO_NAME}")
+# Proje başına repository eşlemesi (verilmeyen projeler yukarıdaki repository'yi kullanır)
+DEEPSOURCE_PROJECT_REPOS = os.getenv("DEEPSOURCE_PROJECT_REPOS", "")
+
+# Toplu ön-çekim (prefetch) sonuçlarının geçerlilik süresi
+DEEPSOURCE_PREFETCH_TTL = float(os.getenv("DEEPSOURCE_PREFETCH_TTL", "300"))
+
+# Tekil sorguyla alınan son analiz kimliğinin tutulma süresi (aynı taramadaki
+# projeler aynı repository için tekrar sormaz)
+DEEPSOURCE_ANALYSIS_STATE_TTL = float(os.getenv("DEEPSOURCE_ANALYSIS_STATE_TTL", "30"))
+
+# Önbellek anahtarında tarayıcı kimliği olarak kullanılır
+# (CLI yolu veya API endpoint'i değişirse eski sonuçlar kullanılmaz)
+DEEPSOURCE_TOOL_ID = f"cli:{DEEPSOURCE_CLI_PATH}|api:{DEEPSOURCE_API_URL}"
+
+def find_deepsource_cli():
+    """
+    DeepSource CLI'nin yolunu bulur (tool_registry ilk kullanımda çağırır)
+    
+    Returns:
+        str: DeepSource CLI yolu veya kurulu değilse None
+    """
+    if Path(DEEPSOURCE_CLI_PATH).exists():
+        return DEEPSOURCE_CLI_PATH
+    return shutil.which(DEEPSOURCE_CLI_PATH)
+
+tool_registry.register("deepsource", find_deepsource_cli, version_args=("version",))
+
+def resolve_deepsource_repository(project_name: str = None) -> tuple:
+    """
+    Projenin DeepSource'ta hangi repository'ye karşılık geldiğini döner
+    
+    Args:
+        project_name: Proje adı (DEEPSOURCE_PROJECT_REPOS'ta yoksa varsayılan repository)
+    
+    Returns:
+        tuple: (owner, name, vcs_provider)
+    """
+    default = (DEEPSOURCE_REPO_OWNER, DEEPSOURCE_REPO_NAME, DEEPSOURCE_VCS_PROVIDER)
+    if not project_name or not DEEPSOURCE_PROJECT_REPOS:
+        return default
+    try:
+        spec = json.loads(DEEPSOURCE_PROJECT_REPOS).get(project_name)
+    except (json.JSONDecodeError, AttributeError):
+        print("WARNING: DEEPSOURCE_PROJECT_REPOS geçerli bir JSON nesnesi değil, yok sayılıyor")
+        return default
+    if not spec:
+        return default
+    
+    parts = spec.strip("/").split("/")
+    if len(parts) == 3:
+        return (parts[1], parts[2], parts[0].upper())
+    if len(parts) == 2:
+        return (parts[0], parts[1], DEEPSOURCE_VCS_PROVIDER)
+    print(f"WARNING: Geçersiz DeepSource repository eşlemesi ({project_name}): {spec}")
+    return default
+
+def _repository_key(repository: tuple) -> str:
+    """Repository hedefinin "VCS/owner/name" gösterimi (önbellek ve son başarılı yanıt anahtarı)"""
+    owner, name, vcs_provider = repository
+    return f"{vcs_provider}/{owner}/{name}"
+
+# ============================================
+# TOPLU ÖN-ÇEKİM (BATCH PREFETCH)
+# ============================================
+# Çoklu proje taramalarında (/scan/deepsource/all) her proje için ayrı API
+# çağrısı yerine tüm hedefler tek bir alias'lı GraphQL isteğinde çekilir.
+# Sonuçlar {repository: (accumulator, zaman)} olarak kısa süre tutulur ve
+# proje taramaları API yerine buradan beslenir. Aynı istekte alınan son analiz
+# kimlikleri {repository: (durum, geçerlilik sonu)} önbellek anahtarında kullanılır.
+_prefetched_issues = {}
+_analysis_states = {}
+_prefetched_lock = threading.Lock()
+_analysis_state_flights = SingleFlight()
+
+def prefetch_deepsource_issues(project_names: list) -> int:
+    """
+    Projelerin repository issue'larını tek (alias'lı) istekte önceden çeker
+    
+    Aynı repository'yi hedefleyen projeler tek alias'ı paylaşır. CLI kuruluysa
+    veya API token yoksa hiçbir şey yapılmaz (taramalar API kullanmaz).
+    
+    Args:
+        project_names: Taranacak projeler
+    
+    Returns:
+        int: Ön-çekimi yapılan repository sayısı
+    """
+    if not DEEPSOURCE_API_TOKEN or tool_registry.resolve("deepsource")["path"]:
+        return 0
+    
+    from deepsource_client import get_client, DeepSourceAPIError
+    from deepsource_pagination import fetch_issues_batch
+    client = get_client(DEEPSOURCE_API_URL, DEEPSOURCE_API_TOKEN)
+    
+    targets = [resolve_deepsource_repository(project_name) for project_name in project_names]
+    try:
+        accumulators = fetch_issues_batch(client, targets, persist=True)
+    except DeepSourceAPIError as e:
+        # Ön-çekim başarısızsa projeler tek tek (yeniden deneme ve devre kesiciyle) çekilir
+        print(f"WARNING: DeepSource toplu sorgusu başarısız: {e}")
+        return 0
+    
+    fetched_at = time.time()
+    with _prefetched_lock:
+        for repository, accumulator in accumulators.items():
+            _prefetched_issues[repository] = (accumulator, fetched_at)
+            if accumulator.analysis_state is not None:
+                _analysis_states[repository] = (accumulator.analysis_state, fetched_at + DEEPSOURCE_PREFETCH_TTL)
+            client.save_last_good(f"issues:{_repository_key(repository)}", None, accumulator.reference())
+    return len(accumulators)
+
+def _get_prefetched_issues(repository: tuple):
+    """Geçerli bir ön-çekim sonucu varsa döner, süresi dolanı siler"""
+    with _prefetched_lock:
+        entry = _prefetched_issues.get(repository)
+        if entry is None:
+            return None
+        accumulator, fetched_at = entry
+        if time.time() - fetched_at > DEEPSOURCE_PREFETCH_TTL:
+            del _prefetched_issues[repository]
+            return None
+        return accumulator
+
+def _is_accumulator(raw_output) -> bool:
+    """Ham çıktı sayfalı API çekiminin sonucu mu"""
+    return isinstance(raw_output, IssuePageAccumulator)
+
+def _resolve_output(raw_output):
+    """
+    Önbellek / son başarılı yanıt değerini ham çıktıya çevirir
+
+    Sayfalı API sonuçları bu kayıtlarda nesne referansı olarak tutulur.
+    Nesne çöp toplama ile silinmişse None döner.
+    """
+    digest = parse_reference(raw_output)
+    if digest is None:
+        return raw_output
+    try:
+        return object_store.get(digest)
+    except ObjectNotFoundError:
+        return None
+
+def _uses_api() -> bool:
+    """Tarama API ile mi yapılacak (CLI kurulu değil ve token var)"""
+    return bool(DEEPSOURCE_API_TOKEN) and not tool_registry.resolve("deepsource")["path"]
+
+def _remote_analysis_state(repository: tuple):
+    """
+    Repository'nin DeepSource'taki son analizinin kimliği (API önbellek anahtarı için)
+
+    API sonuçları yerel proje içeriğine değil DeepSource'taki son analize
+    bağlıdır; yerel tree hash değişmeden yeni bir analiz yapılmış olabilir.
+    Toplu ön-çekim kimliği issue'larla aynı istekte getirir; yoksa repository
+    başına tek istek yapılır (eşzamanlı çağrılar birleşir) ve sonuç
+    DEEPSOURCE_ANALYSIS_STATE_TTL kadar tutulur.
+
+    Args:
+        repository: (owner, name, vcs_provider)
+
+    Returns:
+        str: "<commit oid>:<run uid>:<durum>" veya alınamazsa None
+        (önbellek bu durumda atlanır)
+    """
+    with _prefetched_lock:
+        entry = _analysis_states.get(repository)
+        if entry is not None and time.time() < entry[1]:
+            return entry[0]
+    state, _ = _analysis_state_flights.do(repository, lambda: _fetch_analysis_state(repository))
+    return state
+
+def _fetch_analysis_state(repository: tuple):
+    """Son analiz kimliğini tekil sorguyla çeker ve tutar (alınamazsa None)"""
+    from deepsource_client import get_client, DeepSourceAPIError
+    owner, name, vcs_provider = repository
+    query = """
+        query {
+            repository(login: %s, name: %s, vcsProvider: %s) {
+                analysisRuns(first: 1) {
+                    edges { node { runUid commitOid status } }
+                }
+            }
+        }
+    """ % (json.dumps(owner), json.dumps(name), vcs_provider)
+    try:
+        response = get_client(DEEPSOURCE_API_URL, DEEPSOURCE_API_TOKEN).execute(query, remember=False)
+        if "errors" in response:
+            raise DeepSourceAPIError(f"DeepSource GraphQL error: {response['errors']}")
+        state = parse_analysis_state(response["data"]["repository"])
+    except (DeepSourceAPIError, KeyError, TypeError) as e:
+        print(f"WARNING: DeepSource son analiz bilgisi alınamadı, önbellek atlanıyor: {e}")
+        return None
+    if state is not None:
+        with _prefetched_lock:
+            _analysis_states[repository] = (state, time.time() + DEEPSOURCE_ANALYSIS_STATE_TTL)
+    return state
 
-def run_deepsource_scan(target_path: str) -> dict:
+def _run_deepsource_scan(target_path: str, repository: tuple = None) -> tuple:
     """
     DeepSource taraması yapar ve JSON çıktısı döner.
     
@@ -257,9 +447,14 @@ def run_deepsource_scan(target_path: str) -> dict:
     
     Args:
         target_path: Taranacak proje yolu (CLI için kullanılır, API için kullanılmaz)
+        repository: (owner, name, vcs_provider); verilmezse varsayılan repository
     
     Returns:
-        dict: DeepSource'un JSON çıktısı (GraphQL response formatı)
+        tuple: (DeepSource'un JSON çıktısı veya API yönteminde IssuePageAccumulator,
+        gerçek sonuç mu)
+        API sonucu sayfalar geldikçe işlenir ve nesne deposuna yazılır; birleşik
+        yanıt dict olarak oluşturulmaz. İkinci değer, çıktı CLI veya API'den başarıyla alındıysa True; mock
+        veya hata sonrası üretilen boş sonuçlarda False olur (önbelleğe alınmaz).
     
     Raises:
         RuntimeError: API hatası veya timeout durumunda
@@ -267,10 +462,15 @@ def run_deepsource_scan(target_path: str) -> dict:
     # ============================================
     # YÖNTEM 1: DeepSource CLI kullanımı
     # ============================================
-    # Eğer DeepSource CLI kuruluysa, local path üzerinde analiz yapar
+    # Eğer DeepSource CLI kuruluysa, local path üzerinde analiz yapar.
+    # CLI'nin varlığı tool_registry'den okunur; kurulu değilse her taramada
+    # başarısız bir süreç başlatılmaz.
+    cli_path = tool_registry.resolve("deepsource")["path"]
     try:
+        if not cli_path:
+            raise FileNotFoundError(DEEPSOURCE_CLI_PATH)
         result = subprocess.run(
-            [DEEPSOURCE_CLI_PATH, "analyze", target_path, "--format", "json"],
+            [cli_path, "analyze", target_path, "--format", "json"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -278,11 +478,11 @@ def run_deepsource_scan(target_path: str) -> dict:
         )
         
         if result.returncode == 0 and result.stdout:
-            return json.loads(result.stdout)
+            return json.loads(result.stdout), True
         elif result.stdout:
             # Bazı durumlarda hata olsa bile stdout'ta JSON olabilir
             try:
-                return json.loads(result.stdout)
+                return json.loads(result.stdout), True
             except json.JSONDecodeError:
                 raise RuntimeError(f"DeepSource CLI error: {result.stderr}")
         else:
@@ -298,100 +498,109 @@ def run_deepsource_scan(target_path: str) -> dict:
     # YÖNTEM 2: DeepSource GraphQL API kullanımı
     # ============================================
     # DeepSource repository-based çalışır, bu yüzden GitHub repository bilgisi kullanılır
+    if repository is None:
+        repository = resolve_deepsource_repository()
+    repo_owner, repo_name, vcs_provider = repository
+    
     if DEEPSOURCE_API_TOKEN:
+        # Toplu ön-çekim bu repository'yi zaten getirdiyse API tekrar çağrılmaz
+        prefetched = _get_prefetched_issues(repository)
+        if prefetched is not None:
+            return prefetched, True
+        
+        # Paylaşılan istemci: bağlantı havuzu, jitter'lı yeniden deneme ve devre kesici
+        from deepsource_client import get_client, DeepSourceAPIError
+        from deepsource_pagination import fetch_repository_issues, PaginationError
+        client = get_client(DEEPSOURCE_API_URL, DEEPSOURCE_API_TOKEN)
+        
+        # Birleşik sonucun "son başarılı yanıt" anahtarı (tek tek sayfalar kaydedilmez)
+        last_good_key = f"issues:{_repository_key(repository)}"
+        
         try:
-            # API isteği için header'ları hazırla
-            headers = {
-                "Authorization": f"Bearer {DEEPSOURCE_API_TOKEN}",
-                "Content-Type": "application/json"
-            }
-            
-            # GraphQL query: Repository issues'ları al
-            # first: 100 - İlk 100 issue'yu al (pagination için daha fazla gerekebilir)
-            query = {
-                "query": """
-                query {
-                    repository(login: "%s", name: "%s", vcsProvider: %s) {
-                        name
-                        issues(first: 100) {
-                            totalCount
-                            edges {
-                                node {
-                                    issue {
-                                        shortcode
-                                        title
-                                        severity
-                                        category
-                                    }
-                                }
-                            }
+            # Tüm issue'lar sayfa sayfa çekilir (ilk 100 ile sınırlı değil);
+            # her sayfa geldiği anda sayaçlara ve kompakt issue listesine işlenir
+            accumulator = fetch_repository_issues(client, repo_owner, repo_name, vcs_provider, persist=True)
+        except PaginationError as e:
+            print(f"WARNING: {e}")
+            # GraphQL hatası: mock moda geçmek yerine boş sonuç döndür
+            return {
+                "data": {
+                    "repository": {
+                        "name": repo_name,
+                        "issues": {
+                            "totalCount": 0,
+                            "edges": []
                         }
                     }
                 }
-                """ % (DEEPSOURCE_REPO_OWNER, DEEPSOURCE_REPO_NAME, DEEPSOURCE_VCS_PROVIDER)
-            }
-            
-            # GraphQL API'ye POST isteği gönder
-            response = requests.post(
-                DEEPSOURCE_API_URL,
-                headers=headers,
-                json=query,
-                timeout=300  # 5 dakika timeout
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                # GraphQL hata kontrolü
-                if "errors" in result:
-                    error_msg = f"DeepSource GraphQL error: {result['errors']}"
-                    print(f"WARNING: {error_msg}")
-                    # Hata olsa bile mock moda geçmek yerine boş sonuç döndür
-                    return {
-                        "data": {
-                            "repository": {
-                                "name": DEEPSOURCE_REPO_NAME,
-                                "issues": {
-                                    "totalCount": 0,
-                                    "edges": []
-                                }
-                            }
-                        }
-                    }
-                # Başarılı - boş sonuç da geçerli (repository'de issue yok)
-                return result
-            else:
-                error_msg = f"DeepSource API error: {response.status_code} - {response.text}"
-                print(f"WARNING: {error_msg}")
-                # API hatası - mock moda geç
-                return _get_mock_deepsource_output(target_path)
-        
-        except requests.exceptions.RequestException as e:
-            error_msg = f"DeepSource API request failed: {str(e)}"
-            print(f"WARNING: {error_msg}")
-            # Network hatası - mock moda geç
-            return _get_mock_deepsource_output(target_path)
+            }, False
+        except DeepSourceAPIError as e:
+            print(f"WARNING: {e}")
+            # API bozuk veya devre açık: mock veri yerine son başarılı birleşik
+            # sonuç kullanılır (yoksa mock moda geçilir)
+            last_good = _resolve_output(client.last_good(last_good_key))
+            if last_good is not None:
+                print("WARNING: DeepSource API kullanilamiyor, son basarili yanit kullaniliyor")
+                return last_good, False
+            return _get_mock_deepsource_output(target_path), False
         except Exception as e:
             error_msg = f"DeepSource API unexpected error: {str(e)}"
             print(f"WARNING: {error_msg}")
             # Beklenmeyen hata - mock moda geç
-            return _get_mock_deepsource_output(target_path)
+            return _get_mock_deepsource_output(target_path), False
+        
+        # Başarılı - boş sonuç da geçerli (repository'de issue yok).
+        # Birleşik yanıt sayfalar geldikçe nesne deposuna yazıldı; yalnızca referansı saklanır
+        client.save_last_good(last_good_key, None, accumulator.reference())
+        return accumulator, True
     
     # ============================================
     # YÖNTEM 3: Mock/Test verisi
     # ============================================
     # API token yoksa veya tüm yöntemler başarısız olduysa mock moda geç
     print("WARNING: DeepSource API token bulunamadi veya API cagrisi basarisiz. Test modu kullaniliyor...")
-    return _get_mock_deepsource_output(target_path)
+    return _get_mock_deepsource_output(target_path), False
+
+
+def run_deepsource_scan(target_path: str, repository: tuple = None) -> dict:
+    """
+    DeepSource taraması yapar ve JSON çıktısı döner.
+    
+    Args:
+        target_path: Taranacak proje yolu (CLI için kullanılır, API için kullanılmaz)
+        repository: (owner, name, vcs_provider); verilmezse varsayılan repository
+    
+    Returns:
+        dict: DeepSource'un JSON çıktısı (GraphQL response formatı veya mock)
+    
+    Raises:
+        RuntimeError: API hatası veya timeout durumunda
+    """
+    raw_output, _ = _run_deepsource_scan(target_path, repository)
+    if _is_accumulator(raw_output):
+        return object_store.get(raw_output.digest)
+    return raw_output
 
 
-def save_scan_result(raw_output: dict, tool_name: str, project_name: str) -> str:
+def save_scan_result(
+    raw_output: dict,
+    tool_name: str,
+    project_name: str,
+    tree_hash: str = None,
+    metadata: dict = None
+) -> str:
     """
-    Tarama sonucunu results/ klasörüne kaydeder.
+    Tarama sonucunu results/ klasörüne ve sonuç deposuna kaydeder.
+    
+    Ham çıktı içerik hash'i ile bir kez saklanır (bkz. object_store.py);
+    results/ altındaki kayıt yalnızca referansı ve bu taramanın meta verisini tutar.
     
     Args:
-        raw_output: DeepSource'ten gelen ham JSON çıktısı
+        raw_output: DeepSource'ten gelen ham JSON çıktısı veya IssuePageAccumulator
         tool_name: Kullanılan araç adı (örn: "deepsource")
         project_name: Test projesi adı
+        tree_hash: Taranan içeriğin tree hash'i (opsiyonel)
+        metadata: Taramaya özgü meta veri (süre, önbellek durumu, kaynak kullanımı)
     
     Returns:
         Kaydedilen dosyanın yolu
@@ -405,21 +614,58 @@ def save_scan_result(raw_output: dict, tool_name: str, project_name: str) -> str
     filename = f"{tool_name}_{project_name}_{timestamp}.json"
     file_path = results_path / filename
     
-    # JSON'u kaydet
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(raw_output, f, indent=2, ensure_ascii=False)
-    
+    record_metadata = {
+        "tool": tool_name,
+        "project": project_name,
+        "timestamp": timestamp,
+        "tree_hash": tree_hash
+    }
+    record_metadata.update(metadata or {})
+    
+    # Ham çıktıyı içerik adresli depoya, referansı ve meta veriyi kayda yaz
+    # (RESULTS_COMPACT açıksa minified + gzip, bkz. result_io.py)
+    summary = None
+    if _is_accumulator(raw_output):
+        # Çıktı sayfalar geldikçe depoya yazıldı (bkz. deepsource_pagination.py)
+        file_path, object_hash = write_scan_record(file_path, None, record_metadata, digest=raw_output.digest)
+        summary = {"total_issues": len(raw_output.issues)}
+        # RESULTS_DEDUP kapalıysa kayıt tam çıktıdır; sonuç deposu da referans tutmaz
+        raw_output = None if object_hash else object_store.get(raw_output.digest)
+    else:
+        file_path, object_hash = write_scan_record(file_path, raw_output, record_metadata)
+    
+    results_store.safe_add(
+        KIND_SCAN,
+        raw_output,
+        summary=summary,
+        tool=tool_name,
+        project=project_name,
+        tree_hash=tree_hash,
+        file_path=str(file_path),
+        object_hash=object_hash,
+        metadata=record_metadata
+    )
     print(f"Tarama sonucu kaydedildi: {file_path}")
     return str(file_path)
 
 
-def run_deepsource_scan_and_save(project_name: str) -> dict:
+def run_deepsource_scan_and_save(
+    project_name: str,
+    target_path: str = None,
+    progress=None,
+    use_cache: bool = True
+) -> dict:
     """
     Belirli bir proje için DeepSource taraması yapar ve sonucu kaydeder.
     API'den çağrılabilir fonksiyon.
     
     Args:
         project_name: Test projesi adı
+        target_path: Taranacak klasör (opsiyonel). Verilmezse test_projects/
+            altından proje adına göre bulunur. Karşılaştırmalı taramada aynı
+            snapshot'ı iki araca vermek için kullanılır.
+        progress: Aşama olaylarının kaydedileceği ScanProgress (opsiyonel)
+        use_cache: False ise önbellek atlanır ve tarama her durumda yapılır
     
     Returns:
         {
@@ -427,16 +673,19 @@ def run_deepsource_scan_and_save(project_name: str) -> dict:
             "project": str,
             "file_path": str,
             "metric_result": MetricResult (dict olarak),
+            "cache_hit": bool,
+            "coalesced": bool (sonuç eşzamanlı başka bir taramadan paylaşıldıysa),
             "error": str (varsa)
         }
     """
     import time
     try:
         # Proje yolunu oluştur (uploaded klasörü de kontrol et)
-        target_path = f"../test_projects/{project_name}"
-        if not Path(target_path).exists():
-            # Uploaded klasöründe olabilir
-            target_path = f"../test_projects/uploaded/{project_name}"
+        if target_path is None:
+            target_path = f"../test_projects/{project_name}"
+            if not Path(target_path).exists():
+                # Uploaded klasöründe olabilir
+                target_path = f"../test_projects/uploaded/{project_name}"
         
         # Proje var mı kontrol et
         if not Path(target_path).exists():
@@ -446,28 +695,97 @@ def run_deepsource_scan_and_save(project_name: str) -> dict:
                 "error": f"Project '{project_name}' not found in test_projects/"
             }
         
-        # Tarama süresini ölç (gerçek süre)
-        scan_start_time = time.time()
+        emit_stage(progress, STAGE_PROJECT_RESOLVED, target_path=str(target_path))
+        repository = resolve_deepsource_repository(project_name)
+        tree_hash = compute_tree_hash(target_path)
         
-        # Tarama yap
-        raw_output = run_deepsource_scan(target_path)
+        # Önbellek anahtarı: CLI yerel içeriği analiz eder (tree hash); API ise
+        # DeepSource'taki son analizi döndürür, bu yüzden anahtar o analizin
+        # kimliğidir. Son analiz bilgisi alınamazsa önbellek kullanılmaz.
+        content_key = tree_hash
+        if use_cache and _uses_api():
+            remote_state = _remote_analysis_state(repository)
+            if remote_state is None:
+                use_cache = False
+            else:
+                content_key = f"remote:{remote_state}"
+        scan_key = scan_cache.make_key(
+            "deepsource",
+            content_key,
+            DEEPSOURCE_TOOL_ID,
+            {"repository": _repository_key(repository)}
+        )
         
-        # Gerçek tarama süresini hesapla
-        actual_scan_duration = time.time() - scan_start_time
+        def obtain_raw_output():
+            """Ham çıktıyı önbellekten veya taramadan alır: (raw_output, süre, cache_hit, resource_usage)"""
+            if use_cache:
+                cache_entry = scan_cache.get(scan_key)
+                # Sayfalı API sonuçları önbellekte referans olarak tutulur
+                cached_output = _resolve_output(cache_entry["raw_output"]) if cache_entry is not None else None
+                if cached_output is not None:
+                    # Raporlanan süre, önbelleğe alınan orijinal taramanın süresidir
+                    return cached_output, cache_entry.get("scan_duration", 0.0), True, None
+            
+            # Tarama süresini ve kaynak kullanımını ölç (gerçek süre)
+            scan_start_time = time.time()
+            resource_start = resource_snapshot()
+            
+            # Tarama yap
+            emit_stage(progress, STAGE_SCANNER_STARTED)
+            raw_output, is_live_output = _run_deepsource_scan(target_path, repository)
+            
+            # Gerçek tarama süresini hesapla
+            scan_duration = time.time() - scan_start_time
+            resource_usage = resource_delta(resource_start)
+            
+            # Mock veya hata sonrası boş sonuçlar önbelleğe alınmaz
+            if use_cache and is_live_output:
+                scan_cache.put(
+                    scan_key,
+                    raw_output.reference() if _is_accumulator(raw_output) else raw_output,
+                    tool="deepsource",
+                    tool_version=DEEPSOURCE_TOOL_ID,
+                    scan_duration=scan_duration
+                )
+            return raw_output, scan_duration, False, resource_usage
+        
+        # Aynı içerik için eşzamanlı taramalar tek çalıştırmada birleştirilir;
+        # sonradan gelen çağrılar ilk taramanın sonucunu bekler (ilerleme akışında
+        # scanner_started yerine coalesced aşaması görünür)
+        (raw_output, actual_scan_duration, cache_hit, resource_usage), coalesced = scan_flights.do(
+            (scan_key, use_cache),
+            obtain_raw_output,
+            on_join=lambda: emit_stage(progress, STAGE_COALESCED)
+        )
+        emit_stage(progress, STAGE_OUTPUT_RECEIVED, cache_hit=cache_hit, coalesced=coalesced)
         
         # Sonucu kaydet
-        saved_path = save_scan_result(raw_output, "deepsource", project_name)
+        saved_path = save_scan_result(
+            raw_output,
+            "deepsource",
+            project_name,
+            tree_hash=tree_hash,
+            metadata={
+                "scan_duration": actual_scan_duration,
+                "cache_hit": cache_hit,
+                "coalesced": coalesced,
+                "truncated": getattr(raw_output, "truncated", False),
+                "resource_usage": resource_usage
+            }
+        )
         
-        # Temel metrikleri hesapla
-        metric = DeepSourceMetrics()
-        metric_result = metric.calculate(raw_output)
+        # Temel metrikleri hesapla ve issue'ları çıkar (advanced metrics için).
+        # API sonucunda ikisi de sayfalar geldikçe hesaplandı
+        if _is_accumulator(raw_output):
+            metric_result = raw_output.metric_result()
+            detected_issues = raw_output.issues
+        else:
+            metric_result, detected_issues = DeepSourceMetrics().normalize(raw_output)
         
         # Gerçek tarama süresini metric_result'a ekle (eğer 0 ise)
         if metric_result.scan_duration == 0.0:
             metric_result.scan_duration = actual_scan_duration
-        
-        # Issue'ları çıkar (advanced metrics için)
-        detected_issues = extract_issues_from_deepsource_result(raw_output)
+        emit_stage(progress, STAGE_PARSED, total_issues=metric_result.total_issues)
         
         # Ground truth verilerini yükle
         ground_truth = load_ground_truth(project_name)
@@ -479,11 +797,13 @@ def run_deepsource_scan_and_save(project_name: str) -> dict:
         # Gelişmiş metrikleri hesapla (gerçek tarama süresi ile)
         calculator = AdvancedMetricsCalculator()
         advanced_result = calculator.calculate_all_advanced_metrics(
-            raw_data=raw_output,
+            # Sayfalı API sonucunda yalnızca edges'siz iskelet verilir
+            raw_data=raw_output.skeleton() if _is_accumulator(raw_output) else raw_output,
             detected_issues=detected_issues,
             ground_truth=ground_truth,  # Ground truth verilerini kullan
             scan_duration=metric_result.scan_duration  # Gerçek süre kullanılıyor
         )
+        emit_stage(progress, STAGE_GROUND_TRUTH_MATCHED, ground_truth_count=len(ground_truth))
         
         # Advanced metrics sonucunu kaydet
         advanced_file_path = save_advanced_metrics_result(
@@ -491,7 +811,14 @@ def run_deepsource_scan_and_save(project_name: str) -> dict:
             project_name,
             metric_result,
             advanced_result,
-            ground_truth=ground_truth
+            ground_truth=ground_truth,
+            tree_hash=tree_hash
+        )
+        emit_stage(
+            progress,
+            STAGE_RESULTS_SAVED,
+            file_path=saved_path,
+            advanced_metrics_file_path=advanced_file_path
         )
         
         # MetricResult'ı dict'e çevir
@@ -536,7 +863,9 @@ def run_deepsource_scan_and_save(project_name: str) -> dict:
             "file_path": saved_path,
             "advanced_metrics_file_path": advanced_file_path,
             "metric_result": metric_dict,
-            "advanced_metrics": advanced_metrics_dict
+            "advanced_metrics": advanced_metrics_dict,
+            "cache_hit": cache_hit,
+            "coalesced": coalesced
         }
         
     except Exception as e:
@@ -554,6 +883,11 @@ def main():
     flask_demo projesi için DeepSource taraması yapar,
     sonuçları kaydeder ve normalize edilmiş metrikleri gösterir.
     """
+    # Yapılandırma bilgisi (import sırasında değil, yalnızca CLI'da gösterilir)
+    if not DEEPSOURCE_API_TOKEN:
+        print("WARNING: DEEPSOURCE_API_TOKEN environment variable bulunamadi!")
+    print(f"INFO: Repository: {DEEPSOURCE_REPO_OWNER}/{DEEPSOURCE_REPO_NAME}")
+    
     target_path = "../test_projects/flask_demo"
     project_name = Path(target_path).name
     
@@ -4,21 +4,25 @@ Detaylı Analiz Raporu Oluşturucu
 Benchmark sonuçlarını analiz edip detaylı bir rapor oluşturur.
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
+from result_io import read_json, result_files
+from results_store import results_store, KIND_BENCHMARK_REPORT
 
 def load_latest_benchmark_report() -> Dict:
-    """En son benchmark raporunu yükler"""
+    """En son benchmark raporunu yükler (önce sonuç deposundan, yoksa results/ klasöründen)"""
+    report = results_store.load_latest_payload(KIND_BENCHMARK_REPORT)
+    if report is not None:
+        return report
+    
     results_dir = Path("../results")
-    benchmark_files = sorted(results_dir.glob("benchmark_report_*.json"), reverse=True)
+    benchmark_files = sorted(result_files(results_dir, "benchmark_report_*"), key=lambda path: path.name, reverse=True)
     
     if not benchmark_files:
         raise FileNotFoundError("Benchmark raporu bulunamadı!")
     
-    with open(benchmark_files[0], 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json(benchmark_files[0])
 
 
 def generate_analysis_report():
@@ -4,17 +4,16 @@ HTML Rapor Oluşturucu
 JSON raporunu HTML formatına dönüştürür.
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
+from result_io import read_json, result_files, result_stem
 
 
 def generate_html_report(json_file: Path):
     """JSON raporunu HTML formatına dönüştürür"""
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_json(json_file)
     
-    html_file = json_file.parent / f"report_{json_file.stem.split('_')[-1]}.html"
+    html_file = json_file.parent / f"report_{result_stem(json_file).split('_')[-1]}.html"
     
     html_content = f"""
 <!DOCTYPE html>
@@ -370,10 +369,18 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         json_file = Path(sys.argv[1])
     else:
-        # En son raporu bul
+        # En son raporu bul (önce sonuç deposunun indeksinden)
+        from results_store import results_store, KIND_COMPREHENSIVE_REPORT
+        latest_record = results_store.latest(KIND_COMPREHENSIVE_REPORT)
         results_dir = Path("../results")
-        json_files = sorted(results_dir.glob("comprehensive_test_report_*.json"), reverse=True)
-        if json_files:
+        json_files = sorted(
+            result_files(results_dir, "comprehensive_test_report_*"),
+            key=lambda path: path.name,
+            reverse=True
+        )
+        if latest_record and latest_record["file_path"] and Path(latest_record["file_path"]).exists():
+            json_file = Path(latest_record["file_path"])
+        elif json_files:
             json_file = json_files[0]
         else:
             print("Rapor dosyası bulunamadı!")
@@ -0,0 +1,350 @@
+"""
+Artımlı (Incremental) Snyk Code Tarama Modülü
+
+Bu modül, büyük projelerde tek bir dosya değiştiğinde tüm ağacın yeniden
+taranmasını önler. Her taramadan sonra proje için bir manifest saklanır:
+- Dosya başına içerik özetleri (bkz. tree_hash.compute_file_digests)
+- Taramanın SARIF çıktısının nesne deposundaki referansı (bkz. object_store.py)
+- Tarayıcı sürümü ve tarama seçenekleri
+
+Yeniden taramada yalnızca değişen/eklenen dosyalar aynı göreli yollarla
+geçici bir klasöre kopyalanıp taranır. Yeni bulgular, önceki SARIF'teki
+değişmemiş dosyalara ait bulgularla birleştirilir; silinen dosyaların
+bulguları atılır. Sonuç, tüm ağaç taranmış gibi tek bir SARIF'tir ve
+SnykMetrics / metrics.issue_extractors tarafından aynen işlenir.
+
+Tam taramaya dönülen durumlar:
+- Proje için manifest yoksa
+- Tarayıcı sürümü veya seçenekler değiştiyse
+- Değişen dosya oranı INCREMENTAL_MAX_CHANGED_RATIO'yu aşarsa
+- Kısmi tarama başarısız olursa (örn: değişen dosyalar desteklenmeyen türdeyse)
+- Önceki veya kısmi çıktı bellekte birleştirilemeyecek kadar büyükse
+  (bkz. sarif_stream.py) ya da önceki çıktı depoda bulunamazsa
+
+Not: Snyk Code dosyalar arası veri akışı analizi de yapar. Kısmi taramada
+değişen dosya ile değişmemiş dosyalar arasındaki akışlar görülmeyebilir;
+kesin sonuç gerektiğinde SNYK_INCREMENTAL_ENABLED=0 ile kapatılabilir.
+Bu nedenle birleştirilmiş çıktılar tarama önbelleğine tam tarama sonucu
+olarak yazılmaz (bkz. metric_runner.run_code_scan_and_save).
+
+Kullanım:
+    from incremental_scan import run_incremental_scan
+    raw_output, info = run_incremental_scan(
+        "snyk_code", "flask_demo", target_path, file_digests,
+        scan_fn=run_snyk_code_scan, tool_version="1.1293.0", options={"org": org_id}
+    )
+    info["mode"]  # "full", "incremental" veya "unchanged"
+
+Environment Variables:
+    SNYK_INCREMENTAL_ENABLED: Artımlı taramayı aç/kapat (default: 1)
+    SNYK_INCREMENTAL_MAX_CHANGED_RATIO: Bu oranın üzerinde değişiklikte tam tarama (default: 0.5)
+    SCAN_MANIFEST_DIR: Manifest klasörü (default: ../results/.manifests)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+from object_store import ObjectNotFoundError, object_store, parse_reference
+from result_io import OBJECT_REF_KEY, OBJECT_REF_PREFIX
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+INCREMENTAL_ENABLED = os.getenv("SNYK_INCREMENTAL_ENABLED", "1").lower() not in ("0", "false", "no")
+INCREMENTAL_MAX_CHANGED_RATIO = float(os.getenv("SNYK_INCREMENTAL_MAX_CHANGED_RATIO", "0.5"))
+SCAN_MANIFEST_DIR = os.getenv("SCAN_MANIFEST_DIR", "../results/.manifests")
+
+# Tarama modları
+MODE_FULL = "full"
+MODE_INCREMENTAL = "incremental"
+MODE_UNCHANGED = "unchanged"
+
+
+# ============================================
+# MANIFEST
+# ============================================
+
+def _manifest_path(tool: str, project_name: str) -> Path:
+    # Proje adı yol ayracı içeremez (../ ile klasör dışına çıkılmasın)
+    return Path(SCAN_MANIFEST_DIR) / tool / f"{Path(project_name).name}.json"
+
+
+def load_manifest(tool: str, project_name: str) -> Optional[dict]:
+    """
+    Projenin son tarama manifest'ini yükler
+
+    Args:
+        tool: Tarayıcı kimliği ("snyk_code")
+        project_name: Proje adı
+
+    Returns:
+        dict: {"file_digests", "raw_output" (çıktı referansı), "mergeable",
+        "tool_version", "options", "created_at"}
+        veya manifest yoksa / okunamıyorsa None
+    """
+    try:
+        with open(_manifest_path(tool, project_name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def save_manifest(
+    tool: str,
+    project_name: str,
+    file_digests: Dict[str, str],
+    output_digest: str,
+    tool_version: str,
+    options: Optional[dict] = None,
+    mergeable: bool = True
+):
+    """
+    Taramanın dosya özetlerini ve SARIF çıktısının referansını manifest olarak kaydeder
+
+    SARIF manifest'e kopyalanmaz; çıktı nesne deposunda bir kez tutulur.
+
+    Args:
+        tool: Tarayıcı kimliği
+        project_name: Proje adı
+        file_digests: {göreli_yol: sha256}
+        output_digest: Tüm ağaca karşılık gelen SARIF çıktısının depodaki hash'i
+        tool_version: Tarayıcı sürümü
+        options: Tarama seçenekleri
+        mergeable: False ise çıktı bellekte birleştirilemeyecek kadar büyüktür;
+            sonraki tarama tam tarama yapar
+    """
+    manifest_path = _manifest_path(tool, project_name)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "tool": tool,
+        "project": project_name,
+        "tool_version": tool_version,
+        "options": options or {},
+        "created_at": time.time(),
+        "file_digests": file_digests,
+        "raw_output": {OBJECT_REF_KEY: OBJECT_REF_PREFIX + output_digest},
+        "mergeable": mergeable
+    }
+
+    # Atomik yazma: eşzamanlı taramalar yarım dosya görmez
+    fd, temp_path = tempfile.mkstemp(dir=manifest_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def diff_file_digests(old_digests: Dict[str, str], new_digests: Dict[str, str]) -> Tuple[Set[str], Set[str]]:
+    """
+    İki manifest arasındaki farkı bulur
+
+    Args:
+        old_digests: Önceki taramanın dosya özetleri
+        new_digests: Şimdiki dosya özetleri
+
+    Returns:
+        (değişen veya eklenen dosyalar, silinen dosyalar)
+    """
+    changed = {path for path, digest in new_digests.items() if old_digests.get(path) != digest}
+    removed = set(old_digests) - set(new_digests)
+    return changed, removed
+
+
+def load_manifest_output(manifest: dict) -> Optional[dict]:
+    """
+    Manifest'in referans verdiği SARIF çıktısını depodan yükler
+
+    Args:
+        manifest: load_manifest() sonucu
+
+    Returns:
+        dict: Önceki taramanın SARIF çıktısı veya çıktı birleştirilemiyorsa
+        (çok büyük, depoda yok) None
+    """
+    raw_output = manifest.get("raw_output")
+    digest = parse_reference(raw_output)
+    if digest is None:
+        # Eski manifest'ler SARIF'i doğrudan içerir
+        return raw_output if isinstance(raw_output, dict) and OBJECT_REF_KEY not in raw_output else None
+    if not manifest.get("mergeable", False):
+        return None
+    try:
+        return object_store.get(digest)
+    except ObjectNotFoundError:
+        return None
+
+
+# ============================================
+# SARIF BİRLEŞTİRME
+# ============================================
+
+def _result_uri(result: dict) -> str:
+    """SARIF result'ının ilk konumundaki dosya yolunu döner"""
+    locations = result.get("locations", [])
+    if not locations:
+        return ""
+    uri = locations[0].get("physicalLocation", {}).get("artifactLocation", {}).get("uri", "")
+    # Snyk uri'leri tarama köküne göreli verir; olası "./" ön ekini temizle
+    return uri[2:] if uri.startswith("./") else uri
+
+
+def filter_sarif_results(raw_output: dict, excluded_files: Iterable[str]) -> dict:
+    """
+    SARIF çıktısından verilen dosyalara ait bulguları çıkarır
+
+    Args:
+        raw_output: SARIF çıktısı
+        excluded_files: Bulguları atılacak göreli dosya yolları
+
+    Returns:
+        dict: Filtrelenmiş SARIF kopyası (orijinal değiştirilmez)
+    """
+    excluded = set(excluded_files)
+    filtered = dict(raw_output)
+    filtered["runs"] = []
+    for run in raw_output.get("runs", []):
+        run_copy = dict(run)
+        run_copy["results"] = [
+            result for result in run.get("results", [])
+            if _result_uri(result) not in excluded
+        ]
+        filtered["runs"].append(run_copy)
+    return filtered
+
+
+def merge_sarif(prior_output: dict, partial_output: dict, replaced_files: Iterable[str]) -> dict:
+    """
+    Önceki tam SARIF ile değişen dosyaların kısmi SARIF'ini birleştirir
+
+    replaced_files'a ait önceki bulgular atılır, yerine kısmi taramanın
+    bulguları eklenir. Kural (rule) tanımları id'ye göre birleştirilir.
+
+    Args:
+        prior_output: Önceki taramanın tam SARIF çıktısı
+        partial_output: Yalnızca değişen dosyaların tarandığı SARIF çıktısı
+        replaced_files: Değişen ve silinen göreli dosya yolları
+
+    Returns:
+        dict: Tüm ağaç taranmış gibi birleştirilmiş SARIF
+    """
+    merged = filter_sarif_results(prior_output, replaced_files)
+    partial_runs = partial_output.get("runs", [])
+    if not partial_runs:
+        return merged
+    if not merged.get("runs"):
+        merged["runs"] = [dict(partial_runs[0], results=[])]
+
+    merged_run = merged["runs"][0]
+    partial_run = partial_runs[0]
+    merged_run["results"] = merged_run.get("results", []) + partial_run.get("results", [])
+
+    # Kural tanımlarını birleştir (yeni bulgular yeni kurallara referans verebilir)
+    prior_driver = merged_run.get("tool", {}).get("driver", {})
+    partial_rules = partial_run.get("tool", {}).get("driver", {}).get("rules", [])
+    if partial_rules:
+        rules = list(prior_driver.get("rules", []))
+        known_rule_ids = {rule.get("id") for rule in rules}
+        rules.extend(rule for rule in partial_rules if rule.get("id") not in known_rule_ids)
+        merged_run["tool"] = dict(merged_run.get("tool", {}))
+        merged_run["tool"]["driver"] = dict(prior_driver, rules=rules)
+
+    return merged
+
+
+# ============================================
+# ARTIMLI TARAMA
+# ============================================
+
+def _copy_files(target_path: str, relative_paths: Iterable[str]) -> Path:
+    """
+    Verilen dosyaları aynı göreli yollarla geçici bir klasöre kopyalar
+
+    Returns:
+        Path: Geçici kök klasör (çağıran taraf silmekle sorumludur)
+    """
+    temp_root = Path(tempfile.mkdtemp(prefix="smarttestai_incremental_"))
+    for relative_path in relative_paths:
+        destination = temp_root / relative_path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(Path(target_path) / relative_path, destination)
+    return temp_root
+
+
+def run_incremental_scan(
+    tool: str,
+    project_name: str,
+    target_path: str,
+    file_digests: Dict[str, str],
+    scan_fn: Callable[[str], dict],
+    tool_version: str,
+    options: Optional[dict] = None
+) -> Tuple[dict, dict]:
+    """
+    Manifest'e göre yalnızca değişen dosyaları tarar ve sonucu birleştirir
+
+    Args:
+        tool: Tarayıcı kimliği ("snyk_code")
+        project_name: Proje adı (manifest anahtarı)
+        target_path: Proje klasörü
+        file_digests: Projenin şimdiki dosya özetleri
+        scan_fn: Bir klasörü tarayıp SARIF (veya büyük çıktılar için StreamedSarif)
+            döndüren fonksiyon (örn: run_snyk_code_scan)
+        tool_version: Tarayıcı sürümü
+        options: Tarama seçenekleri
+
+    Returns:
+        (SARIF çıktısı veya StreamedSarif, {"mode", "changed_files", "removed_files"})
+    """
+    options = options or {}
+    manifest = load_manifest(tool, project_name) if INCREMENTAL_ENABLED else None
+    prior_output = None
+    if (
+        manifest is not None
+        and manifest.get("tool_version") == tool_version
+        and manifest.get("options") == options
+    ):
+        prior_output = load_manifest_output(manifest)
+
+    if prior_output is None:
+        return scan_fn(target_path), {"mode": MODE_FULL, "changed_files": len(file_digests), "removed_files": 0}
+
+    changed, removed = diff_file_digests(manifest.get("file_digests", {}), file_digests)
+    info = {"mode": MODE_INCREMENTAL, "changed_files": len(changed), "removed_files": len(removed)}
+
+    if not changed:
+        info["mode"] = MODE_UNCHANGED
+        return filter_sarif_results(prior_output, removed), info
+
+    if len(changed) > INCREMENTAL_MAX_CHANGED_RATIO * max(len(file_digests), 1):
+        info["mode"] = MODE_FULL
+        return scan_fn(target_path), info
+
+    temp_root = _copy_files(target_path, changed)
+    try:
+        partial_output = scan_fn(str(temp_root))
+    except RuntimeError as e:
+        print(f"WARNING: Artımlı tarama başarısız, tam taramaya dönülüyor: {e}")
+        info["mode"] = MODE_FULL
+        return scan_fn(target_path), info
+    finally:
+        shutil.rmtree(temp_root, ignore_errors=True)
+
+    # run_snyk_code_scan StreamedSarif döner; küçük çıktılarda tam SARIF raw_output'tadır
+    partial_output = getattr(partial_output, "raw_output", partial_output)
+    if not isinstance(partial_output, dict):
+        # Kısmi çıktı belleğe alınamayacak kadar büyük: birleştirme yerine tam tarama
+        info["mode"] = MODE_FULL
+        return scan_fn(target_path), info
+
+    return merge_sarif(prior_output, partial_output, changed | removed), info
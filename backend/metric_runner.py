@@ -24,16 +24,48 @@ Kullanım:
     veya
     from metric_runner import run_code_scan_and_save
     result = run_code_scan_and_save("flask_demo")
+
+Environment Variables:
+    SNYK_PATH: Snyk CLI yolu (opsiyonel, verilmezse ilk taramada otomatik bulunur)
+    RATE_LIMIT_SNYK_PER_MINUTE / RATE_LIMIT_SNYK_BURST: Snyk Code tarama hız sınırı (bkz. rate_limiter.py)
 """
 
 import json
 import subprocess
 import os
 import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from metrics.snyk_metrics import SnykMetrics
 from metrics.advanced_metrics import AdvancedMetricsCalculator
+from scan_cache import scan_cache
+from tool_registry import tool_registry
+from single_flight import scan_flights
+from rate_limiter import rate_limiter
+from result_io import write_json
+from object_store import ObjectNotFoundError, object_store, write_scan_record, resource_snapshot, resource_delta
+from results_store import results_store, KIND_SCAN, KIND_ADVANCED_METRICS
+from tree_hash import compute_file_digests, compute_tree_hash
+from incremental_scan import MODE_FULL, run_incremental_scan, save_manifest
+from sarif_stream import (
+    EmptySarifStreamError,
+    SarifStreamError,
+    StreamedSarif,
+    is_streamed_reference,
+    process_sarif_file,
+    streamed_from_reference
+)
+from scan_progress import (
+    emit_stage,
+    STAGE_PROJECT_RESOLVED,
+    STAGE_SCANNER_STARTED,
+    STAGE_COALESCED,
+    STAGE_OUTPUT_RECEIVED,
+    STAGE_PARSED,
+    STAGE_GROUND_TRUTH_MATCHED,
+    STAGE_RESULTS_SAVED,
+)
 
 # Ground truth dosyasının yolu
 GROUND_TRUTH_FILE = "../test_projects/ground_truth.json"
@@ -65,14 +97,26 @@ def load_ground_truth(project_name: str) -> list:
 SNYK_ORG_NAME = "SmartTestAI-demo"
 SNYK_ORG_ID = "31b7aa9b-c8a6-443a-8858-4576d54abd64"
 
+# Snyk CLI yolu (opsiyonel). Verilirse otomatik arama yapılmaz.
+SNYK_PATH = os.getenv("SNYK_PATH")
+
+# Snyk taraması zaman aşımı (10 dakika)
+SNYK_SCAN_TIMEOUT_SECONDS = 600
+
 def find_snyk_cli():
     """
     Snyk CLI'nin yolunu otomatik olarak bulur.
     Birden fazla yolu kontrol eder.
     
+    Doğrudan çağrılmaz; tool_registry ilk kullanımda çağırır ve sonucu
+    diske kaydeder (bkz. get_snyk_path).
+    
     Returns:
         str: Snyk CLI'nin tam yolu veya None
     """
+    if SNYK_PATH:
+        return SNYK_PATH
+    
     # Windows için olası yollar
     possible_paths = [
         # npm global install yolu (kullanıcı bazlı)
@@ -121,54 +165,43 @@ def find_snyk_cli():
     
     return None
 
-# Snyk CLI yolunu otomatik bul
-SNYK_PATH = find_snyk_cli()
-
-if not SNYK_PATH:
-    print("WARNING: Snyk CLI bulunamadı. Lütfen Snyk CLI'yi kurun: npm install -g snyk")
-    print("Alternatif olarak backend/metric_runner.py dosyasında SNYK_PATH değerini manuel olarak ayarlayabilirsiniz.")
+# Snyk CLI import sırasında aranmaz; ilk taramada bulunur ve kaydedilir
+tool_registry.register("snyk", find_snyk_cli)
 
 # Sonuç dosyalarının kaydedileceği klasör
 RESULTS_DIR = "../results"
 
-def extract_issues_from_snyk_result(raw_data: dict) -> list:
+def get_snyk_path():
     """
-    Snyk SARIF formatından issue'ları çıkarır
+    Snyk CLI yolunu döner (ilk çağrıda keşfedilir, sonra kayıttan okunur)
     
-    Args:
-        raw_data: Snyk'ten gelen ham JSON çıktısı
+    Returns:
+        str: Snyk CLI yolu veya bulunamazsa None
+    """
+    return tool_registry.resolve("snyk")["path"]
+
+def get_snyk_version() -> str:
+    """
+    Snyk CLI sürümünü döner (keşif sırasında bir kez sorgulanır)
+    
+    Sürüm, tarama önbelleği anahtarının parçasıdır: Snyk güncellendiğinde
+    eski sonuçlar kullanılmaz.
     
     Returns:
-        list: Issue listesi (dict formatında)
+        str: Sürüm (örn: "1.1293.0") veya bulunamazsa "unknown"
     """
-    issues = []
-    if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
-        results = raw_data["runs"][0].get("results", [])
-        for result in results:
-            locations = result.get("locations", [])
-            if locations:
-                location = locations[0].get("physicalLocation", {})
-                artifact_location = location.get("artifactLocation", {})
-                region = location.get("region", {})
-                
-                issues.append({
-                    "file": artifact_location.get("uri", ""),
-                    "line": region.get("startLine", -1),
-                    "type": result.get("ruleId", ""),
-                    "severity": result.get("level", "error"),
-                    "description": result.get("message", {}).get("text", "")
-                })
-    return issues
+    return tool_registry.resolve("snyk").get("version") or "unknown"
 
 def save_advanced_metrics_result(
     tool_name: str,
     project_name: str,
     basic_result,
     advanced_result,
-    ground_truth: list = None
+    ground_truth: list = None,
+    tree_hash: str = None
 ) -> str:
     """
-    Gelişmiş metrik sonuçlarını results/ klasörüne kaydeder
+    Gelişmiş metrik sonuçlarını results/ klasörüne ve sonuç deposuna kaydeder
     
     Args:
         tool_name: Araç adı ("snyk_code")
@@ -176,6 +209,7 @@ def save_advanced_metrics_result(
         basic_result: Temel metrik sonucu (MetricResult)
         advanced_result: Gelişmiş metrik sonucu (AdvancedMetricResult)
         ground_truth: Ground truth listesi (opsiyonel)
+        tree_hash: Taranan içeriğin tree hash'i (opsiyonel)
     
     Returns:
         str: Kaydedilen dosyanın yolu
@@ -226,106 +260,146 @@ def save_advanced_metrics_result(
         "ground_truth_count": len(ground_truth) if ground_truth else 0
     }
     
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(result_dict, f, indent=2, ensure_ascii=False)
+    file_path = write_json(file_path, result_dict)
     
+    results_store.safe_add(
+        KIND_ADVANCED_METRICS,
+        result_dict,
+        tool=tool_name,
+        project=project_name,
+        tree_hash=tree_hash,
+        file_path=str(file_path)
+    )
     return str(file_path)
 
-def run_snyk_code_scan(target_path: str) -> dict:
+def run_snyk_code_scan(target_path: str) -> StreamedSarif:
     """
     Snyk Code CLI kullanarak kod analizi yapar
     
     Args:
         target_path: Taranacak proje klasörünün yolu
     
+    Snyk SARIF çıktısını doğrudan nesne deposunun geçici klasörüne yazar
+    (--sarif-file-output). Dosya tek geçişte okunur (severity sayımı, issue
+    çıkarımı, içerik hash'i) ve yeniden serileştirilmeden nesne yapılır.
+    SARIF_MATERIALIZE_MAX_BYTES'tan küçük çıktılar tam dict olarak da döner.
+    
     Returns:
-        dict: Snyk'ten gelen JSON formatındaki ham sonuç
-        (SARIF formatı veya eski vulnerabilities formatı)
+        StreamedSarif: Sayılar, issue'lar, içerik hash'i ve (küçükse) ham SARIF
     
     Raises:
         RuntimeError: Snyk CLI hatası veya tarama başarısız olduğunda
     """
-    # Snyk CLI komutunu oluştur
-    # --json flag'i ile JSON formatında çıktı al
-    # --org parametresi ile organizasyon belirtilir
-    cmd = [
-        SNYK_PATH, 
-        "code", 
-        "test", 
-        target_path, 
-        "--json",
-        "--org", SNYK_ORG_ID  # Organization ID kullan
-    ]
+    snyk_path = get_snyk_path()
     
     # Snyk CLI kontrolü
-    if not SNYK_PATH:
+    if not snyk_path:
         raise RuntimeError(
             "Snyk CLI bulunamadı. Lütfen Snyk CLI'yi kurun:\n"
             "  npm install -g snyk\n"
             "ve ardından authenticate edin:\n"
             "  snyk auth\n"
-            "Alternatif olarak backend/metric_runner.py dosyasında SNYK_PATH değerini manuel olarak ayarlayabilirsiniz."
+            "Alternatif olarak SNYK_PATH environment variable'ı ile yolu manuel olarak verebilirsiniz.\n"
+            "Kurulumdan sonra keşfi yenilemek için: GET /tools?refresh=1"
         )
     
-    if SNYK_PATH and SNYK_PATH not in ["snyk", "snyk.cmd"] and not Path(SNYK_PATH).exists():
+    if snyk_path not in ["snyk", "snyk.cmd"] and not Path(snyk_path).exists():
         raise RuntimeError(
-            f"Snyk CLI dosyası bulunamadı: {SNYK_PATH}\n"
+            f"Snyk CLI dosyası bulunamadı: {snyk_path}\n"
             "Lütfen Snyk CLI'nin kurulu olduğundan ve yolun doğru olduğundan emin olun.\n"
-            "backend/metric_runner.py dosyasında SNYK_PATH değerini kontrol edin."
+            "SNYK_PATH environment variable'ının değerini kontrol edin."
         )
     
+    # Snyk CLI komutunu oluştur
+    # SARIF çıktısı doğrudan depoya yazılır; stdout'taki insan okunur
+    # özet ve stderr yalnızca hata mesajları için saklanır
+    # --org parametresi ile organizasyon belirtilir
+    # Snyk Code kotası org başına sayılır; token yoksa sırada beklenir.
+    # Spool dosyası token alındıktan sonra açılır: RateLimitTimeout
+    # depoda sahipsiz geçici dosya bırakmaz
+    rate_limiter.acquire("snyk", SNYK_ORG_ID)
+    sarif_path = object_store.spool_path()
+    cmd = [
+        snyk_path, 
+        "code", 
+        "test", 
+        target_path, 
+        f"--sarif-file-output={sarif_path}",
+        "--org", SNYK_ORG_ID  # Organization ID kullan
+    ]
+    
     try:
-        # Snyk CLI komutunu çalıştır
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            timeout=600  # 10 dakika timeout
-        )
-    except FileNotFoundError:
-        raise RuntimeError(
-            f"Snyk CLI bulunamadı. Yol: {SNYK_PATH}\n"
-            "Lütfen Snyk CLI'yi kurun: npm install -g snyk\n"
-            "ve ardından authenticate edin: snyk auth"
-        )
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("Snyk taraması zaman aşımına uğradı (10 dakikadan fazla sürdü)")
-    except Exception as e:
-        raise RuntimeError(f"Snyk CLI çalıştırma hatası: {str(e)}")
-
-    # Hata kontrolü
-    if result.returncode != 0:
-        error_msg = result.stderr or "Unknown error"
-        # Eğer stdout'ta JSON varsa, onu kullanmayı dene (bazı durumlarda hata olsa bile sonuç döner)
-        if result.stdout:
-            try:
-                output = json.loads(result.stdout)
-                # Eğer valid JSON ise ve runs içeriyorsa, hataya rağmen döndür
-                if "runs" in output or "vulnerabilities" in output:
-                    return output
-            except json.JSONDecodeError:
-                pass
+        try:
+            # Snyk CLI komutunu çalıştır
+            with tempfile.TemporaryFile() as log_file:
+                result = subprocess.run(
+                    cmd,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    timeout=SNYK_SCAN_TIMEOUT_SECONDS
+                )
+                log_file.seek(0)
+                cli_output = log_file.read().decode("utf-8", errors="replace")
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Snyk CLI bulunamadı. Yol: {snyk_path}\n"
+                "Lütfen Snyk CLI'yi kurun: npm install -g snyk\n"
+                "ve ardından authenticate edin: snyk auth"
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("Snyk taraması zaman aşımına uğradı (10 dakikadan fazla sürdü)")
+        except Exception as e:
+            raise RuntimeError(f"Snyk CLI çalıştırma hatası: {str(e)}")
         
-        raise RuntimeError(f"Snyk CLI hatası (return code: {result.returncode}): {error_msg}")
-
-    # JSON çıktısını parse et
-    if not result.stdout or not result.stdout.strip():
-        raise RuntimeError("Snyk CLI hiçbir çıktı döndürmedi")
-
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Snyk çıktısı JSON formatında değil: {str(e)}\nÇıktı: {result.stdout[:500]}")
+        # SARIF dosyasını tek geçişte işle
+        streamed = None
+        parse_error = None
+        try:
+            streamed = process_sarif_file(sarif_path)
+        except SarifStreamError as e:
+            parse_error = e
+        
+        # Hata kontrolü
+        if result.returncode != 0:
+            error_msg = cli_output or "Unknown error"
+            # Eğer dosyada SARIF varsa, onu kullan (bulgu olduğunda Snyk sıfırdan farklı kodla çıkar)
+            if streamed is None or not (streamed.has_runs or "vulnerabilities" in streamed.top_level):
+                raise RuntimeError(f"Snyk CLI hatası (return code: {result.returncode}): {error_msg}")
+        elif isinstance(parse_error, EmptySarifStreamError):
+            raise RuntimeError("Snyk CLI hiçbir çıktı döndürmedi")
+        elif parse_error is not None:
+            with open(sarif_path, "r", encoding="utf-8", errors="replace") as f:
+                head = f.read(500)
+            raise RuntimeError(f"Snyk çıktısı JSON formatında değil: {str(parse_error)}\nÇıktı: {head}")
+        
+        # Dosya kopyalanmadan içerik hash'i altına taşınır
+        object_store.adopt(sarif_path, streamed.digest)
+        return streamed
+    finally:
+        if sarif_path.exists():
+            sarif_path.unlink()
 
-def save_scan_result(raw_output: dict, tool_name: str, project_name: str) -> str:
+def save_scan_result(
+    raw_output: dict,
+    tool_name: str,
+    project_name: str,
+    tree_hash: str = None,
+    metadata: dict = None,
+    digest: str = None
+) -> str:
     """
-    Tarama sonucunu results/ klasörüne kaydeder.
+    Tarama sonucunu results/ klasörüne ve sonuç deposuna kaydeder.
+    
+    Ham çıktı içerik hash'i ile bir kez saklanır (bkz. object_store.py);
+    results/ altındaki kayıt yalnızca referansı ve bu taramanın meta verisini tutar.
     
     Args:
-        raw_output: Snyk'ten gelen ham JSON çıktısı
+        raw_output: Snyk'ten gelen ham JSON çıktısı veya StreamedSarif
         tool_name: Kullanılan araç adı (örn: "snyk_code")
         project_name: Test projesi adı (örn: "nodejs-goof", "flask_demo")
+        tree_hash: Taranan içeriğin tree hash'i (opsiyonel)
+        metadata: Taramaya özgü meta veri (süre, önbellek durumu, kaynak kullanımı)
+        digest: raw_output depoya önceden yazıldıysa içerik hash'i (opsiyonel)
     
     Returns:
         Kaydedilen dosyanın yolu
@@ -339,20 +413,72 @@ def save_scan_result(raw_output: dict, tool_name: str, project_name: str) -> str
     filename = f"{tool_name}_{project_name}_{timestamp}.json"
     file_path = results_path / filename
     
-    # JSON'u kaydet
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(raw_output, f, indent=2, ensure_ascii=False)
-    
+    record_metadata = {
+        "tool": tool_name,
+        "project": project_name,
+        "timestamp": timestamp,
+        "tree_hash": tree_hash
+    }
+    record_metadata.update(metadata or {})
+    
+    # Ham çıktıyı içerik adresli depoya, referansı ve meta veriyi kayda yaz
+    # (RESULTS_COMPACT açıksa minified + gzip, bkz. result_io.py)
+    summary = None
+    if isinstance(raw_output, StreamedSarif):
+        # Çıktı tarama sırasında depoya yazıldı (bkz. run_snyk_code_scan)
+        file_path, object_hash = write_scan_record(file_path, None, record_metadata, digest=raw_output.digest)
+        summary = {"total_issues": raw_output.total_results}
+        # RESULTS_DEDUP kapalıysa kayıt tam çıktıdır; sonuç deposu da referans tutmaz
+        raw_output = None if object_hash else object_store.get(raw_output.digest)
+    else:
+        file_path, object_hash = write_scan_record(file_path, raw_output, record_metadata, digest=digest)
+    
+    results_store.safe_add(
+        KIND_SCAN,
+        raw_output,
+        summary=summary,
+        tool=tool_name,
+        project=project_name,
+        tree_hash=tree_hash,
+        file_path=str(file_path),
+        object_hash=object_hash,
+        metadata=record_metadata
+    )
     print(f"Tarama sonucu kaydedildi: {file_path}")
     return str(file_path)
 
-def run_code_scan_and_save(project_name: str) -> dict:
+def _cached_output(raw_output):
+    """Önbelleğe yazılacak değer: depodaki çıktılar için yalnızca referans"""
+    return raw_output.reference() if isinstance(raw_output, StreamedSarif) else raw_output
+
+def _stored_output(raw_output) -> tuple:
+    """
+    Çıktıyı depoya yazar (akış halinde yazılmadıysa):
+    (içerik hash'i, artımlı birleştirmeye uygun mu)
+    """
+    if isinstance(raw_output, StreamedSarif):
+        # Belleğe alınamayacak kadar büyük çıktılar birleştirilmez
+        return raw_output.digest, raw_output.materialized
+    return object_store.put(raw_output), True
+
+def run_code_scan_and_save(
+    project_name: str,
+    target_path: str = None,
+    progress=None,
+    use_cache: bool = True
+) -> dict:
     """
     Belirli bir proje için code taraması yapar ve sonucu kaydeder.
     API'den çağrılabilir fonksiyon.
     
     Args:
         project_name: Test projesi adı ("flask_demo" veya "nodejs-goof")
+        target_path: Taranacak klasör (opsiyonel). Verilmezse test_projects/
+            altından proje adına göre bulunur. Karşılaştırmalı taramada aynı
+            snapshot'ı iki araca vermek için kullanılır.
+        progress: Aşama olaylarının kaydedileceği ScanProgress (opsiyonel)
+        use_cache: False ise önbellek ve artımlı tarama atlanır, tüm proje
+            her durumda yeniden taranır
     
     Returns:
         {
@@ -360,16 +486,20 @@ def run_code_scan_and_save(project_name: str) -> dict:
             "project": str,
             "file_path": str,
             "metric_result": MetricResult (dict olarak),
+            "cache_hit": bool,
+            "coalesced": bool (sonuç eşzamanlı başka bir taramadan paylaşıldıysa),
+            "incremental": {"mode", "changed_files", "removed_files"} veya None,
             "error": str (varsa)
         }
     """
     import time
     try:
         # Proje yolunu oluştur (uploaded klasörü de kontrol et)
-        target_path = f"../test_projects/{project_name}"
-        if not Path(target_path).exists():
-            # Uploaded klasöründe olabilir
-            target_path = f"../test_projects/uploaded/{project_name}"
+        if target_path is None:
+            target_path = f"../test_projects/{project_name}"
+            if not Path(target_path).exists():
+                # Uploaded klasöründe olabilir
+                target_path = f"../test_projects/uploaded/{project_name}"
         
         # Proje var mı kontrol et
         if not Path(target_path).exists():
@@ -379,28 +509,134 @@ def run_code_scan_and_save(project_name: str) -> dict:
                 "error": f"Project '{project_name}' not found in test_projects/"
             }
         
-        # Tarama süresini ölç (gerçek süre)
-        scan_start_time = time.time()
+        emit_stage(progress, STAGE_PROJECT_RESOLVED, target_path=str(target_path))
         
-        # Tarama yap
-        raw_output = run_snyk_code_scan(target_path)
+        # Dosya özetleri hem önbellek anahtarı hem artımlı tarama manifest'i için kullanılır
+        file_digests = compute_file_digests(target_path)
+        scan_options = {"org": SNYK_ORG_ID}
+        tree_hash = compute_tree_hash(target_path, file_digests)
         
-        # Gerçek tarama süresini hesapla
-        actual_scan_duration = time.time() - scan_start_time
+        # Önbellek anahtarı: aynı içerik, aynı Snyk sürümü ve aynı organization
+        # ile daha önce tarandıysa Snyk CLI tekrar çalıştırılmaz
+        scan_key = scan_cache.make_key(
+            "snyk_code",
+            tree_hash,
+            get_snyk_version(),
+            scan_options
+        )
+        
+        def obtain_raw_output():
+            """
+            Ham çıktıyı önbellekten veya taramadan alır:
+            (raw_output, süre, cache_hit, incremental_info, resource_usage)
+            """
+            if use_cache:
+                cache_entry = scan_cache.get(scan_key)
+                cached_output = cache_entry["raw_output"] if cache_entry is not None else None
+                if is_streamed_reference(cached_output):
+                    # Büyük çıktılar önbellekte referans olarak tutulur
+                    try:
+                        cached_output = streamed_from_reference(cached_output)
+                    except ObjectNotFoundError:
+                        cached_output = None
+                if cached_output is not None:
+                    # Raporlanan süre, önbelleğe alınan orijinal taramanın süresidir
+                    return cached_output, cache_entry.get("scan_duration", 0.0), True, None, None
+            
+            # Tarama süresini ve kaynak kullanımını ölç (gerçek süre)
+            scan_start_time = time.time()
+            resource_start = resource_snapshot()
+            
+            # Tarama yap (önceki manifest varsa yalnızca değişen dosyalar taranır)
+            emit_stage(progress, STAGE_SCANNER_STARTED)
+            incremental_info = None
+            if use_cache:
+                raw_output, incremental_info = run_incremental_scan(
+                    "snyk_code",
+                    project_name,
+                    target_path,
+                    file_digests,
+                    scan_fn=run_snyk_code_scan,
+                    tool_version=get_snyk_version(),
+                    options=scan_options
+                )
+            else:
+                raw_output = run_snyk_code_scan(target_path)
+            
+            # Gerçek tarama süresini hesapla
+            scan_duration = time.time() - scan_start_time
+            resource_usage = resource_delta(resource_start)
+            
+            # Artımlı taramada birleştirilen SARIF dosyalar arası akışları kaçırabilir;
+            # aynı ağaç için tam tarama isteyenlere dönmemesi için önbelleğe yazılmaz
+            if use_cache and (incremental_info is None or incremental_info["mode"] == MODE_FULL):
+                scan_cache.put(
+                    scan_key,
+                    _cached_output(raw_output),
+                    tool="snyk_code",
+                    tool_version=get_snyk_version(),
+                    scan_duration=scan_duration
+                )
+            return raw_output, scan_duration, False, incremental_info, resource_usage
+        
+        # Aynı içerik için eşzamanlı taramalar tek Snyk sürecinde birleştirilir;
+        # sonradan gelen çağrılar ilk taramanın sonucunu bekler (ilerleme akışında
+        # scanner_started yerine coalesced aşaması görünür)
+        (raw_output, actual_scan_duration, cache_hit, incremental_info, resource_usage), coalesced = scan_flights.do(
+            (scan_key, use_cache),
+            obtain_raw_output,
+            on_join=lambda: emit_stage(progress, STAGE_COALESCED)
+        )
+        emit_stage(
+            progress,
+            STAGE_OUTPUT_RECEIVED,
+            cache_hit=cache_hit,
+            coalesced=coalesced,
+            incremental=incremental_info
+        )
+        
+        # Bir sonraki artımlı tarama için manifest'i güncelle
+        # (çıktı depoya bir kez yazılır; manifest ve kayıt yalnızca referans tutar)
+        output_digest, mergeable = _stored_output(raw_output)
+        save_manifest(
+            "snyk_code",
+            project_name,
+            file_digests,
+            output_digest,
+            tool_version=get_snyk_version(),
+            options=scan_options,
+            mergeable=mergeable
+        )
         
         # Sonucu kaydet
-        saved_path = save_scan_result(raw_output, "snyk_code", project_name)
+        saved_path = save_scan_result(
+            raw_output,
+            "snyk_code",
+            project_name,
+            tree_hash=tree_hash,
+            metadata={
+                "scan_duration": actual_scan_duration,
+                "cache_hit": cache_hit,
+                "coalesced": coalesced,
+                "incremental": incremental_info,
+                "resource_usage": resource_usage
+            },
+            digest=output_digest
+        )
         
-        # Temel metrikleri hesapla
-        metric = SnykMetrics()
-        metric_result = metric.calculate(raw_output)
+        # Temel metrikleri hesapla ve issue'ları çıkar (advanced metrics için).
+        # Snyk çıktısı okunurken ikisi de tek geçişte hesaplandı; yalnızca artımlı
+        # taramada birleştirilen SARIF yeniden (yine tek geçişte) normalize edilir
+        if isinstance(raw_output, StreamedSarif):
+            metric_result = raw_output.metric_result()
+            detected_issues = raw_output.issues
+        else:
+            metric_result, detected_issues = SnykMetrics().normalize(raw_output)
         
         # Gerçek tarama süresini metric_result'a ekle (eğer 0 ise)
         if metric_result.scan_duration == 0.0:
             metric_result.scan_duration = actual_scan_duration
-        
-        # Issue'ları çıkar (advanced metrics için)
-        detected_issues = extract_issues_from_snyk_result(raw_output)
+        emit_stage(progress, STAGE_PARSED, total_issues=metric_result.total_issues)
         
         # Ground truth verilerini yükle
         ground_truth = load_ground_truth(project_name)
@@ -412,11 +648,13 @@ def run_code_scan_and_save(project_name: str) -> dict:
         # Gelişmiş metrikleri hesapla (gerçek tarama süresi ile)
         calculator = AdvancedMetricsCalculator()
         advanced_result = calculator.calculate_all_advanced_metrics(
-            raw_data=raw_output,
+            # Tek geçişte işlenen çıktılarda yalnızca run özellikleri (results hariç) verilir
+            raw_data=raw_output.skeleton() if isinstance(raw_output, StreamedSarif) else raw_output,
             detected_issues=detected_issues,
             ground_truth=ground_truth,  # Ground truth verilerini kullan
             scan_duration=metric_result.scan_duration  # Gerçek süre kullanılıyor
         )
+        emit_stage(progress, STAGE_GROUND_TRUTH_MATCHED, ground_truth_count=len(ground_truth))
         
         # Advanced metrics sonucunu kaydet
         advanced_file_path = save_advanced_metrics_result(
@@ -424,7 +662,14 @@ def run_code_scan_and_save(project_name: str) -> dict:
             project_name,
             metric_result,
             advanced_result,
-            ground_truth=ground_truth
+            ground_truth=ground_truth,
+            tree_hash=tree_hash
+        )
+        emit_stage(
+            progress,
+            STAGE_RESULTS_SAVED,
+            file_path=saved_path,
+            advanced_metrics_file_path=advanced_file_path
         )
         
         # MetricResult'ı dict'e çevir
@@ -469,7 +714,10 @@ def run_code_scan_and_save(project_name: str) -> dict:
             "file_path": saved_path,
             "advanced_metrics_file_path": advanced_file_path,
             "metric_result": metric_dict,
-            "advanced_metrics": advanced_metrics_dict
+            "advanced_metrics": advanced_metrics_dict,
+            "cache_hit": cache_hit,
+            "coalesced": coalesced,
+            "incremental": incremental_info
         }
         
     except Exception as e:
@@ -488,9 +736,8 @@ def main():
     # Sonucu kaydet
     saved_path = save_scan_result(raw_output, "snyk_code", project_name)
     
-    # Metrik hesapla
-    metric = SnykMetrics()
-    result = metric.calculate(raw_output)
+    # Metrikler çıktı okunurken hesaplandı
+    result = raw_output.metric_result()
 
     print("\n=== SMARTTESTAI METRIC OUTPUT ===")
     print(result)
@@ -31,11 +31,18 @@ Kullanım:
     )
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
 import time
-import psutil
 import os
+from .issue_model import Issue
+from .issue_matching import (
+    EXACT_POLICY,
+    MATCHING_MODE_OPTIMAL,
+    issues_match,
+    match_issues,
+    resolve_matching_mode,
+)
 
 
 @dataclass
@@ -74,13 +81,16 @@ class AdvancedMetricsCalculator:
     
     def __init__(self):
         self.scan_times = []  # Tarama sürelerini saklamak için
+        # psutil yalnızca hesaplama yapılacağı zaman yüklenir (import maliyeti yüksek)
+        import psutil
         self.process = psutil.Process(os.getpid())
     
     def calculate_defect_detection_accuracy(
         self,
-        detected_issues: List[Dict],
-        ground_truth: List[Dict],
-        issue_matching_func=None
+        detected_issues: List[Union[Issue, Dict]],
+        ground_truth: List[Union[Issue, Dict]],
+        issue_matching_func=None,
+        matching_mode: Optional[str] = None
     ) -> Dict[str, float]:
         """
         Hata Tespit Başarısı (Defect Detection Accuracy) hesaplar
@@ -89,6 +99,8 @@ class AdvancedMetricsCalculator:
             detected_issues: Araç tarafından bulunan issue'lar
             ground_truth: Gerçekte var olan issue'lar (test verisi)
             issue_matching_func: Issue'ları eşleştirmek için fonksiyon (opsiyonel)
+            matching_mode: "greedy" (sırayla ilk uygun kayıt) veya "optimal" (en fazla
+                eşleşme, en küçük satır farkı); None ise ISSUE_MATCHING_MODE
         
         Returns:
             {
@@ -99,32 +111,36 @@ class AdvancedMetricsCalculator:
                 "false_positives": int,
                 "false_negatives": int
             }
-        """
-        if issue_matching_func is None:
-            # Varsayılan eşleştirme: Issue key'lerine göre
-            issue_matching_func = self._default_issue_matcher
         
+        Raises:
+            ValueError: Bilinmeyen eşleştirme modu veya issue_matching_func ile matching_mode="optimal"
+        """
         # True Positives: Hem bulundu hem de gerçekte var
         # False Positives: Bulundu ama gerçekte yok
         # False Negatives: Bulunmadı ama gerçekte var
         
-        true_positives = 0
-        false_positives = 0
-        matched_ground_truth = set()
-        
-        for detected in detected_issues:
-            matched = False
-            for i, truth in enumerate(ground_truth):
-                if i not in matched_ground_truth and issue_matching_func(detected, truth):
-                    true_positives += 1
-                    matched_ground_truth.add(i)
-                    matched = True
-                    break
+        if issue_matching_func is None:
+            # Varsayılan eşleştirme: aynı dosya adı ve satır. Ground truth dosya/satıra
+            # göre indekslenir; her çift karşılaştırılmaz (bkz. metrics/issue_matching.py)
+            true_positives = len(match_issues(detected_issues, ground_truth, EXACT_POLICY, matching_mode))
+        elif matching_mode is not None and resolve_matching_mode(matching_mode) == MATCHING_MODE_OPTIMAL:
+            raise ValueError("Optimal eşleştirme özel issue_matching_func ile kullanılamaz")
+        else:
+            # Özel eşleştirme fonksiyonu indekslenemez; her çift karşılaştırılır.
+            # Çağıranın nesneleri olduğu gibi iletilir (detected["rule_id"] gibi
+            # erişimler bozulmasın); Issue'ya dönüştürme yalnızca varsayılan yolda
+            true_positives = 0
+            matched_ground_truth = set()
             
-            if not matched:
-                false_positives += 1
+            for detected in detected_issues:
+                for i, truth in enumerate(ground_truth):
+                    if i not in matched_ground_truth and issue_matching_func(detected, truth):
+                        true_positives += 1
+                        matched_ground_truth.add(i)
+                        break
         
-        false_negatives = len(ground_truth) - len(matched_ground_truth)
+        false_positives = len(detected_issues) - true_positives
+        false_negatives = len(ground_truth) - true_positives
         true_negatives = 0  # Genellikle hesaplanmaz (çok büyük sayı)
         
         # Precision: TP / (TP + FP)
@@ -150,25 +166,13 @@ class AdvancedMetricsCalculator:
             "false_positive_rate": false_positive_rate
         }
     
-    def _default_issue_matcher(self, detected: Dict, truth: Dict) -> bool:
+    def _default_issue_matcher(self, detected: Issue, truth: Issue) -> bool:
         """
         Varsayılan issue eşleştirme fonksiyonu
         Issue'ları dosya yolu ve satır numarasına göre eşleştirir
         """
-        detected_file = detected.get("file", detected.get("location", {}).get("file", ""))
-        detected_line = detected.get("line", detected.get("location", {}).get("line", -1))
-        
-        truth_file = truth.get("file", truth.get("location", {}).get("file", ""))
-        truth_line = truth.get("line", truth.get("location", {}).get("line", -1))
-        
         # Dosya adı ve satır numarası eşleşiyorsa aynı issue kabul et
-        if detected_file and truth_file:
-            detected_file_name = detected_file.split("/")[-1] if "/" in detected_file else detected_file
-            truth_file_name = truth_file.split("/")[-1] if "/" in truth_file else truth_file
-            
-            return detected_file_name == truth_file_name and detected_line == truth_line
-        
-        return False
+        return issues_match(detected, truth, EXACT_POLICY)
     
     def calculate_code_coverage(
         self,
@@ -264,11 +268,12 @@ class AdvancedMetricsCalculator:
     def calculate_all_advanced_metrics(
         self,
         raw_data: Dict,
-        detected_issues: List[Dict],
+        detected_issues: List[Union[Issue, Dict]],
         ground_truth: Optional[List[Dict]] = None,
         scan_duration: float = 0.0,
         total_lines: Optional[int] = None,
-        total_files: Optional[int] = None
+        total_files: Optional[int] = None,
+        matching_mode: Optional[str] = None
     ) -> AdvancedMetricResult:
         """
         Tüm gelişmiş metrikleri hesaplar
@@ -280,6 +285,7 @@ class AdvancedMetricsCalculator:
             scan_duration: Tarama süresi
             total_lines: Toplam kod satırı sayısı
             total_files: Toplam dosya sayısı
+            matching_mode: Issue eşleştirme modu, "greedy" veya "optimal" (None ise ISSUE_MATCHING_MODE)
         
         Returns:
             AdvancedMetricResult
@@ -291,7 +297,7 @@ class AdvancedMetricsCalculator:
         # Hata Tespit Başarısı
         if ground_truth:
             accuracy_metrics = self.calculate_defect_detection_accuracy(
-                detected_issues, ground_truth
+                detected_issues, ground_truth, matching_mode=matching_mode
             )
         else:
             # Ground truth yoksa varsayılan değerler
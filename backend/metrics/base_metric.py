@@ -5,15 +5,28 @@ Bu modül, tüm AI kod analiz araçları için ortak bir interface sağlar.
 Her araç, kendi çıktı formatını standart MetricResult formatına
 dönüştürmek için BaseMetric'ten türetilmelidir.
 
+normalize() MetricResult'ı ve issue listesini birlikte döndürür. Varsayılan
+olarak calculate() ve aracın kayıtlı issue çıkarıcısını (EXTRACTOR, bkz.
+issue_extractors.py) çağırır; Snyk ve DeepSource severity'leri çıkarıcı
+döngüsünde sayarak çıktıyı tek geçişte gezer.
+
 Kullanım:
     class MyToolMetrics(BaseMetric):
+        TOOL_NAME = "My Tool"
+        EXTRACTOR = "my_tool"
+
         def calculate(self, raw_data: dict) -> MetricResult:
             # Araç özel normalizasyon mantığı
             return MetricResult(...)
+
+    metric_result, issues = MyToolMetrics().normalize(raw_data)
 """
 
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 from .result_model import MetricResult
+from .issue_model import Issue
+from .issue_extractors import DEFAULT_FILE, extract_issues
 
 class BaseMetric(ABC):
     """
@@ -23,6 +36,35 @@ class BaseMetric(ABC):
     formatına dönüştürmek için bu sınıftan türetilmelidir.
     """
     
+    # MetricResult.tool_name değeri (alt sınıflar tanımlar)
+    TOOL_NAME = ""
+    
+    # issue_extractors kayıt defterindeki araç kimliği (yoksa normalize() issue döndürmez)
+    EXTRACTOR = ""
+    
+    @classmethod
+    def result_from_counts(cls, counts: dict, total_issues: int, scan_duration: float = 0.0) -> MetricResult:
+        """
+        Önceden sayılmış severity değerlerinden MetricResult oluşturur
+        
+        Args:
+            counts: {"critical", "high", "medium", "low"} sayıları
+            total_issues: Toplam issue sayısı
+            scan_duration: Tarama süresi (saniye)
+        
+        Returns:
+            MetricResult: Normalize edilmiş metrik sonucu
+        """
+        return MetricResult(
+            tool_name=cls.TOOL_NAME,
+            critical=counts["critical"],
+            high=counts["high"],
+            medium=counts["medium"],
+            low=counts["low"],
+            total_issues=total_issues,
+            scan_duration=scan_duration
+        )
+    
     @abstractmethod
     def calculate(self, raw_data: dict) -> MetricResult:
         """
@@ -42,6 +84,24 @@ class BaseMetric(ABC):
         """
         pass
     
+    def normalize(self, raw_data: dict, default_file: str = DEFAULT_FILE) -> Tuple[MetricResult, List[Issue]]:
+        """
+        Temel metrikleri ve issue listesini birlikte döndürür
+        
+        Sonuç, calculate(raw_data) ve extract_issues(EXTRACTOR, ...) çağrılarının
+        döndürdüğü değerlerle aynıdır. Alt sınıflar ikisini tek geçişte
+        hesaplamak için override edebilir.
+        
+        Args:
+            raw_data: Araçtan gelen ham JSON çıktısı
+            default_file: Çıktıda dosya bilgisi yoksa kullanılacak dosya adı
+        
+        Returns:
+            (MetricResult, List[Issue])
+        """
+        issues = extract_issues(self.EXTRACTOR, raw_data, default_file) if self.EXTRACTOR else []
+        return self.calculate(raw_data), issues
+    
     def calculate_advanced_metrics(
         self, 
         raw_data: dict, 
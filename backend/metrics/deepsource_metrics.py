@@ -32,6 +32,7 @@ Severity Mapping:
 
 from .base_metric import BaseMetric
 from .result_model import MetricResult
+from .issue_extractors import DEFAULT_FILE, extract_deepsource_issues
 
 class DeepSourceMetrics(BaseMetric):
     """
@@ -41,6 +42,31 @@ class DeepSourceMetrics(BaseMetric):
     standart MetricResult formatına dönüştürür.
     """
     
+    TOOL_NAME = "DeepSource"
+    EXTRACTOR = "deepsource"
+    
+    # DeepSource severity -> Standart format mapping
+    # Bilinmeyen severity'ler medium olarak sayılır (varsayılan)
+    SEVERITY_MAP = {
+        "CRITICAL": "critical",
+        "MAJOR": "high",
+        "MINOR": "medium",
+        "INFO": "low"
+    }
+    
+    @classmethod
+    def severity_bucket(cls, severity: str) -> str:
+        """
+        DeepSource severity'sini standart seviyeye çevirir
+        
+        Args:
+            severity: "CRITICAL", "MAJOR", "MINOR" veya "INFO"
+        
+        Returns:
+            str: "critical", "high", "medium" veya "low"
+        """
+        return cls.SEVERITY_MAP.get((severity or "").upper(), "medium")
+    
     def calculate(self, raw_data: dict) -> MetricResult:
         """
         DeepSource GraphQL API çıktısını standart MetricResult formatına çevirir
@@ -94,21 +120,7 @@ class DeepSourceMetrics(BaseMetric):
         counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
         
         for issue in issues:
-            # DeepSource severity formatı: "CRITICAL", "MAJOR", "MINOR", "INFO"
-            severity = issue.get("severity", "").upper()
-            
-            # DeepSource severity -> Standart format mapping
-            if severity == "CRITICAL":
-                counts["critical"] += 1
-            elif severity == "MAJOR":
-                counts["high"] += 1
-            elif severity == "MINOR":
-                counts["medium"] += 1
-            elif severity == "INFO":
-                counts["low"] += 1
-            else:
-                # Bilinmeyen severity'leri medium olarak say (varsayılan)
-                counts["medium"] += 1
+            counts[self.severity_bucket(issue.get("severity", ""))] += 1
         
         # ============================================
         # SCAN DURATION
@@ -120,13 +132,13 @@ class DeepSourceMetrics(BaseMetric):
         # ============================================
         # NORMALIZE EDİLMİŞ SONUCU DÖNDÜR
         # ============================================
-        return MetricResult(
-            tool_name="DeepSource",
-            critical=counts["critical"],
-            high=counts["high"],
-            medium=counts["medium"],
-            low=counts["low"],
-            total_issues=len(issues),
-            scan_duration=scan_duration
-        )
-
+        return self.result_from_counts(counts, len(issues), scan_duration)
+    
+    def normalize(self, raw_data: dict, default_file: str = DEFAULT_FILE):
+        """
+        Severity'ler issue çıkarıcısının döngüsünde sayılır (tek geçiş).
+        Mock formatındaki issue'lar calculate() gibi sayılmaz.
+        """
+        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        issues = extract_deepsource_issues(raw_data, default_file, counts=counts, severity_of=self.severity_bucket)
+        return self.result_from_counts(counts, sum(counts.values())), issues
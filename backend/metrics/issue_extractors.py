@@ -0,0 +1,352 @@
+"""
+Issue Extractors
+
+Bu modül, araçların ham çıktılarından Issue listesi çıkaran tek katmandır.
+Her araç için bir çıkarıcı kayıt defterine (registry) eklenir; runner'lar,
+benchmark/rapor script'leri ve testler aynı fonksiyonu kullanır:
+
+- snyk_code (snyk): SARIF, runs[0].results[*]
+- deepsource: GraphQL (data.repository.issues.edges) veya mock ({"issues": [...]})
+
+Issue'lar ara sözlük oluşturulmadan doğrudan tuple olarak kurulur
+(bkz. issue_model.py). Çöp toplayıcı süreç genelinde olduğundan kütüphane
+kodu onu duraklatmaz (istek thread'lerini etkiler); toplama maliyeti
+yalnızca benchmark komutunda ölçümden çıkarılır.
+
+Kullanım:
+    from metrics.issue_extractors import extract_issues
+    issues = extract_issues("snyk_code", raw_output)
+    issues = extract_issues("deepsource", raw_output, default_file="app.py")
+
+    Yeni bir araç eklemek için:
+    @register_extractor("my_tool")
+    def extract_my_tool_issues(raw_data: dict, default_file: str) -> List[Issue]:
+        ...
+
+    Sözlük tabanlı eski çıkarıma karşı bellek/süre karşılaştırması için:
+    cd backend
+    python -m metrics.issue_extractors benchmark [--issues 100000] [--repeat 5]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from .issue_model import Issue
+
+# Issue(...) yerine doğrudan tuple.__new__: NamedTuple kurucusunun Python
+# seviyesindeki argüman işleme maliyeti olmadan, sözlük literal'i kadar hızlı
+_new_issue = tuple.__new__
+
+# .get(..., {}) her çağrıda yeni bir boş sözlük oluşturur; yalnızca okunan ortak boş değer
+_EMPTY: dict = {}
+
+# Dosya bilgisi vermeyen çıktılar için varsayılan dosya adı
+DEFAULT_FILE = "unknown"
+
+# ============================================
+# KAYIT DEFTERİ
+# ============================================
+
+ISSUE_EXTRACTORS: Dict[str, Callable[[dict, str], List[Issue]]] = {}
+
+
+def register_extractor(tool: str, *aliases: str):
+    """
+    Bir aracın issue çıkarıcısını kaydeden decorator
+
+    Args:
+        tool: Araç kimliği (örn: "snyk_code")
+        aliases: Aynı çıkarıcıyı kullanan diğer adlar (örn: "snyk")
+    """
+    def decorator(func):
+        for name in (tool,) + aliases:
+            ISSUE_EXTRACTORS[name] = func
+        return func
+    return decorator
+
+
+def extract_issues(tool: str, raw_data: dict, default_file: str = DEFAULT_FILE) -> List[Issue]:
+    """
+    Aracın ham çıktısından issue'ları çıkarır
+
+    Args:
+        tool: Araç kimliği ("snyk_code", "snyk", "deepsource")
+        raw_data: Aracın ham JSON çıktısı
+        default_file: Çıktıda dosya bilgisi yoksa kullanılacak dosya adı
+
+    Returns:
+        List[Issue]
+
+    Raises:
+        ValueError: Araç için kayıtlı çıkarıcı yoksa
+    """
+    extractor = ISSUE_EXTRACTORS.get(tool)
+    if extractor is None:
+        raise ValueError(f"Bilinmeyen araç: {tool} (kayıtlı: {', '.join(sorted(ISSUE_EXTRACTORS))})")
+    if not isinstance(raw_data, dict):
+        return []
+    return extractor(raw_data, default_file)
+
+
+# ============================================
+# SNYK CODE (SARIF)
+# ============================================
+
+def sarif_result_to_issue(result: dict) -> Optional[Issue]:
+    """
+    Tek bir SARIF result'ını Issue'ya çevirir (konumu olmayan result'lar için None)
+
+    Akış halinde ayrıştırmada (sarif_stream.py) result'lar tek tek bu
+    fonksiyondan geçer.
+    """
+    locations = result.get("locations")
+    if not locations:
+        return None
+    location = locations[0].get("physicalLocation", _EMPTY)
+    return _new_issue(Issue, (
+        location.get("artifactLocation", _EMPTY).get("uri", ""),
+        location.get("region", _EMPTY).get("startLine", -1),
+        result.get("ruleId", ""),
+        result.get("level", "error"),
+        result.get("message", _EMPTY).get("text", "")
+    ))
+
+
+@register_extractor("snyk_code", "snyk")
+def extract_snyk_issues(
+    raw_data: dict,
+    default_file: str = DEFAULT_FILE,
+    counts: Optional[dict] = None,
+    severity_of: Optional[Callable[[dict], str]] = None
+) -> List[Issue]:
+    """
+    Snyk SARIF çıktısından issue'ları çıkarır (yalnızca ilk run; SnykMetrics ile aynı kapsam)
+
+    SARIF result'ları her zaman dosya konumu taşır; default_file kullanılmaz.
+
+    Args:
+        raw_data: SARIF çıktısı
+        default_file: Kullanılmaz (kayıt defteri imzası)
+        counts: Verilirse her result'ın severity'si (severity_of) aynı döngüde
+            sayılır; konumu olmayan result'lar da sayılır (SnykMetrics.normalize)
+        severity_of: result -> "critical" / "high" / "medium" / "low"
+    """
+    runs = raw_data.get("runs")
+    if not runs:
+        return []
+    issues = []
+    append = issues.append
+    # Döngüde global isim araması olmasın
+    new_issue, issue_type = _new_issue, Issue
+    count = counts is not None
+    for result in runs[0].get("results", []):
+        # Hızlı yol: Snyk'in her zaman yazdığı alanlara doğrudan erişim;
+        # eksik alan varsa sarif_result_to_issue varsayılanları uygular
+        try:
+            location = result["locations"][0]["physicalLocation"]
+            append(new_issue(issue_type, (
+                location["artifactLocation"]["uri"],
+                location["region"]["startLine"],
+                result["ruleId"],
+                result.get("level", "error"),
+                result["message"]["text"]
+            )))
+        except (KeyError, IndexError, TypeError):
+            issue = sarif_result_to_issue(result)
+            if issue is not None:
+                append(issue)
+        if count:
+            counts[severity_of(result)] += 1
+    return issues
+
+
+# ============================================
+# DEEPSOURCE
+# ============================================
+
+@register_extractor("deepsource")
+def extract_deepsource_issues(
+    raw_data: dict,
+    default_file: str = DEFAULT_FILE,
+    counts: Optional[dict] = None,
+    severity_of: Optional[Callable[[str], str]] = None
+) -> List[Issue]:
+    """
+    DeepSource GraphQL formatından veya mock formatından issue'ları çıkarır
+
+    GraphQL API'si issue başına dosya/satır vermez; dosya default_file,
+    satır -1 olur. Mock formatında severity büyük harfe çevrilir (MAJOR, MINOR, ...).
+
+    Args:
+        raw_data: GraphQL yanıtı veya mock çıktı
+        default_file: Dosya bilgisi yoksa kullanılacak dosya adı
+        counts: Verilirse GraphQL issue'larının severity'si (severity_of) aynı
+            döngüde sayılır; mock formatı sayılmaz (DeepSourceMetrics.calculate ile aynı)
+        severity_of: DeepSource severity'si -> "critical" / "high" / "medium" / "low"
+    """
+    issues = []
+    append = issues.append
+    count = counts is not None
+
+    # GraphQL formatı (gerçek API)
+    if "data" in raw_data and "repository" in raw_data["data"]:
+        repo_data = raw_data["data"]["repository"]
+        if "issues" in repo_data and "edges" in repo_data["issues"]:
+            for edge in repo_data["issues"]["edges"]:
+                if "node" in edge and "issue" in edge["node"]:
+                    issue = edge["node"]["issue"]
+                    severity = issue.get("severity", "")
+                    append(_new_issue(Issue, (
+                        default_file,
+                        -1,
+                        issue.get("shortcode", ""),
+                        severity,
+                        issue.get("title", "")
+                    )))
+                    if count:
+                        counts[severity_of(severity)] += 1
+
+    # Mock format (test için)
+    elif "issues" in raw_data:
+        for issue in raw_data["issues"]:
+            append(_new_issue(Issue, (
+                issue.get("file", default_file),
+                issue.get("line", -1),
+                issue.get("issue_code", ""),
+                issue.get("severity", "").upper(),
+                issue.get("message", "")
+            )))
+
+    return issues
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def _extract_snyk_dicts(raw_data: dict) -> List[dict]:
+    """Karşılaştırma için eski, sözlük tabanlı çıkarım (runner'lardaki kopyaların aynısı)"""
+    issues = []
+    if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
+        results = raw_data["runs"][0].get("results", [])
+        for result in results:
+            locations = result.get("locations", [])
+            if locations:
+                location = locations[0].get("physicalLocation", {})
+                artifact_location = location.get("artifactLocation", {})
+                region = location.get("region", {})
+
+                issues.append({
+                    "file": artifact_location.get("uri", ""),
+                    "line": region.get("startLine", -1),
+                    "type": result.get("ruleId", ""),
+                    "severity": result.get("level", "error"),
+                    "description": result.get("message", {}).get("text", "")
+                })
+    return issues
+
+
+def _synthetic_sarif(issue_count: int) -> dict:
+    """Bellekte küçük kalan, issue_count sonuçlu SARIF (metinler paylaşılır)"""
+    results = []
+    for index in range(issue_count):
+        results.append({
+            "ruleId": f"python/Rule{index % 40}",
+            "level": ("error", "warning", "note")[index % 3],
+            "message": {"text": "Unsanitized input flows into a sink"},
+            "locations": [{"physicalLocation": {
+                "artifactLocation": {"uri": f"src/module_{index % 300}.py"},
+                "region": {"startLine": index % 900 + 1}
+            }}]
+        })
+    return {"version": "2.1.0", "runs": [{"tool": {"driver": {"name": "SnykCode"}}, "results": results}]}
+
+
+def _dict_keys(issues: List[dict]) -> list:
+    """Eşleştiricilerin her issue için yaptığı okuma (sözlük)"""
+    return [(issue.get("file", "").lower(), issue.get("line", -1)) for issue in issues]
+
+
+def _issue_keys(issues: List[Issue]) -> list:
+    """Eşleştiricilerin her issue için yaptığı okuma (Issue)"""
+    return [(issue.file.lower(), issue.line) for issue in issues]
+
+
+def _retained_bytes(extract, raw_data: dict):
+    """Sonuç listesinin tuttuğu bellek (tracemalloc) ve listenin kendisi"""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    issues = extract(raw_data)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained, issues
+
+
+def benchmark(issue_count: int = 100000, repeat: int = 5) -> Dict[str, dict]:
+    """
+    Sözlük tabanlı ve Issue tabanlı çıkarımı karşılaştırır
+
+    Makinedeki dalgalanma iki modeli farklı etkilemesin diye ölçümler her
+    tekrarda sırayla yapılır; her ölçümün en iyi süresi alınır.
+
+    Args:
+        issue_count: Sentetik SARIF'teki result sayısı
+        repeat: Süre ölçümlerinin tekrar sayısı
+
+    Returns:
+        {"dict": {...}, "issue": {...}}: count, extract_seconds, read_seconds, bytes
+    """
+    raw_data = _synthetic_sarif(issue_count)
+    variants = {
+        "dict": (_extract_snyk_dicts, _dict_keys),
+        "issue": (lambda data: extract_issues("snyk_code", data), _issue_keys)
+    }
+    rows = {}
+    for label, (extract, read_keys) in variants.items():
+        retained, issues = _retained_bytes(extract, raw_data)
+        rows[label] = {
+            "count": len(issues),
+            "extract_seconds": float("inf"),
+            "read_seconds": float("inf"),
+            "bytes": retained,
+            "issues": issues
+        }
+
+    for _ in range(repeat):
+        for label, (extract, read_keys) in variants.items():
+            row = rows[label]
+            start_time = time.perf_counter()
+            extract(raw_data)
+            row["extract_seconds"] = min(row["extract_seconds"], time.perf_counter() - start_time)
+            start_time = time.perf_counter()
+            read_keys(row["issues"])
+            row["read_seconds"] = min(row["read_seconds"], time.perf_counter() - start_time)
+
+    for row in rows.values():
+        del row["issues"]
+    return rows
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        count = int(sys.argv[sys.argv.index("--issues") + 1]) if "--issues" in sys.argv else 100000
+        repeat_count = int(sys.argv[sys.argv.index("--repeat") + 1]) if "--repeat" in sys.argv else 5
+        # Tek thread'li ölçüm süreci: çöp toplama duraklamaları sürelere karışmasın
+        gc.collect()
+        gc.disable()
+        try:
+            rows = benchmark(count, repeat_count)
+        finally:
+            gc.enable()
+        print(f"Sentetik SARIF: {count} issue")
+        print(f"{'Model':<8} {'Çıkarım (ms)':>13} {'Okuma (ms)':>11} {'Bellek (MB)':>12} {'Bayt/issue':>11}")
+        for label, row in rows.items():
+            print(
+                f"{label:<8} {row['extract_seconds'] * 1000:>13.1f} {row['read_seconds'] * 1000:>11.1f} "
+                f"{row['bytes'] / 1e6:>12.2f} {row['bytes'] / max(row['count'], 1):>11.0f}"
+            )
+    else:
+        print("Kullanım: python -m metrics.issue_extractors benchmark [--issues N] [--repeat N]")
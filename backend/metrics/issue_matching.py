@@ -0,0 +1,672 @@
+"""
+Issue Matching
+
+Bu modül, bulunan issue'ları ground truth kayıtlarıyla eşleştirir ve
+precision/recall/F1 değerlerini hesaplar. Benchmark ve rapor script'leri ile
+AdvancedMetricsCalculator aynı eşleştiriciyi kullanır; aralarındaki fark
+yalnızca eşleştirme kurallarıdır (MatchPolicy).
+
+Eşleştirme açgözlüdür (greedy): bulunan issue'lar sırayla gezilir ve her biri,
+kurallara uyan ve henüz eşleşmemiş en küçük sıralı ground truth kaydıyla
+eşleşir. Sonuç, her çifti karşılaştıran iç içe döngüyle birebir aynıdır;
+ancak ground truth bir kez dosya adına göre gruplanıp satıra göre sıralanır
+ve tolerans penceresindeki adaylar ikili arama (bisect) ile bulunur.
+Karmaşıklık O(n·m) yerine yaklaşık O((n + m) log m) olur.
+
+İsteğe bağlı "optimal" mod, her dosyada en fazla sayıda çifti ve bu sayıda
+toplam satır farkı en küçük olan bire bir atamayı bulur (min-cost max-flow).
+Açgözlü eşleştirme sıraya bağlıdır ve yakın bulgular kümelendiğinde true
+positive sayısını eksik sayabilir; optimal mod sıradan bağımsız ve
+deterministiktir, böylece çalıştırmalar arası metrik farkları güvenilir olur.
+
+Kurallar (MatchPolicy):
+- Dosya adı dizinden bağımsız karşılaştırılır (Issue.file_name)
+- Satırlar ±line_tolerance içinde ise eşleşir
+- type_fallback: satırı olmayan (<= 0) issue'lar tip benzerliğiyle eşleşir
+- require_file=False: dosyası boş olan issue her dosyayla eşleşebilir
+
+Environment Variables:
+    ISSUE_MATCHING_MODE: Varsayılan eşleştirme modu, "greedy" veya "optimal" (varsayılan: greedy)
+
+Kullanım:
+    from metrics.issue_matching import match_metrics, BENCHMARK_POLICY
+    metrics = match_metrics(detected_issues, ground_truth, BENCHMARK_POLICY)
+    metrics["precision"], metrics["recall"], metrics["f1_score"]
+
+    pairs = greedy_match(detected_issues, ground_truth, EXACT_POLICY)  # [(detected_index, truth_index), ...]
+
+    # En fazla çift, en küçük toplam satır farkı
+    metrics = match_metrics(detected_issues, ground_truth, BENCHMARK_POLICY, mode="optimal")
+"""
+
+import heapq
+import os
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .issue_model import Issue
+
+
+@dataclass(frozen=True)
+class MatchPolicy:
+    """
+    Issue eşleştirme kuralları
+
+    Attributes:
+        line_tolerance: Kabul edilen satır farkı (0: aynı satır)
+        positive_lines_only: Satır karşılaştırması yalnızca iki satır da > 0 ise yapılır
+        type_fallback: Satırlardan biri <= 0 ise issue tipleri birbirini içeriyorsa eşleşir
+        case_sensitive: Dosya adları büyük/küçük harf duyarlı karşılaştırılır
+        require_file: Dosyası boş olan issue hiçbir şeyle eşleşmez (False ise her dosyayla eşleşebilir)
+    """
+    line_tolerance: int = 2
+    positive_lines_only: bool = True
+    type_fallback: bool = False
+    case_sensitive: bool = False
+    require_file: bool = False
+
+
+# benchmark_runner.py: ±2 satır; satır yoksa (DeepSource) issue tipi benzerliği
+BENCHMARK_POLICY = MatchPolicy(type_fallback=True)
+
+# comprehensive_test_report.py: ±2 satır
+REPORT_POLICY = MatchPolicy()
+
+# AdvancedMetricsCalculator: aynı dosya adı ve aynı satır
+EXACT_POLICY = MatchPolicy(
+    line_tolerance=0,
+    positive_lines_only=False,
+    case_sensitive=True,
+    require_file=True
+)
+
+
+# Eşleştirme modları
+MATCHING_MODE_GREEDY = "greedy"
+MATCHING_MODE_OPTIMAL = "optimal"
+MATCHING_MODES = (MATCHING_MODE_GREEDY, MATCHING_MODE_OPTIMAL)
+
+# Varsayılan eşleştirme modu (fonksiyonlara mode=None verildiğinde)
+DEFAULT_MATCHING_MODE = os.getenv("ISSUE_MATCHING_MODE", MATCHING_MODE_GREEDY)
+
+
+def resolve_matching_mode(mode: Optional[str] = None) -> str:
+    """
+    Eşleştirme modunu doğrular (None ise DEFAULT_MATCHING_MODE)
+
+    Raises:
+        ValueError: Bilinmeyen mod
+    """
+    mode = (mode or DEFAULT_MATCHING_MODE).strip().lower()
+    if mode not in MATCHING_MODES:
+        raise ValueError(f"Bilinmeyen eşleştirme modu: {mode} (geçerli: {', '.join(MATCHING_MODES)})")
+    return mode
+
+
+def _file_key(issue: Issue, policy: MatchPolicy) -> Optional[str]:
+    """Dosya grubunun anahtarı (dosyası boş issue'lar için None)"""
+    if not issue.file:
+        return None
+    name = issue.file_name
+    return name if policy.case_sensitive else name.lower()
+
+
+def _types_similar(detected_type: str, truth_type: str) -> bool:
+    """Issue tipleri birbirini içeriyorsa (büyük harfe çevrilmiş) benzer kabul edilir"""
+    return truth_type in detected_type or detected_type in truth_type
+
+
+def issues_match(detected: Issue, truth: Issue, policy: MatchPolicy = REPORT_POLICY) -> bool:
+    """
+    Tek bir issue çiftini kurallara göre karşılaştırır
+
+    İndeksli eşleştiricinin referans tanımıdır; greedy_match ile aynı kararı verir.
+    Özel eşleştirme fonksiyonu bekleyen yerlerde de kullanılabilir.
+
+    Args:
+        detected: Bulunan issue
+        truth: Ground truth kaydı
+        policy: Eşleştirme kuralları
+
+    Returns:
+        bool: Eşleşiyorsa True
+    """
+    detected, truth = Issue.coerce(detected), Issue.coerce(truth)
+    detected_key, truth_key = _file_key(detected, policy), _file_key(truth, policy)
+    if detected_key is None or truth_key is None:
+        if policy.require_file:
+            return False
+    elif detected_key != truth_key:
+        return False
+
+    detected_line, truth_line = detected.line, truth.line
+    lines_comparable = not policy.positive_lines_only or (detected_line > 0 and truth_line > 0)
+    if lines_comparable and abs(detected_line - truth_line) <= policy.line_tolerance:
+        return True
+
+    if policy.type_fallback and (detected_line <= 0 or truth_line <= 0):
+        return _types_similar(detected.type.upper(), truth.type.upper())
+
+    return False
+
+
+# ============================================
+# İNDEKS
+# ============================================
+
+class _FileBucket:
+    """Bir dosya adındaki ground truth kayıtları"""
+
+    __slots__ = ("lines", "line_indices", "lineless", "indices")
+
+    def __init__(self):
+        # Satıra göre sıralı (satır, sıra) çiftleri: lines[k] <-> line_indices[k]
+        self.lines: List[int] = []
+        self.line_indices: List[int] = []
+        # Satır karşılaştırmasına girmeyen kayıtlar (positive_lines_only ve satır <= 0)
+        self.lineless: List[int] = []
+        # Tüm kayıtlar, sıra numarasına göre
+        self.indices: List[int] = []
+
+
+class GroundTruthIndex:
+    """
+    Ground truth kayıtlarını dosya adına ve satıra göre indeksler
+
+    Dosyası boş kayıtlar (require_file=False iken her dosyayla eşleşebilir)
+    ayrı bir grupta tutulur; dosyası boş bulunan issue'lar için tüm kayıtları
+    içeren bir grup daha oluşturulur.
+    """
+
+    def __init__(self, ground_truth: Iterable, policy: MatchPolicy = REPORT_POLICY):
+        """
+        Args:
+            ground_truth: Ground truth kayıtları (Issue veya sözlük)
+            policy: Eşleştirme kuralları
+        """
+        self.policy = policy
+        self.truths: List[Issue] = [Issue.coerce(truth) for truth in ground_truth]
+        self.truth_types: List[str] = [truth.type.upper() for truth in self.truths]
+        self.buckets: Dict[Optional[str], _FileBucket] = {}
+        self.all = _FileBucket()
+
+        rows: Dict[Optional[str], List[Tuple[int, int]]] = {}
+        all_rows = []
+        lineless_check = policy.positive_lines_only
+        for index, truth in enumerate(self.truths):
+            key = _file_key(truth, policy)
+            if key is None and policy.require_file:
+                continue
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = _FileBucket()
+                rows[key] = []
+            bucket.indices.append(index)
+            self.all.indices.append(index)
+            if lineless_check and truth.line <= 0:
+                bucket.lineless.append(index)
+                self.all.lineless.append(index)
+            else:
+                rows[key].append((truth.line, index))
+                all_rows.append((truth.line, index))
+
+        for key, bucket in self.buckets.items():
+            self._fill_lines(bucket, rows[key])
+        self._fill_lines(self.all, all_rows)
+
+    @staticmethod
+    def _fill_lines(bucket: _FileBucket, rows: List[Tuple[int, int]]):
+        rows.sort()
+        bucket.lines = [line for line, _ in rows]
+        bucket.line_indices = [index for _, index in rows]
+
+    def candidate_buckets(self, detected: Issue) -> List[_FileBucket]:
+        """Bulunan issue'nun eşleşebileceği gruplar"""
+        key = _file_key(detected, self.policy)
+        if key is None:
+            return [] if self.policy.require_file else [self.all]
+        buckets = []
+        bucket = self.buckets.get(key)
+        if bucket is not None:
+            buckets.append(bucket)
+        if not self.policy.require_file:
+            wildcard = self.buckets.get(None)
+            if wildcard is not None:
+                buckets.append(wildcard)
+        return buckets
+
+    def candidates(self, detected: Issue) -> Iterator[Tuple[int, int]]:
+        """
+        Bulunan issue ile eşleşebilen tüm kayıtlar ve eşleşme maliyetleri
+
+        Maliyet satır farkıdır; tip benzerliğiyle (satırsız) eşleşmeler, her satır
+        eşleşmesinden pahalı olsun diye line_tolerance + 1 maliyetlidir.
+
+        Yields:
+            (ground truth sırası, maliyet)
+        """
+        policy = self.policy
+        line = detected.line
+        has_line = not policy.positive_lines_only or line > 0
+        detected_type = detected.type.upper() if policy.type_fallback else ""
+        type_cost = policy.line_tolerance + 1
+        truth_types = self.truth_types
+        for bucket in self.candidate_buckets(detected):
+            if has_line:
+                lines = bucket.lines
+                line_indices = bucket.line_indices
+                for position in range(
+                    bisect_left(lines, line - policy.line_tolerance),
+                    bisect_right(lines, line + policy.line_tolerance)
+                ):
+                    yield line_indices[position], abs(lines[position] - line)
+                typed = bucket.lineless if policy.type_fallback else ()
+            else:
+                typed = bucket.indices if policy.type_fallback else ()
+            for truth_index in typed:
+                if _types_similar(detected_type, truth_types[truth_index]):
+                    yield truth_index, type_cost
+
+
+def greedy_match(
+    detected_issues: Iterable,
+    ground_truth: Iterable,
+    policy: MatchPolicy = REPORT_POLICY
+) -> List[Tuple[int, int]]:
+    """
+    Bulunan issue'ları ground truth ile açgözlü eşleştirir
+
+    Her bulunan issue (sırayla), issues_match ile eşleşen ve henüz
+    eşleşmemiş en küçük sıralı ground truth kaydını alır.
+
+    Args:
+        detected_issues: Bulunan issue'lar (Issue veya sözlük)
+        ground_truth: Ground truth kayıtları (Issue veya sözlük)
+        policy: Eşleştirme kuralları
+
+    Returns:
+        List[Tuple[int, int]]: (bulunan sırası, ground truth sırası) çiftleri
+    """
+    index = ground_truth if isinstance(ground_truth, GroundTruthIndex) else GroundTruthIndex(ground_truth, policy)
+    policy = index.policy
+    truth_types = index.truth_types
+    matched = bytearray(len(index.truths))
+    tolerance = policy.line_tolerance
+    positive_lines_only = policy.positive_lines_only
+    type_fallback = policy.type_fallback
+    candidate_buckets = index.candidate_buckets
+    pairs = []
+
+    for detected_index, detected in enumerate(detected_issues):
+        detected = Issue.coerce(detected)
+        buckets = candidate_buckets(detected)
+        if not buckets:
+            continue
+        line = detected.line
+        has_line = not positive_lines_only or line > 0
+        detected_type = detected.type.upper() if type_fallback else ""
+        best = -1
+
+        for bucket in buckets:
+            if has_line:
+                # Tolerans penceresindeki satırlar: en küçük sıralı boş kayıt
+                lines = bucket.lines
+                line_indices = bucket.line_indices
+                for position in range(bisect_left(lines, line - tolerance), bisect_right(lines, line + tolerance)):
+                    truth_index = line_indices[position]
+                    if not matched[truth_index] and (best < 0 or truth_index < best):
+                        best = truth_index
+                if type_fallback:
+                    # Satırı olmayan kayıtlar tip benzerliğiyle (sıra numarasına göre ilk uygun)
+                    for truth_index in bucket.lineless:
+                        if best >= 0 and truth_index > best:
+                            break
+                        if not matched[truth_index] and _types_similar(detected_type, truth_types[truth_index]):
+                            best = truth_index
+                            break
+            elif type_fallback:
+                # Bulunan issue'nun satırı yok: gruptaki tüm kayıtlar tip benzerliğiyle
+                for truth_index in bucket.indices:
+                    if best >= 0 and truth_index > best:
+                        break
+                    if not matched[truth_index] and _types_similar(detected_type, truth_types[truth_index]):
+                        best = truth_index
+                        break
+
+        if best >= 0:
+            matched[best] = 1
+            pairs.append((detected_index, best))
+
+    return pairs
+
+
+# ============================================
+# OPTİMAL EŞLEŞTİRME (MIN-COST MAX-FLOW)
+# ============================================
+
+def _connected_components(edges: List[Tuple[int, int, int]]) -> List[List[Tuple[int, int, int]]]:
+    """Kenarları, birbirine bağlı gruplara ayırır (union-find)"""
+    parent: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+    def find(node):
+        root = node
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while node != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    for detected_group, truth_group, _ in edges:
+        detected_root, truth_root = find((0, detected_group)), find((1, truth_group))
+        if detected_root != truth_root:
+            parent[truth_root] = detected_root
+
+    components: Dict[Tuple[int, int], List[Tuple[int, int, int]]] = {}
+    for edge in edges:
+        components.setdefault(find((0, edge[0])), []).append(edge)
+    return list(components.values())
+
+
+def _min_cost_max_flow(
+    edges: List[Tuple[int, int, int]],
+    detected_sizes: List[int],
+    truth_sizes: List[int]
+) -> List[int]:
+    """
+    Bir bileşende en fazla eşleşmeli, en küçük toplam maliyetli akış
+
+    Kaynak -> bulunan grubu (kapasite: grup boyutu) -> ground truth grubu
+    (kenar maliyeti) -> hedef (kapasite: grup boyutu). Ardışık en kısa yollar
+    (successive shortest paths): her fazda potansiyellerle Dijkstra yapılır,
+    ardından sıfır indirgenmiş maliyetli kenarlar üzerinden aynı maliyetteki
+    artırım yolları DFS ile doldurulur. Maliyetler küçük tamsayılar olduğu için
+    faz sayısı azdır.
+
+    Args:
+        edges: (bulunan grubu, ground truth grubu, maliyet) kenarları
+        detected_sizes: Bulunan gruplarının boyutları
+        truth_sizes: Ground truth gruplarının boyutları
+
+    Returns:
+        List[int]: Her kenardaki akış (edges ile aynı sırada)
+    """
+    detected_ids: Dict[int, int] = {}
+    truth_ids: Dict[int, int] = {}
+    for detected_group, truth_group, _ in edges:
+        detected_ids.setdefault(detected_group, len(detected_ids))
+        truth_ids.setdefault(truth_group, len(truth_ids))
+
+    # Düğümler: 0 = kaynak, bulunan grupları, ground truth grupları, son = hedef
+    detected_offset = 1
+    truth_offset = detected_offset + len(detected_ids)
+    sink = truth_offset + len(truth_ids)
+    node_count = sink + 1
+
+    # Kenar dizileri: kenar e'nin tersi e ^ 1
+    heads: List[int] = []
+    capacities: List[int] = []
+    costs: List[int] = []
+    adjacency: List[List[int]] = [[] for _ in range(node_count)]
+
+    def add_edge(source: int, target: int, capacity: int, cost: int) -> int:
+        edge = len(heads)
+        adjacency[source].append(edge)
+        heads.append(target)
+        capacities.append(capacity)
+        costs.append(cost)
+        adjacency[target].append(edge + 1)
+        heads.append(source)
+        capacities.append(0)
+        costs.append(-cost)
+        return edge
+
+    for detected_group, local_id in detected_ids.items():
+        add_edge(0, detected_offset + local_id, detected_sizes[detected_group], 0)
+    pair_edges = [
+        add_edge(
+            detected_offset + detected_ids[detected_group],
+            truth_offset + truth_ids[truth_group],
+            min(detected_sizes[detected_group], truth_sizes[truth_group]),
+            cost
+        )
+        for detected_group, truth_group, cost in edges
+    ]
+    for truth_group, local_id in truth_ids.items():
+        add_edge(truth_offset + local_id, sink, truth_sizes[truth_group], 0)
+
+    def augment(path_edges: List[int]):
+        amount = min(capacities[edge] for edge in path_edges)
+        for edge in path_edges:
+            capacities[edge] -= amount
+            capacities[edge ^ 1] += amount
+
+    infinity = float("inf")
+    potentials = [0] * node_count
+    while True:
+        # Dijkstra (indirgenmiş maliyetler negatif değildir)
+        distances = [infinity] * node_count
+        distances[0] = 0
+        parent_edges = [-1] * node_count
+        heap = [(0, 0)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            if node == sink:
+                break
+            node_potential = potentials[node]
+            for edge in adjacency[node]:
+                if capacities[edge]:
+                    target = heads[edge]
+                    candidate = distance + costs[edge] + node_potential - potentials[target]
+                    if candidate < distances[target]:
+                        distances[target] = candidate
+                        parent_edges[target] = edge
+                        heapq.heappush(heap, (candidate, target))
+        sink_distance = distances[sink]
+        if sink_distance == infinity:
+            break
+        for node in range(node_count):
+            potentials[node] += min(distances[node], sink_distance)
+
+        # Dijkstra'nın bulduğu en kısa yol her fazda artırılır (ilerleme garantisi)
+        path_edges = []
+        node = sink
+        while node != 0:
+            edge = parent_edges[node]
+            path_edges.append(edge)
+            node = heads[edge ^ 1]
+        augment(path_edges)
+
+        # Aynı maliyetteki diğer yollar: sıfır indirgenmiş maliyetli kenarlarda iteratif DFS
+        dead = [False] * node_count
+        next_edge = [0] * node_count
+        while True:
+            path_edges = []
+            on_path = [0]
+            visiting = {0}
+            while on_path and on_path[-1] != sink:
+                node = on_path[-1]
+                node_edges = adjacency[node]
+                advanced = False
+                while next_edge[node] < len(node_edges):
+                    edge = node_edges[next_edge[node]]
+                    target = heads[edge]
+                    if (
+                        capacities[edge]
+                        and not dead[target]
+                        and target not in visiting
+                        and costs[edge] + potentials[node] - potentials[target] == 0
+                    ):
+                        path_edges.append(edge)
+                        on_path.append(target)
+                        visiting.add(target)
+                        advanced = True
+                        break
+                    next_edge[node] += 1
+                if not advanced:
+                    dead[node] = True
+                    visiting.discard(on_path.pop())
+                    if path_edges:
+                        path_edges.pop()
+                        next_edge[on_path[-1]] += 1
+            if not on_path:
+                break
+            augment(path_edges)
+
+    return [capacities[edge ^ 1] for edge in pair_edges]
+
+
+def optimal_match(
+    detected_issues: Iterable,
+    ground_truth: Iterable,
+    policy: MatchPolicy = REPORT_POLICY
+) -> List[Tuple[int, int]]:
+    """
+    Bulunan issue'ları ground truth ile optimal (bire bir) eşleştirir
+
+    Eşleşebilen çiftler (issues_match) arasında önce çift sayısını en büyük,
+    sonra toplam satır farkını en küçük yapan atamayı bulur. Tip benzerliğiyle
+    eşleşen satırsız çiftler, her satır eşleşmesinden pahalı sayılır.
+
+    Aynı dosya, satır ve tipteki issue'lar birbirinin yerine geçebildiği için
+    tek bir düğümde toplanır (kapasite: adet); yalnızca birbirine bağlı gruplar
+    (genelde aynı dosyanın yakın satırları) birlikte çözülür. Çift sayısı ve
+    toplam maliyet girdi sırasından bağımsızdır; bir gruptaki issue'lar sıra
+    numarasına göre atanır.
+
+    Args:
+        detected_issues: Bulunan issue'lar (Issue veya sözlük)
+        ground_truth: Ground truth kayıtları (Issue veya sözlük)
+        policy: Eşleştirme kuralları
+
+    Returns:
+        List[Tuple[int, int]]: (bulunan sırası, ground truth sırası) çiftleri, bulunan sırasına göre
+    """
+    index = ground_truth if isinstance(ground_truth, GroundTruthIndex) else GroundTruthIndex(ground_truth, policy)
+    policy = index.policy
+
+    # Ground truth grupları: (dosya anahtarı, satır, tip) aynı olan kayıtlar
+    truth_group_of: List[int] = []
+    truth_groups: List[List[int]] = []
+    truth_group_ids: Dict[Tuple, int] = {}
+    for truth_index, truth in enumerate(index.truths):
+        signature = (_file_key(truth, policy), truth.line, index.truth_types[truth_index])
+        group = truth_group_ids.setdefault(signature, len(truth_groups))
+        if group == len(truth_groups):
+            truth_groups.append([])
+        truth_groups[group].append(truth_index)
+        truth_group_of.append(group)
+
+    # Bulunan grupları ve gruplar arası kenarlar (her grup için adaylar bir kez aranır)
+    detected_groups: List[List[int]] = []
+    detected_group_ids: Dict[Tuple, int] = {}
+    edges: List[Tuple[int, int, int]] = []
+    for detected_index, detected in enumerate(detected_issues):
+        detected = Issue.coerce(detected)
+        signature = (_file_key(detected, policy), detected.line, detected.type.upper() if policy.type_fallback else "")
+        group = detected_group_ids.get(signature)
+        if group is None:
+            group = detected_group_ids[signature] = len(detected_groups)
+            detected_groups.append([])
+            linked = set()
+            for truth_index, cost in index.candidates(detected):
+                truth_group = truth_group_of[truth_index]
+                if truth_group not in linked:
+                    linked.add(truth_group)
+                    edges.append((group, truth_group, cost))
+        detected_groups[group].append(detected_index)
+
+    detected_sizes = [len(members) for members in detected_groups]
+    truth_sizes = [len(members) for members in truth_groups]
+    detected_taken = [0] * len(detected_groups)
+    truth_taken = [0] * len(truth_groups)
+    pairs = []
+    for component in _connected_components(edges):
+        if len(component) == 1:
+            # Tek kenar: akış iki grubun küçük olanı kadardır
+            detected_group, truth_group, _ = component[0]
+            flows = [min(detected_sizes[detected_group], truth_sizes[truth_group])]
+        else:
+            flows = _min_cost_max_flow(component, detected_sizes, truth_sizes)
+        for (detected_group, truth_group, _), flow in zip(component, flows):
+            for _ in range(flow):
+                pairs.append((
+                    detected_groups[detected_group][detected_taken[detected_group]],
+                    truth_groups[truth_group][truth_taken[truth_group]]
+                ))
+                detected_taken[detected_group] += 1
+                truth_taken[truth_group] += 1
+    pairs.sort()
+    return pairs
+
+
+def match_issues(
+    detected_issues: Iterable,
+    ground_truth: Iterable,
+    policy: MatchPolicy = REPORT_POLICY,
+    mode: Optional[str] = None
+) -> List[Tuple[int, int]]:
+    """
+    Seçilen modla eşleştirir ("greedy": greedy_match, "optimal": optimal_match)
+
+    Args:
+        detected_issues: Bulunan issue'lar (Issue veya sözlük)
+        ground_truth: Ground truth kayıtları (Issue veya sözlük)
+        policy: Eşleştirme kuralları
+        mode: Eşleştirme modu (None ise DEFAULT_MATCHING_MODE)
+
+    Returns:
+        List[Tuple[int, int]]: (bulunan sırası, ground truth sırası) çiftleri
+
+    Raises:
+        ValueError: Bilinmeyen mod
+    """
+    if resolve_matching_mode(mode) == MATCHING_MODE_OPTIMAL:
+        return optimal_match(detected_issues, ground_truth, policy)
+    return greedy_match(detected_issues, ground_truth, policy)
+
+
+def match_metrics(
+    detected_issues: List,
+    ground_truth: List,
+    policy: MatchPolicy = REPORT_POLICY,
+    mode: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    Precision, Recall, F1 Score hesaplar
+
+    Args:
+        detected_issues: Bulunan issue'lar (Issue veya sözlük)
+        ground_truth: Ground truth kayıtları (Issue veya sözlük)
+        policy: Eşleştirme kuralları
+        mode: Eşleştirme modu ("greedy" veya "optimal"; None ise DEFAULT_MATCHING_MODE)
+
+    Returns:
+        Metrikler (precision, recall, f1_score, true_positives, false_positives, false_negatives)
+
+    Raises:
+        ValueError: Bilinmeyen mod
+    """
+    true_positives = len(match_issues(detected_issues, ground_truth, policy, mode)) if ground_truth else 0
+    false_positives = len(detected_issues) - true_positives
+    false_negatives = len(ground_truth) - true_positives
+
+    # Precision: TP / (TP + FP)
+    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
+
+    # Recall: TP / (TP + FN)
+    recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0.0
+
+    # F1 Score
+    f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
+
+    return {
+        "precision": precision,
+        "recall": recall,
+        "f1_score": f1_score,
+        "true_positives": true_positives,
+        "false_positives": false_positives,
+        "false_negatives": false_negatives
+    }
@@ -0,0 +1,92 @@
+"""
+Issue Model
+
+Bu modül, tüm araçların bulduğu issue'lar için ortak ve kompakt bir tip tanımlar.
+Snyk SARIF, DeepSource GraphQL ve mock çıktılarından çıkarılan issue'lar
+(bkz. issue_extractors.py) ve ground truth kayıtları bu tipe dönüştürülür;
+eşleştirme ve metrik hesapları tek bir alan kümesi üzerinde çalışır.
+
+Issue bir NamedTuple'dır (__slots__ = ()): örnek başına __dict__ tutulmaz,
+anahtar isimleri her issue'da tekrar saklanmaz. 100.000 issue'luk bir taramada
+sözlük listesine göre belirgin şekilde daha az bellek kullanır
+(bkz. python -m metrics.issue_extractors benchmark).
+
+Kullanım:
+    issue = Issue(file="app.py", line=18, type="SQL_INJECTION", severity="high", description="...")
+    issue.file, issue.line
+    issue.to_dict()                      # JSON için
+    Issue.from_dict(ground_truth_item)   # {"file", "line", ...} veya {"location": {...}}
+"""
+
+from typing import NamedTuple
+
+
+class Issue(NamedTuple):
+    """
+    Standart issue modeli
+
+    Attributes:
+        file: Dosya yolu (araç ne veriyorsa; dosya bilgisi yoksa varsayılan değer)
+        line: Satır numarası (bilinmiyorsa -1)
+        type: Kural / issue tipi (örn: "python/Sqli", "PYL-W0612", "SQL_INJECTION")
+        severity: Aracın kendi severity değeri (örn: "error", "MAJOR", "high")
+        description: Açıklama
+    """
+    file: str = ""
+    line: int = -1
+    type: str = ""
+    severity: str = ""
+    description: str = ""
+
+    @property
+    def file_name(self) -> str:
+        """Dizinden bağımsız dosya adı (eşleştirme için; / ve \\ ayraçları)"""
+        return self.file.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+
+    def get(self, key: str, default=None):
+        """
+        Sözlük gibi okuma (issue'ları dict olarak alan eski eşleştirme fonksiyonları için)
+
+        Args:
+            key: Alan adı
+            default: Alan yoksa dönecek değer
+        """
+        return getattr(self, key, default) if key in self._fields else default
+
+    def to_dict(self) -> dict:
+        """JSON'a yazılabilir sözlük"""
+        return {
+            "file": self.file,
+            "line": self.line,
+            "type": self.type,
+            "severity": self.severity,
+            "description": self.description
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Issue":
+        """
+        Sözlükten Issue oluşturur
+
+        Düz ({"file", "line", ...}) ve iç içe ({"location": {"file", "line"}})
+        biçimler desteklenir; eksik alanlar varsayılan değerleri alır.
+
+        Args:
+            data: Issue veya ground truth kaydı
+
+        Returns:
+            Issue
+        """
+        location = data.get("location") or {}
+        return cls(
+            data.get("file", location.get("file", "")) or "",
+            data.get("line", location.get("line", -1)),
+            data.get("type", "") or "",
+            data.get("severity", "") or "",
+            data.get("description", "") or ""
+        )
+
+    @classmethod
+    def coerce(cls, value) -> "Issue":
+        """Issue'yu olduğu gibi, sözlüğü from_dict ile döner"""
+        return value if isinstance(value, cls) else cls.from_dict(value)
@@ -21,6 +21,7 @@ Severity Mapping:
 
 from .base_metric import BaseMetric
 from .result_model import MetricResult
+from .issue_extractors import DEFAULT_FILE, extract_snyk_issues
 import time
 
 class SnykMetrics(BaseMetric):
@@ -28,6 +29,41 @@ class SnykMetrics(BaseMetric):
     Snyk Code çıktılarını standart metrik formatına normalize eder
     """
     
+    TOOL_NAME = "Snyk Code"
+    EXTRACTOR = "snyk_code"
+    
+    @staticmethod
+    def severity_of(result: dict) -> str:
+        """
+        Tek bir SARIF result'ının standart severity'sini belirler
+        
+        Args:
+            result: runs[*].results[*] öğesi
+        
+        Returns:
+            str: "critical", "high", "medium" veya "low"
+        """
+        level = result.get("level", "error").lower()
+        priority_score = result.get("properties", {}).get("priorityScore", 0)
+        
+        # Priority score varsa, ona göre severity belirle
+        # Snyk Code priority score: 0-1000 arası
+        if priority_score > 0:
+            if priority_score >= 900:
+                return "critical"
+            elif priority_score >= 700:
+                return "high"
+            elif priority_score >= 500:
+                return "medium"
+            return "low"
+        
+        # Priority score yoksa, level'a göre belirle
+        if level == "error":
+            return "high"
+        elif level == "warning":
+            return "medium"
+        return "low"
+    
     def calculate(self, raw_data: dict) -> MetricResult:
         """
         Snyk Code'un ham çıktısını standart MetricResult formatına çevirir
@@ -57,28 +93,7 @@ class SnykMetrics(BaseMetric):
             
             # Her result için severity belirleme
             for result in results:
-                level = result.get("level", "error").lower()
-                priority_score = result.get("properties", {}).get("priorityScore", 0)
-                
-                # Priority score varsa, ona göre severity belirle
-                # Snyk Code priority score: 0-1000 arası
-                if priority_score > 0:
-                    if priority_score >= 900:
-                        counts["critical"] += 1
-                    elif priority_score >= 700:
-                        counts["high"] += 1
-                    elif priority_score >= 500:
-                        counts["medium"] += 1
-                    else:
-                        counts["low"] += 1
-                else:
-                    # Priority score yoksa, level'a göre belirle
-                    if level == "error":
-                        counts["high"] += 1
-                    elif level == "warning":
-                        counts["medium"] += 1
-                    else:
-                        counts["low"] += 1
+                counts[self.severity_of(result)] += 1
             
             # Scan duration SARIF formatında genelde yok
             # automationDetails içinde olabilir ama genelde 0.0 olarak bırakıyoruz
@@ -123,3 +138,15 @@ class SnykMetrics(BaseMetric):
             total_issues=len(vulns),
             scan_duration=raw_data.get("scanDuration", 0.0)
         )
+    
+    def normalize(self, raw_data: dict, default_file: str = DEFAULT_FILE):
+        """
+        SARIF çıktısında severity'ler issue çıkarıcısının döngüsünde sayılır
+        (tek geçiş). Eski format (vulnerabilities[]) issue konumu taşımadığından
+        calculate() ile sayılır ve issue listesi boş döner.
+        """
+        if not raw_data.get("runs"):
+            return self.calculate(raw_data), []
+        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        issues = extract_snyk_issues(raw_data, default_file, counts=counts, severity_of=self.severity_of)
+        return self.result_from_counts(counts, sum(counts.values())), issues
@@ -0,0 +1,585 @@
+"""
+İçerik Adresli Ham Çıktı Deposu (Object Store) Modülü
+
+Değişmemiş projelerin tekrar taranması bayt bayt aynı ham çıktıyı üretir
+(örn: aynı içerikli çok sayıda deepsource_flask_demo_*.json). Bu modül ham
+çıktıları içerik hash'leri altında tek kez saklar:
+
+    results/objects/<hash[:2]>/<hash>.json      (RESULTS_COMPACT=1 ise .json.gz)
+
+results/ altındaki tarama kaydı (snyk_code_<proje>_<ts>.json) artık yalnızca
+bu nesneye bir referans ve taramaya özgü meta veriyi (zaman, süre, önbellek
+durumu, kaynak kullanımı) tutar:
+
+    {"$object": "sha256:<hash>", "tool": "snyk_code", "project": "flask_demo",
+     "timestamp": "...", "tree_hash": "...", "scan_duration": 12.5, "resource_usage": {...}}
+
+result_io.read_json() referansları otomatik çözer; okuyucular ham çıktıyı
+eskisi gibi alır. Hash, nesnenin (sıkıştırılmamış) dosya baytları üzerinden
+hesaplanır: put() ile yazılan nesnelerde bu boşluksuz (minified) JSON'dur,
+tarayıcının doğrudan depoya yazdığı dosyalarda (adopt()) tarayıcının kendi
+çıktısıdır.
+
+Kullanım:
+    from object_store import object_store, write_scan_record
+    saved_path, digest = write_scan_record(file_path, raw_output, {"scan_duration": 3.2})
+    raw_output = object_store.get(digest)
+
+    Eski tam sonuç dosyalarını referans kayıtlarına çevirmek / sahipsiz nesneleri silmek için:
+    cd backend
+    python object_store.py migrate
+    python object_store.py gc
+
+Environment Variables:
+    RESULTS_DEDUP: Ham çıktıları içerik adresli sakla (default: 1)
+    RESULTS_OBJECTS_DIR: Nesne klasörü (default: ../results/objects)
+    RESULTS_OBJECT_GC_MIN_AGE_SECONDS: Sahipsiz nesnelerin silinmeden önceki en kısa yaşı (default: 3600)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from result_io import (
+    COMPRESSED_SUFFIX,
+    OBJECT_REF_KEY,
+    OBJECT_REF_PREFIX,
+    RESULTS_COMPACT,
+    RESULTS_COMPRESSION_LEVEL,
+    read_json,
+    result_files,
+    write_json
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+RESULTS_DEDUP = os.getenv("RESULTS_DEDUP", "1").lower() not in ("0", "false", "no")
+RESULTS_OBJECTS_DIR = os.getenv("RESULTS_OBJECTS_DIR", "../results/objects")
+RESULTS_OBJECT_GC_MIN_AGE_SECONDS = float(os.getenv("RESULTS_OBJECT_GC_MIN_AGE_SECONDS", "3600"))
+
+
+class ObjectNotFoundError(RuntimeError):
+    """Referans verilen nesne depoda bulunamadığında fırlatılır"""
+
+
+def object_digest(data) -> Tuple[str, bytes]:
+    """
+    Verinin içerik hash'ini hesaplar
+
+    Args:
+        data: JSON'a çevrilebilir veri
+
+    Returns:
+        (sha256 hex, minified JSON baytları)
+    """
+    minified = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(minified).hexdigest(), minified
+
+
+def encode_minified(minified: bytes) -> bytes:
+    """Minified JSON baytlarını saklama biçimine çevirir (RESULTS_COMPACT açıksa gzip)"""
+    if RESULTS_COMPACT:
+        return gzip.compress(minified, compresslevel=RESULTS_COMPRESSION_LEVEL, mtime=0)
+    return minified
+
+
+def parse_reference(data) -> Optional[str]:
+    """Referans kaydından hash'i döner; kayıt referans değilse None"""
+    if isinstance(data, dict):
+        reference = data.get(OBJECT_REF_KEY)
+        if isinstance(reference, str) and reference.startswith(OBJECT_REF_PREFIX):
+            return reference[len(OBJECT_REF_PREFIX):]
+    return None
+
+
+class ObjectStore:
+    """
+    Ham çıktıların içerik hash'i ile adreslendiği disk deposu
+
+    Nesneler değişmezdir; aynı içerik ikinci kez yazılmaz, yalnızca mtime'ı
+    güncellenir (çöp toplama yaş kontrolü için).
+    """
+
+    def __init__(self, root: str = RESULTS_OBJECTS_DIR):
+        self.root = Path(root)
+
+    def _candidates(self, digest: str) -> Tuple[Path, Path]:
+        directory = self.root / digest[:2]
+        return directory / f"{digest}.json", directory / f"{digest}.json{COMPRESSED_SUFFIX}"
+
+    def path_for(self, digest: str) -> Optional[Path]:
+        """Nesnenin dosya yolu (her iki biçim denenir; yoksa None)"""
+        for path in self._candidates(digest):
+            if path.exists():
+                return path
+        return None
+
+    def put(self, data, digest: Optional[str] = None, minified: Optional[bytes] = None) -> str:
+        """
+        Veriyi saklar (zaten varsa yazmaz)
+
+        Args:
+            data: JSON'a çevrilebilir veri
+            digest, minified: object_digest() sonucu önceden hesaplandıysa
+
+        Returns:
+            str: İçerik hash'i
+        """
+        if digest is None or minified is None:
+            digest, minified = object_digest(data)
+
+        existing = self.path_for(digest)
+        if existing is not None:
+            try:
+                os.utime(existing)
+            except OSError:
+                pass
+            return digest
+
+        plain_path, compressed_path = self._candidates(digest)
+        target = compressed_path if RESULTS_COMPACT else plain_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encode_minified(minified))
+            # Aynı nesneyi eşzamanlı yazanlar aynı baytları üretir; son os.replace kazanır
+            os.replace(temp_path, target)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def spool_path(self, suffix: str = ".tmp") -> Path:
+        """
+        Tarayıcının çıktısını doğrudan yazacağı boş geçici dosya
+
+        Dosya deponun tmp/ klasöründedir; adopt() ile kopyalanmadan nesneye
+        dönüştürülür. Sahipsiz kalırsa collect_garbage() siler.
+        """
+        temp_dir = self.root / "tmp"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir, suffix=suffix)
+        os.close(fd)
+        return Path(temp_path)
+
+    def adopt(self, path, digest: str) -> str:
+        """
+        Diskteki bir dosyayı (örn: spool_path()) olduğu gibi nesne yapar
+
+        Dosya yeniden yazılmaz, yalnızca taşınır (RESULTS_COMPACT açıksa gzip
+        ile sıkıştırılarak). Aynı nesne zaten varsa dosya silinir.
+
+        Args:
+            path: Nesne yapılacak JSON dosyası (aynı dosya sisteminde)
+            digest: Dosya baytlarının sha256'sı (okuyan taraf tek geçişte hesaplar)
+
+        Returns:
+            str: digest
+        """
+        path = Path(path)
+        existing = self.path_for(digest)
+        if existing is not None:
+            path.unlink()
+            try:
+                os.utime(existing)
+            except OSError:
+                pass
+            return digest
+
+        plain_path, compressed_path = self._candidates(digest)
+        target = compressed_path if RESULTS_COMPACT else plain_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if RESULTS_COMPACT:
+            compressed_temp = path.with_name(path.name + COMPRESSED_SUFFIX)
+            try:
+                with open(path, "rb") as source, gzip.GzipFile(
+                    compressed_temp, "wb", compresslevel=RESULTS_COMPRESSION_LEVEL, mtime=0
+                ) as out:
+                    shutil.copyfileobj(source, out, 1024 * 1024)
+                os.replace(compressed_temp, target)
+            except Exception:
+                try:
+                    os.unlink(compressed_temp)
+                except OSError:
+                    pass
+                raise
+            path.unlink()
+        else:
+            os.replace(path, target)
+        return digest
+
+    def copy_to(self, digest: str, path) -> Path:
+        """
+        Nesneyi belleğe almadan bir sonuç dosyasına kopyalar
+
+        Hedef biçimi RESULTS_COMPACT'a göredir (kompakt modda ".gz" eklenir,
+        bkz. result_io.write_json).
+
+        Args:
+            digest: Nesnenin içerik hash'i
+            path: Hedef dosya (.json uzantılı)
+
+        Returns:
+            Path: Gerçekte yazılan dosyanın yolu
+
+        Raises:
+            ObjectNotFoundError: Nesne yoksa
+        """
+        source_path = self.path_for(digest)
+        if source_path is None:
+            raise ObjectNotFoundError(f"Nesne bulunamadı: {digest}")
+        path = Path(path)
+        if RESULTS_COMPACT and path.suffix != COMPRESSED_SUFFIX:
+            path = path.with_name(path.name + COMPRESSED_SUFFIX)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw_out:
+                opener = gzip.open if source_path.suffix == COMPRESSED_SUFFIX else open
+                with opener(source_path, "rb") as source:
+                    if RESULTS_COMPACT:
+                        with gzip.GzipFile(
+                            fileobj=raw_out, mode="wb", compresslevel=RESULTS_COMPRESSION_LEVEL, mtime=0
+                        ) as out:
+                            shutil.copyfileobj(source, out, 1024 * 1024)
+                    else:
+                        shutil.copyfileobj(source, raw_out, 1024 * 1024)
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return path
+
+    def writer(self) -> "ObjectWriter":
+        """Büyük nesneleri bellekte tutmadan parça parça yazmak için yazıcı"""
+        return ObjectWriter(self)
+
+    def get(self, digest: str):
+        """
+        Nesneyi okur
+
+        Raises:
+            ObjectNotFoundError: Nesne yoksa
+        """
+        path = self.path_for(digest)
+        if path is None:
+            raise ObjectNotFoundError(f"Nesne bulunamadı: {digest}")
+        return read_json(path, resolve=False)
+
+    def iter_objects(self) -> Iterable[Path]:
+        """Depodaki tüm nesne dosyaları"""
+        if not self.root.exists():
+            return []
+        return (path for path in self.root.glob("*/*.json*") if not path.name.endswith(".tmp"))
+
+    def collect_garbage(
+        self,
+        results_dir: str = "../results",
+        min_age: float = RESULTS_OBJECT_GC_MIN_AGE_SECONDS,
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Hiçbir kaydın referans vermediği nesneleri siler
+
+        Yeni yazılmış (min_age'den genç) nesnelere dokunulmaz; kaydı henüz
+        yazılmamış bir nesnenin silinmesi böylece önlenir.
+
+        Returns:
+            int: Silinen nesne sayısı
+        """
+        now = time.time() if now is None else now
+        referenced = referenced_digests(results_dir)
+        removed = 0
+        # Yarım kalmış ObjectWriter / spool_path() geçici dosyaları
+        for temp_path in (self.root / "tmp").glob("*.tmp*"):
+            try:
+                if now - temp_path.stat().st_mtime >= min_age:
+                    temp_path.unlink()
+            except OSError:
+                pass
+        for path in self.iter_objects():
+            digest = path.name.split(".", 1)[0]
+            if digest in referenced:
+                continue
+            try:
+                if now - path.stat().st_mtime < min_age:
+                    continue
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def stats(self) -> dict:
+        """Nesne sayısı ve toplam boyut"""
+        count = total_bytes = 0
+        for path in self.iter_objects():
+            try:
+                total_bytes += path.stat().st_size
+                count += 1
+            except OSError:
+                pass
+        return {"objects": count, "bytes": total_bytes, "root": str(self.root)}
+
+
+class ObjectWriter:
+    """
+    Nesneyi parça parça (akış halinde) yazar
+
+    Yazılan baytlar nesnenin minified JSON biçimi olmalıdır; hash bu baytlar
+    üzerinden hesaplanır, böylece object_digest() ile aynı sonucu verir.
+    Aynı nesne zaten varsa commit() yeni dosyayı atar.
+
+    Kullanım:
+        writer = object_store.writer()
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+            digest = writer.commit()
+        except Exception:
+            writer.abort()
+            raise
+    """
+
+    def __init__(self, store: ObjectStore):
+        self.store = store
+        self.size = 0
+        self._hash = hashlib.sha256()
+        temp_dir = store.root / "tmp"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        fd, self._temp_path = tempfile.mkstemp(dir=temp_dir, suffix=".tmp")
+        self._raw = os.fdopen(fd, "wb")
+        self._out = self._raw
+        if RESULTS_COMPACT:
+            self._out = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=RESULTS_COMPRESSION_LEVEL, mtime=0)
+
+    def write(self, data: bytes):
+        """Minified JSON baytlarını ekler"""
+        self._hash.update(data)
+        self._out.write(data)
+        self.size += len(data)
+
+    def _close(self):
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+
+    def commit(self) -> str:
+        """
+        Nesneyi içerik hash'i altına yerleştirir
+
+        Returns:
+            str: İçerik hash'i
+        """
+        self._close()
+        digest = self._hash.hexdigest()
+        existing = self.store.path_for(digest)
+        if existing is not None:
+            os.unlink(self._temp_path)
+            try:
+                os.utime(existing)
+            except OSError:
+                pass
+            return digest
+
+        plain_path, compressed_path = self.store._candidates(digest)
+        target = compressed_path if RESULTS_COMPACT else plain_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._temp_path, target)
+        return digest
+
+    def abort(self):
+        """Yarım nesneyi siler"""
+        try:
+            self._close()
+        except OSError:
+            pass
+        try:
+            os.unlink(self._temp_path)
+        except OSError:
+            pass
+
+
+# ============================================
+# TARAMA KAYITLARI
+# ============================================
+
+def write_scan_record(
+    path,
+    raw_output,
+    metadata: Optional[dict] = None,
+    digest: Optional[str] = None
+) -> Tuple[Path, Optional[str]]:
+    """
+    Ham çıktıyı depoya, referans + meta veriyi results/ altındaki kayda yazar
+
+    RESULTS_DEDUP kapalıysa ham çıktı eskisi gibi doğrudan kayda yazılır;
+    depoya akış halinde yazılmış çıktılar (digest verilip raw_output None)
+    belleğe alınmadan kayda kopyalanır.
+
+    Args:
+        path: Kayıt dosyası (.json)
+        raw_output: Tarayıcının ham çıktısı (digest verildiyse None olabilir)
+        metadata: Taramaya özgü meta veri (zaman, süre, kaynak kullanımı, ...)
+        digest: Ham çıktı depoya önceden (akış halinde) yazıldıysa hash'i
+
+    Returns:
+        (yazılan kayıt yolu, içerik hash'i veya dedup kapalıysa None)
+
+    Raises:
+        ObjectNotFoundError: Dedup kapalıyken digest'in nesnesi depoda yoksa
+    """
+    if not RESULTS_DEDUP:
+        if raw_output is None:
+            return object_store.copy_to(digest, path), None
+        return write_json(path, raw_output), None
+
+    if digest is None:
+        digest = object_store.put(raw_output)
+    record = {OBJECT_REF_KEY: OBJECT_REF_PREFIX + digest}
+    record.update(metadata or {})
+    return write_json(path, record), digest
+
+
+def referenced_digests(results_dir: str = "../results") -> set:
+    """results/ altındaki kayıtların referans verdiği nesne hash'leri"""
+    referenced = set()
+    for path in result_files(results_dir):
+        try:
+            digest = parse_reference(read_json(path, resolve=False))
+        except (OSError, ValueError, EOFError):
+            continue
+        if digest:
+            referenced.add(digest)
+    return referenced
+
+
+def migrate_directory(results_dir: str = "../results", min_bytes: int = 0) -> dict:
+    """
+    Eski tam ham çıktı dosyalarını (tarama kayıtları) referans kayıtlarına çevirir
+
+    Rapor ve gelişmiş metrik dosyalarına dokunulmaz. Dosya zaman damgası korunur.
+
+    Args:
+        results_dir: Sonuç klasörü
+        min_bytes: Bu boyuttan küçük dosyalar atlanır
+
+    Returns:
+        dict: {"migrated", "bytes_before", "bytes_after", "objects_written"}
+    """
+    # results_store, object_store'u import ettiği için sınıflandırıcı burada yüklenir
+    from results_store import KIND_SCAN, classify_result_file
+
+    migrated = bytes_before = bytes_after = 0
+    objects_before = object_store.stats()["objects"]
+    for path in sorted(result_files(results_dir)):
+        meta = classify_result_file(path)
+        if meta is None or meta["kind"] != KIND_SCAN:
+            continue
+        try:
+            size = path.stat().st_size
+            data = read_json(path, resolve=False)
+        except (OSError, ValueError, EOFError):
+            continue
+        if size < min_bytes or parse_reference(data) is not None:
+            continue
+
+        stat = path.stat()
+        digest = object_store.put(data)
+        record = {
+            OBJECT_REF_KEY: OBJECT_REF_PREFIX + digest,
+            "tool": meta["tool"],
+            "project": meta["project"],
+            "migrated": True
+        }
+        # Kaydın biçimi (json / json.gz) ve adı korunur
+        new_path = write_json(path, record, compact=path.name.endswith(COMPRESSED_SUFFIX))
+        os.utime(new_path, (stat.st_atime, stat.st_mtime))
+        migrated += 1
+        bytes_before += size
+        bytes_after += new_path.stat().st_size
+
+    return {
+        "migrated": migrated,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "objects_written": object_store.stats()["objects"] - objects_before
+    }
+
+
+# ============================================
+# KAYNAK KULLANIMI
+# ============================================
+
+def resource_snapshot() -> Optional[tuple]:
+    """Kaynak kullanımı ölçümünün başlangıç noktası (desteklenmeyen platformda None)"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+
+
+def resource_delta(start: Optional[tuple]) -> Optional[dict]:
+    """
+    resource_snapshot()'tan bu yana harcanan CPU süresi ve alt süreç bellek tepe değeri
+
+    Tarayıcı CLI'leri alt süreç olarak çalıştığı için (Snyk, DeepSource CLI)
+    CPU süresi süreç + beklenen alt süreçler toplamıdır. Aynı anda başka
+    taramalar da çalışıyorsa değerler onları da içerir.
+
+    Returns:
+        dict: {"cpu_user_seconds", "cpu_system_seconds", "peak_child_rss_mb"} veya None
+    """
+    if start is None or resource is None:
+        return None
+    self_end, children_end = resource_snapshot()
+    self_start, children_start = start
+    # ru_maxrss: Linux'ta KB, macOS'ta bayt
+    rss_divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "cpu_user_seconds": round(
+            (self_end.ru_utime - self_start.ru_utime) + (children_end.ru_utime - children_start.ru_utime), 4
+        ),
+        "cpu_system_seconds": round(
+            (self_end.ru_stime - self_start.ru_stime) + (children_end.ru_stime - children_start.ru_stime), 4
+        ),
+        "peak_child_rss_mb": round(children_end.ru_maxrss / rss_divisor, 2)
+    }
+
+
+# Uygulama genelinde paylaşılan nesne deposu
+object_store = ObjectStore()
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "migrate":
+        print(json.dumps(migrate_directory(), indent=2))
+        print(json.dumps(object_store.stats(), indent=2))
+    elif command == "gc":
+        print(f"Silinen sahipsiz nesne: {object_store.collect_garbage()}")
+    elif command == "stats":
+        print(json.dumps(object_store.stats(), indent=2))
+    else:
+        print("Kullanım: python object_store.py migrate|gc|stats")
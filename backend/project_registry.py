@@ -0,0 +1,424 @@
+"""
+Proje Kayıt Dizini (Project Registry) Modülü
+
+Bu modül, taranabilir projelerin (test_projects/ altındaki sabit projeler ve
+/upload ile yüklenenler) kalıcı bir SQLite dizinini tutar. Her proje için:
+- Dosya sayısı, satır sayısı (LOC), boyut ve dile göre dağılım
+- Tree hash (tarama önbelleğiyle aynı içerik hash'i)
+- Araç başına son tarama işaretçisi (sonuç dosyası, zaman, başarı)
+
+İstatistikler yalnızca proje değiştiğinde yeniden hesaplanır: Dosyaların
+mtime/boyut imzası kayıtlı imzayla aynıysa dosyalar okunmaz. Değiştiyse
+her dosya tek sefer okunur; aynı okumada hem SHA-256 özeti hem satır sayısı
+çıkarılır.
+
+Dizin bellekte de tutulur: üyelik kontrolü (contains) ve proje listesi
+(GET /projects) diske veya dosya sistemine gitmeden, kilit altında cevaplanır.
+Yazmalar (kayıt, silme, tarama işaretçisi) hem belleğe hem SQLite'a yapılır.
+
+Kullanım:
+    from project_registry import project_registry
+    project_registry.contains("flask_demo")
+    project_registry.register("uploaded_7b6950545e5b", "../test_projects/uploaded/uploaded_7b6950545e5b")
+    project_registry.list_projects()
+    project_registry.record_scan("flask_demo", "snyk_code", result)
+
+Environment Variables:
+    PROJECT_REGISTRY_DB: SQLite dosyası (default: ../results/.cache/projects.db)
+    TEST_PROJECTS_DIR: Sabit test projelerinin klasörü (default: ../test_projects)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from tree_hash import HASH_CHUNK_SIZE, compute_tree_hash, iter_project_files
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+PROJECT_REGISTRY_DB = os.getenv("PROJECT_REGISTRY_DB", "../results/.cache/projects.db")
+TEST_PROJECTS_DIR = os.getenv("TEST_PROJECTS_DIR", "../test_projects")
+
+# test_projects/ altındaki sabit projeler (sıra /projects ve */all taramalarında korunur)
+BUILTIN_PROJECTS = [
+    "flask_demo",
+    "vulnerable_sql_injection",
+    "vulnerable_command_injection",
+    "vulnerable_xss",
+    "vulnerable_hardcoded_creds"
+]
+
+# Dosya uzantısı -> dil (istatistik için)
+LANGUAGE_BY_SUFFIX = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".go": "Go",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".cs": "C#",
+    ".c": "C",
+    ".h": "C",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".rs": "Rust",
+    ".swift": "Swift",
+    ".scala": "Scala",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".sql": "SQL",
+    ".sh": "Shell",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    registered_at REAL NOT NULL,
+    exists_on_disk INTEGER NOT NULL DEFAULT 0,
+    signature TEXT,
+    tree_hash TEXT,
+    file_count INTEGER,
+    loc INTEGER,
+    size_bytes INTEGER,
+    languages TEXT,
+    stats_refreshed_at REAL
+);
+CREATE TABLE IF NOT EXISTS last_scans (
+    project TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    file_path TEXT,
+    scanned_at REAL NOT NULL,
+    success INTEGER NOT NULL,
+    PRIMARY KEY (project, tool)
+);
+"""
+
+PROJECT_COLUMNS = (
+    "name", "kind", "path", "position", "registered_at", "exists_on_disk", "signature",
+    "tree_hash", "file_count", "loc", "size_bytes", "languages", "stats_refreshed_at"
+)
+
+
+def tree_signature(root: Path) -> Optional[str]:
+    """
+    Projenin mtime/boyut imzası (dosyalar okunmaz, yalnızca stat yapılır)
+
+    Returns:
+        str: İmza veya klasör yoksa None
+    """
+    if not root.is_dir():
+        return None
+    digest = hashlib.sha256()
+    for relative_path, full_path in iter_project_files(root):
+        try:
+            stat = full_path.stat()
+        except OSError:
+            continue
+        digest.update(f"{relative_path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def compute_project_stats(root: Path) -> dict:
+    """
+    Proje istatistiklerini hesaplar (her dosya tek sefer okunur)
+
+    Args:
+        root: Proje klasörü
+
+    Returns:
+        dict: {"tree_hash", "file_count", "loc", "size_bytes", "languages"}
+    """
+    file_digests = {}
+    languages: Dict[str, dict] = {}
+    total_loc = 0
+    total_bytes = 0
+
+    for relative_path, full_path in iter_project_files(root):
+        digest = hashlib.sha256()
+        line_count = 0
+        size = 0
+        last_chunk = b""
+        try:
+            with open(full_path, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    line_count += chunk.count(b"\n")
+                    size += len(chunk)
+                    last_chunk = chunk
+        except OSError:
+            continue
+        # Son satır "\n" ile bitmiyorsa o da sayılır
+        if last_chunk and not last_chunk.endswith(b"\n"):
+            line_count += 1
+
+        file_digests[relative_path] = digest.hexdigest()
+        total_loc += line_count
+        total_bytes += size
+
+        language = LANGUAGE_BY_SUFFIX.get(Path(relative_path).suffix.lower())
+        if language:
+            language_stats = languages.setdefault(language, {"files": 0, "loc": 0})
+            language_stats["files"] += 1
+            language_stats["loc"] += line_count
+
+    return {
+        "tree_hash": compute_tree_hash(root, file_digests),
+        "file_count": len(file_digests),
+        "loc": total_loc,
+        "size_bytes": total_bytes,
+        "languages": languages
+    }
+
+
+class ProjectRegistry:
+    """
+    Projelerin SQLite dizini ve bellek içi kopyası
+    """
+
+    def __init__(
+        self,
+        db_path: str = PROJECT_REGISTRY_DB,
+        test_projects_dir: str = TEST_PROJECTS_DIR,
+        builtin_projects: Optional[List[str]] = None
+    ):
+        self.db_path = Path(db_path)
+        self.test_projects_dir = Path(test_projects_dir)
+        self.builtin_projects = list(BUILTIN_PROJECTS if builtin_projects is None else builtin_projects)
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._projects: Dict[str, dict] = {}
+        self._last_scans: Dict[str, Dict[str, dict]] = {}
+        self._loaded = False
+
+    # ============================================
+    # YÜKLEME
+    # ============================================
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def _ensure_loaded(self):
+        """
+        Dizini ilk kullanımda yükler (import sırasında disk erişimi yapılmaz)
+
+        Sabit projeler kaydedilir ve değişmişlerse istatistikleri yenilenir;
+        klasörü silinmiş yüklenmiş projeler dizinden çıkarılır.
+        """
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            db = self._db()
+            for row in db.execute("SELECT * FROM projects ORDER BY position"):
+                self._projects[row["name"]] = self._row_to_dict(row)
+            for row in db.execute("SELECT * FROM last_scans"):
+                self._last_scans.setdefault(row["project"], {})[row["tool"]] = {
+                    "file_path": row["file_path"],
+                    "scanned_at": row["scanned_at"],
+                    "success": bool(row["success"])
+                }
+            self._loaded = True
+
+            for name in self.builtin_projects:
+                self.register(name, self.test_projects_dir / name, kind="builtin")
+            for name, project in list(self._projects.items()):
+                if project["kind"] == "uploaded" and not Path(project["path"]).is_dir():
+                    self.remove(name)
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> dict:
+        project = {column: row[column] for column in PROJECT_COLUMNS}
+        project["exists_on_disk"] = bool(project["exists_on_disk"])
+        project["languages"] = json.loads(project["languages"]) if project["languages"] else {}
+        return project
+
+    def _save_project(self, project: dict):
+        """Projeyi belleğe ve SQLite'a yazar (kilit altında çağrılır)"""
+        self._projects[project["name"]] = project
+        values = dict(project)
+        values["exists_on_disk"] = int(values["exists_on_disk"])
+        values["languages"] = json.dumps(values["languages"] or {}, sort_keys=True)
+        placeholders = ", ".join(f":{column}" for column in PROJECT_COLUMNS)
+        with self._db():
+            self._db().execute(
+                f"INSERT OR REPLACE INTO projects ({', '.join(PROJECT_COLUMNS)}) VALUES ({placeholders})",
+                values
+            )
+
+    # ============================================
+    # KAYIT / YENİLEME
+    # ============================================
+
+    def register(self, name: str, path, kind: str = "uploaded", refresh: bool = True) -> dict:
+        """
+        Projeyi dizine ekler (zaten varsa yalnızca gerekirse yeniler)
+
+        Args:
+            name: Proje adı
+            path: Proje klasörü
+            kind: "builtin" veya "uploaded"
+            refresh: İstatistikler mtime imzası değiştiyse yeniden hesaplansın mı
+
+        Returns:
+            dict: Proje kaydı
+        """
+        self._ensure_loaded()
+        with self._lock:
+            project = self._projects.get(name)
+            if project is None:
+                project = {column: None for column in PROJECT_COLUMNS}
+                project.update({
+                    "name": name,
+                    "kind": kind,
+                    "path": str(path),
+                    "position": max((p["position"] for p in self._projects.values()), default=-1) + 1,
+                    "registered_at": time.time(),
+                    "exists_on_disk": False,
+                    "languages": {}
+                })
+                self._save_project(project)
+        return self.refresh(name) if refresh else dict(project)
+
+    def refresh(self, name: str, force: bool = False) -> dict:
+        """
+        Projenin istatistiklerini mtime imzası değiştiyse yeniden hesaplar
+
+        Args:
+            name: Proje adı
+            force: True ise imza aynı olsa da yeniden hesaplanır
+
+        Returns:
+            dict: Güncel proje kaydı
+
+        Raises:
+            KeyError: Proje kayıtlı değilse
+        """
+        self._ensure_loaded()
+        with self._lock:
+            project = dict(self._projects[name])
+
+        root = Path(project["path"])
+        signature = tree_signature(root)
+        if signature is not None and signature == project["signature"] and not force:
+            return project
+
+        # Dosya okuma kilit dışında yapılır; diğer istekler beklemez
+        if signature is None:
+            project.update({"exists_on_disk": False, "signature": None})
+        else:
+            project.update(compute_project_stats(root))
+            project.update({
+                "exists_on_disk": True,
+                "signature": signature,
+                "stats_refreshed_at": time.time()
+            })
+
+        with self._lock:
+            if name in self._projects:
+                self._save_project(project)
+        return project
+
+    def refresh_all(self, force: bool = False) -> int:
+        """
+        Tüm projeleri (imzası değişenleri) yeniler
+
+        Returns:
+            int: İstatistikleri yeniden hesaplanan proje sayısı
+        """
+        refreshed = 0
+        for name in self.names():
+            before = self.get(name)
+            after = self.refresh(name, force=force)
+            if after.get("stats_refreshed_at") != (before or {}).get("stats_refreshed_at"):
+                refreshed += 1
+        return refreshed
+
+    def remove(self, name: str):
+        """Projeyi dizinden çıkarır (klasöre dokunulmaz)"""
+        self._ensure_loaded()
+        with self._lock:
+            self._projects.pop(name, None)
+            self._last_scans.pop(name, None)
+            with self._db():
+                self._db().execute("DELETE FROM projects WHERE name = ?", (name,))
+                self._db().execute("DELETE FROM last_scans WHERE project = ?", (name,))
+
+    def record_scan(self, name: str, tool: str, result: dict):
+        """
+        Projenin araç başına son tarama işaretçisini günceller
+
+        Args:
+            name: Proje adı
+            tool: Araç adı ("snyk_code", "deepsource")
+            result: Runner sonucu (success, file_path)
+        """
+        self._ensure_loaded()
+        scan = {
+            "file_path": result.get("file_path"),
+            "scanned_at": time.time(),
+            "success": bool(result.get("success"))
+        }
+        with self._lock:
+            if name not in self._projects:
+                return
+            self._last_scans.setdefault(name, {})[tool] = scan
+            with self._db():
+                self._db().execute(
+                    "INSERT OR REPLACE INTO last_scans (project, tool, file_path, scanned_at, success) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, tool, scan["file_path"], scan["scanned_at"], int(scan["success"]))
+                )
+
+    # ============================================
+    # SORGULAR (bellekten)
+    # ============================================
+
+    def contains(self, name: str) -> bool:
+        """Proje kayıtlı mı (O(1))"""
+        self._ensure_loaded()
+        with self._lock:
+            return name in self._projects
+
+    def names(self) -> List[str]:
+        """Kayıtlı projelerin adları (kayıt sırasıyla, kopya liste)"""
+        self._ensure_loaded()
+        with self._lock:
+            return sorted(self._projects, key=lambda name: self._projects[name]["position"])
+
+    def get(self, name: str) -> Optional[dict]:
+        """Proje kaydı ve son taramaları (yoksa None)"""
+        self._ensure_loaded()
+        with self._lock:
+            project = self._projects.get(name)
+            if project is None:
+                return None
+            return {**project, "last_scans": dict(self._last_scans.get(name, {}))}
+
+    def list_projects(self) -> List[dict]:
+        """Tüm proje kayıtları, kayıt sırasıyla"""
+        return [project for project in (self.get(name) for name in self.names()) if project is not None]
+
+
+# Uygulama genelinde paylaşılan dizin
+project_registry = ProjectRegistry()
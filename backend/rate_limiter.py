@@ -0,0 +1,232 @@
+"""
+Harici Tarayıcı API'leri İçin Token-Bucket Hız Sınırlayıcı
+
+Bu modül, DeepSource ve Snyk gibi harici servislere yapılan çağrıları servis
+ve kimlik bilgisi (token, org) başına bir token-bucket ile sınırlar.
+benchmark_runner.py veya comprehensive_test_report.py gibi toplu çalıştırmalar
+servisleri throttle edilene kadar zorlamaz; çağıranlar hata almak yerine
+token boşalana kadar sırada bekler.
+
+Bucket, dakikada RATE_LIMIT_<SERVİS>_PER_MINUTE token ile dolar ve en fazla
+RATE_LIMIT_<SERVİS>_BURST token biriktirir. Token yoksa çağrı bir sonraki
+uygun zamanı rezerve eder (bucket eksiye düşer) ve o zamana kadar kilit
+dışında uyur; böylece bekleyenler geliş sırasıyla (FIFO) geçer.
+
+Servis 429 / Retry-After dönerse defer() ile bucket o süre boyunca
+boşaltılır; aynı kimlik bilgisini kullanan tüm çağıranlar birlikte bekler.
+
+Kalan token, bir sonraki token için bekleme süresi ve sıradaki çağrı sayısı
+status() ile (GET /rate-limits) okunabilir.
+
+Kullanım:
+    from rate_limiter import rate_limiter
+    waited = rate_limiter.acquire("deepsource", token)
+    rate_limiter.defer("deepsource", token, retry_after_seconds)
+    rate_limiter.status()
+
+Environment Variables:
+    RATE_LIMIT_ENABLED: Sınırlayıcıyı aç/kapat (default: 1)
+    RATE_LIMIT_DEEPSOURCE_PER_MINUTE: DeepSource API dakikalık istek sınırı (default: 60)
+    RATE_LIMIT_DEEPSOURCE_BURST: DeepSource API anlık en fazla istek (default: 10)
+    RATE_LIMIT_SNYK_PER_MINUTE: Snyk Code dakikalık tarama sınırı (default: 20)
+    RATE_LIMIT_SNYK_BURST: Snyk Code anlık en fazla tarama (default: 5)
+    RATE_LIMIT_MAX_WAIT_SECONDS: Sırada en fazla bekleme, 0 = sınırsız (default: 0)
+"""
+
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1").lower() not in ("0", "false", "no")
+RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "0"))
+
+# Servis başına varsayılan sınırlar: (dakikalık token, burst)
+DEFAULT_LIMITS = {
+    "deepsource": (60.0, 10.0),
+    "snyk": (20.0, 5.0),
+}
+
+
+class RateLimitTimeout(RuntimeError):
+    """Token için beklenecek süre RATE_LIMIT_MAX_WAIT_SECONDS'ı aşarsa"""
+
+
+def _service_limits(service: str) -> Tuple[float, float]:
+    """Servisin (dakikalık token, burst) değerlerini environment'tan okur"""
+    default_per_minute, default_burst = DEFAULT_LIMITS.get(service, (60.0, 10.0))
+    prefix = f"RATE_LIMIT_{service.upper()}"
+    per_minute = float(os.getenv(f"{prefix}_PER_MINUTE", str(default_per_minute)))
+    burst = float(os.getenv(f"{prefix}_BURST", str(default_burst)))
+    # 0 veya negatif değerler sıfıra bölmeye yol açmasın
+    return max(per_minute, 0.001), max(burst, 1.0)
+
+
+class TokenBucket:
+    """
+    Tek bir servis + kimlik bilgisi için token bucket
+    """
+
+    def __init__(self, per_minute: float, burst: float, max_wait: float = RATE_LIMIT_MAX_WAIT_SECONDS):
+        self.rate = per_minute / 60.0
+        self.capacity = burst
+        self.max_wait = max_wait
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self.queued = 0
+        self.deferrals = 0
+
+    def _refill(self, now: float):
+        """Geçen süre kadar token ekler (kilit altında çağrılır)"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Token alır; yoksa sırası gelene kadar bekler
+
+        Args:
+            tokens: Harcanacak token sayısı
+
+        Returns:
+            float: Beklenen süre (saniye)
+
+        Raises:
+            RateLimitTimeout: Bekleme süresi max_wait'i aşacaksa (rezervasyon yapılmaz)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = 0.0 if self.tokens >= tokens else (tokens - self.tokens) / self.rate
+            if self.max_wait and wait > self.max_wait:
+                raise RateLimitTimeout(
+                    f"Hız sınırı: token için {wait:.1f} sn beklenmesi gerekiyor "
+                    f"(limit: {self.max_wait:.0f} sn)"
+                )
+            # Rezervasyon: bucket eksiye düşebilir, sonraki çağrılar bu borcun
+            # arkasında sıraya girer
+            self.tokens -= tokens
+            self.acquired += 1
+            if wait > 0:
+                self.queued += 1
+                self.waited_seconds += wait
+
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                with self._lock:
+                    self.queued -= 1
+        return wait
+
+    def defer(self, seconds: float):
+        """
+        Servisin istediği süre boyunca yeni token verilmesini engeller (429 / Retry-After)
+
+        Args:
+            seconds: Beklenecek süre
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Bucket, ilk token ancak "seconds" sonra hazır olacak kadar boşaltılır
+            self.tokens = min(self.tokens, 1.0 - seconds * self.rate)
+            self.deferrals += 1
+
+    def status(self) -> dict:
+        """Kalan token, bir sonraki token için bekleme süresi ve sayaçlar"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "per_minute": round(self.rate * 60.0, 3),
+                "burst": self.capacity,
+                "remaining": round(max(self.tokens, 0.0), 3),
+                "wait_seconds": round(max(0.0, (1.0 - self.tokens) / self.rate), 3),
+                "queued": self.queued,
+                "acquired_total": self.acquired,
+                "waited_seconds_total": round(self.waited_seconds, 3),
+                "deferrals": self.deferrals
+            }
+
+
+class RateLimiter:
+    """
+    Servis + kimlik bilgisi başına TokenBucket tutan kayıt
+    """
+
+    def __init__(self, enabled: bool = RATE_LIMIT_ENABLED):
+        self.enabled = enabled
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _credential_id(credential: Optional[str]) -> str:
+        """Kimlik bilgisinin kısa hash'i (token'ın kendisi saklanmaz/gösterilmez)"""
+        if not credential:
+            return "anonymous"
+        return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:12]
+
+    def bucket(self, service: str, credential: Optional[str] = None) -> TokenBucket:
+        """Servis ve kimlik bilgisi için bucket'ı döner (yoksa oluşturur)"""
+        key = (service, self._credential_id(credential))
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(*_service_limits(service))
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, service: str, credential: Optional[str] = None, tokens: float = 1.0) -> float:
+        """
+        Servis çağrısından önce token alır (gerekirse bekler)
+
+        Args:
+            service: Servis adı ("deepsource", "snyk")
+            credential: Kota sahibi kimlik bilgisi (API token, org id)
+            tokens: Harcanacak token sayısı
+
+        Returns:
+            float: Beklenen süre (saniye), sınırlayıcı kapalıysa 0
+        """
+        if not self.enabled:
+            return 0.0
+        return self.bucket(service, credential).acquire(tokens)
+
+    def defer(self, service: str, credential: Optional[str], seconds: float):
+        """Servis throttle ettiğinde (429) aynı kimlik bilgisindeki tüm çağrıları bekletir"""
+        if self.enabled and seconds > 0:
+            self.bucket(service, credential).defer(seconds)
+
+    def status(self) -> dict:
+        """
+        Tüm bucket'ların durumunu döner
+
+        Returns:
+            dict: {"enabled", "services": yapılandırılmış sınırlar,
+            "limits": {"servis:kimlik_hash": bucket durumu}}
+        """
+        with self._lock:
+            buckets = list(self._buckets.items())
+        return {
+            "enabled": self.enabled,
+            # Henüz hiç çağrı yapılmamış servisler için de sınırlar görünür
+            "services": {
+                service: dict(zip(("per_minute", "burst"), _service_limits(service)))
+                for service in DEFAULT_LIMITS
+            },
+            "limits": {f"{service}:{credential_id}": bucket.status() for (service, credential_id), bucket in buckets}
+        }
+
+
+# Uygulama genelinde paylaşılan sınırlayıcı
+rate_limiter = RateLimiter()
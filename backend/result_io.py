@@ -0,0 +1,311 @@
+"""
+Sonuç Dosyası Okuma/Yazma (Result I/O) Modülü
+
+Bu modül, results/ klasörüne yazılan ham tarayıcı çıktıları ve raporlar için
+ortak okuma/yazma katmanıdır. İki kayıt biçimi desteklenir:
+- Standart (default): Girintili JSON (indent=2), dosya adı *.json
+- Kompakt: Boşluksuz (minified) JSON + gzip akış sıkıştırması, dosya adı *.json.gz
+
+Okuyucular biçimi dosyanın ilk baytlarından (gzip imzası) anlar; bu yüzden
+rapor üreticileri, benchmark issue çıkarımı, sonuç deposu ve API dosya
+servisi iki biçimi de aynı şekilde okur. Kompakt mod açıkken sonuç deposu
+payload'ları da gzip ile sıkıştırılır. İçerik adresli ham çıktılara referans
+veren tarama kayıtları (bkz. object_store.py) read_json tarafından çözülür.
+
+Yazma işlemleri geçici dosya + os.replace ile atomiktir.
+
+Kullanım:
+    from result_io import write_json, read_json, result_files
+    saved_path = write_json(Path("../results") / "snyk_code_flask_demo_<ts>.json", raw_output)
+    data = read_json(saved_path)
+    for path in result_files(Path("../results"), "benchmark_report_*"):
+        ...
+
+    Disk kullanımı ve hız karşılaştırması için:
+    cd backend
+    python result_io.py benchmark [--synthetic 20000] [--repeat 5]
+
+Environment Variables:
+    RESULTS_COMPACT: Kompakt (minified + gzip) kayıt modunu aç (default: 0)
+    RESULTS_COMPRESSION_LEVEL: gzip seviyesi, 1-9 (default: 1)
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+RESULTS_COMPACT = os.getenv("RESULTS_COMPACT", "0").lower() in ("1", "true", "yes")
+RESULTS_COMPRESSION_LEVEL = min(max(int(os.getenv("RESULTS_COMPRESSION_LEVEL", "1")), 1), 9)
+
+COMPRESSED_SUFFIX = ".gz"
+GZIP_MAGIC = b"\x1f\x8b"
+
+# İçerik adresli ham çıktıya referans veren kayıtlar (bkz. object_store.py)
+OBJECT_REF_KEY = "$object"
+OBJECT_REF_PREFIX = "sha256:"
+
+
+# ============================================
+# KODLAMA
+# ============================================
+
+def encode(data, compact: Optional[bool] = None, level: int = RESULTS_COMPRESSION_LEVEL) -> bytes:
+    """
+    Veriyi seçilen biçimde baytlara çevirir
+
+    Args:
+        data: JSON'a çevrilebilir veri
+        compact: True ise minified + gzip, False ise girintili JSON (default: RESULTS_COMPACT)
+        level: gzip seviyesi
+
+    Returns:
+        bytes: Dosyaya veya BLOB'a yazılacak içerik
+    """
+    if compact is None:
+        compact = RESULTS_COMPACT
+    if not compact:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    minified = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # mtime=0: aynı içerik her zaman aynı baytları üretir
+    return gzip.compress(minified, compresslevel=level, mtime=0)
+
+
+def decode(raw: bytes):
+    """
+    encode() çıktısını (veya herhangi bir JSON/gzip JSON baytını) çözer
+
+    Args:
+        raw: Ham baytlar
+
+    Returns:
+        Çözülmüş JSON verisi
+    """
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def is_compressed(path: Union[str, Path]) -> bool:
+    """Dosyanın gzip ile sıkıştırılmış olup olmadığını ilk baytlarından anlar"""
+    with open(path, "rb") as f:
+        return f.read(2) == GZIP_MAGIC
+
+
+# ============================================
+# DOSYA OKUMA / YAZMA
+# ============================================
+
+def write_json(path: Union[str, Path], data, compact: Optional[bool] = None) -> Path:
+    """
+    Veriyi atomik olarak dosyaya yazar
+
+    Kompakt modda dosya adına ".gz" eklenir (örn: x.json -> x.json.gz).
+
+    Args:
+        path: Hedef dosya (.json uzantılı)
+        data: JSON'a çevrilebilir veri
+        compact: Biçim (default: RESULTS_COMPACT)
+
+    Returns:
+        Path: Gerçekte yazılan dosyanın yolu
+    """
+    if compact is None:
+        compact = RESULTS_COMPACT
+    path = Path(path)
+    if compact and path.suffix != COMPRESSED_SUFFIX:
+        path = path.with_name(path.name + COMPRESSED_SUFFIX)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = encode(data, compact=compact)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def read_bytes(path: Union[str, Path]) -> bytes:
+    """Dosyanın çözülmüş (sıkıştırılmamış) JSON baytlarını döner"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return gzip.decompress(raw) if raw[:2] == GZIP_MAGIC else raw
+
+
+def read_json(path: Union[str, Path], resolve: bool = True):
+    """
+    Standart veya kompakt biçimdeki sonuç dosyasını okur
+
+    Dosya içerik adresli bir ham çıktıya referans veren bir tarama kaydıysa
+    (bkz. object_store.py) ve resolve=True ise referans verilen ham çıktı döner.
+
+    Args:
+        path: Dosya yolu (.json veya .json.gz)
+        resolve: Referans kayıtlarını çöz (default: True)
+
+    Returns:
+        Çözülmüş JSON verisi
+
+    Raises:
+        OSError: Dosya okunamazsa
+        ValueError: İçerik geçerli JSON değilse (json.JSONDecodeError dahil)
+        object_store.ObjectNotFoundError: Referans verilen nesne yoksa
+    """
+    with open(path, "rb") as f:
+        data = decode(f.read())
+    if resolve and isinstance(data, dict) and OBJECT_REF_KEY in data:
+        # object_store bu modülü import ettiği için burada yüklenir
+        from object_store import object_store, parse_reference
+        digest = parse_reference(data)
+        if digest:
+            return object_store.get(digest)
+    return data
+
+
+def result_files(directory: Union[str, Path], pattern: str = "*") -> List[Path]:
+    """
+    Klasördeki sonuç dosyalarını (her iki biçim) listeler
+
+    Args:
+        directory: Klasör
+        pattern: Uzantısız glob deseni (örn: "benchmark_report_*")
+
+    Returns:
+        List[Path]: Eşleşen .json ve .json.gz dosyaları
+    """
+    directory = Path(directory)
+    return list(directory.glob(f"{pattern}.json")) + list(directory.glob(f"{pattern}.json{COMPRESSED_SUFFIX}"))
+
+
+def result_stem(path: Union[str, Path]) -> str:
+    """Biçim uzantıları olmadan dosya adı (x.json.gz -> x)"""
+    name = Path(path).name
+    for suffix in (".json" + COMPRESSED_SUFFIX, ".json"):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return Path(name).stem
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def _synthetic_sarif(result_count: int) -> dict:
+    """Büyük bir Snyk Code SARIF çıktısını taklit eden veri üretir"""
+    rules = [f"python/Rule{index}" for index in range(40)]
+    return {
+        "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "SnykCode", "rules": [
+                {"id": rule, "shortDescription": {"text": f"{rule} açıklaması"}} for rule in rules
+            ]}},
+            "results": [
+                {
+                    "ruleId": rules[index % len(rules)],
+                    "level": ("error", "warning", "note")[index % 3],
+                    "message": {"text": f"Unsanitized input flows into a sink at step {index}"},
+                    "locations": [{"physicalLocation": {
+                        "artifactLocation": {"uri": f"src/module_{index % 300}/file_{index % 37}.py"},
+                        "region": {"startLine": index % 900 + 1, "endLine": index % 900 + 3,
+                                   "startColumn": 5, "endColumn": 42}
+                    }}],
+                    "fingerprints": {"0": f"{index:064x}"},
+                    "properties": {"priorityScore": index % 1000, "isAutofixable": index % 2 == 0}
+                }
+                for index in range(result_count)
+            ]
+        }]
+    }
+
+
+def benchmark(samples: List, repeat: int = 5, levels=(1, 6, 9)) -> List[dict]:
+    """
+    Standart ve kompakt biçimleri disk boyutu ve okuma/yazma hızında karşılaştırır
+
+    Args:
+        samples: Ölçülecek veriler
+        repeat: Her ölçümün tekrar sayısı (en iyi süre alınır)
+        levels: Denenecek gzip seviyeleri
+
+    Returns:
+        List[dict]: Biçim başına bytes, ratio, write_mb_s, read_mb_s
+    """
+    variants = [("indent=2 (standart)", False, None)]
+    variants += [(f"minified+gzip-{level}", True, level) for level in levels]
+    reference_bytes = sum(len(encode(sample, compact=False)) for sample in samples)
+    rows = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, compact, level in variants:
+            paths = [Path(temp_dir) / f"sample_{index}.json" for index in range(len(samples))]
+            best_write = best_read = float("inf")
+            written = []
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                written = []
+                for path, sample in zip(paths, samples):
+                    if compact:
+                        # Benchmark'ta seviye parametresi doğrudan denenir
+                        target = path.with_name(path.name + COMPRESSED_SUFFIX)
+                        target.write_bytes(encode(sample, compact=True, level=level))
+                    else:
+                        target = write_json(path, sample, compact=False)
+                    written.append(target)
+                best_write = min(best_write, time.perf_counter() - start_time)
+
+                start_time = time.perf_counter()
+                for target in written:
+                    read_json(target)
+                best_read = min(best_read, time.perf_counter() - start_time)
+
+            disk_bytes = sum(target.stat().st_size for target in written)
+            rows.append({
+                "format": label,
+                "bytes": disk_bytes,
+                "ratio": disk_bytes / reference_bytes if reference_bytes else 0.0,
+                # Hız, standart biçimdeki mantıksal JSON boyutu üzerinden hesaplanır
+                "write_mb_s": reference_bytes / best_write / 1e6 if best_write else 0.0,
+                "read_mb_s": reference_bytes / best_read / 1e6 if best_read else 0.0
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        repeat_count = int(sys.argv[sys.argv.index("--repeat") + 1]) if "--repeat" in sys.argv else 5
+        if "--synthetic" in sys.argv:
+            result_count = int(sys.argv[sys.argv.index("--synthetic") + 1])
+            benchmark_samples = [_synthetic_sarif(result_count)]
+            source = f"sentetik SARIF ({result_count} sonuç)"
+        else:
+            benchmark_samples = [read_json(path) for path in sorted(result_files("../results"))]
+            source = f"../results ({len(benchmark_samples)} dosya)"
+        if not benchmark_samples:
+            print("Ölçülecek sonuç dosyası bulunamadı! (--synthetic N kullanın)")
+            sys.exit(1)
+
+        print(f"Kaynak: {source}")
+        print(f"{'Biçim':<22} {'Boyut (KB)':>12} {'Oran':>7} {'Yazma MB/s':>12} {'Okuma MB/s':>12}")
+        for row in benchmark(benchmark_samples, repeat=repeat_count):
+            print(
+                f"{row['format']:<22} {row['bytes'] / 1024:>12.1f} {row['ratio']:>7.3f} "
+                f"{row['write_mb_s']:>12.1f} {row['read_mb_s']:>12.1f}"
+            )
+    else:
+        print("Kullanım: python result_io.py benchmark [--synthetic N] [--repeat N]")
@@ -0,0 +1,565 @@
+"""
+Tarama Sonuçları Deposu (Results Store) Modülü
+
+Bu modül, tarama sonuçlarını ve raporları araç, proje, zaman ve tree hash
+üzerinden indeksli bir SQLite veritabanında tutar. Ham çıktılar (SARIF,
+GraphQL yanıtı, rapor JSON'u) kompakt JSON olarak (RESULTS_COMPACT açıksa
+gzip ile) BLOB sütununda saklanır; liste ve "en son" sorguları yalnızca
+indeksli meta veri sütunlarını okur, payload'a yalnızca istenince dokunulur.
+Tarama ham çıktıları içerik hash'i ile bir kez tutulur: nesne deposunda
+(object_store.py) bulunan çıktılar için veritabanına yalnızca hash yazılır,
+payload istenince depodan okunur. Depoda olmayan çıktılar (RESULTS_DEDUP=0
+veya eski tam sonuç dosyaları) objects tablosunda tutulur. Aynı çıktıyı
+üreten taramalar yalnızca hash'i ve kendi meta verisini saklar.
+
+Kayıt türleri (kind):
+- scan: Tarayıcının ham çıktısı (snyk_code_<proje>_<ts>.json, deepsource_<proje>_<ts>.json)
+- advanced_metrics: Gelişmiş metrik sonucu (<araç>_advanced_metrics_<proje>_<ts>.json)
+- benchmark_report: benchmark_runner.py raporu
+- comprehensive_report: comprehensive_test_report.py raporu
+
+Runner'lar sonuç dosyalarını yazmaya devam eder ve her kaydı buraya da
+ekler. Mevcut results/ geçmişi import_directory ile (dosyalar paralel
+süreçlerde ayrıştırılarak) bir kez içe aktarılır; zaten aktarılmış dosyalar
+atlanır.
+
+Kullanım:
+    from results_store import results_store
+    results_store.add("scan", raw_output, tool="snyk_code", project="flask_demo", tree_hash=tree_hash)
+    record = results_store.latest("scan", tool="snyk_code", project="flask_demo")
+    payload = results_store.payload(record["id"])
+    results_store.history("advanced_metrics", tool="deepsource", project="flask_demo", limit=20)
+
+    Geçmişi içe aktarmak için:
+    cd backend
+    python results_store.py import [--workers 8]
+
+Environment Variables:
+    RESULTS_DB: SQLite dosyası (default: ../results/results.db)
+    RESULTS_IMPORT_WORKERS: İçe aktarmada paralel süreç sayısı (default: CPU sayısı)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+from result_io import decode, read_json, result_files
+from object_store import ObjectNotFoundError, encode_minified, object_digest, object_store, parse_reference
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+RESULTS_DB = os.getenv("RESULTS_DB", "../results/results.db")
+RESULTS_IMPORT_WORKERS = int(os.getenv("RESULTS_IMPORT_WORKERS", str(os.cpu_count() or 4)))
+
+KIND_SCAN = "scan"
+KIND_ADVANCED_METRICS = "advanced_metrics"
+KIND_BENCHMARK_REPORT = "benchmark_report"
+KIND_COMPREHENSIVE_REPORT = "comprehensive_report"
+
+# Dosya adlarındaki zaman damgası (örn: 2026-01-06_21-29-44)
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+_TIMESTAMP_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.json(\.gz)?$")
+_EMBEDDED_TIMESTAMP_PATTERN = re.compile(r"_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$")
+
+# Bilinen araç önekleri (uzun olan önce denenir)
+_TOOL_PREFIXES = ("snyk_code", "deepsource")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    tool TEXT,
+    project TEXT,
+    created_at REAL NOT NULL,
+    tree_hash TEXT,
+    file_path TEXT UNIQUE,
+    summary TEXT,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS objects (
+    hash TEXT PRIMARY KEY,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_lookup ON results (kind, tool, project, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_results_kind_time ON results (kind, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_results_tree_hash ON results (tree_hash);
+"""
+
+# Sonradan eklenen sütunlar (eski veritabanları açılışta güncellenir)
+MIGRATION_COLUMNS = (("object_hash", "TEXT"), ("metadata", "TEXT"))
+
+# Listelerde dönen sütunlar (payload hariç)
+META_COLUMNS = (
+    "id", "kind", "tool", "project", "created_at", "tree_hash", "file_path", "summary", "object_hash", "metadata"
+)
+
+
+def encode_payload(payload) -> bytes:
+    """Payload'ı kompakt JSON baytlarına çevirir (RESULTS_COMPACT açıksa gzip ile)"""
+    return encode_minified(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def summarize(kind: str, payload: dict) -> Optional[dict]:
+    """
+    Listelerde payload açmadan gösterilecek küçük özet
+
+    Args:
+        kind: Kayıt türü
+        payload: Ham içerik
+
+    Returns:
+        dict veya None
+    """
+    if not isinstance(payload, dict):
+        return None
+    if kind == KIND_ADVANCED_METRICS:
+        return payload.get("basic_metrics")
+    if kind == KIND_SCAN:
+        runs = payload.get("runs")
+        if isinstance(runs, list) and runs:
+            return {"total_issues": sum(len(run.get("results") or []) for run in runs)}
+        issues = ((payload.get("data") or {}).get("repository") or {}).get("issues")
+        if isinstance(issues, dict):
+            return {"total_issues": len(issues.get("edges") or [])}
+    return None
+
+
+def classify_result_file(path: Path) -> Optional[dict]:
+    """
+    results/ klasöründeki dosya adından kayıt türünü, aracı, projeyi ve zamanı çıkarır
+
+    Args:
+        path: Sonuç dosyası
+
+    Returns:
+        dict: {"kind", "tool", "project", "created_at"} veya tanınmayan dosyalar için None
+    """
+    name = path.name
+    match = _TIMESTAMP_PATTERN.search(name)
+    if not match:
+        return None
+    created_at = datetime.strptime(match.group(1), TIMESTAMP_FORMAT).timestamp()
+    stem = name[:match.start()].rstrip("_")
+
+    if stem == "benchmark_report":
+        return {"kind": KIND_BENCHMARK_REPORT, "tool": None, "project": None, "created_at": created_at}
+    if stem == "comprehensive_test_report":
+        return {"kind": KIND_COMPREHENSIVE_REPORT, "tool": None, "project": None, "created_at": created_at}
+
+    if "_advanced_metrics_" in stem:
+        tool, project = stem.split("_advanced_metrics_", 1)
+        # Eski dosyalarda araç adı öneki tekrarlanabilir (örn: snyk_advanced_metrics_snyk_code_flask_demo)
+        # ve kaynak dosyanın zaman damgası proje adına eklenmiş olabilir
+        for prefix in _TOOL_PREFIXES:
+            if project.startswith(prefix + "_"):
+                tool, project = prefix, project[len(prefix) + 1:]
+        project = _EMBEDDED_TIMESTAMP_PATTERN.sub("", project)
+        return {
+            "kind": KIND_ADVANCED_METRICS,
+            "tool": "snyk_code" if tool.startswith("snyk") else tool,
+            "project": project,
+            "created_at": created_at
+        }
+
+    for prefix in _TOOL_PREFIXES:
+        if stem.startswith(prefix + "_"):
+            return {
+                "kind": KIND_SCAN,
+                "tool": prefix,
+                "project": stem[len(prefix) + 1:],
+                "created_at": created_at
+            }
+    return None
+
+
+def _parse_result_file(path_str: str) -> Optional[tuple]:
+    """
+    Tek bir sonuç dosyasını ayrıştırır (ProcessPoolExecutor worker'ında çalışır)
+
+    Tarama kayıtlarının ham çıktısı içerik hash'i ile döner; aynı çıktıyı
+    paylaşan kayıtlar veritabanında tek bir nesneye işaret eder. Referans
+    kayıtlarında çıktı nesne deposunda kalır (payload baytları boş döner).
+
+    Returns:
+        (meta dict, kompakt payload baytları) veya tanınmayan/bozuk dosyalar için None
+    """
+    path = Path(path_str)
+    meta = classify_result_file(path)
+    if meta is None:
+        return None
+    try:
+        data = read_json(path, resolve=False)
+        digest = parse_reference(data)
+        payload = object_store.get(digest) if digest else data
+    except (OSError, ValueError, EOFError, ObjectNotFoundError):
+        return None
+
+    meta["summary"] = summarize(meta["kind"], payload)
+    meta["file_path"] = str(path)
+    meta["object_hash"] = None
+    meta["metadata"] = None
+    if meta["kind"] != KIND_SCAN:
+        return meta, encode_payload(payload)
+
+    if digest:
+        meta["object_hash"] = digest
+        meta["metadata"] = {key: value for key, value in data.items() if not key.startswith("$")}
+        return meta, b""
+    meta["object_hash"], minified = object_digest(payload)
+    return meta, encode_minified(minified)
+
+
+class ResultsStore:
+    """
+    Tarama sonuçlarının indeksli SQLite deposu
+    """
+
+    def __init__(self, db_path: str = RESULTS_DB):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _db(self) -> sqlite3.Connection:
+        """Thread başına bağlantı (WAL modunda okuyucular yazarı beklemez)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if not self._schema_ready:
+                connection.executescript(SCHEMA)
+                self._migrate(connection)
+                self._schema_ready = True
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection):
+        """Eski şemaya sonradan eklenen sütunları ekler"""
+        existing = {row["name"] for row in connection.execute("PRAGMA table_info(results)")}
+        with connection:
+            for column, column_type in MIGRATION_COLUMNS:
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE results ADD COLUMN {column} {column_type}")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_results_object_hash ON results (object_hash)")
+
+    @staticmethod
+    def _row_to_meta(row: sqlite3.Row) -> dict:
+        record = {column: row[column] for column in META_COLUMNS}
+        for column in ("summary", "metadata"):
+            record[column] = json.loads(record[column]) if record[column] else None
+        return record
+
+    # ============================================
+    # YAZMA
+    # ============================================
+
+    def add(
+        self,
+        kind: str,
+        payload,
+        tool: Optional[str] = None,
+        project: Optional[str] = None,
+        tree_hash: Optional[str] = None,
+        file_path: Optional[str] = None,
+        created_at: Optional[float] = None,
+        summary: Optional[dict] = None,
+        object_hash: Optional[str] = None,
+        metadata: Optional[dict] = None
+    ) -> int:
+        """
+        Yeni bir sonuç kaydı ekler
+
+        Tarama kayıtlarının (scan) ham çıktısı içerik hash'i ile bir kez
+        saklanır; kayıt yalnızca hash'i ve kendi meta verisini tutar. object_hash
+        verildiyse çıktı nesne deposundadır ve yeniden serileştirilmez; aksi
+        halde objects tablosuna yazılır.
+
+        Args:
+            kind: Kayıt türü (KIND_*)
+            payload: Ham içerik (JSON'a çevrilebilir). Ham çıktısı yalnızca nesne
+                deposunda duran büyük taramalar için None (object_hash zorunlu)
+            tool: Araç adı ("snyk_code", "deepsource")
+            project: Proje adı
+            tree_hash: Taranan içeriğin tree hash'i
+            file_path: Aynı sonucun results/ altındaki dosyası (varsa)
+            created_at: Zaman (default: şimdi)
+            summary: Özet (verilmezse payload'dan çıkarılır)
+            object_hash: Ham çıktının nesne deposundaki içerik hash'i (scan için;
+                verilmezse hesaplanır ve çıktı objects tablosuna yazılır)
+            metadata: Taramaya özgü meta veri (süre, kaynak kullanımı, ...)
+
+        Returns:
+            int: Kayıt id'si
+        """
+        if summary is None:
+            summary = summarize(kind, payload)
+        object_payload = None
+        if kind == KIND_SCAN and object_hash:
+            # Çıktı nesne deposunda (bkz. write_scan_record): yalnızca referans tutulur
+            record_payload = b""
+        elif kind == KIND_SCAN and payload is None:
+            raise ValueError("payload olmadan eklenen tarama kaydı object_hash gerektirir")
+        elif kind == KIND_SCAN:
+            object_hash, minified = object_digest(payload)
+            object_payload = encode_minified(minified)
+            record_payload = b""
+        else:
+            record_payload = encode_payload(payload)
+
+        with self._write_lock:
+            db = self._db()
+            with db:
+                if object_payload is not None:
+                    db.execute(
+                        "INSERT OR IGNORE INTO objects (hash, payload) VALUES (?, ?)",
+                        (object_hash, object_payload)
+                    )
+                cursor = db.execute(
+                    "INSERT OR REPLACE INTO results "
+                    "(kind, tool, project, created_at, tree_hash, file_path, summary, payload, object_hash, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        kind,
+                        tool,
+                        project,
+                        time.time() if created_at is None else created_at,
+                        tree_hash,
+                        file_path,
+                        json.dumps(summary) if summary is not None else None,
+                        record_payload,
+                        object_hash,
+                        json.dumps(metadata) if metadata is not None else None
+                    )
+                )
+            return cursor.lastrowid
+
+    def safe_add(self, kind: str, payload, **fields) -> Optional[int]:
+        """
+        add() gibi; veritabanı hatasında taramayı bozmamak için uyarı yazıp None döner
+
+        Sonuç dosyası zaten yazıldığı için kayıt sonradan import_directory ile eklenebilir.
+        """
+        try:
+            return self.add(kind, payload, **fields)
+        except sqlite3.Error as e:
+            print(f"WARNING: Sonuç deposuna yazılamadı ({kind}): {e}")
+            return None
+
+    def delete_project(self, project: str) -> int:
+        """Projenin tüm kayıtlarını ve artık referans verilmeyen nesneleri siler (retention için)"""
+        with self._write_lock:
+            db = self._db()
+            with db:
+                deleted = db.execute("DELETE FROM results WHERE project = ?", (project,)).rowcount
+                db.execute(
+                    "DELETE FROM objects WHERE hash NOT IN "
+                    "(SELECT object_hash FROM results WHERE object_hash IS NOT NULL)"
+                )
+                return deleted
+
+    # ============================================
+    # SORGULAR
+    # ============================================
+
+    @staticmethod
+    def _filters(kind: str, tool: Optional[str], project: Optional[str], tree_hash: Optional[str] = None) -> tuple:
+        clauses = ["kind = ?"]
+        params: List = [kind]
+        for column, value in (("tool", tool), ("project", project), ("tree_hash", tree_hash)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def latest(
+        self,
+        kind: str,
+        tool: Optional[str] = None,
+        project: Optional[str] = None,
+        tree_hash: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Filtreye uyan en son kaydın meta verisi (indeks üzerinden, payload okunmaz)
+
+        Returns:
+            dict veya kayıt yoksa None
+        """
+        where, params = self._filters(kind, tool, project, tree_hash)
+        row = self._db().execute(
+            f"SELECT {', '.join(META_COLUMNS)} FROM results WHERE {where} "
+            "ORDER BY created_at DESC, id DESC LIMIT 1",
+            params
+        ).fetchone()
+        return self._row_to_meta(row) if row else None
+
+    def history(
+        self,
+        kind: str,
+        tool: Optional[str] = None,
+        project: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 50
+    ) -> List[dict]:
+        """
+        Filtreye uyan kayıtlar, yeniden eskiye (payload hariç)
+
+        Args:
+            kind: Kayıt türü
+            tool: Araç filtresi (opsiyonel)
+            project: Proje filtresi (opsiyonel)
+            since: Bu zamandan sonraki kayıtlar (opsiyonel)
+            limit: En fazla kayıt
+        """
+        where, params = self._filters(kind, tool, project)
+        if since is not None:
+            where += " AND created_at >= ?"
+            params.append(since)
+        params.append(limit)
+        rows = self._db().execute(
+            f"SELECT {', '.join(META_COLUMNS)} FROM results WHERE {where} "
+            "ORDER BY created_at DESC, id DESC LIMIT ?",
+            params
+        ).fetchall()
+        return [self._row_to_meta(row) for row in rows]
+
+    def latest_per_project(self, kind: str, tool: str) -> List[dict]:
+        """Aracın her proje için en son kaydı"""
+        rows = self._db().execute(
+            f"SELECT {', '.join(META_COLUMNS)} FROM results r WHERE kind = ? AND tool = ? "
+            "AND id = (SELECT id FROM results WHERE kind = r.kind AND tool = r.tool AND project = r.project "
+            "ORDER BY created_at DESC, id DESC LIMIT 1) ORDER BY project",
+            (kind, tool)
+        ).fetchall()
+        return [self._row_to_meta(row) for row in rows]
+
+    def payload(self, record_id: int):
+        """Kaydın ham içeriği (yoksa None)"""
+        row = self._db().execute(
+            "SELECT COALESCE(o.payload, r.payload) AS payload, r.object_hash FROM results r "
+            "LEFT JOIN objects o ON o.hash = r.object_hash WHERE r.id = ?",
+            (record_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        if not row["payload"] and row["object_hash"]:
+            # Büyük ham çıktılar veritabanına kopyalanmaz, nesne deposundan okunur
+            return object_store.get(row["object_hash"])
+        return decode(row["payload"])
+
+    def load_latest_payload(self, kind: str, tool: Optional[str] = None, project: Optional[str] = None):
+        """En son kaydın ham içeriği (yoksa None)"""
+        record = self.latest(kind, tool, project)
+        return self.payload(record["id"]) if record else None
+
+    def stats(self) -> dict:
+        """Tür başına kayıt sayısı ve payload boyutu (tekil ham çıktılar "objects" altında)"""
+        db = self._db()
+        rows = db.execute(
+            "SELECT kind, COUNT(*) AS records, SUM(LENGTH(payload)) AS payload_bytes FROM results GROUP BY kind"
+        ).fetchall()
+        report = {row["kind"]: {"records": row["records"], "payload_bytes": row["payload_bytes"]} for row in rows}
+        objects = db.execute("SELECT COUNT(*) AS records, SUM(LENGTH(payload)) AS payload_bytes FROM objects").fetchone()
+        report["objects"] = {"records": objects["records"], "payload_bytes": objects["payload_bytes"] or 0}
+        return report
+
+    # ============================================
+    # GEÇMİŞİ İÇE AKTARMA
+    # ============================================
+
+    def import_files(self, paths: Iterable, workers: int = RESULTS_IMPORT_WORKERS) -> dict:
+        """
+        Sonuç dosyalarını paralel ayrıştırıp tek transaction'da içe aktarır
+
+        Zaten aktarılmış dosyalar (aynı file_path) atlanır.
+
+        Args:
+            paths: Dosya yolları
+            workers: Paralel süreç sayısı (1 ise aynı süreçte)
+
+        Returns:
+            dict: {"imported", "skipped_existing", "unrecognized", "duration"}
+        """
+        start_time = time.time()
+        existing = {
+            row["file_path"]
+            for row in self._db().execute("SELECT file_path FROM results WHERE file_path IS NOT NULL")
+        }
+        candidates = [str(path) for path in paths]
+        pending = [path for path in candidates if path not in existing]
+
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_parse_result_file, pending, chunksize=8))
+        else:
+            parsed = [_parse_result_file(path) for path in pending]
+
+        rows = []
+        objects = {}
+        for meta, payload_bytes in (item for item in parsed if item is not None):
+            if meta["object_hash"]:
+                # Referans kayıtlarının çıktısı nesne deposundadır (boş baytlar)
+                if payload_bytes:
+                    objects[meta["object_hash"]] = payload_bytes
+                payload_bytes = b""
+            rows.append((
+                meta["kind"],
+                meta["tool"],
+                meta["project"],
+                meta["created_at"],
+                (meta["metadata"] or {}).get("tree_hash"),
+                meta["file_path"],
+                json.dumps(meta["summary"]) if meta["summary"] is not None else None,
+                payload_bytes,
+                meta["object_hash"],
+                json.dumps(meta["metadata"]) if meta["metadata"] is not None else None
+            ))
+        with self._write_lock:
+            db = self._db()
+            with db:
+                db.executemany("INSERT OR IGNORE INTO objects (hash, payload) VALUES (?, ?)", objects.items())
+                db.executemany(
+                    "INSERT OR IGNORE INTO results "
+                    "(kind, tool, project, created_at, tree_hash, file_path, summary, payload, object_hash, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+
+        return {
+            "imported": len(rows),
+            "skipped_existing": len(candidates) - len(pending),
+            "unrecognized": len(pending) - len(rows),
+            "duration": time.time() - start_time
+        }
+
+    def import_directory(self, results_dir: str = "../results", workers: int = RESULTS_IMPORT_WORKERS) -> dict:
+        """results/ klasöründeki tüm JSON sonuç dosyalarını içe aktarır"""
+        return self.import_files(sorted(result_files(results_dir)), workers=workers)
+
+
+# Uygulama genelinde paylaşılan depo
+results_store = ResultsStore()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "import":
+        worker_count = RESULTS_IMPORT_WORKERS
+        if "--workers" in sys.argv:
+            worker_count = int(sys.argv[sys.argv.index("--workers") + 1])
+        report = results_store.import_directory(workers=worker_count)
+        print(json.dumps(report, indent=2))
+        print(json.dumps(results_store.stats(), indent=2))
+    else:
+        print("Kullanım: python results_store.py import [--workers N]")
@@ -0,0 +1,389 @@
+"""
+Yüklenen Projeler İçin Saklama (Retention) ve Çöp Toplama Modülü
+
+Bu modül, /upload ile oluşturulan proje klasörlerini ve bu projelerin
+sonuç dosyalarını (results/*_<proje>_*.json, tarama manifest'leri) süre ve
+disk kotasına göre temizler:
+- TTL: Son kullanımı (yükleme veya tarama) RETENTION_TTL_SECONDS'tan eski
+  projeler silinir
+- LRU: Toplam boyut RETENTION_MAX_BYTES'ı veya proje sayısı
+  RETENTION_MAX_PROJECTS'i aşarsa en uzun süredir kullanılmayan projeler
+  sınır altına inene kadar silinir
+- Yarım kalmış yüklemelerin geçici (staging) klasörleri temizlenir
+
+Devam eden taramalar korunur: Runner'lar, kuyruktaki işler ve karşılaştırmalı
+taramalar projeyi kullanırken bir "lease" tutar. Lease'i olan proje
+silinmez; silinmekte olan bir proje için lease isteyen çağrı silme
+bitene kadar bekler (ve proje artık bulunamaz). Yeni yüklenen projeler
+RETENTION_MIN_AGE_SECONDS boyunca hiç silinmez (yükleme ile tarama arası).
+
+Silinen projeler on_evict ile kaydedilen fonksiyonlara bildirilir
+(örn: app.py projeyi project_registry dizininden çıkarır).
+
+Kullanım:
+    from retention import project_leases, retention_manager
+    with project_leases.hold("uploaded_7b6950545e5b"):
+        ...  # tarama
+    report = retention_manager.sweep(dry_run=True)
+    retention_manager.start()   # arka plan temizleyicisi
+
+Environment Variables:
+    RETENTION_TTL_SECONDS: Kullanılmayan yüklemelerin saklanma süresi (default: 604800, 7 gün)
+    RETENTION_MAX_BYTES: Yüklemeler + sonuç dosyaları için disk kotası (default: 1 GB)
+    RETENTION_MAX_PROJECTS: En fazla yüklenmiş proje sayısı (default: 200)
+    RETENTION_MIN_AGE_SECONDS: Yeni projelerin silinmeden önceki en kısa yaşı (default: 600)
+    RETENTION_SWEEP_INTERVAL_SECONDS: Arka plan temizlik aralığı, 0 = kapalı (default: 3600)
+    RETENTION_RESULTS_DIR: Sonuç dosyalarının klasörü (default: ../results)
+"""
+
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from upload_store import upload_store
+from incremental_scan import SCAN_MANIFEST_DIR
+from result_io import result_files
+from object_store import object_store
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+RETENTION_TTL_SECONDS = float(os.getenv("RETENTION_TTL_SECONDS", str(7 * 24 * 3600)))
+RETENTION_MAX_BYTES = int(os.getenv("RETENTION_MAX_BYTES", str(1024 * 1024 * 1024)))
+RETENTION_MAX_PROJECTS = int(os.getenv("RETENTION_MAX_PROJECTS", "200"))
+RETENTION_MIN_AGE_SECONDS = float(os.getenv("RETENTION_MIN_AGE_SECONDS", "600"))
+RETENTION_SWEEP_INTERVAL_SECONDS = float(os.getenv("RETENTION_SWEEP_INTERVAL_SECONDS", "3600"))
+RETENTION_RESULTS_DIR = os.getenv("RETENTION_RESULTS_DIR", "../results")
+
+# Yüklenen projelerin ad öneki (yalnızca bunlar temizlenir; test_projects/ altındaki
+# sabit projelere dokunulmaz)
+UPLOADED_PREFIX = "uploaded_"
+
+# Bu süreden eski staging klasörleri yarım kalmış yükleme kabul edilir
+STALE_STAGING_SECONDS = 3600
+
+
+# ============================================
+# PROJE LEASE'LERİ
+# ============================================
+
+class ProjectLeases:
+    """
+    Kullanımdaki projelerin sayacı; silme ile kullanım arasındaki yarışı önler
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._evicting = set()
+        self._condition = threading.Condition()
+
+    def acquire(self, project_name: str):
+        """Projeyi kullanıma alır (proje siliniyorsa silme bitene kadar bekler)"""
+        with self._condition:
+            while project_name in self._evicting:
+                self._condition.wait()
+            self._counts[project_name] += 1
+
+    def release(self, project_name: str):
+        """Kullanımı bırakır; son kullanım bittiğinde projenin kullanım zamanı güncellenir"""
+        with self._condition:
+            self._counts[project_name] -= 1
+            last_holder = self._counts[project_name] <= 0
+            if last_holder:
+                del self._counts[project_name]
+        if last_holder and project_name.startswith(UPLOADED_PREFIX):
+            upload_store.mark_used(project_name)
+
+    @contextmanager
+    def hold(self, project_name: str):
+        """with bloğu boyunca projeyi kullanımda tutar"""
+        self.acquire(project_name)
+        try:
+            yield
+        finally:
+            self.release(project_name)
+
+    def begin_eviction(self, project_name: str) -> bool:
+        """
+        Proje kullanımda değilse silme için kilitler
+
+        Returns:
+            bool: Kilitlendiyse True (end_eviction ile bırakılmalı)
+        """
+        with self._condition:
+            if self._counts.get(project_name, 0) > 0:
+                return False
+            self._evicting.add(project_name)
+            return True
+
+    def end_eviction(self, project_name: str):
+        with self._condition:
+            self._evicting.discard(project_name)
+            self._condition.notify_all()
+
+    def active(self) -> dict:
+        """{proje: aktif kullanım sayısı}"""
+        with self._condition:
+            return dict(self._counts)
+
+
+# Runner'lar, iş kuyruğu ve temizleyici tarafından paylaşılan lease kaydı
+project_leases = ProjectLeases()
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for dir_path, _, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                total += (Path(dir_path) / file_name).stat().st_size
+            except OSError:
+                pass
+    return total
+
+
+# ============================================
+# TEMİZLEYİCİ
+# ============================================
+
+class RetentionManager:
+    """
+    Yüklenen projeleri TTL ve LRU ile temizleyen yönetici
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = RETENTION_TTL_SECONDS,
+        max_bytes: int = RETENTION_MAX_BYTES,
+        max_projects: int = RETENTION_MAX_PROJECTS,
+        min_age_seconds: float = RETENTION_MIN_AGE_SECONDS,
+        results_dir: str = RETENTION_RESULTS_DIR,
+        leases: ProjectLeases = project_leases
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_projects = max_projects
+        self.min_age_seconds = min_age_seconds
+        self.results_dir = Path(results_dir)
+        self.leases = leases
+        self._evict_callbacks: List[Callable[[str], None]] = []
+        self._sweep_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.last_report: Optional[dict] = None
+
+    def on_evict(self, callback: Callable[[str], None]):
+        """Proje silindiğinde çağrılacak fonksiyonu kaydeder (argüman: proje adı)"""
+        self._evict_callbacks.append(callback)
+
+    def _result_files(self, project_name: str) -> List[Path]:
+        """Projeye ait sonuç dosyaları ve tarama manifest'leri"""
+        files = result_files(self.results_dir, f"*_{project_name}_*")
+        files.extend(Path(SCAN_MANIFEST_DIR).glob(f"*/{project_name}.json"))
+        return files
+
+    def collect(self) -> List[dict]:
+        """
+        Yüklenmiş projeleri son kullanım zamanına göre (eskiden yeniye) listeler
+
+        Returns:
+            list: {"project", "last_used", "created", "bytes", "result_files"}
+        """
+        records = upload_store.records()
+        projects = []
+        if not upload_store.upload_dir.is_dir():
+            return projects
+
+        for project_dir in upload_store.upload_dir.iterdir():
+            if not project_dir.is_dir() or not project_dir.name.startswith(UPLOADED_PREFIX):
+                continue
+            record = records.get(project_dir.name, {})
+            # İçerik adreslemesi öncesi yüklemelerin kaydı yoktur: klasör zamanı kullanılır
+            dir_mtime = project_dir.stat().st_mtime
+            last_used = max(
+                record.get("last_used_at", 0),
+                record.get("last_uploaded_at", 0)
+            ) or dir_mtime
+            result_files = self._result_files(project_dir.name)
+            project_bytes = record.get("size_bytes")
+            if project_bytes is None:
+                project_bytes = _dir_size(project_dir)
+            projects.append({
+                "project": project_dir.name,
+                "last_used": last_used,
+                "created": record.get("created_at", dir_mtime),
+                "bytes": project_bytes + sum(f.stat().st_size for f in result_files if f.exists()),
+                "result_files": result_files
+            })
+
+        projects.sort(key=lambda project: project["last_used"])
+        return projects
+
+    def sweep(self, dry_run: bool = False, now: Optional[float] = None) -> dict:
+        """
+        TTL ve kota kurallarına göre projeleri siler
+
+        Args:
+            dry_run: True ise hiçbir şey silinmez, yalnızca silinecekler raporlanır
+            now: Referans zaman (test için)
+
+        Returns:
+            dict: {"evicted", "skipped_in_use", "freed_bytes", "remaining_projects",
+            "remaining_bytes", "stale_staging_removed", "dry_run"}
+        """
+        now = time.time() if now is None else now
+        with self._sweep_lock:
+            projects = self.collect()
+            total_bytes = sum(project["bytes"] for project in projects)
+            remaining = len(projects)
+            evicted = []
+            skipped_in_use = []
+
+            for project in projects:
+                # Yeni yüklenmiş (henüz taranmamış olabilecek) projelere dokunulmaz
+                if now - project["last_used"] < self.min_age_seconds:
+                    continue
+
+                if now - project["last_used"] > self.ttl_seconds:
+                    reason = "ttl"
+                elif total_bytes > self.max_bytes:
+                    reason = "disk_quota"
+                elif remaining > self.max_projects:
+                    reason = "max_projects"
+                else:
+                    # Liste eskiden yeniye sıralı: sonrakiler de sınır içinde
+                    break
+
+                if not self.leases.begin_eviction(project["project"]):
+                    skipped_in_use.append(project["project"])
+                    continue
+                try:
+                    if not dry_run:
+                        self._evict(project)
+                finally:
+                    self.leases.end_eviction(project["project"])
+
+                evicted.append({
+                    "project": project["project"],
+                    "reason": reason,
+                    "bytes": project["bytes"],
+                    "last_used": project["last_used"]
+                })
+                total_bytes -= project["bytes"]
+                remaining -= 1
+
+            report = {
+                "evicted": evicted,
+                "skipped_in_use": skipped_in_use,
+                "freed_bytes": sum(item["bytes"] for item in evicted),
+                "remaining_projects": remaining,
+                "remaining_bytes": total_bytes,
+                "stale_staging_removed": 0 if dry_run else self._remove_stale_staging(now),
+                # Silinen kayıtların tek başına referans verdiği ham çıktılar
+                "objects_removed": object_store.collect_garbage(str(self.results_dir)) if evicted and not dry_run else 0,
+                "dry_run": dry_run,
+                "swept_at": now
+            }
+            if not dry_run:
+                self.last_report = report
+            return report
+
+    def _evict(self, project: dict):
+        """Proje klasörünü, sonuç dosyalarını ve dizin kaydını siler"""
+        project_name = project["project"]
+        project_dir = upload_store.upload_dir / project_name
+        # Önce staging'e taşınır: klasör ya tamamen vardır ya hiç yoktur
+        trash_dir = upload_store.staging_root / f"evicted_{project_name}_{int(time.time() * 1000)}"
+        try:
+            upload_store.staging_root.mkdir(parents=True, exist_ok=True)
+            os.replace(project_dir, trash_dir)
+        except OSError:
+            trash_dir = project_dir
+        shutil.rmtree(trash_dir, ignore_errors=True)
+
+        for result_file in project["result_files"]:
+            try:
+                result_file.unlink()
+            except OSError:
+                pass
+
+        upload_store.forget(project_name)
+        for callback in self._evict_callbacks:
+            try:
+                callback(project_name)
+            except Exception as e:
+                print(f"WARNING: Retention callback hatası ({project_name}): {e}")
+
+    def _remove_stale_staging(self, now: float) -> int:
+        """Yarım kalmış yüklemelerden kalan staging klasörlerini siler"""
+        removed = 0
+        if not upload_store.staging_root.is_dir():
+            return removed
+        for staging_dir in upload_store.staging_root.iterdir():
+            try:
+                if now - staging_dir.stat().st_mtime > STALE_STAGING_SECONDS:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+    # ============================================
+    # ARKA PLAN TEMİZLEYİCİSİ
+    # ============================================
+
+    def start(self, interval_seconds: float = RETENTION_SWEEP_INTERVAL_SECONDS) -> bool:
+        """
+        Arka plan temizleyicisini başlatır (zaten çalışıyorsa bir şey yapmaz)
+
+        Args:
+            interval_seconds: İki temizlik arası süre; 0 ise başlatılmaz
+
+        Returns:
+            bool: Temizleyici çalışıyorsa True
+        """
+        if interval_seconds <= 0:
+            return False
+
+        def _loop():
+            while not self._stop.wait(interval_seconds):
+                try:
+                    self.sweep()
+                except Exception as e:
+                    print(f"WARNING: Retention temizliği başarısız: {e}")
+
+        # Eşzamanlı ilk istekler tek bir temizleyici başlatır (bkz. app.start_background_services)
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            self._stop.clear()
+            self._thread = threading.Thread(target=_loop, name="retention-sweeper", daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self):
+        """Arka plan temizleyicisini durdurur"""
+        self._stop.set()
+
+    def status(self) -> dict:
+        """Yapılandırma, aktif lease'ler ve son temizlik raporu"""
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "max_bytes": self.max_bytes,
+            "max_projects": self.max_projects,
+            "min_age_seconds": self.min_age_seconds,
+            "sweeper_running": self._thread is not None and self._thread.is_alive(),
+            "active_leases": self.leases.active(),
+            "last_report": self.last_report
+        }
+
+
+# Uygulama genelinde paylaşılan yönetici
+retention_manager = RetentionManager()
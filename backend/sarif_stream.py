@@ -0,0 +1,595 @@
+"""
+Akış Halinde SARIF Ayrıştırıcı (Streaming SARIF Parser) Modülü
+
+Monorepo taramalarında Snyk Code yüzlerce MB'lık SARIF üretebilir. Bu çıktıyı
+tek seferde json.loads ile açmak, belgenin bellekte birkaç kopyasına yol açar.
+Bu modül SARIF'i bir metin akışından (alt süreç pipe'ı veya diskteki dosya)
+parça parça okur ve runs[*].results[*] öğelerini tek tek üretir; bellekte
+aynı anda yalnızca okuma tamponu ve o anki result bulunur.
+
+process_sarif_stream() tek geçişte:
+- Severity sayımını yapar (SnykMetrics.severity_of ile aynı kurallar)
+- Issue'ları çıkarır (metrics.issue_extractors ile aynı alanlar)
+- Ham çıktıyı minified JSON olarak içerik adresli depoya yazar (object_store)
+
+Çıktı küçükse (SARIF_MATERIALIZE_MAX_BYTES altında) tam dict de döner ve
+geri kalan akış (önbellek, artımlı tarama) eskisi gibi çalışır. Büyük
+çıktılarda yalnızca özet (StreamedSarif) tutulur; ham çıktı depodadır.
+
+Tarayıcı çıktısını doğrudan diske yazdığında (snyk --sarif-file-output)
+process_sarif_file() dosyayı aynı şekilde tek geçişte okur; çıktı yeniden
+serileştirilmez, dosya olduğu gibi nesne deposuna alınır (ObjectStore.adopt).
+
+Ayrıştırma, json.JSONDecoder.raw_decode ile her result'ı C hızında çözer;
+yalnızca belge iskeleti (anahtarlar, ayraçlar) Python'da gezilir.
+
+Kullanım:
+    from sarif_stream import process_sarif_stream, iter_sarif_results
+    with open("big.sarif", encoding="utf-8") as f:
+        streamed = process_sarif_stream(f)
+    streamed.counts, streamed.total_results, streamed.digest
+
+    for run_index, result in iter_sarif_results(stream):
+        ...
+
+    spool = object_store.spool_path()        # tarayıcı buraya yazar
+    streamed = process_sarif_file(spool)
+    object_store.adopt(spool, streamed.digest)
+
+Environment Variables:
+    SARIF_STREAM_CHUNK_SIZE: Okuma parçası (karakter, default: 1048576)
+    SARIF_MATERIALIZE_MAX_BYTES: Bu boyutun altındaki çıktılar tam dict olarak da döner (default: 33554432, 32 MB)
+"""
+
+import codecs
+import gzip
+import hashlib
+import io
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from metrics.snyk_metrics import SnykMetrics
+from metrics.result_model import MetricResult
+from metrics.issue_model import Issue
+from metrics.issue_extractors import sarif_result_to_issue
+from object_store import object_store, ObjectWriter, ObjectNotFoundError
+from result_io import GZIP_MAGIC, OBJECT_REF_KEY, OBJECT_REF_PREFIX
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+SARIF_STREAM_CHUNK_SIZE = int(os.getenv("SARIF_STREAM_CHUNK_SIZE", str(1024 * 1024)))
+SARIF_MATERIALIZE_MAX_BYTES = int(os.getenv("SARIF_MATERIALIZE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Cache ve manifest'lerde büyük çıktıların yerine tutulan özet anahtarı
+SUMMARY_KEY = "$summary"
+
+_WHITESPACE = " \t\n\r"
+# Bir sayının devamı olabilecek karakterler (kesir, üs)
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_decoder = json.JSONDecoder()
+
+
+def _dumps(value) -> str:
+    """object_digest() ile aynı minified biçim"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class SarifStreamError(ValueError):
+    """Akış geçerli bir JSON belgesi değilse fırlatılır"""
+
+
+class EmptySarifStreamError(SarifStreamError):
+    """Akış boşsa (veya yalnızca boşluk içeriyorsa) fırlatılır"""
+
+
+# ============================================
+# AKIŞ OKUYUCU
+# ============================================
+
+class _JsonStreamReader:
+    """
+    Metin akışı üzerinde JSON belge iskeletini gezen küçük okuyucu
+
+    Tampon yalnızca henüz tüketilmemiş kısmı tutar; tek bir değer tampona
+    sığmazsa tampon o değer tamamlanana kadar (katlanarak) büyütülür.
+    """
+
+    def __init__(self, source, chunk_size: int = SARIF_STREAM_CHUNK_SIZE):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0
+
+    def _fill(self, size: int) -> bool:
+        """Tampona en az bir parça ekler; akış bittiyse False"""
+        if self.pos:
+            self.consumed += self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        data = self.source.read(max(size, self.chunk_size))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer += data
+        return True
+
+    @property
+    def offset(self) -> int:
+        """Şimdiye kadar tüketilen karakter sayısı"""
+        return self.consumed + self.pos
+
+    def peek(self) -> str:
+        """Boşlukları atlayıp sıradaki karakteri döner (akış bittiyse "")"""
+        while True:
+            buffer = self.buffer
+            length = len(buffer)
+            pos = self.pos
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise SarifStreamError(f"Beklenen '{char}', bulunan '{found or 'EOF'}' (konum {self.offset})")
+        self.pos += 1
+
+    def consume_separator(self, closing: str) -> bool:
+        """
+        Dizi/nesne öğesinden sonraki ayırıcıyı okur
+
+        Returns:
+            bool: Başka öğe varsa True, kapanış karakteri geldiyse False
+        """
+        found = self.peek()
+        self.pos += 1
+        if found == ",":
+            return True
+        if found == closing:
+            return False
+        raise SarifStreamError(f"Beklenen ',' veya '{closing}', bulunan '{found or 'EOF'}' (konum {self.offset})")
+
+    def read_value(self):
+        """Sıradaki tam JSON değerini çözer"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise SarifStreamError(f"Geçersiz JSON (konum {self.offset}): {e.msg}") from None
+                # Değer tampona sığmadı: tamponu katlayarak büyüt
+                self._fill(len(self.buffer) - self.pos)
+                continue
+            # Tampon sonuna kadar uzanan bir sayı yarım olabilir
+            # (örn: "12" + "34", "1." + "5", "1e" + "3")
+            if (
+                not self.eof
+                and isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and all(char in _NUMBER_CHARS for char in self.buffer[end:])
+            ):
+                self._fill(self.chunk_size)
+                continue
+            self.pos = end
+            return value
+
+
+def iter_sarif_events(source, chunk_size: int = SARIF_STREAM_CHUNK_SIZE) -> Iterator[tuple]:
+    """
+    SARIF belgesini belge sırasında olaylara ayırır
+
+    Olaylar:
+        ("key", key, value)            Üst düzey anahtar (runs hariç)
+        ("runs_start",) / ("runs_end",)
+        ("run_start", i) / ("run_end", i)
+        ("run_key", i, key, value)     Run anahtarı (results hariç)
+        ("results_start", i) / ("results_end", i)
+        ("result", i, result)
+        ("run_value", i, value)        Nesne olmayan run öğesi (geçersiz SARIF)
+
+    Args:
+        source: read(n) metodu olan metin akışı
+        chunk_size: Okuma parçası
+
+    Yields:
+        tuple: Olay
+    """
+    reader = _JsonStreamReader(source, chunk_size)
+    if reader.peek() == "":
+        raise EmptySarifStreamError("Akış boş")
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+
+    while True:
+        key = reader.read_value()
+        reader.expect(":")
+        if key == "runs" and reader.peek() == "[":
+            reader.pos += 1
+            yield ("runs_start",)
+            run_index = 0
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield from _iter_run_events(reader, run_index)
+                    run_index += 1
+                    if not reader.consume_separator("]"):
+                        break
+            yield ("runs_end",)
+        else:
+            yield ("key", key, reader.read_value())
+        if not reader.consume_separator("}"):
+            break
+
+    if reader.peek() != "":
+        raise SarifStreamError(f"Belge sonunda fazladan veri (konum {reader.offset})")
+
+
+def _iter_run_events(reader: _JsonStreamReader, run_index: int) -> Iterator[tuple]:
+    """Tek bir run nesnesinin olayları"""
+    if reader.peek() != "{":
+        yield ("run_value", run_index, reader.read_value())
+        return
+
+    reader.pos += 1
+    yield ("run_start", run_index)
+    if reader.peek() == "}":
+        reader.pos += 1
+        yield ("run_end", run_index)
+        return
+
+    while True:
+        key = reader.read_value()
+        reader.expect(":")
+        if key == "results" and reader.peek() == "[":
+            reader.pos += 1
+            yield ("results_start", run_index)
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield ("result", run_index, reader.read_value())
+                    if not reader.consume_separator("]"):
+                        break
+            yield ("results_end", run_index)
+        else:
+            yield ("run_key", run_index, key, reader.read_value())
+        if not reader.consume_separator("}"):
+            break
+    yield ("run_end", run_index)
+
+
+def iter_sarif_results(source, chunk_size: int = SARIF_STREAM_CHUNK_SIZE) -> Iterator[Tuple[int, dict]]:
+    """
+    runs[*].results[*] öğelerini sırayla üretir
+
+    Yields:
+        (run index, result dict)
+    """
+    for event in iter_sarif_events(source, chunk_size):
+        if event[0] == "result":
+            yield event[1], event[2]
+
+
+# ============================================
+# TEK GEÇİŞLİ İŞLEME
+# ============================================
+
+@dataclass
+class StreamedSarif:
+    """
+    Akış halinde işlenmiş SARIF çıktısının özeti
+
+    Attributes:
+        counts: Severity sayıları (yalnızca ilk run; SnykMetrics ile aynı kapsam)
+        total_results: İlk run'daki result sayısı
+        issues: İlk run'dan çıkarılan issue'lar
+        run_properties: İlk run'ın results dışındaki anahtarları (tool, properties, ...)
+        top_level: Üst düzey anahtarlar (runs hariç; $schema, version, ...)
+        digest: Ham çıktının depodaki içerik hash'i (persist=False ise None)
+        size: Minified ham çıktının bayt boyutu
+        raw_output: Çıktı küçükse tam dict, aksi halde None
+        has_runs: Belgede "runs" dizisi var mı
+    """
+    counts: dict = field(default_factory=lambda: {"critical": 0, "high": 0, "medium": 0, "low": 0})
+    total_results: int = 0
+    issues: List[Issue] = field(default_factory=list)
+    run_properties: dict = field(default_factory=dict)
+    top_level: dict = field(default_factory=dict)
+    digest: Optional[str] = None
+    size: int = 0
+    raw_output: Optional[dict] = None
+    has_runs: bool = False
+
+    @property
+    def materialized(self) -> bool:
+        return self.raw_output is not None
+
+    def metric_result(self) -> MetricResult:
+        """SnykMetrics.calculate() ile aynı MetricResult"""
+        return SnykMetrics.result_from_counts(self.counts, self.total_results)
+
+    def skeleton(self) -> dict:
+        """results'ı boş bırakılmış küçük SARIF (coverage gibi run özellikleri için)"""
+        return dict(self.top_level, runs=[dict(self.run_properties, results=[])])
+
+    def reference(self) -> dict:
+        """Önbellek ve manifest'lerde tam çıktının yerine tutulan referans"""
+        return {
+            OBJECT_REF_KEY: OBJECT_REF_PREFIX + self.digest,
+            SUMMARY_KEY: {"total_results": self.total_results, "size": self.size}
+        }
+
+
+class _CanonicalSink:
+    """
+    Olaylardan minified JSON'u belge sırasıyla yeniden üretir
+
+    Çıktı materialize sınırını aşana kadar bellekte tutulur; aşınca depoya
+    akış halinde yazılmaya başlanır. Sınır aşılmazsa hiçbir şey yazılmaz
+    (küçük çıktılar zaten dict olarak kaydedilir).
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.chunks: List[bytes] = []
+        self.buffered = 0
+        self.writer: Optional[ObjectWriter] = None
+
+    def write(self, text: str):
+        data = text.encode("utf-8")
+        if self.writer is not None:
+            self.writer.write(data)
+            return
+        self.chunks.append(data)
+        self.buffered += len(data)
+        if self.buffered > self.limit:
+            self.writer = object_store.writer()
+            for chunk in self.chunks:
+                self.writer.write(chunk)
+            self.chunks = []
+
+    def commit(self) -> Optional[str]:
+        return self.writer.commit() if self.writer is not None else None
+
+    def abort(self):
+        if self.writer is not None:
+            self.writer.abort()
+
+
+def process_sarif_stream(
+    source,
+    materialize_limit: int = SARIF_MATERIALIZE_MAX_BYTES,
+    persist: bool = True,
+    chunk_size: int = SARIF_STREAM_CHUNK_SIZE
+) -> StreamedSarif:
+    """
+    SARIF akışını tek geçişte sayar, issue'larını çıkarır ve depoya yazar
+
+    Args:
+        source: read(n) metodu olan metin akışı (pipe veya dosya)
+        materialize_limit: Bu boyutun (minified bayt) altındaki çıktılar tam dict olarak da döner
+        persist: Sınırı aşan çıktıyı içerik adresli depoya yaz
+        chunk_size: Okuma parçası
+
+    Returns:
+        StreamedSarif
+
+    Raises:
+        SarifStreamError: Akış geçerli JSON değilse
+    """
+    streamed = StreamedSarif()
+    sink = _CanonicalSink(materialize_limit) if persist else None
+    # Sınır aşılana kadar tam belge de kurulur (persist=False ise sınır
+    # ölçülmez: materialize_limit > 0 tam belge, 0 yalnızca özet demektir)
+    document: Optional[dict] = {} if materialize_limit > 0 else None
+    runs: Optional[list] = None
+    current_run: Optional[dict] = None
+    # Her kapta ilk öğeden önce virgül yazılmaz
+    first = [True]
+
+    def emit(text: str):
+        if sink is not None:
+            sink.write(text)
+
+    def separator():
+        if first[-1]:
+            first[-1] = False
+        else:
+            emit(",")
+
+    emit("{")
+    try:
+        for event in iter_sarif_events(source, chunk_size):
+            kind = event[0]
+            if kind == "result":
+                run_index, result = event[1], event[2]
+                separator()
+                emit(_dumps(result))
+                if run_index == 0 and isinstance(result, dict):
+                    streamed.total_results += 1
+                    streamed.counts[SnykMetrics.severity_of(result)] += 1
+                    issue = sarif_result_to_issue(result)
+                    if issue is not None:
+                        streamed.issues.append(issue)
+                if document is not None:
+                    current_run["results"].append(result)
+            elif kind == "key":
+                separator()
+                emit(f"{_dumps(event[1])}:{_dumps(event[2])}")
+                streamed.top_level[event[1]] = event[2]
+                if document is not None:
+                    document[event[1]] = event[2]
+            elif kind == "runs_start":
+                separator()
+                emit('"runs":[')
+                first.append(True)
+                streamed.has_runs = True
+                runs = []
+                if document is not None:
+                    document["runs"] = runs
+            elif kind == "run_start":
+                separator()
+                emit("{")
+                first.append(True)
+                current_run = {}
+                if document is not None:
+                    runs.append(current_run)
+            elif kind == "run_key":
+                run_index, key, value = event[1], event[2], event[3]
+                separator()
+                emit(f"{_dumps(key)}:{_dumps(value)}")
+                if run_index == 0:
+                    streamed.run_properties[key] = value
+                if document is not None:
+                    current_run[key] = value
+            elif kind == "results_start":
+                separator()
+                emit('"results":[')
+                first.append(True)
+                if document is not None:
+                    current_run["results"] = []
+            elif kind in ("results_end", "runs_end"):
+                emit("]")
+                first.pop()
+            elif kind == "run_end":
+                emit("}")
+                first.pop()
+            elif kind == "run_value":
+                separator()
+                emit(_dumps(event[2]))
+                if document is not None:
+                    runs.append(event[2])
+
+            # Çıktı sınırı aştıysa yalnızca özet tutulmaya devam edilir
+            if document is not None and sink is not None and sink.writer is not None:
+                document = None
+        emit("}")
+
+        digest = sink.commit() if sink is not None else None
+    except Exception:
+        if sink is not None:
+            sink.abort()
+        raise
+
+    streamed.digest = digest
+    if sink is not None:
+        streamed.size = sink.writer.size if sink.writer is not None else sink.buffered
+    streamed.raw_output = document
+    return streamed
+
+
+class _HashingTextReader:
+    """
+    İkili dosyayı okurken baytların sha256'sını hesaplayan metin okuyucu
+
+    Dosyanın içerik hash'i ayrıştırma ile aynı geçişte çıkar; nesne deposuna
+    alınırken (ObjectStore.adopt) dosya ikinci kez okunmaz.
+    """
+
+    def __init__(self, binary):
+        self.binary = binary
+        self.hash = hashlib.sha256()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def read(self, size: int = -1) -> str:
+        data = self.binary.read(size)
+        self.hash.update(data)
+        return self._decoder.decode(data, final=not data)
+
+
+def process_sarif_file(
+    path,
+    materialize_limit: int = SARIF_MATERIALIZE_MAX_BYTES,
+    chunk_size: int = SARIF_STREAM_CHUNK_SIZE
+) -> StreamedSarif:
+    """
+    Tarayıcının diske yazdığı SARIF dosyasını tek geçişte işler
+
+    Sayım ve issue çıkarımı process_sarif_stream() ile aynıdır; çıktı yeniden
+    serileştirilmez. digest dosya baytlarının sha256'sıdır ve dosya
+    ObjectStore.adopt() ile olduğu gibi nesne yapılabilir.
+
+    Args:
+        path: SARIF dosyası
+        materialize_limit: Dosya bu boyuttan küçükse tam dict de döner
+        chunk_size: Okuma parçası
+
+    Returns:
+        StreamedSarif
+
+    Raises:
+        SarifStreamError: Dosya geçerli JSON değilse (boşsa EmptySarifStreamError)
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        reader = _HashingTextReader(f)
+        streamed = process_sarif_stream(
+            reader,
+            materialize_limit=materialize_limit if size <= materialize_limit else 0,
+            persist=False,
+            chunk_size=chunk_size
+        )
+    streamed.digest = reader.hash.hexdigest()
+    streamed.size = size
+    return streamed
+
+
+def streamed_from_object(digest: str, size: int = 0) -> StreamedSarif:
+    """
+    Depodaki bir çıktıdan özeti yeniden üretir (önbellek isabetinde)
+
+    Nesne tekrar yazılmaz; ham çıktı akış halinde okunur ve yalnızca
+    SARIF_MATERIALIZE_MAX_BYTES'tan küçükse tam dict olarak tutulur.
+
+    Args:
+        digest: Nesnenin içerik hash'i
+        size: Bilinen boyut (referans özetinden)
+
+    Returns:
+        StreamedSarif
+
+    Raises:
+        ObjectNotFoundError: Nesne yoksa
+    """
+    path = object_store.path_for(digest)
+    if path is None:
+        raise ObjectNotFoundError(f"Nesne bulunamadı: {digest}")
+    with open(path, "rb") as f:
+        compressed = f.read(2) == GZIP_MAGIC
+    binary = gzip.open(path, "rb") if compressed else open(path, "rb")
+    materialize_limit = SARIF_MATERIALIZE_MAX_BYTES if 0 < size <= SARIF_MATERIALIZE_MAX_BYTES else 0
+    with io.TextIOWrapper(binary, encoding="utf-8") as text:
+        streamed = process_sarif_stream(text, materialize_limit=materialize_limit, persist=False)
+    streamed.digest = digest
+    streamed.size = size
+    return streamed
+
+
+def is_streamed_reference(value) -> bool:
+    """Önbellek/manifest değeri StreamedSarif.reference() çıktısı mı?"""
+    return isinstance(value, dict) and OBJECT_REF_KEY in value and SUMMARY_KEY in value
+
+
+def streamed_from_reference(reference: dict) -> StreamedSarif:
+    """
+    StreamedSarif.reference() çıktısından özeti yeniden üretir
+
+    Raises:
+        ObjectNotFoundError: Nesne çöp toplama ile silinmişse
+    """
+    digest = reference[OBJECT_REF_KEY][len(OBJECT_REF_PREFIX):]
+    return streamed_from_object(digest, size=reference.get(SUMMARY_KEY, {}).get("size", 0))
@@ -0,0 +1,250 @@
+"""
+Tarama Sonuç Önbelleği (Scan Result Cache) Modülü
+
+Bu modül, değişmemiş projelerin tekrar tekrar taranmasını önlemek için
+tarayıcı ham çıktılarını içerik adresli olarak diskte saklar. Önbellek
+anahtarı şunlardan oluşur:
+- Projenin tree hash'i (dosya içerikleri, bkz. tree_hash.py)
+- Tarayıcı kimliği ve sürümü (örn: "snyk_code" + "1.1293.0")
+- Tarama seçenekleri (örn: Snyk organization, DeepSource repository)
+
+Proje dosyalarından biri, tarayıcı sürümü veya seçenekler değişirse anahtar
+değişir ve tarama yeniden yapılır.
+
+Tahliye (eviction):
+- TTL: created_at üzerinden SCAN_CACHE_TTL_SECONDS'tan eski kayıtlar silinir
+- Boyut: kayıt sayısı veya toplam boyut sınırı aşılırsa en az kullanılan
+  kayıtlar silinir (LRU, dosya mtime'ı son erişim zamanı olarak kullanılır)
+
+Kullanım:
+    from scan_cache import scan_cache
+    key = scan_cache.make_key("snyk_code", tree_hash, "1.1293.0", {"org": org_id})
+    entry = scan_cache.get(key)
+    if entry is None:
+        raw_output = run_snyk_code_scan(target_path)
+        scan_cache.put(key, raw_output, tool="snyk_code", scan_duration=12.5)
+
+Environment Variables:
+    SCAN_CACHE_ENABLED: Önbelleği aç/kapat (default: 1)
+    SCAN_CACHE_DIR: Önbellek klasörü (default: ../results/.cache/scans)
+    SCAN_CACHE_TTL_SECONDS: Kayıt ömrü (default: 86400)
+    SCAN_CACHE_MAX_ENTRIES: En fazla kayıt sayısı (default: 500)
+    SCAN_CACHE_MAX_BYTES: En fazla toplam boyut (default: 536870912, 512 MB)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+SCAN_CACHE_ENABLED = os.getenv("SCAN_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+SCAN_CACHE_DIR = os.getenv("SCAN_CACHE_DIR", "../results/.cache/scans")
+SCAN_CACHE_TTL_SECONDS = float(os.getenv("SCAN_CACHE_TTL_SECONDS", "86400"))
+SCAN_CACHE_MAX_ENTRIES = int(os.getenv("SCAN_CACHE_MAX_ENTRIES", "500"))
+SCAN_CACHE_MAX_BYTES = int(os.getenv("SCAN_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+
+class ScanResultCache:
+    """
+    Disk tabanlı, içerik adresli tarama sonuç önbelleği
+
+    Her kayıt ayrı bir JSON dosyasıdır; yazma işlemleri geçici dosya +
+    os.replace ile atomik yapılır, böylece birden fazla worker süreci aynı
+    klasörü güvenle paylaşabilir.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = SCAN_CACHE_DIR,
+        ttl_seconds: float = SCAN_CACHE_TTL_SECONDS,
+        max_entries: int = SCAN_CACHE_MAX_ENTRIES,
+        max_bytes: int = SCAN_CACHE_MAX_BYTES,
+        enabled: bool = SCAN_CACHE_ENABLED
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(tool: str, tree_hash: str, tool_version: str, options: Optional[dict] = None) -> str:
+        """
+        Önbellek anahtarını oluşturur
+
+        Args:
+            tool: Tarayıcı kimliği ("snyk_code", "deepsource")
+            tree_hash: Projenin içerik hash'i
+            tool_version: Tarayıcı sürümü veya kimliği
+            options: Sonucu etkileyen tarama seçenekleri
+
+        Returns:
+            str: Hex formatında SHA-256 anahtar
+        """
+        key_material = json.dumps(
+            {
+                "tool": tool,
+                "tree_hash": tree_hash,
+                "tool_version": tool_version,
+                "options": options or {}
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Önbellekteki kaydı döner
+
+        Args:
+            key: make_key ile oluşturulan anahtar
+
+        Returns:
+            dict: {"raw_output", "tool", "tool_version", "created_at", "scan_duration"}
+            veya kayıt yoksa / süresi dolmuşsa None
+        """
+        if not self.enabled:
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            self.misses += 1
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+
+        # LRU için son erişim zamanını güncelle
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, raw_output: dict, tool: str, tool_version: str = "", scan_duration: float = 0.0):
+        """
+        Tarama sonucunu önbelleğe yazar ve gerekirse eski kayıtları tahliye eder
+
+        Args:
+            key: make_key ile oluşturulan anahtar
+            raw_output: Tarayıcının ham çıktısı
+            tool: Tarayıcı kimliği
+            tool_version: Tarayıcı sürümü
+            scan_duration: Gerçek tarama süresi (cache hit'lerde raporlanır)
+        """
+        if not self.enabled:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "tool": tool,
+            "tool_version": tool_version,
+            "created_at": time.time(),
+            "scan_duration": scan_duration,
+            "raw_output": raw_output
+        }
+
+        # Atomik yazma: aynı klasörde geçici dosya + os.replace
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, self._entry_path(key))
+        except Exception:
+            self._remove(Path(temp_path))
+            raise
+
+        self.evict()
+
+    def evict(self):
+        """Süresi dolmuş kayıtları ve sınırları aşan en eski kayıtları siler"""
+        with self._lock:
+            entries = []
+            now = time.time()
+            for entry_path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                # mtime = son erişim zamanı (get() sırasında güncellenir)
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+            # TTL süresince hiç erişilmemiş kayıtların created_at'i de TTL'den eskidir.
+            # Erişilen ama süresi dolan kayıtlar get() sırasında created_at ile silinir.
+            live = []
+            for mtime, size, entry_path in entries:
+                if now - mtime > self.ttl_seconds:
+                    self._remove(entry_path)
+                else:
+                    live.append((mtime, size, entry_path))
+
+            # En eski erişim zamanından başlayarak sınırlar altına inene kadar sil
+            live.sort()
+            total_bytes = sum(size for _, size, _ in live)
+            while live and (len(live) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, entry_path = live.pop(0)
+                self._remove(entry_path)
+                total_bytes -= size
+
+    def clear(self) -> int:
+        """Tüm kayıtları siler ve silinen kayıt sayısını döner"""
+        removed = 0
+        with self._lock:
+            for entry_path in self.cache_dir.glob("*.json"):
+                self._remove(entry_path)
+                removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        """Önbellek doluluk ve isabet istatistikleri"""
+        entry_count = 0
+        total_bytes = 0
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                total_bytes += entry_path.stat().st_size
+                entry_count += 1
+            except OSError:
+                continue
+        return {
+            "enabled": self.enabled,
+            "cache_dir": str(self.cache_dir),
+            "entries": entry_count,
+            "total_bytes": total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+# Uygulama genelinde paylaşılan önbellek
+scan_cache = ScanResultCache()
@@ -0,0 +1,189 @@
+"""
+Karşılaştırmalı Tarama (Snyk Code vs DeepSource) Modülü
+
+Bu modül, aynı proje için Snyk Code ve DeepSource taramalarını eşzamanlı
+çalıştırır ve sonuçları yan yana karşılaştırır. Web UI ve benchmark
+script'lerinin araç başına yaptığı iki ayrı HTTP çağrısının yerine tek bir
+sunucu tarafı çağrı kullanılır; karşılaştırma süresi iki taramanın toplamı
+yerine en uzun taramanın süresine iner.
+
+Her iki araç da projenin aynı anlık kopyasını (snapshot) tarar; tarama
+sırasında proje klasöründe değişiklik olsa bile iki sonuç tutarlı kalır.
+
+Kullanım:
+    from scan_compare import run_comparison
+    result = run_comparison("flask_demo")
+    result["comparison"]["severity"]["high"]
+"""
+
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from scan_jobs import run_scan
+from retention import project_leases
+
+# Karşılaştırılan araçlar (sonuç anahtarları ile aynı)
+COMPARE_TOOLS = ("snyk_code", "deepsource")
+
+
+def resolve_project_path(project_name: str) -> Optional[Path]:
+    """
+    Proje adından klasör yolunu bulur (uploaded klasörü de kontrol edilir)
+
+    Args:
+        project_name: Test projesi adı
+
+    Returns:
+        Path veya proje bulunamazsa None
+    """
+    for candidate in (
+        Path(f"../test_projects/{project_name}"),
+        Path(f"../test_projects/uploaded/{project_name}"),
+    ):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def snapshot_project(project_path: Path) -> Path:
+    """
+    Proje klasörünün geçici bir kopyasını oluşturur
+
+    Args:
+        project_path: Kopyalanacak proje klasörü
+
+    Returns:
+        Path: Snapshot klasörü (çağıran taraf silmekle sorumludur)
+    """
+    snapshot_root = Path(tempfile.mkdtemp(prefix="smarttestai_snapshot_"))
+    # Klasör adı korunur; araç çıktılarında aynı proje adı görünür
+    snapshot_path = snapshot_root / project_path.name
+    shutil.copytree(project_path, snapshot_path)
+    return snapshot_path
+
+
+def _side_by_side(snyk_value, deepsource_value) -> dict:
+    """Tek bir metrik için yan yana karşılaştırma satırı oluşturur"""
+    row = {"snyk_code": snyk_value, "deepsource": deepsource_value, "difference": None}
+    if isinstance(snyk_value, (int, float)) and isinstance(deepsource_value, (int, float)):
+        row["difference"] = snyk_value - deepsource_value
+    return row
+
+
+def build_comparison(snyk_result: dict, deepsource_result: dict) -> dict:
+    """
+    İki runner sonucundan yan yana karşılaştırma tablosu oluşturur
+
+    Başarısız taramanın değerleri None olarak gösterilir.
+
+    Args:
+        snyk_result: run_code_scan_and_save sonucu
+        deepsource_result: run_deepsource_scan_and_save sonucu
+
+    Returns:
+        dict: severity, accuracy ve efficiency grupları altında metrik satırları
+    """
+    snyk_metrics = snyk_result.get("metric_result", {}) if snyk_result.get("success") else {}
+    deepsource_metrics = deepsource_result.get("metric_result", {}) if deepsource_result.get("success") else {}
+
+    snyk_advanced = snyk_result.get("advanced_metrics", {}) if snyk_result.get("success") else {}
+    deepsource_advanced = deepsource_result.get("advanced_metrics", {}) if deepsource_result.get("success") else {}
+
+    severity = {}
+    for key in ("critical", "high", "medium", "low", "total_issues"):
+        severity[key] = _side_by_side(snyk_metrics.get(key), deepsource_metrics.get(key))
+
+    snyk_accuracy = snyk_advanced.get("defect_detection_accuracy", {})
+    deepsource_accuracy = deepsource_advanced.get("defect_detection_accuracy", {})
+    accuracy = {}
+    for key in ("precision", "recall", "f1_score", "true_positives", "false_positives", "false_negatives"):
+        accuracy[key] = _side_by_side(snyk_accuracy.get(key), deepsource_accuracy.get(key))
+    accuracy["false_positive_rate"] = _side_by_side(
+        snyk_advanced.get("false_positive_rate"),
+        deepsource_advanced.get("false_positive_rate")
+    )
+
+    snyk_efficiency = snyk_advanced.get("operational_efficiency", {})
+    deepsource_efficiency = deepsource_advanced.get("operational_efficiency", {})
+    efficiency = {
+        "scan_duration": _side_by_side(snyk_metrics.get("scan_duration"), deepsource_metrics.get("scan_duration")),
+        "memory_usage_mb": _side_by_side(
+            snyk_efficiency.get("memory_usage_mb"),
+            deepsource_efficiency.get("memory_usage_mb")
+        ),
+    }
+
+    return {
+        "severity": severity,
+        "accuracy": accuracy,
+        "efficiency": efficiency
+    }
+
+
+def run_comparison(project_name: str, **options) -> dict:
+    """
+    Snyk Code ve DeepSource taramalarını aynı snapshot üzerinde eşzamanlı çalıştırır
+
+    Args:
+        project_name: Test projesi adı
+        **options: Her iki runner'a aktarılan ek parametreler (örn: use_cache)
+
+    Returns:
+        {
+            "success": bool (en az bir tarama başarılıysa True),
+            "project": str,
+            "snyk_code": run_code_scan_and_save sonucu,
+            "deepsource": run_deepsource_scan_and_save sonucu,
+            "comparison": build_comparison sonucu,
+            "wall_time": float (toplam geçen süre, saniye),
+            "error": str (varsa)
+        }
+    """
+    # Snapshot alınırken proje saklama temizliğinde silinmez
+    with project_leases.hold(project_name):
+        project_path = resolve_project_path(project_name)
+        if project_path is None:
+            return {
+                "success": False,
+                "project": project_name,
+                "error": f"Project '{project_name}' not found in test_projects/"
+            }
+        snapshot_path = snapshot_project(project_path)
+
+    start_time = time.time()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(COMPARE_TOOLS), thread_name_prefix="scan-compare") as executor:
+            futures = {
+                tool: executor.submit(run_scan, tool, project_name, target_path=str(snapshot_path), **options)
+                for tool in COMPARE_TOOLS
+            }
+            results = {}
+            for tool, future in futures.items():
+                try:
+                    results[tool] = future.result()
+                except Exception as e:
+                    results[tool] = {"success": False, "project": project_name, "error": str(e)}
+    finally:
+        shutil.rmtree(snapshot_path.parent, ignore_errors=True)
+
+    wall_time = time.time() - start_time
+    snyk_result = results["snyk_code"]
+    deepsource_result = results["deepsource"]
+    success = snyk_result.get("success", False) or deepsource_result.get("success", False)
+
+    comparison_result = {
+        "success": success,
+        "project": project_name,
+        "snyk_code": snyk_result,
+        "deepsource": deepsource_result,
+        "comparison": build_comparison(snyk_result, deepsource_result),
+        "wall_time": wall_time
+    }
+    if not success:
+        comparison_result["error"] = "Both scans failed"
+    return comparison_result
@@ -0,0 +1,363 @@
+"""
+Tarama İş Kuyruğu (Scan Job Queue) Modülü
+
+Bu modül, uzun süren Snyk Code ve DeepSource taramalarını HTTP request
+thread'inden ayırmak için sınırlı boyutlu bir worker havuzu ve iş (job)
+kaydı sağlar. Endpoint tarama isteğini kuyruğa ekler ve hemen bir job id
+döner; tarama arka planda çalışır, sonucu GET /jobs/<id> ile sorgulanır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/scan_jobs.py: Bu dosya
+- backend/metric_runner.py: Snyk Code runner'ı (run_code_scan_and_save)
+- backend/deepsource_runner.py: DeepSource runner'ı (run_deepsource_scan_and_save)
+
+Ana Bileşenler:
+- run_scan(): Tool adına göre doğru runner'ı çağırır (ortak giriş noktası)
+- ScanJob: Tek bir tarama işinin durumu ve sonucu
+- ScanJobManager: Sınırlı worker havuzu ve iş kaydı
+- job_manager: Uygulama genelinde paylaşılan ScanJobManager örneği
+- run_scans_parallel(): */all endpoint'leri için sınırlı paralel tarama
+
+İş Durumları:
+- queued: Kuyrukta, worker bekliyor
+- running: Tarama çalışıyor
+- completed: Tarama başarılı
+- failed: Tarama başarısız (error alanında sebep)
+
+Kullanım:
+    from scan_jobs import job_manager
+    job = job_manager.submit("snyk_code", "flask_demo")
+    job_manager.get(job.job_id).to_dict()
+
+Environment Variables:
+    SCAN_JOB_WORKERS: Aynı anda çalışan tarama sayısı (default: 4)
+    SCAN_JOB_MAX_QUEUED: Kuyrukta bekleyebilecek en fazla iş sayısı (default: 100)
+    SCAN_JOB_RETENTION_SECONDS: Biten işlerin bellekte tutulma süresi (default: 3600)
+    SCAN_ALL_SNYK_CONCURRENCY: /scan/code/all için paralel Snyk taraması (default: 2)
+    SCAN_ALL_DEEPSOURCE_CONCURRENCY: /scan/deepsource/all için paralel tarama (default: 4)
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from scan_progress import ScanProgress
+from retention import project_leases
+from project_registry import project_registry
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+SCAN_JOB_WORKERS = int(os.getenv("SCAN_JOB_WORKERS", "4"))
+SCAN_JOB_MAX_QUEUED = int(os.getenv("SCAN_JOB_MAX_QUEUED", "100"))
+SCAN_JOB_RETENTION_SECONDS = float(os.getenv("SCAN_JOB_RETENTION_SECONDS", "3600"))
+
+# Toplu (*/all) taramalarda her araç için ayrı eşzamanlılık sınırı
+# Snyk CLI yerel CPU/bellek tükettiği için daha düşük tutulur,
+# DeepSource çağrıları ağ beklemesi ağırlıklıdır
+FAN_OUT_CONCURRENCY = {
+    "snyk_code": int(os.getenv("SCAN_ALL_SNYK_CONCURRENCY", "2")),
+    "deepsource": int(os.getenv("SCAN_ALL_DEEPSOURCE_CONCURRENCY", "4")),
+}
+
+# Desteklenen araçlar ve kabul edilen takma adlar
+# Tool adları, sonuç dosyalarındaki önek ile aynıdır (snyk_code_*, deepsource_*)
+TOOL_ALIASES = {
+    "snyk": "snyk_code",
+    "code": "snyk_code",
+    "snyk_code": "snyk_code",
+    "deepsource": "deepsource",
+}
+
+# İş durumları
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """Kuyruk dolu olduğunda yeni iş kabul edilemez"""
+
+
+def normalize_tool_name(tool: str) -> str:
+    """
+    Tool adını standart forma çevirir
+
+    Args:
+        tool: "snyk", "code", "snyk_code" veya "deepsource"
+
+    Returns:
+        str: "snyk_code" veya "deepsource"
+
+    Raises:
+        ValueError: Bilinmeyen tool adı
+    """
+    normalized = TOOL_ALIASES.get((tool or "").strip().lower())
+    if not normalized:
+        raise ValueError(f"Unknown tool: {tool}. Available tools: {sorted(set(TOOL_ALIASES.values()))}")
+    return normalized
+
+
+def run_scan(tool: str, project_name: str, **options) -> dict:
+    """
+    Tool adına göre ilgili runner'ı çalıştırır
+
+    Senkron endpoint'ler, job worker'ları ve toplu taramalar aynı giriş
+    noktasını kullanır.
+
+    Args:
+        tool: Tool adı (bkz. normalize_tool_name)
+        project_name: Test projesi adı
+        **options: Runner'a aktarılan ek parametreler
+
+    Returns:
+        dict: Runner sonucu (success, project, file_path, metric_result, ...)
+    """
+    tool = normalize_tool_name(tool)
+    # Tarama sürerken proje saklama temizliğinde (retention) silinmez
+    with project_leases.hold(project_name):
+        # Runner'lar ilk taramada yüklenir (requests, psutil vb. import maliyeti
+        # uygulama açılışına eklenmez)
+        if tool == "snyk_code":
+            from metric_runner import run_code_scan_and_save
+            result = run_code_scan_and_save(project_name, **options)
+        else:
+            from deepsource_runner import run_deepsource_scan_and_save
+            result = run_deepsource_scan_and_save(project_name, **options)
+
+    # Proje dizinindeki son tarama işaretçisi (GET /projects)
+    project_registry.record_scan(project_name, tool, result)
+    return result
+
+
+def run_scans_parallel(
+    tool: str,
+    projects: List[str],
+    max_workers: Optional[int] = None,
+    **options
+) -> List[dict]:
+    """
+    Birden fazla projeyi sınırlı bir thread havuzunda paralel tarar
+
+    Sonuçlar proje listesiyle aynı sırada döner; her proje için sonuç,
+    sıralı taramadaki ile aynı formattadır (başarısız taramalar dahil).
+
+    Args:
+        tool: Tool adı ("snyk_code" veya "deepsource")
+        projects: Taranacak proje adları
+        max_workers: Eşzamanlı tarama sınırı (default: FAN_OUT_CONCURRENCY[tool])
+        **options: Her runner çağrısına aktarılan ek parametreler (örn: use_cache)
+
+    Returns:
+        list: Her proje için runner sonucu
+    """
+    tool = normalize_tool_name(tool)
+    projects = list(projects)
+    if max_workers is None:
+        max_workers = FAN_OUT_CONCURRENCY[tool]
+    max_workers = max(1, min(max_workers, len(projects) or 1))
+
+    # DeepSource API: tüm projelerin issue'ları tek bir alias'lı GraphQL
+    # isteğinde önceden çekilir, proje taramaları bu sonuçtan beslenir
+    if tool == "deepsource" and len(projects) > 1:
+        from deepsource_runner import prefetch_deepsource_issues
+        prefetch_deepsource_issues(projects)
+
+    def _scan(project: str) -> dict:
+        try:
+            return run_scan(tool, project, **options)
+        except Exception as e:
+            return {"success": False, "project": project, "error": str(e)}
+
+    # Tek worker ile thread açmaya gerek yok
+    if max_workers == 1:
+        return [_scan(project) for project in projects]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"scan-all-{tool}") as executor:
+        return list(executor.map(_scan, projects))
+
+
+@dataclass
+class ScanJob:
+    """Tek bir tarama işinin durumu"""
+    job_id: str
+    tool: str
+    project: str
+    options: Dict = field(default_factory=dict)
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    # Runner'ın geçtiği aşamalar (SSE ile yayınlanır)
+    progress: ScanProgress = field(default_factory=ScanProgress, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    def to_dict(self) -> dict:
+        """İşi JSON'a çevrilebilir dict olarak döner"""
+        queue_time = None
+        run_time = None
+        if self.started_at is not None:
+            queue_time = self.started_at - self.created_at
+            run_time = (self.finished_at or time.time()) - self.started_at
+
+        return {
+            "job_id": self.job_id,
+            "tool": self.tool,
+            "project": self.project,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queue_time": queue_time,
+            "run_time": run_time,
+            "result": self.result,
+            "error": self.error,
+            "stages": list(self.progress.events)
+        }
+
+
+class ScanJobManager:
+    """
+    Sınırlı worker havuzu ile tarama işlerini yönetir
+
+    Worker sayısı, aynı anda çalışan tarayıcı süreçlerini sınırlar;
+    kuyruk sınırı ise bekleyen işlerin sınırsız büyümesini engeller.
+    Biten işler retention süresi dolunca bellekten silinir.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SCAN_JOB_WORKERS,
+        max_queued: int = SCAN_JOB_MAX_QUEUED,
+        retention_seconds: float = SCAN_JOB_RETENTION_SECONDS
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queued = max(0, max_queued)
+        self.retention_seconds = retention_seconds
+        self._jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Havuz ilk iş geldiğinde oluşturulur (import sırasında thread açılmaz)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="scan-job"
+            )
+        return self._executor
+
+    def submit(self, tool: str, project: str, **options) -> ScanJob:
+        """
+        Yeni bir tarama işi kuyruğa ekler
+
+        Args:
+            tool: Tool adı ("snyk_code" veya "deepsource")
+            project: Proje adı
+            **options: Runner'a aktarılacak ek parametreler
+
+        Returns:
+            ScanJob: Oluşturulan iş (status: queued)
+
+        Raises:
+            ValueError: Bilinmeyen tool adı
+            JobQueueFullError: Bekleyen iş sayısı sınırı aşıldı
+        """
+        tool = normalize_tool_name(tool)
+
+        # Kuyrukta beklerken de proje saklama temizliğinde silinmez (_run bırakır)
+        project_leases.acquire(project)
+        try:
+            with self._lock:
+                self._prune_locked()
+                pending = sum(1 for job in self._jobs.values() if not job.is_finished)
+                if pending >= self.max_workers + self.max_queued:
+                    raise JobQueueFullError(
+                        f"Scan queue is full ({pending} pending jobs). Try again later."
+                    )
+
+                job = ScanJob(job_id=uuid.uuid4().hex, tool=tool, project=project, options=options)
+                self._jobs[job.job_id] = job
+                self._get_executor().submit(self._run, job)
+        except BaseException:
+            project_leases.release(project)
+            raise
+
+        return job
+
+    def _run(self, job: ScanJob):
+        """Worker thread'inde işi çalıştırır ve durumunu günceller"""
+        with self._lock:
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+
+        try:
+            result = run_scan(job.tool, job.project, progress=job.progress, **job.options)
+        except Exception as e:
+            result = {"success": False, "project": job.project, "error": str(e)}
+        finally:
+            project_leases.release(job.project)
+
+        with self._lock:
+            job.result = result
+            job.finished_at = time.time()
+            if result.get("success", False):
+                job.status = JOB_COMPLETED
+            else:
+                job.status = JOB_FAILED
+                job.error = result.get("error", "Scan failed")
+
+        # SSE dinleyicilerine taramanın bittiğini bildir
+        job.progress.finish(job.status)
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        """İşi id ile döner (bulunamazsa None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, status: Optional[str] = None) -> List[ScanJob]:
+        """Kayıtlı işleri oluşturulma sırasına göre döner"""
+        with self._lock:
+            self._prune_locked()
+            jobs = list(self._jobs.values())
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        return jobs
+
+    def stats(self) -> dict:
+        """Kuyruk doluluk bilgisi"""
+        with self._lock:
+            counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_COMPLETED: 0, JOB_FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {
+            "max_workers": self.max_workers,
+            "max_queued": self.max_queued,
+            **counts
+        }
+
+    def _prune_locked(self):
+        # Retention süresi dolmuş biten işleri sil (lock altında çağrılır)
+        cutoff = time.time() - self.retention_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_finished and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Uygulama genelinde paylaşılan iş yöneticisi
+job_manager = ScanJobManager()
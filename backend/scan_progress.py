@@ -0,0 +1,127 @@
+"""
+Tarama İlerleme (Scan Progress) Modülü
+
+Bu modül, runner'ların tarama sırasında geçtiği gerçek aşamaları kaydeder.
+Her aşama olayı bir zaman damgası ve bir önceki aşamadan bu yana geçen
+süreyi taşır; böylece hem istemciler (SSE ile) gerçek ilerlemeyi görür hem
+de taramanın zamanının nereye gittiği ölçülebilir.
+
+Aşamalar (sırasıyla):
+- project_resolved: Proje klasörü bulundu
+- scanner_started: Tarayıcı (Snyk CLI / DeepSource) çağrıldı
+- coalesced: Tarayıcı çağrılmadı; aynı içeriğin eşzamanlı taramasına katılındı
+  (scanner_started yerine, bkz. single_flight.py)
+- output_received: Tarayıcı çıktısı alındı
+- parsed: Çıktı normalize edildi (MetricResult + issue listesi)
+- ground_truth_matched: Ground truth ile karşılaştırma yapıldı
+- results_saved: Sonuç dosyaları kaydedildi
+
+Kullanım:
+    progress = ScanProgress()
+    run_code_scan_and_save("flask_demo", progress=progress)
+    progress.events  # [{"stage": "project_resolved", "timestamp": ..., "duration": ...}, ...]
+"""
+
+import json
+import threading
+import time
+from typing import List, Optional, Tuple
+
+# Aşama adları
+STAGE_PROJECT_RESOLVED = "project_resolved"
+STAGE_SCANNER_STARTED = "scanner_started"
+STAGE_COALESCED = "coalesced"
+STAGE_OUTPUT_RECEIVED = "output_received"
+STAGE_PARSED = "parsed"
+STAGE_GROUND_TRUTH_MATCHED = "ground_truth_matched"
+STAGE_RESULTS_SAVED = "results_saved"
+
+
+class ScanProgress:
+    """
+    Tek bir taramanın aşama olaylarını thread-safe olarak tutar
+
+    Runner emit() ile olay ekler; SSE endpoint'i wait_for_events() ile
+    yeni olayları bekler.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.events: List[dict] = []
+        self.finished = False
+        self.status: Optional[str] = None
+        self._last_timestamp = self.started_at
+        self._condition = threading.Condition()
+
+    def emit(self, stage: str, **details):
+        """
+        Yeni bir aşama olayı kaydeder
+
+        Args:
+            stage: Aşama adı (STAGE_* sabitleri)
+            **details: Olaya eklenecek ek bilgiler (JSON'a çevrilebilir olmalı)
+        """
+        now = time.time()
+        with self._condition:
+            event = {
+                "stage": stage,
+                "timestamp": now,
+                # Bir önceki aşamadan bu yana geçen süre (saniye)
+                "duration": now - self._last_timestamp,
+                # Tarama başından bu yana geçen süre (saniye)
+                "elapsed": now - self.started_at,
+                **details
+            }
+            self._last_timestamp = now
+            self.events.append(event)
+            self._condition.notify_all()
+
+    def finish(self, status: str):
+        """Taramanın bittiğini işaretler ve bekleyen dinleyicileri uyandırır"""
+        with self._condition:
+            self.finished = True
+            self.status = status
+            self._condition.notify_all()
+
+    def wait_for_events(self, since: int, timeout: float = 15.0) -> Tuple[List[dict], bool]:
+        """
+        since indeksinden sonraki olayları döner, yoksa timeout kadar bekler
+
+        Args:
+            since: Daha önce alınan olay sayısı
+            timeout: En fazla bekleme süresi (saniye)
+
+        Returns:
+            (yeni olaylar, tarama bitti mi)
+        """
+        with self._condition:
+            if len(self.events) <= since and not self.finished:
+                self._condition.wait(timeout)
+            return list(self.events[since:]), self.finished
+
+
+def emit_stage(progress: Optional[ScanProgress], stage: str, **details):
+    """progress verilmişse aşama olayını kaydeder (runner'lar için kısayol)"""
+    if progress is not None:
+        progress.emit(stage, **details)
+
+
+def format_sse(data: dict, event: Optional[str] = None, event_id: Optional[int] = None) -> str:
+    """
+    Tek bir Server-Sent Events mesajı oluşturur
+
+    Args:
+        data: Mesaj içeriği (JSON olarak gönderilir)
+        event: SSE event adı (opsiyonel)
+        event_id: SSE id alanı; istemci yeniden bağlanırken Last-Event-ID olarak döner
+
+    Returns:
+        str: "id: ...\\nevent: ...\\ndata: ...\\n\\n" formatında mesaj
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
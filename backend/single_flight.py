@@ -0,0 +1,113 @@
+"""
+Single-Flight (Eşzamanlı Çağrı Birleştirme) Modülü
+
+Bu modül, aynı anahtarla eşzamanlı yapılan pahalı çağrıları tek bir
+çalıştırmada birleştirir. Örneğin iki kullanıcı (veya bir benchmark ve
+bir kullanıcı) aynı projeyi aynı anda taramak istediğinde yalnızca ilk
+çağrı Snyk CLI'yi çalıştırır; sonraki çağrılar ilk çalıştırmanın bitmesini
+bekler ve aynı sonucu (veya aynı hatayı) alır.
+
+Anahtar, tarayıcı + proje içerik hash'i + seçeneklerden oluşur (bkz.
+ScanResultCache.make_key). Çağrı bittikten sonra anahtar serbest bırakılır;
+sonraki istekler önbellekten veya yeni bir taramadan beslenir.
+
+Not: Birleştirme süreç içidir (thread'ler arası). Senkron endpoint'ler,
+job kuyruğu worker'ları ve fan-out havuzları aynı süreçte çalıştığı için
+hepsi aynı scan_flights nesnesini paylaşır.
+
+Kullanım:
+    from single_flight import scan_flights
+    raw_output, shared = scan_flights.do(key, lambda: run_snyk_code_scan(path))
+
+    # Katılan çağrı beklemeye başlamadan önce bilgilendirilir (örn: ilerleme olayı)
+    raw_output, shared = scan_flights.do(key, scan, on_join=lambda: emit_stage(progress, STAGE_COALESCED))
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """Devam eden tek bir çağrının durumu"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Aynı anahtarlı eşzamanlı çağrıları birleştiren yardımcı sınıf
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        on_join: Optional[Callable[[], None]] = None
+    ) -> Tuple[Any, bool]:
+        """
+        fn'i anahtar başına en fazla bir kez eşzamanlı çalıştırır
+
+        Args:
+            key: Çağrı anahtarı
+            fn: Çalıştırılacak fonksiyon (argümansız)
+            on_join: Çağrı devam eden bir çalıştırmaya katıldığında, beklemeden
+                önce çağrılır (opsiyonel; lider çağrıda çağrılmaz)
+
+        Returns:
+            (fn sonucu, sonuç başka bir çağrıdan mı paylaşıldı)
+
+        Raises:
+            fn'in fırlattığı hata; bekleyen çağrılara da aynı hata iletilir
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            if on_join is not None:
+                on_join()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.value, False
+
+    def stats(self) -> dict:
+        """Devam eden çağrı ve birleştirilen çağrı sayıları"""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "waiting": sum(call.waiters for call in self._calls.values()),
+                "coalesced_total": self.coalesced
+            }
+
+
+# Tüm tarama yolları (senkron endpoint'ler, job'lar, fan-out) için paylaşılan örnek
+scan_flights = SingleFlight()
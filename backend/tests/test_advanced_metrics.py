@@ -3,7 +3,8 @@
 Gelişmiş Metrik Test Script'i
 
 Bu script, Snyk Code ve DeepSource için gelişmiş metrikleri hesaplar
-ve sonuçları results/ klasörüne kaydeder.
+ve sonuçları kaydeder (script olarak results/ klasörüne, pytest altında
+geçici klasöre).
 
 Test Senaryoları:
 1. Snyk Code: vulnerable_demo projesi için ground truth ile precision/recall hesaplar
@@ -18,10 +19,11 @@ Kullanım:
 
 Çıktı:
     - Console'da metrik sonuçları gösterilir
-    - results/ klasörüne JSON formatında kaydedilir
+    - results/ klasörüne JSON formatında kaydedilir (pytest depoya yazmaz)
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -29,12 +31,18 @@ from datetime import datetime
 # Backend klasörünü Python path'ine ekle
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Sonuç dosyalarının kaydedileceği klasör (çalışma klasöründen bağımsız)
+RESULTS_DIR = Path(__file__).resolve().parent.parent.parent / "results"
+
+# Tarama kayıtları nesne referansı tutar; nesneler aynı results/ altında çözülür
+# (yalnızca okunur, bu script depoya nesne yazmaz)
+os.environ.setdefault("RESULTS_OBJECTS_DIR", str(RESULTS_DIR / "objects"))
+
+from result_io import read_json, result_files, result_stem
 from metrics.advanced_metrics import AdvancedMetricsCalculator, AdvancedMetricResult
 from metrics.snyk_metrics import SnykMetrics
 from metrics.deepsource_metrics import DeepSourceMetrics
-
-# Sonuç dosyalarının kaydedileceği klasör (proje root'una göre)
-RESULTS_DIR = "../../results"
+from metrics.issue_extractors import extract_issues
 
 def create_ground_truth_vulnerable_demo():
     """
@@ -86,54 +94,17 @@ def create_ground_truth_vulnerable_demo():
         }
     ]
 
-def extract_issues_from_snyk_result(raw_data: dict) -> list:
-    """Snyk SARIF formatından issue'ları çıkarır"""
-    issues = []
-    if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
-        results = raw_data["runs"][0].get("results", [])
-        for result in results:
-            locations = result.get("locations", [])
-            if locations:
-                location = locations[0].get("physicalLocation", {})
-                artifact_location = location.get("artifactLocation", {})
-                region = location.get("region", {})
-                
-                issues.append({
-                    "file": artifact_location.get("uri", ""),
-                    "line": region.get("startLine", -1),
-                    "type": result.get("ruleId", ""),
-                    "severity": result.get("level", "error"),
-                    "description": result.get("message", {}).get("text", "")
-                })
-    return issues
-
-def extract_issues_from_deepsource_result(raw_data: dict) -> list:
-    """DeepSource GraphQL formatından issue'ları çıkarır"""
-    issues = []
-    if "data" in raw_data and "repository" in raw_data["data"]:
-        repo_data = raw_data["data"]["repository"]
-        if "issues" in repo_data and "edges" in repo_data["issues"]:
-            for edge in repo_data["issues"]["edges"]:
-                if "node" in edge and "issue" in edge["node"]:
-                    issue = edge["node"]["issue"]
-                    # DeepSource'te dosya ve satır bilgisi yok, sadece issue bilgisi var
-                    issues.append({
-                        "file": "unknown",  # DeepSource API'sinde dosya bilgisi yok
-                        "line": -1,
-                        "type": issue.get("shortcode", ""),
-                        "severity": issue.get("severity", ""),
-                        "description": issue.get("title", "")
-                    })
-    return issues
-
-def test_snyk_advanced_metrics():
+def test_snyk_advanced_metrics(tmp_path: Path):
     """Snyk için gelişmiş metrikleri test et"""
     print("=" * 60)
     print("SNYK CODE - GELISMIS METRIK TESTI")
     print("=" * 60)
     
-    # Son Snyk sonuç dosyasını bul
-    snyk_files = list(Path("../../results").glob("snyk_code_*.json"))
+    # Son Snyk sonuç dosyasını bul (advanced_metrics olmayan; .json veya .json.gz)
+    snyk_files = [
+        f for f in result_files(RESULTS_DIR, "snyk_code_*")
+        if "advanced_metrics" not in f.name
+    ]
     if not snyk_files:
         print("HATA: Snyk sonuc dosyasi bulunamadi!")
         return
@@ -141,12 +112,11 @@ def test_snyk_advanced_metrics():
     latest_snyk = max(snyk_files, key=lambda x: x.stat().st_mtime)
     print(f"\nDosya: {latest_snyk.name}")
     
-    # Sonuç dosyasını oku
-    with open(latest_snyk, "r", encoding="utf-8") as f:
-        snyk_raw_data = json.load(f)
+    # Sonuç dosyasını oku (nesne referansı çözülür)
+    snyk_raw_data = read_json(latest_snyk)
     
     # Issue'ları çıkar
-    detected_issues = extract_issues_from_snyk_result(snyk_raw_data)
+    detected_issues = extract_issues("snyk_code", snyk_raw_data)
     print(f"Bulunan Issues: {len(detected_issues)}")
     
     # Ground truth (vulnerable_demo için)
@@ -195,11 +165,11 @@ def test_snyk_advanced_metrics():
     print(f"  Memory Usage: {advanced_result.memory_usage_mb:.2f} MB")
     
     # Sonuçları kaydet
-    save_advanced_metrics_result("snyk", latest_snyk.stem, basic_result, advanced_result, ground_truth)
+    save_advanced_metrics_result("snyk", result_stem(latest_snyk), basic_result, advanced_result, ground_truth, tmp_path)
     
     print("\n" + "=" * 60)
 
-def test_deepsource_advanced_metrics():
+def test_deepsource_advanced_metrics(tmp_path: Path):
     """DeepSource için gelişmiş metrikleri test et"""
     print("=" * 60)
     print("DEEPSOURCE - GELISMIS METRIK TESTI")
@@ -207,7 +177,7 @@ def test_deepsource_advanced_metrics():
     
     # Son DeepSource sonuç dosyasını bul (advanced_metrics olmayan)
     deepsource_files = [
-        f for f in Path("../../results").glob("deepsource_*.json")
+        f for f in result_files(RESULTS_DIR, "deepsource_*")
         if "advanced_metrics" not in f.name
     ]
     if not deepsource_files:
@@ -217,12 +187,11 @@ def test_deepsource_advanced_metrics():
     latest_deepsource = max(deepsource_files, key=lambda x: x.stat().st_mtime)
     print(f"\nDosya: {latest_deepsource.name}")
     
-    # Sonuç dosyasını oku
-    with open(latest_deepsource, "r", encoding="utf-8") as f:
-        deepsource_raw_data = json.load(f)
+    # Sonuç dosyasını oku (nesne referansı çözülür)
+    deepsource_raw_data = read_json(latest_deepsource)
     
     # Issue'ları çıkar
-    detected_issues = extract_issues_from_deepsource_result(deepsource_raw_data)
+    detected_issues = extract_issues("deepsource", deepsource_raw_data)
     print(f"Bulunan Issues: {len(detected_issues)}")
     
     # Ground truth (DeepSource repository-based çalıştığı için genel ground truth)
@@ -264,7 +233,9 @@ def test_deepsource_advanced_metrics():
     print(f"  Memory Usage: {advanced_result.memory_usage_mb:.2f} MB")
     
     # Sonuçları kaydet
-    save_advanced_metrics_result("deepsource", latest_deepsource.stem, basic_result, advanced_result, ground_truth)
+    save_advanced_metrics_result(
+        "deepsource", result_stem(latest_deepsource), basic_result, advanced_result, ground_truth, tmp_path
+    )
     
     print("\n" + "=" * 60)
 
@@ -273,10 +244,11 @@ def save_advanced_metrics_result(
     project_name: str,
     basic_result,
     advanced_result: AdvancedMetricResult,
-    ground_truth: list = None
+    ground_truth: list = None,
+    output_dir: Path = RESULTS_DIR
 ):
     """
-    Gelişmiş metrik sonuçlarını results/ klasörüne kaydeder
+    Gelişmiş metrik sonuçlarını output_dir klasörüne kaydeder
     
     Args:
         tool_name: Araç adı ("snyk" veya "deepsource")
@@ -284,8 +256,9 @@ def save_advanced_metrics_result(
         basic_result: Temel metrik sonucu (MetricResult)
         advanced_result: Gelişmiş metrik sonucu (AdvancedMetricResult)
         ground_truth: Ground truth listesi (opsiyonel)
+        output_dir: Sonuç klasörü (varsayılan: results/)
     """
-    results_path = Path(RESULTS_DIR)
+    results_path = Path(output_dir)
     results_path.mkdir(parents=True, exist_ok=True)
     
     # Dosya adını oluştur
@@ -343,12 +316,12 @@ if __name__ == "__main__":
     print("\nGELISMIS METRIK TEST SUITI\n")
     
     # Snyk testi
-    test_snyk_advanced_metrics()
+    test_snyk_advanced_metrics(RESULTS_DIR)
     
     print("\n")
     
     # DeepSource testi
-    test_deepsource_advanced_metrics()
+    test_deepsource_advanced_metrics(RESULTS_DIR)
     
     print("\nTest tamamlandi!")
 
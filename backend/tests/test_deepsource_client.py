@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+DeepSource İstemcisi Devre Kesici Test Script'i
+
+Bu script, DeepSourceClient'ın devre kesici durumlarını gerçek API'ye
+bağlanmadan (sahte HTTP oturumu ile) doğrular.
+
+Test Senaryoları:
+1. closed -> open (eşik kadar ardışık hata) -> half_open -> closed
+2. half_open deneme çağrısı 4xx dönerse devre kapanır (API ayakta)
+3. half_open deneme çağrısı hız sınırı zaman aşımıyla yarıda kalırsa
+   devre kilitlenmez; sonraki çağrı yeniden deneme yapabilir
+4. half_open deneme çağrısı 5xx dönerse devre tekrar açılır
+
+Kullanım:
+    cd backend
+    python tests/test_deepsource_client.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import deepsource_client
+from deepsource_client import CircuitBreaker, CircuitOpenError, DeepSourceAPIError, DeepSourceClient
+from rate_limiter import RateLimitTimeout
+
+# Testlerde half_open'a geçiş süresi (saniye)
+RESET_SECONDS = 0.05
+
+
+class FakeResponse:
+    """requests.Response yerine kullanılan minimal yanıt"""
+
+    def __init__(self, status_code: int, data: dict = None):
+        self.status_code = status_code
+        self._data = data if data is not None else {"data": {}}
+        self.text = str(self._data)
+        self.headers = {}
+
+    def json(self) -> dict:
+        return self._data
+
+
+class FakeSession:
+    """Sıradaki durum kodunu dönen sahte HTTP oturumu"""
+
+    def __init__(self):
+        self.status_codes = []
+        self.calls = 0
+
+    def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.status_codes.pop(0) if self.status_codes else 200)
+
+
+class TimeoutLimiter:
+    """Her acquire çağrısında RateLimitTimeout fırlatan hız sınırlayıcı"""
+
+    enabled = True
+
+    def acquire(self, service, credential=None, tokens=1.0):
+        raise RateLimitTimeout("test: token yok")
+
+    def defer(self, service, credential, seconds):
+        pass
+
+
+def make_client(tmp_dir: Path):
+    """Yeniden denemesiz, küçük eşikli istemci ve sahte oturumu"""
+    breaker = CircuitBreaker(threshold=2, reset_seconds=RESET_SECONDS)
+    client = DeepSourceClient(
+        "https://example.invalid/graphql/", "token",
+        max_retries=0, breaker=breaker, last_good_dir=str(tmp_dir)
+    )
+    session = FakeSession()
+    client._session = session
+    return client, session
+
+
+def open_breaker(client: DeepSourceClient, session: FakeSession):
+    """Eşik kadar 5xx ile devreyi açar ve half_open olana kadar bekler"""
+    session.status_codes = [503] * client.breaker.threshold
+    for _ in range(client.breaker.threshold):
+        try:
+            client.execute("query", remember=False)
+        except DeepSourceAPIError:
+            pass
+    assert client.breaker.state == "open"
+    try:
+        client.execute("query", remember=False)
+        raise AssertionError("Açık devrede çağrı yapılmamalı")
+    except CircuitOpenError:
+        pass
+    time.sleep(RESET_SECONDS * 1.5)
+    assert client.breaker.state == "half_open"
+
+
+def test_breaker_cycle(tmp_path: Path):
+    """closed -> open -> half_open -> closed"""
+    client, session = make_client(tmp_path)
+    assert client.breaker.state == "closed"
+    open_breaker(client, session)
+    calls = session.calls
+
+    assert client.execute("query", remember=False) == {"data": {}}
+    assert session.calls == calls + 1
+    assert client.breaker.state == "closed"
+    assert client.breaker.consecutive_failures == 0
+    print("[OK] closed -> open -> half_open -> closed")
+
+
+def test_trial_4xx_closes_breaker(tmp_path: Path):
+    """half_open denemesinde 401: API ayakta, devre kapanır"""
+    client, session = make_client(tmp_path)
+    open_breaker(client, session)
+
+    session.status_codes = [401]
+    try:
+        client.execute("query", remember=False)
+        raise AssertionError("401 DeepSourceAPIError fırlatmalı")
+    except CircuitOpenError:
+        raise AssertionError("401 devre açık hatası olmamalı")
+    except DeepSourceAPIError:
+        pass
+    assert client.breaker.state == "closed"
+    assert client.execute("query", remember=False) == {"data": {}}
+    print("[OK] half_open denemesinde 4xx devreyi kapatır")
+
+
+def test_trial_rate_limit_timeout_releases_trial(tmp_path: Path):
+    """half_open denemesi hız sınırında yarıda kalırsa devre kilitlenmez"""
+    client, session = make_client(tmp_path)
+    open_breaker(client, session)
+
+    original_limiter = deepsource_client.rate_limiter
+    deepsource_client.rate_limiter = TimeoutLimiter()
+    try:
+        client.execute("query", remember=False)
+        raise AssertionError("RateLimitTimeout fırlatmalı")
+    except RateLimitTimeout:
+        pass
+    finally:
+        deepsource_client.rate_limiter = original_limiter
+
+    assert client.breaker.state == "half_open"
+    assert not client.breaker._trial_in_progress
+    assert client.execute("query", remember=False) == {"data": {}}
+    assert client.breaker.state == "closed"
+    print("[OK] Yarıda kalan half_open denemesi devreyi kilitlemez")
+
+
+def test_trial_failure_reopens_breaker(tmp_path: Path):
+    """half_open denemesinde 5xx: devre tekrar açılır"""
+    client, session = make_client(tmp_path)
+    open_breaker(client, session)
+
+    session.status_codes = [503]
+    try:
+        client.execute("query", remember=False)
+        raise AssertionError("503 DeepSourceAPIError fırlatmalı")
+    except CircuitOpenError:
+        raise AssertionError("Deneme çağrısı yapılmalıydı")
+    except DeepSourceAPIError:
+        pass
+    assert client.breaker.state == "open"
+    print("[OK] half_open denemesinde 5xx devreyi tekrar açar")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        test_breaker_cycle(tmp_dir)
+        test_trial_4xx_closes_breaker(tmp_dir)
+        test_trial_rate_limit_timeout_releases_trial(tmp_dir)
+        test_trial_failure_reopens_breaker(tmp_dir)
+    print("\nDeepSource istemcisi testleri başarılı!")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+DeepSource Sayfalama Test Script'i
+
+Bu script, deepsource_pagination.py'nin sayfaları birleşik yanıtı bellekte
+oluşturmadan işlediğini sahte bir GraphQL istemcisiyle doğrular.
+
+Test Senaryoları:
+1. Offset ve cursor modunda tüm sayfalar çekilir; sayılar ve issue'lar
+   birleşik yanıt üzerinde DeepSourceMetrics.normalize ile aynıdır
+2. Nesne deposuna akış halinde yazılan nesne, birleşik yanıtın
+   object_digest() hash'iyle ve içeriğiyle aynıdır
+3. DEEPSOURCE_MAX_PAGES sınırına takılan sonuç truncated işaretlenir ve
+   has_next_page True kalır
+4. Toplu çekim son analiz kimliğini issue'larla aynı istekte alır; ön-çekim
+   sonrası taramalar önbellek anahtarı için ayrı istek yapmaz, ön-çekim
+   yokken repository başına tek istek yapılır
+
+Kullanım:
+    cd backend
+    python tests/test_deepsource_pagination.py
+"""
+
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Nesneler geçici klasöre yazılır (object_store import edilmeden önce)
+os.environ["RESULTS_OBJECTS_DIR"] = tempfile.mkdtemp(prefix="ds_objects_")
+os.environ["TOOL_REGISTRY_FILE"] = os.path.join(os.environ["RESULTS_OBJECTS_DIR"], "tool_registry.json")
+
+import deepsource_client
+import deepsource_runner
+from deepsource_pagination import PaginationError, fetch_issues_batch, fetch_repository_issues
+from metrics.deepsource_metrics import DeepSourceMetrics
+from object_store import object_digest, object_store
+
+SEVERITIES = ["CRITICAL", "MAJOR", "MINOR", "INFO", None]
+
+
+class FakeClient:
+    """Sorgudaki first/offset/after argümanlarına göre sayfa dönen sahte istemci"""
+
+    def __init__(self, issues: list, offset_supported: bool = True):
+        self.issues = issues
+        self.offset_supported = offset_supported
+        self.requests = 0
+
+    def execute(self, query: str, variables=None, remember=True) -> dict:
+        self.requests += 1
+        first = int(re.search(r"first: (\d+)", query).group(1))
+        offset_match = re.search(r"offset: (\d+)", query)
+        after_match = re.search(r'after: "(\d+)"', query)
+        if offset_match and not self.offset_supported:
+            return {"errors": [{"message": "Unknown argument offset"}]}
+        start = int(offset_match.group(1)) if offset_match else int(after_match.group(1)) if after_match else 0
+        page = self.issues[start:start + first]
+        end = start + len(page)
+        return {
+            "data": {
+                "repository": {
+                    "name": "repo",
+                    "issues": {
+                        "totalCount": len(self.issues),
+                        "pageInfo": {"hasNextPage": end < len(self.issues), "endCursor": str(end)},
+                        "edges": [{"node": {"issue": issue}} for issue in page]
+                    }
+                }
+            }
+        }
+
+
+def make_issues(count: int) -> list:
+    return [
+        {
+            "shortcode": f"PYL-W{index % 40:04d}",
+            "title": f"Issue {index} – ünicode",
+            "severity": SEVERITIES[index % len(SEVERITIES)],
+            "category": "BUG_RISK"
+        }
+        for index in range(count)
+    ]
+
+
+def combined_response(issues: list) -> dict:
+    """Tek sayfalı birleşik yanıt (karşılaştırma referansı)"""
+    return {
+        "data": {
+            "repository": {
+                "name": "repo",
+                "issues": {
+                    "totalCount": len(issues),
+                    "edges": [{"node": {"issue": issue}} for issue in issues]
+                }
+            }
+        }
+    }
+
+
+def test_pages_match_combined_response():
+    """Offset ve cursor modunda sonuç birleşik yanıtla aynı"""
+    issues = make_issues(1234)
+    expected = combined_response(issues)
+    expected_metric, expected_issues = DeepSourceMetrics().normalize(expected)
+    expected_digest, _ = object_digest(expected)
+
+    for offset_supported, concurrency in ((True, 4), (False, 4), (True, 1)):
+        client = FakeClient(issues, offset_supported)
+        accumulator = fetch_repository_issues(
+            client, "owner", "repo", "GITHUB", page_size=100, concurrency=concurrency, persist=True
+        )
+        assert not accumulator.truncated
+        assert accumulator.counts == {
+            "critical": expected_metric.critical,
+            "high": expected_metric.high,
+            "medium": expected_metric.medium,
+            "low": expected_metric.low
+        }
+        assert accumulator.metric_result().total_issues == expected_metric.total_issues
+        assert accumulator.issues == expected_issues
+        assert accumulator.digest == expected_digest
+        assert object_store.get(accumulator.digest) == expected
+    print("[OK] Sayfalı sonuç birleşik yanıtla aynı (offset, cursor, tek iş parçacığı)")
+
+
+def test_empty_repository():
+    """Issue'suz repository de geçerli bir nesne üretir"""
+    accumulator = fetch_repository_issues(FakeClient([]), "owner", "repo", "GITHUB", persist=True)
+    assert accumulator.issues == []
+    assert object_store.get(accumulator.digest) == combined_response([])
+    print("[OK] Boş repository")
+
+
+def test_max_pages_marks_truncated():
+    """Sayfa sınırında sonuç eksik olarak işaretlenir"""
+    issues = make_issues(1000)
+    for offset_supported in (True, False):
+        accumulator = fetch_repository_issues(
+            FakeClient(issues, offset_supported), "owner", "repo", "GITHUB",
+            page_size=100, concurrency=4, max_pages=3
+        )
+        assert len(accumulator.issues) == 300
+        assert accumulator.has_next_page
+        assert accumulator.truncated
+    print("[OK] DEEPSOURCE_MAX_PAGES sınırı truncated olarak işaretlenir")
+
+
+def test_first_page_error_leaves_no_object():
+    """İlk sayfa hatasında yarım nesne kalmaz"""
+    class ErrorClient:
+        def execute(self, query, variables=None, remember=True):
+            return {"errors": [{"message": "Repository not found"}]}
+
+    before = object_store.stats()["objects"]
+    try:
+        fetch_repository_issues(ErrorClient(), "owner", "repo", "GITHUB", persist=True)
+        raise AssertionError("PaginationError fırlatmalı")
+    except PaginationError:
+        pass
+    assert object_store.stats()["objects"] == before
+    assert not list((object_store.root / "tmp").glob("*.tmp"))
+    print("[OK] Hata durumunda yarım nesne kalmaz")
+
+
+class BatchClient:
+    """Alias'lı toplu sorguya ve tekil son analiz sorgusuna yanıt veren sahte istemci"""
+
+    def __init__(self):
+        self.queries = []
+
+    def execute(self, query: str, variables=None, remember=True) -> dict:
+        self.queries.append(query)
+        targets = re.findall(r'(?:(t\d+): )?repository\(login: "([^"]+)", name: "([^"]+)"', query)
+        data = {}
+        for alias, owner, name in targets:
+            repository = {
+                "name": name,
+                "analysisRuns": {"edges": [{"node": {"runUid": f"run-{name}", "commitOid": "abc", "status": "SUCCESS"}}]},
+            }
+            if "issues(" in query:
+                issues = make_issues(3)
+                repository["issues"] = {
+                    "totalCount": len(issues),
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "edges": [{"node": {"issue": issue}} for issue in issues]
+                }
+            data[alias or "repository"] = repository
+        return {"data": data}
+
+    def save_last_good(self, key, variables, value):
+        pass
+
+
+def test_batch_includes_analysis_state():
+    """Son analiz issue'larla aynı istekte gelir; taramalar ayrıca sormaz"""
+    client = BatchClient()
+    targets = [("owner", "a", "GITHUB"), ("owner", "b", "GITHUB"), ("owner", "a", "GITHUB")]
+    accumulators = fetch_issues_batch(client, targets)
+    assert len(client.queries) == 1 and "analysisRuns(first: 1)" in client.queries[0]
+    assert {target: acc.analysis_state for target, acc in accumulators.items()} == {
+        ("owner", "a", "GITHUB"): "abc:run-a:SUCCESS",
+        ("owner", "b", "GITHUB"): "abc:run-b:SUCCESS",
+    }
+
+    # Runner: ön-çekim sonrası _remote_analysis_state API'ye gitmez
+    original = (deepsource_runner.DEEPSOURCE_API_TOKEN, deepsource_client.get_client,
+                deepsource_runner.resolve_deepsource_repository)
+    deepsource_runner.DEEPSOURCE_API_TOKEN = "token"
+    deepsource_client.get_client = lambda api_url, token: client
+    deepsource_runner.resolve_deepsource_repository = lambda project_name=None: ("owner", project_name, "GITHUB")
+    try:
+        client.queries.clear()
+        assert deepsource_runner.prefetch_deepsource_issues(["c", "d"]) == 2
+        assert len(client.queries) == 1
+        assert deepsource_runner._remote_analysis_state(("owner", "c", "GITHUB")) == "abc:run-c:SUCCESS"
+        assert deepsource_runner._remote_analysis_state(("owner", "d", "GITHUB")) == "abc:run-d:SUCCESS"
+        assert len(client.queries) == 1
+
+        # Ön-çekim yoksa repository başına tek istek, sonraki çağrılar tutulan değeri kullanır
+        for _ in range(3):
+            assert deepsource_runner._remote_analysis_state(("owner", "e", "GITHUB")) == "abc:run-e:SUCCESS"
+        assert len(client.queries) == 2 and "issues(" not in client.queries[1]
+    finally:
+        (deepsource_runner.DEEPSOURCE_API_TOKEN, deepsource_client.get_client,
+         deepsource_runner.resolve_deepsource_repository) = original
+        deepsource_runner._prefetched_issues.clear()
+        deepsource_runner._analysis_states.clear()
+    print("[OK] Son analiz kimliği toplu istekte gelir ve repository başına tutulur")
+
+
+if __name__ == "__main__":
+    import shutil
+
+    try:
+        test_pages_match_combined_response()
+        test_empty_repository()
+        test_max_pages_marks_truncated()
+        test_first_page_error_leaves_no_object()
+        test_batch_includes_analysis_state()
+    finally:
+        shutil.rmtree(os.environ["RESULTS_OBJECTS_DIR"], ignore_errors=True)
+    print("\nDeepSource sayfalama testleri başarılı!")
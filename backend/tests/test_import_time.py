@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Import Süresi (Startup) Benchmark Script'i
+
+Bu script, backend modüllerinin soğuk import süresini ölçer ve kayıtlı
+baseline ile karşılaştırır. Worker süreçleri ve CLI çağrıları kısa ömürlü
+olduğu için açılış süresindeki artışlar doğrudan gecikmeye yansır.
+
+Her modül ayrı ve temiz bir Python sürecinde `python -X importtime` ile
+import edilir; RUNS kez ölçülür ve medyan alınır. Ek olarak:
+- Import sırasında stdout'a hiçbir şey yazılmamalıdır (modül seviyesi yan etki)
+- LAZY_MODULES içindeki ağır modüller import sırasında yüklenmemelidir
+
+Bir modülün süresi baseline * TOLERANCE + SLACK_MS değerini aşarsa test
+başarısız olur.
+
+Kullanım:
+    cd backend
+    python tests/test_import_time.py
+
+    Baseline'ı güncellemek için (bilinçli bir değişiklikten sonra):
+    python tests/test_import_time.py --update-baseline
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Backend klasörü (modüller buradan import edilir)
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Baseline dosyası
+BASELINE_FILE = Path(__file__).parent / "import_time_baseline.json"
+
+# Ölçülen modüller
+MODULES = [
+    "app",
+    "metric_runner",
+    "deepsource_runner",
+    "scan_jobs",
+    "scan_compare",
+    "metrics.advanced_metrics",
+    "benchmark_runner",
+    "comprehensive_test_report",
+]
+
+# Import sırasında yüklenmemesi gereken ağır modüller (ilk kullanımda yüklenir)
+LAZY_MODULES = {
+    "app": ["requests", "psutil", "metric_runner", "deepsource_runner"],
+    "scan_jobs": ["metric_runner", "deepsource_runner"],
+    "deepsource_runner": ["requests", "psutil"],
+    "metric_runner": ["psutil"],
+    "benchmark_runner": ["requests"],
+    "comprehensive_test_report": ["requests"],
+}
+
+# Ölçüm tekrarı ve tolerans (farklı makinelerde baseline'ın %50 fazlası + 50 ms kabul edilir)
+RUNS = 5
+TOLERANCE = 1.5
+SLACK_MS = 50.0
+
+
+def measure_import_ms(module: str) -> tuple:
+    """
+    Modülü temiz bir süreçte import eder ve kümülatif import süresini döner
+
+    Args:
+        module: Modül adı (örn: "app", "metrics.advanced_metrics")
+
+    Returns:
+        (süre_ms, stdout çıktısı)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import edilemedi:\n{result.stderr[-2000:]}")
+
+    # Satır formatı: "import time: self [us] | cumulative | imported package"
+    # En üst seviyedeki (girintisiz) modül satırı kümülatif süreyi verir
+    for line in reversed(result.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].rstrip() == f" {module}":
+            return int(parts[1].strip()) / 1000.0, result.stdout
+    raise RuntimeError(f"{module} için importtime satırı bulunamadı")
+
+
+def loaded_lazy_modules(module: str) -> list:
+    """Modül import edildikten sonra yüklenmiş olan LAZY_MODULES elemanlarını döner"""
+    lazy = LAZY_MODULES.get(module, [])
+    if not lazy:
+        return []
+    code = (
+        "import sys, json\n"
+        f"import {module}\n"
+        f"print(json.dumps([name for name in {lazy!r} if name in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import edilemedi:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_all() -> dict:
+    """
+    Tüm modüllerin medyan import süresini ölçer
+
+    Returns:
+        dict: {modül: {"median_ms", "stdout"}}
+    """
+    measurements = {}
+    for module in MODULES:
+        # İlk çalıştırma bytecode (__pycache__) oluşturur, ölçüme katılmaz
+        measure_import_ms(module)
+        samples = []
+        stdout = ""
+        for _ in range(RUNS):
+            elapsed_ms, stdout = measure_import_ms(module)
+            samples.append(elapsed_ms)
+        measurements[module] = {"median_ms": statistics.median(samples), "stdout": stdout}
+    return measurements
+
+
+def test_import_time_within_baseline():
+    """Import süreleri, yan etkiler ve tembel yüklenen modüller için kontroller"""
+    baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))["modules"]
+    measurements = measure_all()
+    failures = []
+
+    print(f"{'Modül':<28} {'Medyan (ms)':>12} {'Baseline (ms)':>14} {'Limit (ms)':>11}")
+    for module, measurement in measurements.items():
+        median_ms = measurement["median_ms"]
+        baseline_ms = baseline.get(module)
+        limit_ms = baseline_ms * TOLERANCE + SLACK_MS if baseline_ms is not None else None
+        print(
+            f"{module:<28} {median_ms:>12.1f} "
+            f"{baseline_ms if baseline_ms is not None else '-':>14} "
+            f"{f'{limit_ms:.1f}' if limit_ms is not None else '-':>11}"
+        )
+
+        if limit_ms is not None and median_ms > limit_ms:
+            failures.append(f"{module}: {median_ms:.1f} ms > limit {limit_ms:.1f} ms")
+        if measurement["stdout"].strip():
+            failures.append(f"{module}: import sırasında stdout'a yazıyor: {measurement['stdout'].strip()[:200]}")
+
+        eagerly_loaded = loaded_lazy_modules(module)
+        if eagerly_loaded:
+            failures.append(f"{module}: import sırasında yüklenmemesi gereken modüller: {eagerly_loaded}")
+
+    assert not failures, "\n".join(failures)
+
+
+def update_baseline():
+    """Ölçülen süreleri baseline dosyasına yazar"""
+    measurements = measure_all()
+    baseline = {
+        "python": sys.version.split()[0],
+        "runs": RUNS,
+        "modules": {module: round(m["median_ms"], 1) for module, m in measurements.items()}
+    }
+    BASELINE_FILE.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+    print(f"Baseline kaydedildi: {BASELINE_FILE}")
+    print(json.dumps(baseline["modules"], indent=2))
+
+
+if __name__ == "__main__":
+    if "--update-baseline" in sys.argv:
+        update_baseline()
+    else:
+        try:
+            test_import_time_within_baseline()
+        except AssertionError as e:
+            print(f"\nIMPORT SURESI TESTI BASARISIZ:\n{e}")
+            sys.exit(1)
+        print("\nImport suresi testi basarili!")
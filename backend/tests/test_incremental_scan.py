@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Artımlı Tarama Test Script'i
+
+Bu script, incremental_scan.py'nin yalnızca değişen dosyaları taradığını ve
+sonucu doğru birleştirdiğini sahte bir tarayıcıyla (Snyk CLI olmadan) doğrular.
+
+Test Senaryoları:
+1. merge_sarif: değişen dosyanın bulguları yenileriyle değişir, diğer
+   dosyaların bulguları ve önceki SARIF değişmeden kalır
+2. filter_sarif_results: silinen dosyanın bulguları atılır ("./" ön ekli
+   uri'ler dahil)
+3. run_incremental_scan: manifest yok, sürüm/seçenek değişti, önceki çıktı
+   depoda yok, çıktı birleştirilemez, değişiklik oranı aşıldı ve kısmi
+   tarama başarısız durumlarında tam taramaya dönülür
+4. run_code_scan_and_save: birleştirilmiş (incremental) ve değişmemiş
+   (unchanged) sonuçlar tarama önbelleğine tam tarama sonucu olarak yazılmaz
+
+Kullanım:
+    cd backend
+    python tests/test_incremental_scan.py
+"""
+
+import copy
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Nesneler ve önbellekler geçici klasöre yazılır (modüller import edilmeden önce)
+TEST_ROOT = Path(tempfile.mkdtemp(prefix="incremental_"))
+os.environ["RESULTS_OBJECTS_DIR"] = str(TEST_ROOT / "objects")
+os.environ["TOOL_REGISTRY_FILE"] = str(TEST_ROOT / "tool_registry.json")
+
+import incremental_scan
+import metric_runner
+from incremental_scan import (
+    MODE_FULL,
+    MODE_INCREMENTAL,
+    MODE_UNCHANGED,
+    filter_sarif_results,
+    merge_sarif,
+    run_incremental_scan,
+    save_manifest,
+)
+from object_store import object_store
+from results_store import ResultsStore
+from scan_cache import ScanResultCache
+from tree_hash import compute_file_digests
+
+TOOL_VERSION = "1.0.0"
+OPTIONS = {"org": "test-org"}
+
+
+def sarif_result(uri: str, rule_id: str, line: int = 1) -> dict:
+    return {
+        "ruleId": rule_id,
+        "level": "error",
+        "message": {"text": rule_id},
+        "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": uri},
+            "region": {"startLine": line}
+        }}]
+    }
+
+
+def sarif(results: list, rule_ids: list) -> dict:
+    return {
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "SnykCode", "rules": [{"id": rule_id} for rule_id in rule_ids]}},
+            "results": results
+        }]
+    }
+
+
+def result_uris(output: dict) -> list:
+    return sorted(incremental_scan._result_uri(result) for result in output["runs"][0]["results"])
+
+
+class FakeScanner:
+    """Klasördeki her .py dosyası için, içeriğine göre bir bulgu üreten sahte tarayıcı"""
+
+    def __init__(self):
+        self.scanned = []
+        self.fail_partial = False
+
+    def __call__(self, target_path: str) -> dict:
+        root = Path(target_path)
+        files = sorted(path.relative_to(root).as_posix() for path in root.rglob("*.py"))
+        self.scanned.append(files)
+        if self.fail_partial and len(self.scanned) == 1:
+            raise RuntimeError("Desteklenmeyen dosya türü")
+        results = [
+            sarif_result(relative_path, f"python/{(root / relative_path).read_text().strip()}")
+            for relative_path in files
+        ]
+        return sarif(results, sorted({result["ruleId"] for result in results}))
+
+
+def make_project(root: Path, files: dict) -> str:
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return str(root)
+
+
+def test_merge_replaces_changed_file_only():
+    """Yalnızca değişen dosyanın bulguları değişir"""
+    prior = sarif([
+        sarif_result("a.py", "python/Sqli", 3),
+        sarif_result("b.py", "python/Sqli", 5),
+        sarif_result("b.py", "python/XSS", 9),
+        sarif_result("./c.py", "python/XSS", 1),
+    ], ["python/Sqli", "python/XSS"])
+    partial = sarif([sarif_result("b.py", "python/PathTraversal", 7)], ["python/PathTraversal"])
+    prior_copy = copy.deepcopy(prior)
+
+    merged = merge_sarif(prior, partial, {"b.py"})
+    results = merged["runs"][0]["results"]
+    assert result_uris(merged) == ["a.py", "b.py", "c.py"]
+    assert [result for result in results if result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] != "b.py"] \
+        == [prior["runs"][0]["results"][0], prior["runs"][0]["results"][3]]
+    assert [result["ruleId"] for result in results if incremental_scan._result_uri(result) == "b.py"] == ["python/PathTraversal"]
+    assert [rule["id"] for rule in merged["runs"][0]["tool"]["driver"]["rules"]] == \
+        ["python/Sqli", "python/XSS", "python/PathTraversal"]
+    # Önceki çıktı yerinde değiştirilmez
+    assert prior == prior_copy
+
+    # Kısmi taramada bulgu yoksa değişen dosyanın eski bulguları yine atılır
+    merged = merge_sarif(prior, sarif([], []), {"b.py"})
+    assert result_uris(merged) == ["a.py", "c.py"]
+    print("[OK] merge_sarif yalnızca değişen dosyanın bulgularını değiştirir")
+
+
+def test_filter_drops_deleted_file():
+    """Silinen dosyanın bulguları atılır"""
+    prior = sarif([
+        sarif_result("a.py", "python/Sqli"),
+        sarif_result("./lib/b.py", "python/XSS"),
+        sarif_result("lib/b.py", "python/XSS", 4),
+    ], ["python/Sqli", "python/XSS"])
+    filtered = filter_sarif_results(prior, {"lib/b.py"})
+    assert result_uris(filtered) == ["a.py"]
+    assert len(prior["runs"][0]["results"]) == 3
+    assert filtered["runs"][0]["tool"] == prior["runs"][0]["tool"]
+    print("[OK] filter_sarif_results silinen dosyanın bulgularını atar")
+
+
+def test_fallback_to_full_scan(tmp_path: Path):
+    """Birleştirme güvenilir değilse tam tarama yapılır"""
+    original_manifest_dir = incremental_scan.SCAN_MANIFEST_DIR
+    incremental_scan.SCAN_MANIFEST_DIR = str(tmp_path / "manifests")
+    try:
+        check_fallbacks(tmp_path)
+    finally:
+        incremental_scan.SCAN_MANIFEST_DIR = original_manifest_dir
+    print("[OK] run_incremental_scan güvenilmeyen durumlarda tam taramaya döner")
+
+
+def check_fallbacks(tmp_path: Path):
+    target_path = make_project(tmp_path / "project", {
+        "a.py": "Sqli", "b.py": "XSS", "lib/c.py": "Sqli", "lib/d.py": "Eval"
+    })
+
+    def scan(options=OPTIONS, tool_version=TOOL_VERSION, scanner=None):
+        scanner = scanner or FakeScanner()
+        output, info = run_incremental_scan(
+            "snyk_code", "demo", target_path, compute_file_digests(target_path),
+            scan_fn=scanner, tool_version=tool_version, options=options
+        )
+        return output, info, scanner
+
+    def remember(output, mergeable=True):
+        save_manifest("snyk_code", "demo", compute_file_digests(target_path), object_store.put(output),
+                      TOOL_VERSION, OPTIONS, mergeable=mergeable)
+
+    # Manifest yok
+    output, info, scanner = scan()
+    assert info["mode"] == MODE_FULL and scanner.scanned == [["a.py", "b.py", "lib/c.py", "lib/d.py"]]
+    remember(output)
+
+    # Değişiklik yok: tarayıcı çalışmaz
+    unchanged, info, scanner = scan()
+    assert info["mode"] == MODE_UNCHANGED and scanner.scanned == [] and unchanged == output
+
+    # Tek dosya değişti: yalnızca o dosya taranır, sonuç tam taramayla aynı
+    Path(target_path, "b.py").write_text("Ssrf")
+    merged, info, scanner = scan()
+    assert info["mode"] == MODE_INCREMENTAL and scanner.scanned == [["b.py"]]
+    assert result_uris(merged) == result_uris(FakeScanner()(target_path))
+    assert sorted(result["ruleId"] for result in merged["runs"][0]["results"]) == \
+        ["python/Eval", "python/Sqli", "python/Sqli", "python/Ssrf"]
+
+    # Sürüm veya seçenek değişti
+    assert scan(tool_version="2.0.0")[1]["mode"] == MODE_FULL
+    assert scan(options={"org": "other"})[1]["mode"] == MODE_FULL
+
+    # Kısmi tarama başarısız: tam taramaya dönülür
+    failing = FakeScanner()
+    failing.fail_partial = True
+    output, info, _ = scan(scanner=failing)
+    assert info["mode"] == MODE_FULL and failing.scanned == [["b.py"], ["a.py", "b.py", "lib/c.py", "lib/d.py"]]
+
+    # Değişen dosya oranı INCREMENTAL_MAX_CHANGED_RATIO'yu aştı
+    for relative_path in ("a.py", "lib/c.py", "lib/d.py"):
+        Path(target_path, relative_path).write_text("Xxe")
+    output, info, scanner = scan()
+    assert info["mode"] == MODE_FULL and info["changed_files"] == 4 and len(scanner.scanned) == 1
+
+    # Önceki çıktı birleştirilemez (çok büyük) veya depoda yok
+    remember(output, mergeable=False)
+    Path(target_path, "a.py").write_text("Sqli")
+    assert scan()[1]["mode"] == MODE_FULL
+    save_manifest("snyk_code", "demo", {}, "0" * 64, TOOL_VERSION, OPTIONS)
+    assert scan()[1]["mode"] == MODE_FULL
+
+
+def test_merged_result_not_cached(tmp_path: Path):
+    """Birleştirilmiş ve değişmemiş sonuçlar önbelleğe tam tarama olarak yazılmaz"""
+    cache = ScanResultCache(cache_dir=str(tmp_path / "cache"), enabled=True)
+    originals = (
+        incremental_scan.SCAN_MANIFEST_DIR, metric_runner.RESULTS_DIR, metric_runner.scan_cache,
+        metric_runner.results_store, metric_runner.run_snyk_code_scan, metric_runner.get_snyk_version,
+    )
+    incremental_scan.SCAN_MANIFEST_DIR = str(tmp_path / "manifests")
+    metric_runner.RESULTS_DIR = str(tmp_path / "results")
+    metric_runner.scan_cache = cache
+    metric_runner.results_store = ResultsStore(str(tmp_path / "results.db"))
+    metric_runner.run_snyk_code_scan = scanner = FakeScanner()
+    metric_runner.get_snyk_version = lambda: TOOL_VERSION
+    try:
+        target_path = make_project(tmp_path / "project", {"a.py": "Sqli", "b.py": "XSS", "c.py": "Eval"})
+
+        def scan_and_key() -> tuple:
+            result = metric_runner.run_code_scan_and_save("demo", target_path=target_path)
+            assert result["success"], result.get("error")
+            key = cache.make_key(
+                "snyk_code",
+                metric_runner.compute_tree_hash(target_path),
+                TOOL_VERSION,
+                {"org": metric_runner.SNYK_ORG_ID}
+            )
+            return result, key
+
+        result, full_key = scan_and_key()
+        assert result["incremental"]["mode"] == MODE_FULL
+        assert cache.get(full_key) is not None
+
+        Path(target_path, "b.py").write_text("Ssrf")
+        result, merged_key = scan_and_key()
+        assert result["incremental"]["mode"] == MODE_INCREMENTAL and scanner.scanned[-1] == ["b.py"]
+        assert cache.get(merged_key) is None
+
+        # Önbellekte yok; manifest'ten değişmemiş olarak döner ve yine yazılmaz
+        result, unchanged_key = scan_and_key()
+        assert unchanged_key == merged_key
+        assert result["incremental"]["mode"] == MODE_UNCHANGED and not result["cache_hit"]
+        assert cache.get(merged_key) is None
+        assert len(scanner.scanned) == 2
+
+        # Tam tarama sonucu önbellekten gelir
+        Path(target_path, "b.py").write_text("XSS")
+        result, key = scan_and_key()
+        assert key == full_key and result["cache_hit"]
+    finally:
+        (
+            incremental_scan.SCAN_MANIFEST_DIR, metric_runner.RESULTS_DIR, metric_runner.scan_cache,
+            metric_runner.results_store, metric_runner.run_snyk_code_scan, metric_runner.get_snyk_version,
+        ) = originals
+    print("[OK] Artımlı tarama sonuçları önbelleğe tam tarama olarak yazılmaz")
+
+
+if __name__ == "__main__":
+    try:
+        test_merge_replaces_changed_file_only()
+        test_filter_drops_deleted_file()
+        for test in (test_fallback_to_full_scan, test_merged_result_not_cached):
+            with tempfile.TemporaryDirectory() as tmp:
+                test(Path(tmp))
+    finally:
+        shutil.rmtree(TEST_ROOT, ignore_errors=True)
+    print("\nArtımlı tarama testleri başarılı!")
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Issue Eşleştirme Test Script'i
+
+Bu script, indeksli eşleştiricinin (metrics/issue_matching.py) her çifti
+karşılaştıran iç içe döngüyle aynı sonucu verdiğini ve büyük sonuçlarda
+hızlı kaldığını doğrular.
+
+Test Senaryoları:
+1. Rastgele issue'larda (boş dosya, satırsız issue, farklı büyük/küçük harf,
+   aynı satırda birden fazla kayıt) her politika için referans döngüyle aynı çiftler
+2. Bilinen küçük bir örnekte precision/recall değerleri
+3. 100.000 bulunan issue ve 10.000 ground truth kaydı 1 saniyenin altında
+4. Optimal mod: küçük örneklerde tüm atamaları deneyen aramayla aynı çift
+   sayısı ve toplam satır farkı; sıradan bağımsız; açgözlüden az değil
+5. Optimal mod: kümelenmiş bulgularda açgözlünün kaçırdığı eşleşme
+6. Özel issue_matching_func çağıranın nesnelerini (sözlükleri) olduğu gibi alır
+
+Kullanım:
+    cd backend
+    python tests/test_issue_matching.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metrics.advanced_metrics import AdvancedMetricsCalculator
+from metrics.issue_model import Issue
+from metrics.issue_matching import (
+    BENCHMARK_POLICY,
+    EXACT_POLICY,
+    REPORT_POLICY,
+    GroundTruthIndex,
+    greedy_match,
+    issues_match,
+    match_metrics,
+    optimal_match,
+)
+
+POLICIES = {
+    "benchmark": BENCHMARK_POLICY,
+    "report": REPORT_POLICY,
+    "exact": EXACT_POLICY,
+}
+
+# 100k x 10k eşleştirme için üst sınır (saniye)
+LARGE_MATCH_LIMIT_SECONDS = 1.0
+
+
+def reference_match(detected_issues: list, ground_truth: list, policy) -> list:
+    """Eski iç içe döngü (her bulunan issue için ilk uygun, eşleşmemiş kayıt)"""
+    matched = set()
+    pairs = []
+    for i, detected in enumerate(detected_issues):
+        for j, truth in enumerate(ground_truth):
+            if j not in matched and issues_match(detected, truth, policy):
+                matched.add(j)
+                pairs.append((i, j))
+                break
+    return pairs
+
+
+def random_issue(rng: random.Random) -> Issue:
+    """Kenar durumları sık üreten rastgele issue"""
+    file = rng.choice(["app.py", "src/app.py", "APP.py", "lib\\util.py", "util.py", "", "dir/"])
+    line = rng.choice([-1, 0, rng.randint(1, 30), rng.randint(1, 30)])
+    issue_type = rng.choice(["SQL_INJECTION", "python/Sqli", "SQL", "XSS", "", "PYL-W0612"])
+    return Issue(file, line, issue_type, "high", "")
+
+
+def test_matches_reference():
+    """Her politika için indeksli eşleştirici iç içe döngüyle aynı çiftleri üretir"""
+    rng = random.Random(1234)
+    for _ in range(300):
+        detected_issues = [random_issue(rng) for _ in range(rng.randint(0, 40))]
+        ground_truth = [random_issue(rng) for _ in range(rng.randint(0, 25))]
+        for name, policy in POLICIES.items():
+            expected = reference_match(detected_issues, ground_truth, policy)
+            actual = greedy_match(detected_issues, ground_truth, policy)
+            assert actual == expected, f"{name}: {actual} != {expected}"
+    print("[OK] Rastgele örneklerde referans döngüyle aynı eşleşmeler")
+
+
+def test_known_example():
+    """Ground truth sözlükleri ve dizinli dosya yolları ile bilinen sonuç"""
+    ground_truth = [
+        {"file": "app.py", "line": 20, "type": "SQL_INJECTION"},
+        {"file": "app.py", "line": 33, "type": "SQL_INJECTION"},
+        {"location": {"file": "app.py", "line": 60}, "type": "XSS"},
+    ]
+    detected_issues = [
+        Issue("src/app.py", 21, "python/Sqli", "error", ""),
+        Issue("src/app.py", 22, "python/Sqli", "error", ""),
+        Issue("src/app.py", 60, "python/XSS", "error", ""),
+        Issue("other.py", 33, "python/Sqli", "error", ""),
+    ]
+    metrics = match_metrics(detected_issues, ground_truth, REPORT_POLICY)
+    assert metrics["true_positives"] == 2
+    assert metrics["false_positives"] == 2
+    assert metrics["false_negatives"] == 1
+    assert abs(metrics["precision"] - 0.5) < 1e-9
+    assert abs(metrics["recall"] - 2 / 3) < 1e-9
+
+    # Aynı dosya ve satır gerekir: yalnızca satır 60
+    assert greedy_match(detected_issues, ground_truth, EXACT_POLICY) == [(2, 2)]
+
+    # Ground truth yoksa tüm bulunanlar false positive
+    assert match_metrics(detected_issues, [], REPORT_POLICY)["false_positives"] == 4
+    print("[OK] Bilinen örnekte precision/recall doğru")
+
+
+def test_large_match_is_fast():
+    """100.000 bulunan issue ve 10.000 ground truth kaydı 1 saniyenin altında eşleşir"""
+    rng = random.Random(42)
+    files = [f"src/pkg_{index % 50}/module_{index}.py" for index in range(500)]
+    ground_truth = [
+        Issue(rng.choice(files), rng.randint(1, 2000), "RULE", "high", "")
+        for _ in range(10000)
+    ]
+    detected_issues = [
+        Issue(rng.choice(files), rng.randint(1, 2000), "RULE", "error", "")
+        for _ in range(100000)
+    ]
+
+    start_time = time.perf_counter()
+    metrics = match_metrics(detected_issues, ground_truth, BENCHMARK_POLICY)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"[OK] 100000 x 10000 eşleştirme: {elapsed:.3f} sn (TP: {metrics['true_positives']})")
+    assert metrics["true_positives"] > 0
+    assert elapsed < LARGE_MATCH_LIMIT_SECONDS, f"Eşleştirme çok yavaş: {elapsed:.3f} sn"
+
+
+def best_assignment(detected_issues: list, ground_truth: list, policy) -> tuple:
+    """Tüm atamaları deneyerek (çift sayısı, en küçük toplam maliyet) bulur (küçük örnekler için)"""
+    index = GroundTruthIndex(ground_truth, policy)
+    costs = {}
+    for i, detected in enumerate(detected_issues):
+        for j, cost in index.candidates(detected):
+            costs[(i, j)] = cost
+    best = (0, 0)
+
+    def search(i: int, used: frozenset, count: int, total: int):
+        nonlocal best
+        if i == len(detected_issues):
+            if count > best[0] or (count == best[0] and total < best[1]):
+                best = (count, total)
+            return
+        search(i + 1, used, count, total)
+        for j in range(len(ground_truth)):
+            if j not in used and (i, j) in costs:
+                search(i + 1, used | {j}, count + 1, total + costs[(i, j)])
+
+    search(0, frozenset(), 0, 0)
+    return best, costs
+
+
+def test_optimal_matches_exhaustive_search():
+    """Optimal mod en fazla çifti ve en küçük toplam satır farkını bulur"""
+    rng = random.Random(99)
+    for _ in range(500):
+        detected_issues = [random_issue(rng) for _ in range(rng.randint(0, 6))]
+        ground_truth = [random_issue(rng) for _ in range(rng.randint(0, 6))]
+        for name, policy in POLICIES.items():
+            expected, costs = best_assignment(detected_issues, ground_truth, policy)
+            pairs = optimal_match(detected_issues, ground_truth, policy)
+            assert len({i for i, _ in pairs}) == len({j for _, j in pairs}) == len(pairs), f"{name}: bire bir değil"
+            assert all(issues_match(detected_issues[i], ground_truth[j], policy) for i, j in pairs)
+            actual = (len(pairs), sum(costs[pair] for pair in pairs))
+            assert actual == expected, f"{name}: {actual} != {expected}"
+            assert len(greedy_match(detected_issues, ground_truth, policy)) <= len(pairs)
+
+            # Sıradan bağımsız: karıştırılmış girdide aynı çift sayısı ve maliyet
+            order = list(range(len(detected_issues)))
+            rng.shuffle(order)
+            shuffled = optimal_match([detected_issues[k] for k in order], ground_truth, policy)
+            assert (len(shuffled), sum(costs[(order[i], j)] for i, j in shuffled)) == expected
+    print("[OK] Optimal mod tüm atamaları deneyen aramayla aynı sonucu verir")
+
+
+def test_optimal_recovers_clustered_matches():
+    """Açgözlü eşleştirme kümelenmiş bulgularda true positive kaçırır; optimal mod kaçırmaz"""
+    ground_truth = [{"file": "app.py", "line": 10}, {"file": "app.py", "line": 13}]
+    # Satır 11, açgözlü eşleştirmede satır 10'u alır; satır 8 ise yalnızca satır 10 ile eşleşebilir
+    detected_issues = [Issue("app.py", 11, "", "", ""), Issue("app.py", 8, "", "", "")]
+    assert match_metrics(detected_issues, ground_truth, REPORT_POLICY, mode="greedy")["true_positives"] == 1
+    assert match_metrics(detected_issues, ground_truth, REPORT_POLICY, mode="optimal")["true_positives"] == 2
+    assert optimal_match(detected_issues, ground_truth, REPORT_POLICY) == [(0, 1), (1, 0)]
+    print("[OK] Optimal mod kümelenmiş bulgularda tüm eşleşmeleri bulur")
+
+
+def test_optimal_large_match_is_fast():
+    """Optimal mod büyük ve yoğun dosyalarda da 1 saniye civarında kalır"""
+    rng = random.Random(7)
+    files = [f"src/module_{index}.py" for index in range(500)]
+    ground_truth = [Issue(rng.choice(files), rng.randint(1, 2000), "RULE", "high", "") for _ in range(10000)]
+    detected_issues = [Issue(rng.choice(files), rng.randint(1, 2000), "RULE", "error", "") for _ in range(100000)]
+    # Tek dosyada yoğun küme: 2000 bulgu ve 2000 kayıt 50 satırda
+    dense_truth = [Issue("dense.py", rng.randint(1, 50), "RULE", "high", "") for _ in range(2000)]
+    dense_detected = [Issue("dense.py", rng.randint(1, 50), "RULE", "error", "") for _ in range(2000)]
+
+    for label, detected, truth in (
+        ("100000 x 10000", detected_issues, ground_truth),
+        ("yoğun 2000 x 2000", dense_detected, dense_truth),
+    ):
+        start_time = time.perf_counter()
+        pairs = optimal_match(detected, truth, BENCHMARK_POLICY)
+        elapsed = time.perf_counter() - start_time
+        greedy_count = len(greedy_match(detected, truth, BENCHMARK_POLICY))
+        print(f"[OK] Optimal {label}: {elapsed:.3f} sn (TP: {len(pairs)}, açgözlü: {greedy_count})")
+        assert len(pairs) >= greedy_count
+        assert elapsed < 2 * LARGE_MATCH_LIMIT_SECONDS, f"Optimal eşleştirme çok yavaş: {elapsed:.3f} sn"
+
+
+def test_custom_matcher_receives_originals():
+    """Özel eşleştirici sözlükleri Issue'ya dönüştürülmeden alır"""
+    detected_issues = [
+        {"file": "app.py", "line": 3, "rule_id": "python/Sqli"},
+        {"file": "app.py", "line": 9, "rule_id": "python/XSS"},
+    ]
+    ground_truth = [{"file": "app.py", "line": 5, "rule_id": "python/Sqli"}]
+    received = []
+
+    def same_rule(detected, truth):
+        received.append((detected, truth))
+        return detected["rule_id"] == truth.get("rule_id")
+
+    metrics = AdvancedMetricsCalculator().calculate_defect_detection_accuracy(
+        detected_issues, ground_truth, issue_matching_func=same_rule
+    )
+    assert metrics["true_positives"] == 1 and metrics["false_positives"] == 1
+    assert all(detected in detected_issues and truth is ground_truth[0] for detected, truth in received)
+    print("[OK] Özel eşleştirici çağıranın nesnelerini olduğu gibi alır")
+
+
+if __name__ == "__main__":
+    test_matches_reference()
+    test_known_example()
+    test_large_match_is_fast()
+    test_optimal_matches_exhaustive_search()
+    test_optimal_recovers_clustered_matches()
+    test_optimal_large_match_is_fast()
+    test_custom_matcher_receives_originals()
+    print("\nIssue eşleştirme testleri başarılı!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Proje Kiralama (Lease) Test Script'i
+
+Bu script, saklama temizliği ile taramalar arasındaki yarışı önleyen ProjectLeases'i
+gerçek thread'lerle (tarayıcı veya API çağrısı olmadan) doğrular.
+
+Test Senaryoları:
+1. Kullanımdaki proje silme için kilitlenemez; silinmekte olan proje
+   end_eviction'a kadar kullanıma alınamaz; diğer projeler etkilenmez
+
+Kullanım:
+    cd backend
+    python tests/test_project_leases.py
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from retention import ProjectLeases
+
+
+def test_project_leases():
+    """Kullanımdaki proje silinemez; silinmekte olan proje kullanıma alınamaz"""
+    leases = ProjectLeases()
+    with leases.hold("demo"):
+        with leases.hold("demo"):
+            assert leases.active() == {"demo": 2}
+        assert not leases.begin_eviction("demo")
+    assert leases.active() == {}
+
+    assert leases.begin_eviction("demo")
+    acquired = threading.Event()
+
+    def use_project():
+        with leases.hold("demo"):
+            acquired.set()
+
+    user = threading.Thread(target=use_project)
+    user.start()
+    # Silme bitene kadar kullanım bekler
+    assert not acquired.wait(0.1)
+    # Silinmeyen projeler etkilenmez
+    with leases.hold("other"):
+        assert leases.active() == {"other": 1}
+    leases.end_eviction("demo")
+    assert acquired.wait(5)
+    user.join(5)
+    assert leases.active() == {}
+    print("[OK] ProjectLeases silme ile kullanım arasındaki yarışı önler")
+
+
+if __name__ == "__main__":
+    test_project_leases()
+    print("\nProje kiralama testleri başarılı!")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Proje Kayıt Dizini Test Script'i
+
+Bu script, project_registry.py'nin istatistikleri yalnızca proje
+değiştiğinde yeniden hesapladığını geçici bir proje klasörüyle doğrular.
+
+Test Senaryoları:
+1. Kayıtta dosya sayısı, LOC, boyut, dil dağılımı ve tree hash hesaplanır
+2. mtime/boyut imzası aynıysa dosyalar yeniden okunmaz; dosya değişince,
+   eklenince veya silinince istatistikler yenilenir
+3. Dizin SQLite'tan yeniden yüklenince değişmemiş projeler yeniden
+   hesaplanmaz, son tarama işaretçileri korunur; klasörü silinen yüklenmiş
+   projeler dizinden çıkarılır
+
+Kullanım:
+    cd backend
+    python tests/test_project_registry.py
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import project_registry as project_registry_module
+from project_registry import ProjectRegistry
+from tree_hash import compute_tree_hash
+
+
+class StatsCounter:
+    """compute_project_stats çağrılarını sayar"""
+
+    def __init__(self):
+        self.calls = []
+        self.original = project_registry_module.compute_project_stats
+
+    def __call__(self, root: Path) -> dict:
+        self.calls.append(Path(root).name)
+        return self.original(root)
+
+
+def make_registry(tmp_path: Path) -> ProjectRegistry:
+    return ProjectRegistry(str(tmp_path / "projects.db"), str(tmp_path / "projects"), builtin_projects=["demo"])
+
+
+def write(path: Path, content: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@contextmanager
+def counting_stats():
+    """compute_project_stats çağrılarını blok boyunca sayar"""
+    counter = StatsCounter()
+    project_registry_module.compute_project_stats = counter
+    try:
+        yield counter
+    finally:
+        project_registry_module.compute_project_stats = counter.original
+
+
+def test_refresh_on_signature_change(tmp_path: Path):
+    """İstatistikler yalnızca imza değişince yeniden hesaplanır"""
+    with counting_stats() as counter:
+        check_refresh(tmp_path, counter)
+    print("[OK] Proje istatistikleri imza değişince yenilenir")
+
+
+def check_refresh(tmp_path: Path, counter: StatsCounter):
+    root = tmp_path / "projects" / "demo"
+    write(root / "app.py", "import os\nprint(os.getcwd())\n")
+    write(root / "static" / "app.js", "console.log(1)")
+
+    registry = make_registry(tmp_path)
+    project = registry.get("demo")
+    assert counter.calls == ["demo"]
+    assert project["exists_on_disk"] and project["file_count"] == 2
+    assert project["loc"] == 3 and project["tree_hash"] == compute_tree_hash(root)
+    assert project["languages"] == {"Python": {"files": 1, "loc": 2}, "JavaScript": {"files": 1, "loc": 1}}
+
+    # İmza aynı: dosyalar okunmaz
+    assert registry.refresh("demo") == {key: value for key, value in project.items() if key != "last_scans"}
+    assert registry.refresh_all() == 0
+    assert counter.calls == ["demo"]
+
+    # Dosya değişti (boyut da değişti): yeniden hesaplanır
+    write(root / "app.py", "print(1)\n")
+    refreshed = registry.refresh("demo")
+    assert counter.calls == ["demo", "demo"]
+    assert refreshed["loc"] == 2 and refreshed["tree_hash"] == compute_tree_hash(root)
+    assert refreshed["tree_hash"] != project["tree_hash"]
+
+    # Yeni dosya ve silinen dosya da imzayı değiştirir
+    write(root / "lib" / "util.py", "x = 1\n")
+    assert registry.refresh_all() == 1 and registry.get("demo")["file_count"] == 3
+    (root / "static" / "app.js").unlink()
+    assert registry.refresh("demo")["languages"] == {"Python": {"files": 2, "loc": 2}}
+    assert len(counter.calls) == 4
+
+    # Zorla yenileme imzaya bakmaz
+    registry.refresh("demo", force=True)
+    assert len(counter.calls) == 5
+
+
+def test_reload_from_database(tmp_path: Path):
+    """Dizin yeniden yüklenince değişmeyen projeler okunmaz"""
+    with counting_stats() as counter:
+        check_reload(tmp_path, counter)
+    print("[OK] Dizin SQLite'tan yüklenir, silinen yüklemeler çıkarılır")
+
+
+def check_reload(tmp_path: Path, counter: StatsCounter):
+    write(tmp_path / "projects" / "demo" / "app.py", "print(1)\n")
+    uploaded = tmp_path / "projects" / "uploaded" / "uploaded_abc"
+    write(uploaded / "main.py", "print(2)\n")
+
+    registry = make_registry(tmp_path)
+    registry.register("uploaded_abc", uploaded)
+    registry.record_scan("demo", "snyk_code", {"success": True, "file_path": "snyk_code_demo.json"})
+    assert registry.names() == ["demo", "uploaded_abc"]
+    assert len(counter.calls) == 2
+
+    # Yeni süreç: kayıtlar SQLite'tan gelir, değişmeyen projeler okunmaz
+    reloaded = make_registry(tmp_path)
+    assert reloaded.names() == ["demo", "uploaded_abc"]
+    assert reloaded.get("demo")["last_scans"]["snyk_code"]["file_path"] == "snyk_code_demo.json"
+    assert reloaded.get("uploaded_abc")["tree_hash"] == registry.get("uploaded_abc")["tree_hash"]
+    assert len(counter.calls) == 2
+
+    # Klasörü silinen yüklenmiş proje sonraki yüklemede çıkarılır
+    for path in uploaded.iterdir():
+        path.unlink()
+    uploaded.rmdir()
+    assert not make_registry(tmp_path).contains("uploaded_abc")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    for test in (test_refresh_on_signature_change, test_reload_from_database):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("\nProje kayıt dizini testleri başarılı!")
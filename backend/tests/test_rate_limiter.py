@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Hız Sınırlayıcı Test Script'i
+
+Bu script, kimlik bilgisi başına token bucket hız sınırlayıcısını
+gerçek thread'lerle (tarayıcı veya API çağrısı olmadan) doğrular.
+
+Test Senaryoları:
+1. TokenBucket: burst kadar çağrı beklemez, sonrakiler hız kadar bekler;
+   eşzamanlı çağrılar hızı aşamaz
+2. TokenBucket: max_wait aşılacaksa RateLimitTimeout (rezervasyon yapılmaz);
+   defer (429 / Retry-After) sonraki token'ı geciktirir
+3. RateLimiter: kimlik bilgisi başına ayrı bucket; kapalıyken beklemez
+4. Snyk taramasında RateLimitTimeout nesne deposunda sahipsiz spool
+   dosyası bırakmaz
+
+Kullanım:
+    cd backend
+    python tests/test_rate_limiter.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import metric_runner
+from object_store import ObjectStore
+from rate_limiter import RateLimiter, RateLimitTimeout, TokenBucket
+
+# Zamanlamaya bağlı kontrollerde makine gürültüsü için pay (saniye)
+TIMING_SLACK = 0.05
+
+
+def run_threads(count: int, target) -> list:
+    """target(index)'i count thread'de çalıştırır, sonuçları sırayla döner"""
+    results = [None] * count
+
+    def worker(index: int):
+        try:
+            results[index] = target(index)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def test_token_bucket_rate():
+    """Burst kadar çağrı beklemez; eşzamanlı çağrılar hızı aşamaz"""
+    bucket = TokenBucket(per_minute=1200, burst=2, max_wait=5)  # 20 token/sn
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    wait = bucket.acquire()
+    assert 0.05 - TIMING_SLACK < wait <= 0.05 + TIMING_SLACK, wait
+
+    bucket = TokenBucket(per_minute=1200, burst=1, max_wait=5)
+    start_time = time.monotonic()
+    waits = run_threads(10, lambda _: bucket.acquire())
+    elapsed = time.monotonic() - start_time
+    # İlk token hazır; kalan 9 token 20/sn hızla gelir (~0.45 sn)
+    assert elapsed >= 9 / 20 - TIMING_SLACK, elapsed
+    assert sorted(waits)[0] == 0.0 and bucket.acquired == 10
+    assert bucket.status()["queued"] == 0
+    print(f"[OK] TokenBucket hızı eşzamanlı çağrılarda korunur ({elapsed:.2f} sn)")
+
+
+def test_token_bucket_timeout_and_defer():
+    """max_wait aşılırsa rezervasyonsuz hata; defer sonraki token'ı geciktirir"""
+    bucket = TokenBucket(per_minute=6, burst=1, max_wait=1)  # 10 sn'de bir token
+    bucket.acquire()
+    tokens_before = bucket.tokens
+    try:
+        bucket.acquire()
+        raise AssertionError("RateLimitTimeout fırlatmalı")
+    except RateLimitTimeout:
+        pass
+    # Yalnızca geçen süre kadar dolum olur; token düşülmez
+    assert abs(bucket.tokens - tokens_before) < 0.01 and bucket.acquired == 1
+
+    bucket = TokenBucket(per_minute=6000, burst=5, max_wait=5)  # 100 token/sn
+    bucket.defer(0.2)
+    wait = bucket.acquire()
+    assert 0.2 - TIMING_SLACK < wait <= 0.2 + TIMING_SLACK, wait
+    assert bucket.deferrals == 1
+    print("[OK] TokenBucket max_wait ve defer doğru çalışır")
+
+
+def test_rate_limiter_buckets():
+    """Kimlik bilgisi başına ayrı bucket; kapalı sınırlayıcı beklemez"""
+    limiter = RateLimiter(enabled=True)
+    assert limiter.bucket("deepsource", "token-a") is limiter.bucket("deepsource", "token-a")
+    assert limiter.bucket("deepsource", "token-a") is not limiter.bucket("deepsource", "token-b")
+    assert limiter.bucket("deepsource", "token-a") is not limiter.bucket("snyk", "token-a")
+    # Kimlik bilgisi durum çıktısında görünmez (yalnızca kısa hash'i)
+    assert not any("token-a" in key for key in limiter.status()["limits"])
+
+    disabled = RateLimiter(enabled=False)
+    assert all(disabled.acquire("deepsource", "token") == 0.0 for _ in range(1000))
+    disabled.defer("deepsource", "token", 60)
+    assert disabled.status()["limits"] == {}
+    print("[OK] RateLimiter kimlik bilgisi başına bucket tutar")
+
+
+class TimingOutLimiter:
+    """Her acquire çağrısında RateLimitTimeout fırlatan sınırlayıcı"""
+
+    def acquire(self, service: str, credential: str = None):
+        raise RateLimitTimeout(f"Hız sınırı: {service}")
+
+
+def test_snyk_timeout_leaves_no_spool(tmp_path: Path):
+    """Token alınamazsa SARIF spool dosyası açılmaz"""
+    originals = (metric_runner.get_snyk_path, metric_runner.rate_limiter, metric_runner.object_store)
+    metric_runner.get_snyk_path = lambda: "snyk"
+    metric_runner.rate_limiter = TimingOutLimiter()
+    metric_runner.object_store = ObjectStore(str(tmp_path / "objects"))
+    try:
+        metric_runner.run_snyk_code_scan(str(tmp_path))
+        raise AssertionError("RateLimitTimeout fırlatmalı")
+    except RateLimitTimeout:
+        pass
+    finally:
+        metric_runner.get_snyk_path, metric_runner.rate_limiter, metric_runner.object_store = originals
+
+    spool_dir = tmp_path / "objects" / "tmp"
+    assert not spool_dir.exists() or not any(spool_dir.iterdir())
+    print("[OK] Hız sınırı zaman aşımı spool dosyası bırakmaz")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_token_bucket_rate()
+    test_token_bucket_timeout_and_defer()
+    test_rate_limiter_buckets()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_snyk_timeout_leaves_no_spool(Path(tmp))
+    print("\nHız sınırlayıcı testleri başarılı!")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Sonuç Deposu Test Script'i
+
+Bu script, results_store.py'nin nesne deposuna referans veren tarama
+kayıtlarını (ham çıktı veritabanına kopyalanmadan) doğru sakladığını ve
+geri okuduğunu geçici bir veritabanıyla doğrular.
+
+Test Senaryoları:
+1. object_hash ile eklenen referans kaydın payload'ı nesne deposundan
+   okunur; ham çıktı objects tablosuna kopyalanmaz
+2. Aynı çıktının tam kaydı aynı hash'i paylaşır; object_hash olmadan
+   payload'sız tarama kaydı reddedilir
+3. import_files: referans kayıt dosyası meta verisi ve tree hash'iyle içe
+   aktarılır, payload depodan çözülür; tekrar aktarımda atlanır; nesnesi
+   olmayan referans tanınmayan kayıt sayılır
+
+Kullanım:
+    cd backend
+    python tests/test_results_store.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Nesneler geçici klasöre yazılır (object_store import edilmeden önce)
+os.environ["RESULTS_OBJECTS_DIR"] = tempfile.mkdtemp(prefix="results_objects_")
+
+from object_store import object_store
+from result_io import OBJECT_REF_KEY, OBJECT_REF_PREFIX, _synthetic_sarif, write_json
+from results_store import KIND_SCAN, ResultsStore
+
+
+def test_reference_record_round_trip(tmp_path: Path):
+    """Referans kayıt depodaki nesneyi döner, veritabanına kopyalamaz"""
+    store = ResultsStore(str(tmp_path / "results.db"))
+    raw_output = _synthetic_sarif(5)
+    digest = object_store.put(raw_output)
+
+    record_id = store.add(
+        KIND_SCAN, None, tool="snyk_code", project="demo", tree_hash="t" * 64,
+        file_path="snyk_code_demo.json", object_hash=digest, metadata={"scan_duration": 1.5}
+    )
+    record = store.latest(KIND_SCAN, tool="snyk_code", project="demo")
+    assert record["id"] == record_id and record["object_hash"] == digest
+    assert record["metadata"] == {"scan_duration": 1.5} and record["tree_hash"] == "t" * 64
+    assert store.payload(record_id) == raw_output
+    assert store.load_latest_payload(KIND_SCAN, "snyk_code", "demo") == raw_output
+    assert store.stats()["objects"]["records"] == 0
+
+    # Aynı çıktının tam kaydı aynı hash'i paylaşır
+    full_id = store.add(KIND_SCAN, raw_output, tool="snyk_code", project="demo")
+    assert store.history(KIND_SCAN, project="demo")[0]["object_hash"] == digest
+    assert store.payload(full_id) == raw_output
+    assert store.history(KIND_SCAN, project="demo")[0]["summary"] == {"total_issues": 5}
+
+    try:
+        store.add(KIND_SCAN, None, tool="snyk_code", project="demo")
+        raise AssertionError("ValueError fırlatmalı")
+    except ValueError:
+        pass
+    print("[OK] Referans kayıt nesne deposundan okunur")
+
+
+def test_import_reference_files(tmp_path: Path):
+    """Referans kayıt dosyaları meta verisiyle içe aktarılır"""
+    store = ResultsStore(str(tmp_path / "results.db"))
+    raw_output = _synthetic_sarif(3)
+    digest = object_store.put(raw_output)
+    results_dir = tmp_path / "results"
+
+    reference = write_json(results_dir / "snyk_code_demo_2026-01-02_03-04-05.json", {
+        OBJECT_REF_KEY: OBJECT_REF_PREFIX + digest,
+        "tree_hash": "t" * 64,
+        "scan_duration": 2.5
+    })
+    legacy = write_json(results_dir / "snyk_code_demo_2026-01-01_00-00-00.json", raw_output)
+    dangling = write_json(results_dir / "snyk_code_other_2026-01-03_00-00-00.json", {
+        OBJECT_REF_KEY: OBJECT_REF_PREFIX + "0" * 64
+    })
+
+    report = store.import_files([reference, legacy, dangling], workers=1)
+    assert (report["imported"], report["unrecognized"]) == (2, 1)
+
+    latest = store.latest(KIND_SCAN, tool="snyk_code", project="demo")
+    assert latest["file_path"] == str(reference) and latest["object_hash"] == digest
+    assert latest["tree_hash"] == "t" * 64
+    assert latest["metadata"] == {"tree_hash": "t" * 64, "scan_duration": 2.5}
+    assert latest["summary"] == {"total_issues": 3}
+    assert store.payload(latest["id"]) == raw_output
+
+    # Eski tam kayıt aynı nesneyi paylaşır; referans kayıt objects tablosuna kopyalanmaz
+    assert {record["object_hash"] for record in store.history(KIND_SCAN, project="demo")} == {digest}
+    assert store.stats()["objects"]["records"] == 1
+
+    report = store.import_files([reference, legacy], workers=1)
+    assert report["imported"] == 0 and report["skipped_existing"] == 2
+    print("[OK] Referans kayıt dosyaları içe aktarılır")
+
+
+if __name__ == "__main__":
+    try:
+        for test in (test_reference_record_round_trip, test_import_reference_files):
+            with tempfile.TemporaryDirectory() as tmp:
+                test(Path(tmp))
+    finally:
+        shutil.rmtree(os.environ["RESULTS_OBJECTS_DIR"], ignore_errors=True)
+    print("\nSonuç deposu testleri başarılı!")
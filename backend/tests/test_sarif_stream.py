@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Akış Halinde SARIF Ayrıştırıcı Test Script'i
+
+Bu script, sarif_stream.py'nin küçük okuma parçalarıyla (chunk_size) da
+tam belgeyi json.loads ile aynı şekilde çözdüğünü ve tek geçişte
+hesaplanan sayıların/issue'ların SnykMetrics ile aynı olduğunu doğrular.
+
+Test Senaryoları:
+1. Okuma parçası sınırına bölünen değerler (string, sayı, unicode) her
+   parça boyutunda doğru çözülür
+2. Tampon sonunda biten sayı yarım okunmaz (örn: "123" + "456", "-12." + "5e3")
+3. Tampona sığmayan tek değer için tampon katlanarak büyür (okuma sayısı
+   değer boyutuyla doğrusal değil, logaritmik artar)
+4. process_sarif_stream: counts ve issue'lar SnykMetrics.calculate +
+   extract_issues ile aynı; depoya yazılan nesne object_digest() ile aynı
+5. process_sarif_file + ObjectStore.adopt: digest dosya baytlarının
+   sha256'sı, nesne dosyanın kendisi; streamed_from_object aynı özeti üretir
+6. Boş ve yarım kalmış akışlar SarifStreamError fırlatır
+
+Kullanım:
+    cd backend
+    python tests/test_sarif_stream.py
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Nesneler geçici klasöre yazılır (object_store import edilmeden önce)
+os.environ["RESULTS_OBJECTS_DIR"] = tempfile.mkdtemp(prefix="sarif_objects_")
+
+from metrics.issue_extractors import extract_issues
+from metrics.snyk_metrics import SnykMetrics
+from object_store import object_digest, object_store
+from result_io import _synthetic_sarif
+from sarif_stream import (
+    EmptySarifStreamError,
+    SarifStreamError,
+    _JsonStreamReader,
+    iter_sarif_results,
+    process_sarif_file,
+    process_sarif_stream,
+    streamed_from_object,
+)
+
+# Değerlerin parça sınırına farklı yerlerden bölünmesi için denenen boyutlar
+CHUNK_SIZES = [1, 2, 3, 7, 16, 64, 4096]
+
+
+class CountingReader:
+    """read() çağrılarını sayan metin akışı"""
+
+    def __init__(self, text: str):
+        self.stream = io.StringIO(text)
+        self.reads = 0
+
+    def read(self, size: int = -1) -> str:
+        self.reads += 1
+        return self.stream.read(size)
+
+
+def sample_sarif() -> dict:
+    """Sentetik SARIF + sınır durumları (unicode, sayılar, ikinci run, uzun mesaj)"""
+    document = _synthetic_sarif(300)
+    run = document["runs"][0]
+    run["properties"] = {"uploadId": 1234567890, "ratio": 0.125, "flags": [True, False, None]}
+    run["results"].append({
+        "ruleId": "python/Ünicode",
+        "level": "error",
+        "message": {"text": "çok uzun " + "ğüşıöç" * 2000},
+        "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": "src/ünicode/dosya.py"},
+            "region": {"startLine": 98765}
+        }}]
+    })
+    # Sayılar yalnızca ilk run'dan hesaplanır; ikinci run sonucu değiştirmemeli
+    document["runs"].append({"tool": {"driver": {"name": "Other"}}, "results": [{"level": "error"}]})
+    document["count"] = 42
+    return document
+
+
+def assert_matches_metrics(streamed, document: dict):
+    """Tek geçişte hesaplanan özet, belgenin tamamı üzerindeki hesapla aynı"""
+    expected = SnykMetrics().calculate(document)
+    assert streamed.counts == {
+        "critical": expected.critical,
+        "high": expected.high,
+        "medium": expected.medium,
+        "low": expected.low
+    }, streamed.counts
+    assert streamed.total_results == expected.total_issues
+    assert streamed.issues == extract_issues("snyk_code", document)
+
+
+def test_values_split_across_reads():
+    """Her parça boyutunda belge json.loads ile aynı çözülür"""
+    document = sample_sarif()
+    text = json.dumps(document, indent=2, ensure_ascii=False)
+    expected_results = [(index, result) for index, run in enumerate(document["runs"]) for result in run["results"]]
+    for chunk_size in CHUNK_SIZES:
+        streamed = process_sarif_stream(io.StringIO(text), persist=False, chunk_size=chunk_size)
+        assert streamed.raw_output == document, f"chunk_size={chunk_size}"
+        assert list(iter_sarif_results(io.StringIO(text), chunk_size)) == expected_results
+    print(f"[OK] Parça sınırına bölünen değerler doğru çözülür ({len(CHUNK_SIZES)} parça boyutu)")
+
+
+def test_number_at_buffer_edge():
+    """Tampon sonunda biten sayı, sonraki parça okunmadan döndürülmez"""
+    for text, expected in (("123456", 123456), ("-12.5e3 ", -12500.0), ("[1,22,333]", [1, 22, 333])):
+        for chunk_size in (1, 2, 3):
+            reader = _JsonStreamReader(io.StringIO(text), chunk_size)
+            assert reader.read_value() == expected, f"{text!r} chunk_size={chunk_size}"
+
+    # Üst düzey sayısal değerler her parça boyutunda bir kez sınıra denk gelir
+    document = {"version": "2.1.0", "count": 1234, "scale": -12.5e3, "runs": []}
+    text = json.dumps(document, separators=(",", ":"))
+    for chunk_size in range(1, len(text) + 1):
+        streamed = process_sarif_stream(io.StringIO(text), persist=False, chunk_size=chunk_size)
+        assert streamed.raw_output == document, f"chunk_size={chunk_size}"
+        assert streamed.top_level["count"] == 1234
+    print("[OK] Tampon sonunda biten sayılar yarım okunmaz")
+
+
+def test_buffer_doubles_for_large_value():
+    """Tampona sığmayan tek değer için tampon katlanarak büyür"""
+    value = "x" * 100000
+    source = CountingReader(json.dumps({"message": value}))
+    reader = _JsonStreamReader(source, chunk_size=16)
+    reader.expect("{")
+    assert reader.read_value() == "message"
+    reader.expect(":")
+    assert reader.read_value() == value
+    assert len(reader.buffer) >= len(value)
+    # Doğrusal büyümede ~6250 okuma gerekirdi
+    assert source.reads < 40, f"Tampon katlanarak büyümüyor: {source.reads} okuma"
+    print(f"[OK] Büyük değer için tampon katlanarak büyür ({source.reads} okuma)")
+
+
+def test_process_sarif_stream_matches_metrics():
+    """Sayılar, issue'lar ve depodaki nesne tam belge üzerindeki hesapla aynı"""
+    document = sample_sarif()
+    text = json.dumps(document, indent=2, ensure_ascii=False)
+    digest, _ = object_digest(document)
+
+    for chunk_size in (7, 64, 4096):
+        # Sınırın altında: tam belge de döner, depoya yazılmaz
+        streamed = process_sarif_stream(io.StringIO(text), chunk_size=chunk_size)
+        assert_matches_metrics(streamed, document)
+        assert streamed.raw_output == document and streamed.digest is None
+
+        # Sınır aşıldı: yalnızca özet tutulur, minified çıktı depoya akış halinde yazılır
+        streamed = process_sarif_stream(io.StringIO(text), materialize_limit=0, chunk_size=chunk_size)
+        assert_matches_metrics(streamed, document)
+        assert streamed.raw_output is None and not streamed.materialized
+        assert streamed.digest == digest
+        assert object_store.get(streamed.digest) == document
+    print("[OK] process_sarif_stream SnykMetrics.calculate + extract_issues ile aynı")
+
+
+def test_process_sarif_file_and_adopt():
+    """Dosya tek geçişte işlenir ve olduğu gibi nesne yapılır"""
+    document = sample_sarif()
+    data = json.dumps(document, indent=2, ensure_ascii=False).encode("utf-8")
+    spool = object_store.spool_path()
+    spool.write_bytes(data)
+
+    # Küçük parça: çok baytlı UTF-8 karakterleri okuma sınırında bölünür
+    streamed = process_sarif_file(spool, chunk_size=5)
+    assert_matches_metrics(streamed, document)
+    assert streamed.raw_output == document
+    assert streamed.digest == hashlib.sha256(data).hexdigest()
+    assert streamed.size == len(data)
+
+    object_store.adopt(spool, streamed.digest)
+    assert not spool.exists()
+    assert object_store.get(streamed.digest) == document
+
+    # Önbellek isabetinde özet depodaki nesneden yeniden üretilir
+    restored = streamed_from_object(streamed.digest, size=streamed.size)
+    assert_matches_metrics(restored, document)
+    assert restored.raw_output == document
+
+    # Büyük dosya: tam belge tutulmaz, sayılar yine aynı
+    large = process_sarif_file(object_store.path_for(streamed.digest), materialize_limit=10, chunk_size=3)
+    assert_matches_metrics(large, document)
+    assert large.raw_output is None
+    print("[OK] process_sarif_file + adopt aynı özeti ve nesneyi üretir")
+
+
+def test_invalid_streams():
+    """Boş ve yarım kalmış akışlar hata verir; depoda yarım nesne kalmaz"""
+    try:
+        process_sarif_stream(io.StringIO("  \n"))
+        raise AssertionError("Boş akış EmptySarifStreamError fırlatmalı")
+    except EmptySarifStreamError:
+        pass
+
+    objects_before = sorted(object_store.iter_objects())
+    text = json.dumps(sample_sarif())
+    for truncated in (text[: len(text) // 2], text[:-1], text + "x"):
+        try:
+            process_sarif_stream(io.StringIO(truncated), materialize_limit=0, chunk_size=64)
+            raise AssertionError("Geçersiz akış SarifStreamError fırlatmalı")
+        except SarifStreamError:
+            pass
+    assert sorted(object_store.iter_objects()) == objects_before
+    print("[OK] Boş ve yarım akışlar SarifStreamError fırlatır")
+
+
+if __name__ == "__main__":
+    import shutil
+
+    try:
+        test_values_split_across_reads()
+        test_number_at_buffer_edge()
+        test_buffer_doubles_for_large_value()
+        test_process_sarif_stream_matches_metrics()
+        test_process_sarif_file_and_adopt()
+        test_invalid_streams()
+    finally:
+        shutil.rmtree(os.environ["RESULTS_OBJECTS_DIR"], ignore_errors=True)
+    print("\nSARIF akış testleri başarılı!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tarama Sonuç Önbelleği Test Script'i
+
+Bu script, scan_cache.py'nin anahtarının sonucu etkileyen her girdiyle
+değiştiğini ve kayıtların geçici bir klasörde doğru tutulduğunu doğrular.
+
+Test Senaryoları:
+1. Aynı içerik, sürüm ve seçenekler aynı anahtarı verir (seçenek sırası
+   önemsiz); tree hash, araç, sürüm veya seçenek değişirse anahtar değişir
+2. Tarayıcı sürümü değişince eski kayıt isabet vermez; yeni sürümle
+   yazılan kayıt ayrı tutulur
+3. TTL'i dolan kayıt silinir; kayıt sayısı sınırında en az kullanılan
+   kayıt tahliye edilir
+
+Kullanım:
+    cd backend
+    python tests/test_scan_cache.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scan_cache import ScanResultCache
+
+TREE_HASH = "a" * 64
+
+
+def test_key_changes_with_inputs():
+    """Sonucu etkileyen her girdi anahtarı değiştirir"""
+    make_key = ScanResultCache.make_key
+    key = make_key("snyk_code", TREE_HASH, "1.1293.0", {"org": "org-a", "severity": "low"})
+    assert key == make_key("snyk_code", TREE_HASH, "1.1293.0", {"severity": "low", "org": "org-a"})
+    assert make_key("snyk_code", TREE_HASH, "1.1293.0") == make_key("snyk_code", TREE_HASH, "1.1293.0", {})
+
+    variants = [
+        make_key("snyk_code", "b" * 64, "1.1293.0", {"org": "org-a", "severity": "low"}),
+        make_key("deepsource", TREE_HASH, "1.1293.0", {"org": "org-a", "severity": "low"}),
+        make_key("snyk_code", TREE_HASH, "1.1294.0", {"org": "org-a", "severity": "low"}),
+        make_key("snyk_code", TREE_HASH, "1.1293.0", {"org": "org-b", "severity": "low"}),
+        make_key("snyk_code", TREE_HASH, "1.1293.0", {"org": "org-a"}),
+    ]
+    assert key not in variants and len(set(variants)) == len(variants)
+    print("[OK] Anahtar tree hash, araç, sürüm ve seçeneklerle değişir")
+
+
+def test_version_change_misses(tmp_path: Path):
+    """Sürüm güncellenince eski kayıt kullanılmaz"""
+    cache = ScanResultCache(cache_dir=str(tmp_path), enabled=True)
+    old_key = cache.make_key("snyk_code", TREE_HASH, "1.1293.0", {"org": "org-a"})
+    new_key = cache.make_key("snyk_code", TREE_HASH, "1.1294.0", {"org": "org-a"})
+    cache.put(old_key, {"runs": ["eski"]}, tool="snyk_code", tool_version="1.1293.0", scan_duration=12.5)
+
+    entry = cache.get(old_key)
+    assert entry["raw_output"] == {"runs": ["eski"]} and entry["scan_duration"] == 12.5
+    assert cache.get(new_key) is None
+    assert cache.get(cache.make_key("snyk_code", TREE_HASH, "1.1293.0", {"org": "org-b"})) is None
+
+    cache.put(new_key, {"runs": ["yeni"]}, tool="snyk_code", tool_version="1.1294.0")
+    assert cache.get(new_key)["raw_output"] == {"runs": ["yeni"]}
+    assert cache.get(old_key)["raw_output"] == {"runs": ["eski"]}
+    assert cache.stats()["entries"] == 2 and cache.stats()["hits"] == 3 and cache.stats()["misses"] == 2
+
+    # Kapalı önbellek ne okur ne yazar
+    disabled = ScanResultCache(cache_dir=str(tmp_path), enabled=False)
+    assert disabled.get(old_key) is None
+    print("[OK] Sürüm değişince eski kayıt isabet vermez")
+
+
+def test_ttl_and_lru_eviction(tmp_path: Path):
+    """Süresi dolan kayıt silinir; sınırda en az kullanılan tahliye edilir"""
+    cache = ScanResultCache(cache_dir=str(tmp_path), ttl_seconds=60, max_entries=2, enabled=True)
+    keys = [cache.make_key("snyk_code", str(index) * 64, "1.0.0") for index in range(3)]
+    cache.put(keys[0], {"index": 0}, tool="snyk_code")
+    cache.put(keys[1], {"index": 1}, tool="snyk_code")
+
+    # keys[0] en eski erişim; keys[1]'e erişilir, yeni kayıt keys[0]'ı tahliye eder
+    old = time.time() - 30
+    os.utime(tmp_path / f"{keys[0]}.json", (old, old))
+    cache.get(keys[1])
+    cache.put(keys[2], {"index": 2}, tool="snyk_code")
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None and cache.get(keys[2]) is not None
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get(keys[1]) is None
+    assert not (tmp_path / f"{keys[1]}.json").exists()
+    print("[OK] TTL ve LRU tahliyesi çalışır")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_key_changes_with_inputs()
+    for test in (test_version_change_misses, test_ttl_and_lru_eviction):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("\nTarama önbelleği testleri başarılı!")
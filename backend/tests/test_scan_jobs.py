@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tarama İş Kuyruğu Test Script'i
+
+Bu script, ScanJobManager'ın taramaları arka planda çalıştırdığını sahte
+bir runner ile (Snyk CLI veya DeepSource API olmadan) doğrular.
+
+Test Senaryoları:
+1. submit hemen döner; iş sorgulanarak (poll) tamamlanana kadar izlenir,
+   sonuç ve son tarama işaretçisi kaydedilir
+2. Proje kuyrukta beklerken ve tarama sürerken kiralıdır (saklama
+   temizliğinde silinemez); iş bitince kiralama bırakılır
+3. Runner hata verirse iş failed olur, kiralama yine bırakılır
+4. Kuyruk doluysa JobQueueFullError; reddedilen iş kiralama sızdırmaz
+
+Kullanım:
+    cd backend
+    python tests/test_scan_jobs.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import metric_runner
+import scan_jobs
+from project_registry import ProjectRegistry
+from retention import project_leases
+from scan_jobs import JOB_COMPLETED, JOB_FAILED, JobQueueFullError, ScanJobManager
+
+
+class FakeRunner:
+    """release olayı gelene kadar bekleyen sahte run_code_scan_and_save"""
+
+    def __init__(self, error: str = None):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.error = error
+        self.leases_while_running = None
+
+    def __call__(self, project_name: str, progress=None, **options) -> dict:
+        self.leases_while_running = project_leases.active().get(project_name)
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise RuntimeError(self.error)
+        return {"success": True, "project": project_name, "file_path": f"snyk_code_{project_name}.json"}
+
+
+def wait_finished(manager: ScanJobManager, job_id: str, timeout: float = 5.0):
+    """İşi bitene kadar sorgular (GET /jobs/<id> gibi)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job.is_finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"İş {timeout} sn içinde bitmedi: {manager.get(job_id).to_dict()}")
+
+
+def run_with_runner(tmp_path: Path, runner, check):
+    """scan_jobs'u sahte runner ve geçici proje diziniyle çalıştırır"""
+    (tmp_path / "projects" / "demo").mkdir(parents=True)
+    (tmp_path / "projects" / "demo" / "app.py").write_text("print(1)\n")
+    registry = ProjectRegistry(str(tmp_path / "projects.db"), str(tmp_path / "projects"), builtin_projects=["demo"])
+    originals = (metric_runner.run_code_scan_and_save, scan_jobs.project_registry)
+    metric_runner.run_code_scan_and_save = runner
+    scan_jobs.project_registry = registry
+    try:
+        check(registry)
+    finally:
+        metric_runner.run_code_scan_and_save, scan_jobs.project_registry = originals
+
+
+def test_job_completes_and_releases_lease(tmp_path: Path):
+    """İş tamamlanır, kiralama tarama boyunca tutulur ve sonra bırakılır"""
+    runner = FakeRunner()
+
+    def check(registry: ProjectRegistry):
+        manager = ScanJobManager(max_workers=2)
+        job = manager.submit("snyk", "demo")
+        assert job.tool == "snyk_code" and not job.is_finished
+        assert runner.started.wait(5)
+        assert manager.get(job.job_id).to_dict()["status"] == "running"
+        # submit'in kiralaması + run_scan'in kiralaması
+        assert runner.leases_while_running == 2
+        assert not project_leases.begin_eviction("demo")
+
+        runner.release.set()
+        job = wait_finished(manager, job.job_id)
+        assert job.status == JOB_COMPLETED and job.error is None
+        assert job.result["file_path"] == "snyk_code_demo.json"
+        assert job.to_dict()["queue_time"] is not None and job.to_dict()["run_time"] >= 0
+        assert "demo" not in project_leases.active()
+        assert registry.get("demo")["last_scans"]["snyk_code"]["file_path"] == "snyk_code_demo.json"
+        assert manager.stats()[JOB_COMPLETED] == 1
+
+    run_with_runner(tmp_path, runner, check)
+    print("[OK] İş tamamlanır ve proje kiralaması bırakılır")
+
+
+def test_failed_job_releases_lease(tmp_path: Path):
+    """Runner hatasında iş failed olur ve kiralama bırakılır"""
+    runner = FakeRunner(error="Snyk CLI bulunamadı")
+    runner.release.set()
+
+    def check(registry: ProjectRegistry):
+        manager = ScanJobManager(max_workers=1)
+        job = wait_finished(manager, manager.submit("snyk_code", "demo").job_id)
+        assert job.status == JOB_FAILED and job.error == "Snyk CLI bulunamadı"
+        assert "demo" not in project_leases.active()
+
+    run_with_runner(tmp_path, runner, check)
+    print("[OK] Başarısız iş kiralamayı bırakır")
+
+
+def test_queue_full_does_not_leak_lease(tmp_path: Path):
+    """Reddedilen iş ve bilinmeyen araç kiralama bırakmaz"""
+    runner = FakeRunner()
+
+    def check(registry: ProjectRegistry):
+        manager = ScanJobManager(max_workers=1, max_queued=0)
+        job = manager.submit("snyk_code", "demo")
+        assert runner.started.wait(5)
+        try:
+            manager.submit("snyk_code", "demo")
+            raise AssertionError("JobQueueFullError fırlatmalı")
+        except JobQueueFullError:
+            pass
+        try:
+            manager.submit("unknown", "demo")
+            raise AssertionError("ValueError fırlatmalı")
+        except ValueError:
+            pass
+        assert project_leases.active()["demo"] == 2
+
+        runner.release.set()
+        assert wait_finished(manager, job.job_id).status == JOB_COMPLETED
+        assert "demo" not in project_leases.active()
+
+    run_with_runner(tmp_path, runner, check)
+    print("[OK] Dolu kuyruk kiralama sızdırmaz")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    for test in (
+        test_job_completes_and_releases_lease,
+        test_failed_job_releases_lease,
+        test_queue_full_does_not_leak_lease,
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("\nTarama iş kuyruğu testleri başarılı!")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+SingleFlight Test Script'i
+
+Bu script, aynı içerik için eşzamanlı taramaları birleştiren SingleFlight'ı
+gerçek thread'lerle (tarayıcı veya API çağrısı olmadan) doğrular.
+
+Test Senaryoları:
+1. Aynı anahtarlı eşzamanlı çağrılarda fn bir kez çalışır, sonuç
+   paylaşılır, on_join yalnızca katılan çağrılarda çağrılır
+2. Lider hata verirse bekleyenler aynı hatayı alır; anahtar serbest kalır
+   ve sonraki çağrı fn'i yeniden çalıştırır
+
+Kullanım:
+    cd backend
+    python tests/test_single_flight.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from single_flight import SingleFlight
+
+
+def run_threads(count: int, target) -> list:
+    """target(index)'i count thread'de çalıştırır, sonuçları sırayla döner"""
+    results = [None] * count
+
+    def worker(index: int):
+        try:
+            results[index] = target(index)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def test_single_flight_shares_result():
+    """Aynı anahtarlı eşzamanlı çağrılar tek çalıştırmada birleşir"""
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+    joined = []
+
+    def scan():
+        calls.append(1)
+        release.wait(5)
+        return {"issues": 3}
+
+    def call(index: int):
+        return flights.do("key", scan, on_join=lambda: joined.append(index))
+
+    # Lider fn içinde bekler; diğerleri katılınca serbest bırakılır
+    results = []
+    leader = threading.Thread(target=lambda: results.append(call(0)))
+    leader.start()
+    while not calls:
+        time.sleep(0.001)
+    followers = threading.Thread(target=lambda: results.extend(run_threads(4, lambda i: call(i + 1))))
+    followers.start()
+    while flights.stats()["waiting"] < 4:
+        time.sleep(0.001)
+    release.set()
+    leader.join(5)
+    followers.join(5)
+
+    assert len(calls) == 1
+    assert all(value == {"issues": 3} for value, _ in results)
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert sorted(joined) == [1, 2, 3, 4]
+    assert flights.stats() == {"in_flight": 0, "waiting": 0, "coalesced_total": 4}
+
+    # Farklı anahtarlar birleşmez; bitmiş anahtar yeniden çalışır
+    assert flights.do("other", lambda: 1) == (1, False)
+    assert flights.do("key", lambda: 2) == (2, False)
+    print("[OK] SingleFlight sonucu paylaşır, on_join yalnızca katılanlarda çağrılır")
+
+
+def test_single_flight_propagates_error():
+    """Liderin hatası bekleyenlere iletilir ve anahtar serbest kalır"""
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_scan():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("tarayıcı hatası")
+
+    def call(index: int):
+        if index == 0:
+            return flights.do("key", failing_scan)
+        started.wait(5)
+        return flights.do("key", lambda: "çalışmamalı")
+
+    def release_when_joined():
+        while flights.stats()["waiting"] < 2:
+            time.sleep(0.001)
+        release.set()
+
+    releaser = threading.Thread(target=release_when_joined)
+    releaser.start()
+    results = run_threads(3, call)
+    releaser.join(5)
+
+    assert all(isinstance(result, RuntimeError) and str(result) == "tarayıcı hatası" for result in results), results
+    assert flights.stats()["in_flight"] == 0
+    assert flights.do("key", lambda: "yeni") == ("yeni", False)
+    print("[OK] SingleFlight hatayı bekleyenlere iletir ve anahtarı serbest bırakır")
+
+
+if __name__ == "__main__":
+    test_single_flight_shares_result()
+    test_single_flight_propagates_error()
+    print("\nSingleFlight testleri başarılı!")
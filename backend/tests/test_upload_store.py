@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Yükleme Deposu Arşiv Açma Test Script'i
+
+Bu script, upload_store.py'nin arşivleri güvenli açtığını elle hazırlanmış
+zip ve tar arşivleriyle (geçici bir UploadStore üzerinde) doğrular.
+
+Test Senaryoları:
+1. _safe_relative_path: "../", mutlak yol ve sürücü harfi reddedilir;
+   "." ve boş parçalar temizlenir
+2. "../" veya mutlak yollu girdi içeren zip/tar reddedilir, proje
+   klasörü dışına dosya yazılmaz
+3. Zip içindeki sembolik bağlantı ve tar içindeki bağlantı/cihaz/FIFO
+   girdileri atlanır; yalnızca normal dosyalar açılır
+4. Açılmış boyut ve dosya sayısı sınırları aşılırsa UploadTooLargeError;
+   yarım proje yerleştirilmez
+5. Aynı arşiv tekrar yüklenirse açılmadan mevcut projeye yönlendirilir
+
+Kullanım:
+    cd backend
+    python tests/test_upload_store.py
+"""
+
+import io
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from upload_store import (
+    UnsafeArchiveError,
+    UploadSession,
+    UploadStore,
+    UploadTooLargeError,
+    _safe_relative_path,
+)
+
+
+def make_zip(entries: list) -> bytes:
+    """(ad, içerik, unix_modu) girdilerinden zip oluşturur"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content, mode in entries:
+            info = zipfile.ZipInfo(name)
+            info.external_attr = mode << 16
+            archive.writestr(info, content)
+    return buffer.getvalue()
+
+
+def make_tar(members: list) -> bytes:
+    """(TarInfo, içerik) girdilerinden tar.gz oluşturur"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for info, content in members:
+            if content is not None:
+                info.size = len(content)
+            archive.addfile(info, io.BytesIO(content) if content is not None else None)
+    return buffer.getvalue()
+
+
+def tar_member(name: str, member_type: bytes = tarfile.REGTYPE, linkname: str = "") -> tarfile.TarInfo:
+    info = tarfile.TarInfo(name)
+    info.type = member_type
+    info.linkname = linkname
+    return info
+
+
+def upload(store: UploadStore, data: bytes, filename: str) -> dict:
+    """Tek dosyalık yükleme yapar"""
+    with store.session() as session:
+        session.add_stream(io.BytesIO(data), filename)
+        return session.commit()
+
+
+def project_files(store: UploadStore, record: dict) -> list:
+    root = store.upload_dir / record["project_name"]
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file())
+
+
+def projects(store: UploadStore) -> list:
+    """Yerleştirilmiş proje klasörleri"""
+    if not store.upload_dir.exists():
+        return []
+    return sorted(path.name for path in store.upload_dir.iterdir() if path.name.startswith("uploaded_"))
+
+
+def test_safe_relative_path():
+    """Dışarı çıkan yollar reddedilir, güvenli yollar normalize edilir"""
+    for name in ("../evil.py", "src/../../evil.py", "..\\evil.py", "/etc/passwd", "\\etc\\passwd", "C:/evil.py"):
+        try:
+            _safe_relative_path(name)
+            raise AssertionError(f"UnsafeArchiveError fırlatmalı: {name}")
+        except UnsafeArchiveError:
+            pass
+    assert _safe_relative_path("./src//app.py") == "src/app.py"
+    assert _safe_relative_path("src\\lib\\util.py") == "src/lib/util.py"
+    assert _safe_relative_path("") is None
+    assert _safe_relative_path("./") is None
+    print("[OK] _safe_relative_path dışarı çıkan yolları reddeder")
+
+
+def test_unsafe_entries_rejected(tmp_path: Path):
+    """"../" veya mutlak yollu girdi içeren arşiv hiçbir şey yazmadan reddedilir"""
+    store = UploadStore(upload_dir=str(tmp_path / "uploaded"))
+    archives = [
+        (make_zip([("app.py", b"print(1)\n", 0o100644), ("../evil.py", b"x", 0o100644)]), "zip_slip.zip"),
+        (make_zip([("/tmp/evil.py", b"x", 0o100644)]), "absolute.zip"),
+        (make_tar([(tar_member("app.py"), b"print(1)\n"), (tar_member("../../evil.py"), b"x")]), "tar_slip.tar.gz"),
+        (make_tar([(tar_member("/evil.py"), b"x")]), "absolute.tgz"),
+    ]
+    for data, filename in archives:
+        try:
+            upload(store, data, filename)
+            raise AssertionError(f"UnsafeArchiveError fırlatmalı: {filename}")
+        except UnsafeArchiveError:
+            pass
+    assert not list(tmp_path.rglob("evil.py"))
+    assert projects(store) == []
+    assert list(store.staging_root.iterdir()) == []
+    print("[OK] \"../\" ve mutlak yollu arşiv girdileri reddedilir")
+
+
+def test_links_and_special_files_skipped(tmp_path: Path):
+    """Zip sembolik bağlantısı ve tar bağlantı/cihaz girdileri açılmaz"""
+    store = UploadStore(upload_dir=str(tmp_path / "uploaded"))
+    record = upload(store, make_zip([
+        ("repo/app.py", b"print(1)\n", 0o100644),
+        ("repo/passwd.py", b"/etc/passwd", 0o120777),
+    ]), "links.zip")
+    assert project_files(store, record) == ["app.py"]
+    assert record["files"] == 1
+
+    record = upload(store, make_tar([
+        (tar_member("app.py"), b"print(2)\n"),
+        (tar_member("symlink.py", tarfile.SYMTYPE, "/etc/passwd"), None),
+        (tar_member("hardlink.py", tarfile.LNKTYPE, "app.py"), None),
+        (tar_member("device", tarfile.CHRTYPE), None),
+        (tar_member("fifo", tarfile.FIFOTYPE), None),
+        (tar_member("src", tarfile.DIRTYPE), None),
+    ]), "links.tar.gz")
+    assert project_files(store, record) == ["app.py"]
+    root = store.upload_dir / record["project_name"]
+    assert not any(path.is_symlink() for path in root.rglob("*"))
+    print("[OK] Bağlantılar ve özel dosyalar atlanır")
+
+
+def test_size_and_file_limits(tmp_path: Path):
+    """Boyut ve dosya sayısı sınırları aşılınca proje yerleştirilmez"""
+    store = UploadStore(upload_dir=str(tmp_path / "uploaded"), max_extracted_bytes=1000, max_files=3)
+    oversized = [
+        (make_zip([("big.py", b"x" * 2000, 0o100644)]), "big.zip"),
+        (make_zip([("a.py", b"x" * 600, 0o100644), ("b.py", b"x" * 600, 0o100644)]), "sum.zip"),
+        (make_tar([(tar_member("big.py"), b"x" * 2000)]), "big.tar.gz"),
+        (make_zip([(f"f{index}.py", b"x", 0o100644) for index in range(5)]), "many.zip"),
+        (make_tar([(tar_member(f"f{index}.py"), b"x") for index in range(5)]), "many.tgz"),
+    ]
+    for data, filename in oversized:
+        try:
+            upload(store, data, filename)
+            raise AssertionError(f"UploadTooLargeError fırlatmalı: {filename}")
+        except UploadTooLargeError:
+            pass
+
+    # Gelen veri sınırı arşiv açılmadan uygulanır
+    store.max_bytes = 100
+    try:
+        upload(store, make_zip([("app.py", b"x" * 500, 0o100644)]), "received.zip")
+        raise AssertionError("UploadTooLargeError fırlatmalı")
+    except UploadTooLargeError:
+        pass
+
+    assert projects(store) == []
+    assert list(store.staging_root.iterdir()) == []
+    print("[OK] Açılmış boyut ve dosya sayısı sınırları uygulanır")
+
+
+def test_same_archive_deduplicated(tmp_path: Path):
+    """Aynı arşiv tekrar yüklenince açılmadan mevcut proje döner"""
+    store = UploadStore(upload_dir=str(tmp_path / "uploaded"))
+    data = make_zip([("repo-main/app.py", b"print(1)\n", 0o100644), ("repo-main/lib/util.py", b"x = 1\n", 0o100644)])
+    first = upload(store, data, "repo.zip")
+    assert not first["deduplicated"]
+    assert project_files(store, first) == ["app.py", "lib/util.py"]
+
+    extracted = []
+    original_extract = UploadSession._extract
+    UploadSession._extract = lambda session, *args: extracted.append(args)
+    try:
+        second = upload(store, data, "başka_ad.zip")
+    finally:
+        UploadSession._extract = original_extract
+    assert second["deduplicated"] and second["project_name"] == first["project_name"]
+    assert second["upload_count"] == 2
+    assert extracted == []
+
+    # Aynı içerik farklı arşiv olarak gelirse tree hash ile aynı projeye düşer
+    third = upload(store, make_tar([
+        (tar_member("repo-main/lib/util.py"), b"x = 1\n"),
+        (tar_member("repo-main/app.py"), b"print(1)\n"),
+    ]), "repo.tar.gz")
+    assert third["deduplicated"] and third["project_name"] == first["project_name"]
+    assert projects(store) == [first["project_name"]]
+    print("[OK] Aynı arşiv ve aynı içerik tekrar açılmadan mevcut projeye döner")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_safe_relative_path()
+    for test in (
+        test_unsafe_entries_rejected,
+        test_links_and_special_files_skipped,
+        test_size_and_file_limits,
+        test_same_archive_deduplicated,
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("\nYükleme deposu testleri başarılı!")
@@ -0,0 +1,183 @@
+"""
+Tarayıcı Keşif Kaydı (Tool Registry) Modülü
+
+Bu modül, tarayıcı CLI'larının (Snyk, DeepSource) yolunu ve sürümünü ilk
+kullanımda bulur ve sonucu diske kaydeder. Böylece:
+- Modül import edilirken hiçbir süreç başlatılmaz (Flask daha hızlı açılır)
+- Yeniden başlatmalar ve diğer worker süreçleri keşfi tekrar yapmaz
+
+Diskteki kayıt, bulunan çalıştırılabilir dosyanın değiştirilme zamanı
+(mtime) ile doğrulanır: CLI güncellenir veya silinirse kayıt geçersiz olur
+ve keşif yeniden yapılır. Bulunamayan araçlar için sonuç kısa bir süre
+(TOOL_REGISTRY_NEGATIVE_TTL) saklanır; araç sonradan kurulursa bu süre
+sonunda veya ?refresh=1 ile bulunur.
+
+Kullanım:
+    from tool_registry import tool_registry
+    tool_registry.register("snyk", find_snyk_cli)
+    entry = tool_registry.resolve("snyk")
+    entry["path"], entry["version"], entry["available"]
+
+Environment Variables:
+    TOOL_REGISTRY_FILE: Kayıt dosyası (default: ../results/.cache/tool_registry.json)
+    TOOL_REGISTRY_NEGATIVE_TTL: Bulunamayan araç sonucunun saklanma süresi, saniye (default: 300)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+TOOL_REGISTRY_FILE = os.getenv("TOOL_REGISTRY_FILE", "../results/.cache/tool_registry.json")
+TOOL_REGISTRY_NEGATIVE_TTL = float(os.getenv("TOOL_REGISTRY_NEGATIVE_TTL", "300"))
+
+# Sürüm sorgusu için zaman aşımı (saniye)
+VERSION_PROBE_TIMEOUT = 10
+
+
+def _resolve_executable(path: str) -> Optional[Path]:
+    """Komut adını veya yolu gerçek dosya yoluna çevirir (mtime kontrolü için)"""
+    if Path(path).exists():
+        return Path(path).resolve()
+    which_path = shutil.which(path)
+    return Path(which_path).resolve() if which_path else None
+
+
+def _file_mtime(path: Optional[Path]) -> Optional[float]:
+    try:
+        return path.stat().st_mtime if path else None
+    except OSError:
+        return None
+
+
+class ToolRegistry:
+    """
+    Tarayıcıları tembel (lazy) olarak keşfeden ve sonucu diske yazan kayıt
+    """
+
+    def __init__(self, registry_file: str = TOOL_REGISTRY_FILE, negative_ttl: float = TOOL_REGISTRY_NEGATIVE_TTL):
+        self.registry_file = Path(registry_file)
+        self.negative_ttl = negative_ttl
+        self._discoverers: Dict[str, Callable[[], Optional[str]]] = {}
+        self._version_args: Dict[str, Sequence[str]] = {}
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, discover: Callable[[], Optional[str]], version_args: Sequence[str] = ("--version",)):
+        """
+        Bir aracı kaydeder (keşif yapılmaz, yalnızca tanım eklenir)
+
+        Args:
+            name: Araç adı (örn: "snyk")
+            discover: Aracın yolunu döndüren fonksiyon, bulunamazsa None
+            version_args: Sürüm sorgusu argümanları (örn: ("--version",))
+        """
+        self._discoverers[name] = discover
+        self._version_args[name] = tuple(version_args)
+
+    def resolve(self, name: str, refresh: bool = False) -> dict:
+        """
+        Aracın yolunu ve sürümünü döner (gerekirse keşif yapar)
+
+        Args:
+            name: Kayıtlı araç adı
+            refresh: True ise bellek ve disk kaydı yok sayılır, keşif yeniden yapılır
+
+        Returns:
+            dict: {"name", "path", "resolved_path", "version", "available", "mtime", "discovered_at"}
+
+        Raises:
+            KeyError: Araç kayıtlı değilse
+        """
+        if name not in self._discoverers:
+            raise KeyError(f"Unknown tool: {name}")
+
+        with self._lock:
+            if not refresh:
+                entry = self._entries.get(name)
+                if entry is not None and self._is_valid(entry):
+                    return entry
+                entry = self._load_all().get(name)
+                if entry is not None and self._is_valid(entry):
+                    self._entries[name] = entry
+                    return entry
+
+            entry = self._discover(name)
+            self._entries[name] = entry
+            self._save_entry(entry)
+            return entry
+
+    def status(self, refresh: bool = False) -> Dict[str, dict]:
+        """Kayıtlı tüm araçların durumunu döner"""
+        return {name: self.resolve(name, refresh=refresh) for name in sorted(self._discoverers)}
+
+    def _is_valid(self, entry: dict) -> bool:
+        """Kaydın hâlâ geçerli olup olmadığını kontrol eder"""
+        if not entry.get("available"):
+            return time.time() - entry.get("discovered_at", 0) < self.negative_ttl
+        resolved_path = entry.get("resolved_path")
+        return bool(resolved_path) and _file_mtime(Path(resolved_path)) == entry.get("mtime")
+
+    def _discover(self, name: str) -> dict:
+        """Aracı bulur ve sürümünü sorgular (süreç başlatan tek yer)"""
+        path = self._discoverers[name]()
+        resolved_path = _resolve_executable(path) if path else None
+        return {
+            "name": name,
+            "path": path,
+            "resolved_path": str(resolved_path) if resolved_path else None,
+            "version": self._probe_version(path, self._version_args[name]) if path else None,
+            "available": bool(path),
+            "mtime": _file_mtime(resolved_path),
+            "discovered_at": time.time()
+        }
+
+    @staticmethod
+    def _probe_version(path: str, version_args: Sequence[str]) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                [path, *version_args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=VERSION_PROBE_TIMEOUT
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return result.stdout.strip().splitlines()[0]
+        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+            pass
+        return None
+
+    def _load_all(self) -> Dict[str, dict]:
+        try:
+            with open(self.registry_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+
+    def _save_entry(self, entry: dict):
+        """Kaydı diskteki dosyaya atomik olarak yazar (diğer araçların kayıtları korunur)"""
+        entries = self._load_all()
+        entries[entry["name"]] = entry
+        try:
+            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.registry_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.registry_file)
+        except OSError as e:
+            # Kayıt yazılamazsa keşif sonucu yalnızca bu süreçte kullanılır
+            print(f"WARNING: Tool registry kaydedilemedi: {e}")
+
+
+# Uygulama genelinde paylaşılan kayıt
+tool_registry = ToolRegistry()
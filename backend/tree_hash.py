@@ -0,0 +1,106 @@
+"""
+Proje Ağacı Hash Modülü
+
+Bu modül, bir proje klasörünün içeriğinden deterministik bir hash üretir.
+Dosya içerikleri değişmedikçe hash aynı kalır; tarama sonuç önbelleği ve
+diğer içerik adresli yapılar bu hash'i anahtar olarak kullanır.
+
+Hash yalnızca dosya içeriklerine ve göreli yollarına bağlıdır; dosya
+zaman damgaları, izinler veya klasörün kendi adı hash'i etkilemez.
+
+Kullanım:
+    from tree_hash import compute_tree_hash
+    tree_hash = compute_tree_hash("../test_projects/flask_demo")
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+# Hash'e dahil edilmeyen klasörler ve dosya uzantıları (tarayıcılar da bunları analiz etmez)
+IGNORED_DIRS = {".git", "__pycache__", ".pytest_cache", ".mypy_cache", "node_modules", ".venv", "venv"}
+IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+# Dosyalar bu boyuttaki parçalar halinde okunur (büyük dosyalar belleğe alınmaz)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: Path) -> str:
+    """
+    Tek bir dosyanın SHA-256 özetini hesaplar
+
+    Args:
+        file_path: Dosya yolu
+
+    Returns:
+        str: Hex formatında SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_project_files(root):
+    """
+    Proje klasöründeki dosyaları (göreli yol, tam yol) olarak sıralı döner
+
+    Göreli yollar her platformda "/" ayracı ile döner.
+
+    Args:
+        root: Proje klasörü
+
+    Yields:
+        (str, Path): Göreli yol ve tam yol
+    """
+    root = Path(root)
+    for dir_path, dir_names, file_names in os.walk(root):
+        # os.walk'un gezeceği klasörleri yerinde filtrele ve sırala
+        dir_names[:] = sorted(d for d in dir_names if d not in IGNORED_DIRS)
+        for file_name in sorted(file_names):
+            if Path(file_name).suffix in IGNORED_SUFFIXES:
+                continue
+            full_path = Path(dir_path) / file_name
+            relative_path = full_path.relative_to(root).as_posix()
+            yield relative_path, full_path
+
+
+def compute_file_digests(root) -> Dict[str, str]:
+    """
+    Proje klasöründeki her dosya için içerik özetini hesaplar
+
+    Args:
+        root: Proje klasörü
+
+    Returns:
+        dict: {göreli_yol: sha256}
+    """
+    return {
+        relative_path: hash_file(full_path)
+        for relative_path, full_path in iter_project_files(root)
+    }
+
+
+def compute_tree_hash(root, file_digests: Optional[Dict[str, str]] = None) -> str:
+    """
+    Proje klasörünün içerik hash'ini hesaplar
+
+    Args:
+        root: Proje klasörü
+        file_digests: Önceden hesaplanmış dosya özetleri (opsiyonel)
+
+    Returns:
+        str: Hex formatında SHA-256 tree hash
+    """
+    if file_digests is None:
+        file_digests = compute_file_digests(root)
+
+    digest = hashlib.sha256()
+    for relative_path in sorted(file_digests):
+        digest.update(relative_path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(file_digests[relative_path].encode("ascii"))
+        digest.update(b"\n")
+    return digest.hexdigest()
@@ -0,0 +1,456 @@
+"""
+Yüklenen Projeler İçin İçerik Adresli Depolama Modülü
+
+Bu modül, /upload ile gelen dosyaları ve arşivleri (zip, tar, tar.gz, tgz,
+tar.bz2, tar.xz) içerik adresli proje klasörlerine yerleştirir:
+- Gelen veri parça parça diske yazılır ve yazılırken SHA-256 ile özetlenir
+  (tüm dosya belleğe alınmaz, boyut sınırı okuma sırasında uygulanır)
+- Arşivler güvenli açılır: mutlak yollar ve ".." içeren girdiler reddedilir,
+  sembolik/sabit bağlantılar ve cihaz dosyaları atlanır, açılmış toplam
+  boyut ve dosya sayısı sınırlandırılır (zip bomb koruması)
+- Açılan her dosya yazılırken özetlenir; tree hash bu özetlerden, dosyalar
+  tekrar okunmadan hesaplanır
+- Proje adı tree hash'ten türetilir (uploaded_<hash[:12]>). Aynı içerik tekrar
+  yüklenirse mevcut proje döner; tarama önbelleği aynı tree hash ile
+  eşleştiği için sonuçlar yeniden kullanılır
+- Aynı arşiv (bayt bayt) tekrar yüklenirse arşiv açılmadan mevcut projeye
+  yönlendirilir
+
+Arşivde tek bir üst klasör varsa (örn: GitHub zip'leri "repo-main/") bu
+klasör proje kökü kabul edilir.
+
+Yüklemeler UPLOAD_DIR/.index.json dosyasında tree hash, boyut ve yükleme
+zamanlarıyla kayıtlıdır.
+
+Kullanım:
+    from upload_store import upload_store, UploadError
+    with upload_store.session() as upload:
+        upload.add_stream(file.stream, file.filename)
+        record = upload.commit()
+    record["project_name"], record["deduplicated"]
+
+Environment Variables:
+    UPLOAD_DIR: Yüklenen projelerin klasörü (default: ../test_projects/uploaded)
+    UPLOAD_MAX_BYTES: Bir yüklemede alınan en fazla bayt (default: 100 MB)
+    UPLOAD_MAX_EXTRACTED_BYTES: Arşivlerden açılan en fazla toplam bayt (default: 500 MB)
+    UPLOAD_MAX_FILES: Bir projedeki en fazla dosya sayısı (default: 10000)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, Optional
+
+from tree_hash import IGNORED_DIRS, IGNORED_SUFFIXES, compute_tree_hash
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "../test_projects/uploaded")
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(100 * 1024 * 1024)))
+UPLOAD_MAX_EXTRACTED_BYTES = int(os.getenv("UPLOAD_MAX_EXTRACTED_BYTES", str(500 * 1024 * 1024)))
+UPLOAD_MAX_FILES = int(os.getenv("UPLOAD_MAX_FILES", "10000"))
+
+# Diske yazma parça boyutu
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Arşiv olarak açılan dosya uzantıları
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+# Ham gövde (multipart olmayan) yüklemede kabul edilen içerik türleri
+ARCHIVE_CONTENT_TYPES = {
+    "application/zip": "upload.zip",
+    "application/x-zip-compressed": "upload.zip",
+    "application/x-tar": "upload.tar",
+    "application/gzip": "upload.tar.gz",
+    "application/x-gzip": "upload.tar.gz",
+    "application/x-bzip2": "upload.tar.bz2",
+    "application/x-xz": "upload.tar.xz",
+}
+
+
+class UploadError(RuntimeError):
+    """Yükleme işlenemediğinde (geçersiz veya bozuk arşiv vb.)"""
+
+
+class UploadTooLargeError(UploadError):
+    """Yükleme veya açılmış içerik boyut/dosya sınırını aştığında"""
+
+
+class UnsafeArchiveError(UploadError):
+    """Arşiv girdisi veya yüklenen dosya yolu proje klasörünün dışına yazmaya çalıştığında"""
+
+
+def is_archive_name(filename: str) -> bool:
+    """Dosya adı desteklenen bir arşiv uzantısıyla bitiyor mu"""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _safe_relative_path(name: str) -> Optional[str]:
+    """
+    Arşiv girdisi veya yüklenen dosya adını güvenli bir göreli yola çevirir
+
+    Args:
+        name: Arşivdeki girdi adı veya istemcinin verdiği dosya yolu
+
+    Returns:
+        str: "/" ayraçlı göreli yol; klasör girdisi veya boş ise None
+
+    Raises:
+        UnsafeArchiveError: Mutlak yol, sürücü harfi veya ".." içeriyorsa
+    """
+    normalized = name.replace("\\", "/")
+    path = PurePosixPath(normalized)
+    if path.is_absolute() or (path.parts and ":" in path.parts[0]) or ".." in path.parts:
+        raise UnsafeArchiveError(f"Güvenli olmayan yol: {name}")
+    parts = [part for part in path.parts if part not in ("", ".")]
+    return "/".join(parts) or None
+
+
+def _is_ignored(relative_path: str) -> bool:
+    """tree_hash'in yok saydığı klasör/uzantılar (tarayıcılar da analiz etmez)"""
+    parts = relative_path.split("/")
+    return any(part in IGNORED_DIRS for part in parts[:-1]) or Path(parts[-1]).suffix in IGNORED_SUFFIXES
+
+
+class UploadSession:
+    """
+    Tek bir yüklemenin geçici (staging) klasörü ve dosya özetleri
+    """
+
+    def __init__(self, store: "UploadStore"):
+        self.store = store
+        self.staging_dir = Path(tempfile.mkdtemp(prefix="upload_", dir=store.staging_root))
+        self.root = self.staging_dir / "tree"
+        self.root.mkdir()
+        self.file_digests: Dict[str, str] = {}
+        self.received_bytes = 0
+        self.extracted_bytes = 0
+        self.archives = []
+        self.file_names = []
+
+    # ============================================
+    # AKIŞ (STREAM) YAZMA
+    # ============================================
+
+    def _copy_stream(self, source: BinaryIO, target_path: Path, limit_kind: str) -> str:
+        """
+        Akışı parça parça dosyaya yazar, yazarken özetler ve sınırı uygular
+
+        Args:
+            source: Okunacak akış
+            target_path: Yazılacak dosya
+            limit_kind: "received" (gelen veri) veya "extracted" (arşivden açılan)
+
+        Returns:
+            str: İçeriğin SHA-256 özeti
+        """
+        digest = hashlib.sha256()
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(target_path, "wb") as target:
+            for chunk in iter(lambda: source.read(STREAM_CHUNK_SIZE), b""):
+                if limit_kind == "received":
+                    self.received_bytes += len(chunk)
+                    if self.received_bytes > self.store.max_bytes:
+                        raise UploadTooLargeError(
+                            f"Yükleme boyut sınırını aşıyor ({self.store.max_bytes} bayt)"
+                        )
+                else:
+                    self.extracted_bytes += len(chunk)
+                    if self.extracted_bytes > self.store.max_extracted_bytes:
+                        raise UploadTooLargeError(
+                            f"Açılmış arşiv boyut sınırını aşıyor ({self.store.max_extracted_bytes} bayt)"
+                        )
+                digest.update(chunk)
+                target.write(chunk)
+        return digest.hexdigest()
+
+    def _add_file(self, source: BinaryIO, relative_path: str, limit_kind: str):
+        """Dosyayı proje ağacına yazar ve özetini kaydeder"""
+        if _is_ignored(relative_path):
+            return
+        if len(self.file_digests) >= self.store.max_files:
+            raise UploadTooLargeError(f"Dosya sayısı sınırı aşıldı ({self.store.max_files})")
+        self.file_digests[relative_path] = self._copy_stream(source, self.root / relative_path, limit_kind)
+
+    def add_stream(self, source: BinaryIO, filename: str):
+        """
+        Yüklenen tek bir dosyayı ekler; arşivse proje ağacına açar
+
+        Args:
+            source: Dosya akışı (örn: FileStorage.stream veya request.stream)
+            filename: İstemcinin verdiği dosya adı; klasör yüklemelerinde göreli
+                yol (örn: "src/app.py"). Farklı klasörlerdeki aynı adlı dosyalar
+                birbirinin üzerine yazılmasın diye yol korunur.
+
+        Raises:
+            UnsafeArchiveError: Yol mutlak ise veya ".." içeriyorsa
+        """
+        relative_path = _safe_relative_path(filename)
+        if relative_path is None:
+            return
+        self.file_names.append(relative_path)
+
+        if not is_archive_name(relative_path):
+            self._add_file(source, relative_path, "received")
+            return
+
+        # Arşiv önce staging'e yazılır (açmak için seek gerekir), yazılırken özetlenir;
+        # açma işlemi commit'te yapılır (aynı arşiv daha önce yüklendiyse hiç açılmaz)
+        archive_path = self.staging_dir / f"archive_{len(self.archives)}"
+        archive_digest = self._copy_stream(source, archive_path, "received")
+        self.archives.append((archive_path, archive_digest, relative_path))
+
+    def _extract(self, archive_path: Path, filename: str):
+        """Arşivi güvenli şekilde proje ağacına açar"""
+        try:
+            if zipfile.is_zipfile(archive_path):
+                self._extract_zip(archive_path)
+            elif tarfile.is_tarfile(archive_path):
+                self._extract_tar(archive_path)
+            else:
+                raise UploadError(f"Desteklenmeyen veya bozuk arşiv: {filename}")
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+            raise UploadError(f"Arşiv açılamadı: {e}")
+        finally:
+            archive_path.unlink(missing_ok=True)
+
+    def _extract_zip(self, archive_path: Path):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                relative_path = _safe_relative_path(info.filename)
+                if relative_path is None or info.is_dir():
+                    continue
+                # Sembolik bağlantılar (unix modu 0o120000) açılmaz
+                if (info.external_attr >> 16) & 0o170000 == 0o120000:
+                    continue
+                # Başlıktaki boyut yalancı olabilir; asıl sınır kopyalarken uygulanır
+                if self.extracted_bytes + info.file_size > self.store.max_extracted_bytes:
+                    raise UploadTooLargeError(
+                        f"Açılmış arşiv boyut sınırını aşıyor ({self.store.max_extracted_bytes} bayt)"
+                    )
+                with archive.open(info) as source:
+                    self._add_file(source, relative_path, "extracted")
+
+    def _extract_tar(self, archive_path: Path):
+        with tarfile.open(archive_path, "r:*") as archive:
+            for member in archive:
+                relative_path = _safe_relative_path(member.name)
+                # Yalnızca normal dosyalar açılır (bağlantı ve cihaz dosyaları atlanır)
+                if relative_path is None or not member.isfile():
+                    continue
+                if self.extracted_bytes + member.size > self.store.max_extracted_bytes:
+                    raise UploadTooLargeError(
+                        f"Açılmış arşiv boyut sınırını aşıyor ({self.store.max_extracted_bytes} bayt)"
+                    )
+                source = archive.extractfile(member)
+                if source is not None:
+                    with source:
+                        self._add_file(source, relative_path, "extracted")
+
+    # ============================================
+    # TAMAMLAMA
+    # ============================================
+
+    def _project_root(self) -> tuple:
+        """
+        Proje kökünü ve köke göre dosya özetlerini döner
+
+        Tüm dosyalar tek bir üst klasördeyse (örn: "repo-main/") o klasör kök kabul edilir.
+        """
+        top_levels = {path.split("/", 1)[0] for path in self.file_digests}
+        if len(top_levels) == 1 and all("/" in path for path in self.file_digests):
+            top_level = top_levels.pop()
+            return self.root / top_level, {
+                path.split("/", 1)[1]: digest for path, digest in self.file_digests.items()
+            }
+        return self.root, dict(self.file_digests)
+
+    def commit(self) -> dict:
+        """
+        Yüklemeyi içerik adresli proje klasörüne taşır (aynısı varsa onu kullanır)
+
+        Returns:
+            dict: {"project_name", "tree_hash", "files", "size_bytes", "deduplicated"}
+
+        Raises:
+            UploadError: Yüklemede hiç dosya yoksa
+        """
+        # Yalnızca tek bir arşiv yüklendiyse ve aynı arşiv daha önce açıldıysa
+        # mevcut proje döner
+        archive_digest = self.archives[0][1] if len(self.archives) == 1 and not self.file_digests else None
+        if archive_digest:
+            project_name = self.store.project_for_archive(archive_digest)
+            if project_name:
+                return self.store.touch(project_name, deduplicated=True)
+
+        for archive_path, _, filename in self.archives:
+            self._extract(archive_path, filename)
+
+        if not self.file_digests:
+            raise UploadError("Yüklemede taranabilir dosya yok")
+
+        project_root, file_digests = self._project_root()
+        tree_hash = compute_tree_hash(project_root, file_digests)
+        return self.store.place(project_root, tree_hash, file_digests, archive_digest)
+
+    def cleanup(self):
+        """Geçici klasörü siler"""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+
+class UploadStore:
+    """
+    Yüklenen projelerin içerik adresli deposu ve dizini
+    """
+
+    def __init__(
+        self,
+        upload_dir: str = UPLOAD_DIR,
+        max_bytes: int = UPLOAD_MAX_BYTES,
+        max_extracted_bytes: int = UPLOAD_MAX_EXTRACTED_BYTES,
+        max_files: int = UPLOAD_MAX_FILES
+    ):
+        self.upload_dir = Path(upload_dir)
+        self.staging_root = self.upload_dir / ".staging"
+        self.index_file = self.upload_dir / ".index.json"
+        self.max_bytes = max_bytes
+        self.max_extracted_bytes = max_extracted_bytes
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self):
+        """Yeni bir yükleme oturumu açar; çıkışta geçici dosyalar silinir"""
+        self.staging_root.mkdir(parents=True, exist_ok=True)
+        upload = UploadSession(self)
+        try:
+            yield upload
+        finally:
+            upload.cleanup()
+
+    @staticmethod
+    def project_name_for(tree_hash: str) -> str:
+        """Tree hash'ten proje adı türetir"""
+        return f"uploaded_{tree_hash[:12]}"
+
+    # ============================================
+    # DİZİN (INDEX)
+    # ============================================
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            index = {}
+        index.setdefault("projects", {})
+        index.setdefault("archives", {})
+        return index
+
+    def _save_index(self, index: dict):
+        """Dizini atomik olarak yazar"""
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.upload_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.index_file)
+
+    def project_for_archive(self, archive_digest: str) -> Optional[str]:
+        """Aynı arşivden daha önce oluşturulmuş ve hâlâ duran projeyi döner"""
+        with self._lock:
+            project_name = self._load_index()["archives"].get(archive_digest)
+        if project_name and (self.upload_dir / project_name).is_dir():
+            return project_name
+        return None
+
+    def touch(self, project_name: str, deduplicated: bool = False) -> dict:
+        """Projenin son yükleme zamanını ve sayacını günceller, kaydını döner"""
+        with self._lock:
+            index = self._load_index()
+            record = index["projects"].setdefault(project_name, {"project_name": project_name})
+            record["last_uploaded_at"] = time.time()
+            record["upload_count"] = record.get("upload_count", 0) + 1
+            self._save_index(index)
+            return {**record, "deduplicated": deduplicated}
+
+    def place(self, project_root: Path, tree_hash: str, file_digests: Dict[str, str], archive_digest: Optional[str]) -> dict:
+        """
+        Hazırlanan ağacı tree hash'e göre yerine koyar
+
+        Args:
+            project_root: Staging'deki proje kökü
+            tree_hash: Ağacın içerik hash'i
+            file_digests: {göreli_yol: sha256}
+            archive_digest: Tek arşivli yüklemede arşivin özeti (opsiyonel)
+
+        Returns:
+            dict: Proje kaydı + "deduplicated"
+        """
+        project_name = self.project_name_for(tree_hash)
+        target_dir = self.upload_dir / project_name
+        size_bytes = sum((project_root / path).stat().st_size for path in file_digests)
+
+        with self._lock:
+            deduplicated = target_dir.is_dir()
+            if not deduplicated:
+                try:
+                    os.replace(project_root, target_dir)
+                except OSError:
+                    # Başka bir süreç aynı içeriği aynı anda yerleştirdi
+                    if not target_dir.is_dir():
+                        raise
+                    deduplicated = True
+
+            index = self._load_index()
+            now = time.time()
+            record = index["projects"].setdefault(project_name, {"project_name": project_name, "created_at": now})
+            record.update({
+                "tree_hash": tree_hash,
+                "files": len(file_digests),
+                "size_bytes": size_bytes,
+                "last_uploaded_at": now,
+                "upload_count": record.get("upload_count", 0) + 1
+            })
+            if archive_digest:
+                index["archives"][archive_digest] = project_name
+            self._save_index(index)
+            return {**record, "deduplicated": deduplicated}
+
+    def mark_used(self, project_name: str):
+        """Projenin son kullanım (tarama) zamanını günceller (saklama/LRU için)"""
+        if not (self.upload_dir / project_name).is_dir():
+            return
+        with self._lock:
+            index = self._load_index()
+            record = index["projects"].setdefault(project_name, {"project_name": project_name})
+            record["last_used_at"] = time.time()
+            self._save_index(index)
+
+    def records(self) -> Dict[str, dict]:
+        """Dizindeki tüm proje kayıtları"""
+        with self._lock:
+            return self._load_index()["projects"]
+
+    def forget(self, project_name: str):
+        """Projeyi dizinden çıkarır (klasör silinmez)"""
+        with self._lock:
+            index = self._load_index()
+            index["projects"].pop(project_name, None)
+            index["archives"] = {
+                digest: name for digest, name in index["archives"].items() if name != project_name
+            }
+            self._save_index(index)
+
+
+# Uygulama genelinde paylaşılan depo
+upload_store = UploadStore()